@@ -1,8 +1,17 @@
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 
 from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
 
 
+class AIGatewayError(RuntimeError):
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
 class AIGateway(Protocol):
     async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
-        ...
\ No newline at end of file
+        ...
+
+    def stream_text(self, request: InferenceRequest) -> AsyncIterator[str]:
+        ...
@@ -0,0 +1,156 @@
+import json
+from typing import Any, Dict, List, Optional
+
+
+def _strip_comments_and_trailing_commas(text: str) -> str:
+    # Models echo the "// ..." hints from our prompt examples and leave trailing commas; neither is valid JSON.
+    result = []
+    in_string = False
+    escaped = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if in_string:
+            result.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            i += 1
+            continue
+
+        if char == '"':
+            in_string = True
+        elif text.startswith("//", i):
+            newline = text.find("\n", i)
+            i = len(text) if newline == -1 else newline
+            continue
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = len(text) if end == -1 else end + 2
+            continue
+        elif char in "}]":
+            while result and result[-1] in " \t\r\n":
+                result.pop()
+            if result and result[-1] == ",":
+                result.pop()
+        result.append(char)
+        i += 1
+    return "".join(result)
+
+
+def extract_json_object(text: str) -> Dict[str, Any]:
+    decoder = json.JSONDecoder()
+    cleaned = _strip_comments_and_trailing_commas(text)
+    start = cleaned.find("{")
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(cleaned, start)
+        except json.JSONDecodeError:
+            start = cleaned.find("{", start + 1)
+            continue
+        if isinstance(value, dict):
+            return value
+        start = cleaned.find("{", start + 1)
+    raise json.JSONDecodeError("No JSON object found in model output", text, 0)
+
+
+class StreamingJSONArrayExtractor:
+    def __init__(self, array_key: str):
+        self._array_key = array_key
+        self._buffer = ""
+        self._position = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_root_string: Optional[str] = None
+        self._in_target_array = False
+        self._item_start = 0
+        self._finished = False
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        self._buffer += chunk
+        items = []
+        buffer = self._buffer
+        i = self._position
+        while i < len(buffer) and not self._finished:
+            char = buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        self._last_root_string = buffer[self._string_start + 1:i]
+                i += 1
+                continue
+
+            if not self._stack and char != "{":
+                i += 1
+                continue
+
+            if char == "/":
+                if i + 1 >= len(buffer):
+                    break
+                terminator = "\n" if buffer[i + 1] == "/" else ("*/" if buffer[i + 1] == "*" else None)
+                if terminator is not None:
+                    end = buffer.find(terminator, i + 2)
+                    if end == -1:
+                        break
+                    i = end + len(terminator)
+                    continue
+            elif char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                self._stack.append(char)
+                if char == "[" and len(self._stack) == 2 and self._last_root_string == self._array_key:
+                    self._in_target_array = True
+                elif char == "{" and self._in_target_array and len(self._stack) == 3:
+                    self._item_start = i
+            elif char in "}]":
+                if char == "}" and self._in_target_array and len(self._stack) == 3:
+                    try:
+                        item = json.loads(_strip_comments_and_trailing_commas(buffer[self._item_start:i + 1]))
+                    except json.JSONDecodeError:
+                        item = None
+                    if isinstance(item, dict):
+                        items.append(item)
+                if self._stack:
+                    self._stack.pop()
+                if len(self._stack) == 1:
+                    self._in_target_array = False
+                if not self._stack:
+                    self._finished = True
+            i += 1
+        self._position = i
+        return items
+
+
+class StructuredOutputMetrics:
+    def __init__(self):
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def record(self, use_case: str, outcome: str, count: int = 1) -> None:
+        counters = self._counters.setdefault(use_case, {})
+        counters[outcome] = counters.get(outcome, 0) + count
+
+    def stats(self) -> dict:
+        stats = {}
+        for use_case, counters in self._counters.items():
+            responses = counters.get("strict", 0) + counters.get("recovered", 0) + counters.get("parse_failed", 0)
+            stats[use_case] = {
+                **counters,
+                "parse_failure_rate": (counters.get("parse_failed", 0) / responses) if responses else 0.0,
+                "retry_rate": (counters.get("retried", 0) / responses) if responses else 0.0,
+            }
+        return stats
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Protocol
+
+AI_USAGE_GROUP_BY = ("use_case", "user_id", "document_type_id", "model")
+
+@dataclass(frozen=True)
+class AIUsageRecord:
+    model: str
+    status: str
+    latency_ms: float
+    created_at: datetime
+    use_case: Optional[str] = None
+    user_id: Optional[int] = None
+    document_type_id: Optional[int] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    tokens_estimated: bool = False
+    time_to_first_token_ms: Optional[float] = None
+
+class AIUsageSink(Protocol):
+    def record(self, usage_record: AIUsageRecord) -> None:
+        ...
+
+    async def summarize(self, group_by: List[str], since: datetime) -> List[dict]:
+        ...
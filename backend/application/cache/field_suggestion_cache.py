@@ -0,0 +1,23 @@
+from typing import Awaitable, Callable, List, Optional, Protocol
+
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsResponse
+from backend.core.models.document_type import DocumentType
+
+class FieldSuggestionCache(Protocol):
+    async def get(self, document_type_name: str, document_type_description: str) -> Optional[GenerateDocumentFieldsResponse]:
+        ...
+
+    async def get_or_load(
+        self,
+        document_type_name: str,
+        document_type_description: str,
+        loader: Callable[[], Awaitable[Optional[GenerateDocumentFieldsResponse]]]
+    ) -> Optional[GenerateDocumentFieldsResponse]:
+        ...
+
+    async def set(self, document_type_name: str, document_type_description: str, suggestion: GenerateDocumentFieldsResponse) -> None:
+        ...
+
+class FieldSuggestionPrefetcher(Protocol):
+    def prefetch(self, document_types: List[DocumentType], user_id: Optional[int] = None) -> None:
+        ...
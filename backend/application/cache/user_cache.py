@@ -0,0 +1,10 @@
+from typing import Awaitable, Callable, Optional, Protocol
+
+from backend.core.models.user import User
+
+class UserCache(Protocol):
+    async def get(self, user_id: int, loader: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        ...
+
+    async def invalidate(self, user_id: int) -> None:
+        ...
@@ -1,8 +1,17 @@
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
 class InferenceRequest(BaseModel):
     model: str = Field(..., description="The identifier of the model to use for inference (e.g., 'meta-llama/Llama-3.1-8B-Instruct').", min_length=1)
     prompt: str = Field(..., description="The input prompt text to send to the model.", min_length=1)
+    system_prompt: Optional[str] = Field(None, description="Static instructions sent before the prompt as the system message.")
+    response_format: Optional[Literal["json_object"]] = Field(None, description="Ask the provider for output constrained to this format when it supports it.")
+    fallback_models: List[str] = Field(default_factory=list, description="Models to try, in order, if the primary model cannot serve the request.")
+    use_case: Optional[str] = Field(None, description="Use case the call is made for, recorded for usage accounting.")
+    user_id: Optional[int] = Field(None, description="ID of the user the call is made on behalf of, recorded for usage accounting.")
+    document_type_id: Optional[int] = Field(None, description="ID of the document type the call is about, recorded for usage accounting.")
 
 class InferenceResponse(BaseModel):
-    generated_text: str = Field(..., description="The text generated by the AI model.")
\ No newline at end of file
+    generated_text: str = Field(..., description="The text generated by the AI model.")
+    prompt_tokens: Optional[int] = Field(None, description="Input tokens billed by the provider, when reported.")
+    completion_tokens: Optional[int] = Field(None, description="Output tokens billed by the provider, when reported.")
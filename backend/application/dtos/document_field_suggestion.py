@@ -37,6 +37,10 @@ class GenerateDocumentFieldsRequest(BaseModel):
         description="A brief description of the document type, providing context for field generation.",
         min_length=1
     )
+    refresh: bool = Field(
+        False,
+        description="Ask the AI again instead of returning a previously cached suggestion for the same document type."
+    )
 
     def __post_init__(self):
         self.document_type_name = self.document_type_name.strip()
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from backend.application.dtos.document_field import DocumentFieldResponse
 
 class CreateDocumentTypeRequest(BaseModel):
     name: str = Field(..., description="The name of the document type (e.g., 'Service Contract').", min_length=1)
@@ -20,6 +21,13 @@ class DocumentTypeResponse(BaseModel):
         from_attributes = True
 
 
+class DocumentTypeWithFieldsResponse(BaseModel):
+    id: int = Field(..., description="The unique identifier of the document type.")
+    name: str = Field(..., description="The name of the document type (e.g., 'Service Contract').")
+    description: Optional[str] = Field(None, description="An optional description of the document type.")
+    fields: List[DocumentFieldResponse] = Field(..., description="The fields configured for this document type.")
+
+
 class DeleteDocumentTypeResponse(BaseModel):
     message: str = Field(..., description="Confirmation message of the deletion.")
     deleted_id: int = Field(..., description="The ID of the deleted DocumentType.")
@@ -7,7 +7,7 @@ class CreateUserRequest(BaseModel):
     username: str = Field(..., description="The unique username for the new user.", min_length=1, max_length=80)
     email: EmailStr = Field(..., description="The email address for the new user.")
     # password: str = Field(..., description="The plain text password for the new user.", min_length=8)
-    role: Optional[str] = Field("common", description="The role of the new user as a string (e.g., 'admin', 'common'). Will be converted to UserRole enum internally.")
+    role: Optional[str] = Field("common", validate_default=True, description="The role of the new user as a string (e.g., 'admin', 'common'). Will be converted to UserRole enum internally.")
 
     @field_validator('role')
     def validate_role(cls, v):
@@ -60,3 +60,18 @@ class UserListResponse(BaseModel):
     page: int = Field(..., description="The current page number (1-indexed).")
     size: int = Field(..., description="The number of items per page.")
     pages: int = Field(..., description="The total number of pages available.")
+
+class BulkImportUserRowResult(BaseModel):
+    row: int = Field(..., description="The 1-indexed position of the row in the imported payload.")
+    username: Optional[str] = Field(None, description="The username given in the row, if any.")
+    email: Optional[str] = Field(None, description="The email given in the row, if any.")
+    success: bool = Field(..., description="Whether the user in this row was created.")
+    user: Optional[UserResponse] = Field(None, description="The created user, when the row succeeded.")
+    invite_queued: bool = Field(False, description="Whether the set-password invite was queued for delivery.")
+    errors: List[str] = Field(default_factory=list, description="The reasons this row failed, if any.")
+
+class BulkImportUsersResponse(BaseModel):
+    total: int = Field(..., description="The number of rows in the imported payload.")
+    created: int = Field(..., description="The number of users created.")
+    failed: int = Field(..., description="The number of rows that failed.")
+    results: List[BulkImportUserRowResult] = Field(..., description="The outcome of each imported row, in input order.")
@@ -1,5 +1,15 @@
-from typing import Protocol
+from dataclasses import dataclass
+from typing import List, Protocol
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    to_email: str
+    subject: str
+    body: str
 
 class EmailGateway(Protocol):
     async def send_email(self, to_email: str, subject: str, body: str) -> bool:
-        ...
\ No newline at end of file
+        ...
+
+    async def send_emails(self, emails: List[OutgoingEmail]) -> List[bool]:
+        ...
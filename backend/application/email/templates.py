@@ -0,0 +1,20 @@
+from typing import Tuple
+
+def build_account_created_email(username: str, reset_link: str) -> Tuple[str, str]:
+    email_subject = "Set Your Password for DocuGenius-AI"
+    email_body = f"""
+            Hello {username},
+
+            An account has been created for you on DocuGenius-AI.
+            Please click the link below to set your password:
+
+            {reset_link}
+
+            This link will expire in 1 hour.
+
+            If you did not request this, please ignore this email.
+
+            Best regards,
+            DocuGenius-AI Team
+            """
+    return email_subject, email_body
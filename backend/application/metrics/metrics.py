@@ -0,0 +1,15 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator, Protocol
+
+class StageMetrics(Protocol):
+    def observe_stage(self, operation: str, stage: str, seconds: float) -> None:
+        ...
+
+@contextmanager
+def timed_stage(stage_metrics: StageMetrics, operation: str, stage: str) -> Iterator[None]:
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_metrics.observe_stage(operation, stage, time.perf_counter() - started_at)
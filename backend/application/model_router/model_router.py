@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+from typing import List, Protocol, Tuple
+
+SUGGEST_DOCUMENT_TYPES = "suggest_document_types"
+SUGGEST_DOCUMENT_FIELDS = "suggest_document_fields"
+GENERATE_DOCUMENT = "generate_document"
+
+@dataclass(frozen=True)
+class ModelSpec:
+    id: str
+    capabilities: Tuple[str, ...]
+    context_length: int
+    input_cost_per_million_tokens: float
+    output_cost_per_million_tokens: float
+    latency_class: str
+
+@dataclass(frozen=True)
+class ModelRoute:
+    use_case: str
+    model: str
+    fallback_models: List[str] = field(default_factory=list)
+
+class ModelRouter(Protocol):
+    def route(self, use_case: str, estimated_prompt_tokens: int) -> ModelRoute:
+        ...
@@ -0,0 +1,8 @@
+from typing import Protocol
+
+class PasswordHasher(Protocol):
+    async def hash(self, password: str) -> str:
+        ...
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        ...
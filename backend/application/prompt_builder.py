@@ -0,0 +1,62 @@
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from backend.application.prompts import GENERATE_DOCUMENT_CONTENT_SYSTEM_PROMPT, GENERATE_DOCUMENT_CONTENT_USER_PROMPT, \
+    GENERATE_DOCUMENT_FIELDS_SYSTEM_PROMPT, GENERATE_DOCUMENT_FIELDS_USER_PROMPT, GENERATE_DOCUMENT_TYPES_SYSTEM_PROMPT, \
+    GENERATE_DOCUMENT_TYPES_USER_PROMPT
+
+# Rough average for English text with Llama-family tokenizers; good enough for budgeting and routing.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def compact_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass(frozen=True)
+class BuiltPrompt:
+    system_prompt: str
+    user_prompt: str
+
+    @property
+    def estimated_prefix_tokens(self) -> int:
+        return estimate_tokens(self.system_prompt)
+
+    @property
+    def estimated_tokens(self) -> int:
+        return self.estimated_prefix_tokens + estimate_tokens(self.user_prompt)
+
+
+def build_document_types_prompt(business_description: str) -> BuiltPrompt:
+    return BuiltPrompt(
+        system_prompt=GENERATE_DOCUMENT_TYPES_SYSTEM_PROMPT,
+        user_prompt=GENERATE_DOCUMENT_TYPES_USER_PROMPT.format(business_description_input=business_description.strip()),
+    )
+
+
+def build_document_fields_prompt(document_type_name: str, document_type_description: str) -> BuiltPrompt:
+    return BuiltPrompt(
+        system_prompt=GENERATE_DOCUMENT_FIELDS_SYSTEM_PROMPT,
+        user_prompt=GENERATE_DOCUMENT_FIELDS_USER_PROMPT.format(
+            document_type_name=document_type_name.strip(),
+            document_type_description=document_type_description.strip(),
+        ),
+    )
+
+
+def build_document_content_prompt(document_type_name: str, document_type_description: str,
+                                  filled_fields: Dict[str, Any]) -> BuiltPrompt:
+    return BuiltPrompt(
+        system_prompt=GENERATE_DOCUMENT_CONTENT_SYSTEM_PROMPT,
+        user_prompt=GENERATE_DOCUMENT_CONTENT_USER_PROMPT.format(
+            document_type_name=document_type_name.strip(),
+            document_type_description=(document_type_description or "").strip(),
+            filled_fields_json=compact_json(filled_fields),
+        ),
+    )
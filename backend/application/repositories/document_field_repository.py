@@ -14,6 +14,12 @@ class DocumentFieldRepository(Protocol):
     async def find_all_by_document_type(self, document_type_id: int) -> List[DocumentField]:
         ...
 
+    async def find_by_names_and_document_type(self, names: List[str], document_type_id: int) -> List[DocumentField]:
+        ...
+
+    async def save_all(self, document_fields: List[DocumentField]) -> List[DocumentField]:
+        ...
+
     async def update(self, id: int, document_field: DocumentField) -> Optional[DocumentField]:
         ...
 
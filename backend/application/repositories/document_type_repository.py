@@ -8,9 +8,18 @@ class DocumentTypeRepository(Protocol):
     async def find_by_id(self, id: int) -> Optional[DocumentType]:
         ...
 
+    async def find_by_id_with_fields(self, id: int) -> Optional[DocumentType]:
+        ...
+
     async def find_by_name(self, name: str) -> Optional[DocumentType]:
         ...
 
+    async def find_by_names(self, names: List[str]) -> List[DocumentType]:
+        ...
+
+    async def save_all(self, document_types: List[DocumentType]) -> List[DocumentType]:
+        ...
+
     async def find_all(self) -> List[DocumentType]:
         ...
 
@@ -15,6 +15,15 @@ class UserRepository(Protocol):
     async def find_by_email(self, email: str) -> Optional[User]:
         ...
 
+    async def find_by_identifier(self, identifier: str) -> Optional[User]:
+        ...
+
+    async def find_by_usernames_or_emails(self, usernames: List[str], emails: List[str]) -> List[User]:
+        ...
+
+    async def save_all(self, users: List[User], created_by_user_id: int = None) -> List[User]:
+        ...
+
     async def find_all(self) -> List[User]:
         ...
 
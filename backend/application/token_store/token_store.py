@@ -0,0 +1,11 @@
+from typing import List, Optional, Protocol
+
+class PasswordResetTokenStore(Protocol):
+    async def issue(self, user_id: int) -> Optional[str]:
+        ...
+
+    async def issue_many(self, user_ids: List[int]) -> List[str]:
+        ...
+
+    async def consume(self, token: str) -> Optional[int]:
+        ...
@@ -1,19 +1,18 @@
 import logging
-import secrets
 import os
 from backend.application.repositories.user_repository import UserRepository
 from backend.application.email.email import EmailGateway
 from backend.application.dtos.auth_dtos import ForgotPasswordRequest
 from backend.application.dtos.api_response import APIResponse
-import redis.asyncio as redis
+from backend.application.token_store.token_store import PasswordResetTokenStore
 
 logger = logging.getLogger(__name__)
 
 class ForgotPasswordUseCase:
-    def __init__(self, user_repository: UserRepository, email_gateway: EmailGateway, redis_client: redis.Redis):
+    def __init__(self, user_repository: UserRepository, email_gateway: EmailGateway, token_store: PasswordResetTokenStore):
         self._user_repository = user_repository
         self._email_gateway = email_gateway
-        self._redis_client = redis_client
+        self._token_store = token_store
         self._base_url = os.getenv("BASE_URL", "http://localhost:8000")
 
     async def execute(self, request_dto: ForgotPasswordRequest) -> APIResponse[dict]:
@@ -31,13 +30,16 @@ class ForgotPasswordUseCase:
                     errors=None
                 )
 
-            reset_token = secrets.token_urlsafe(32)
-
-            redis_key = f"reset_token:{reset_token}"
-            user_id_str = str(user_entity.id)
-            token_ttl_seconds = 3600
-
-            await self._redis_client.setex(redis_key, token_ttl_seconds, user_id_str)
+            reset_token = await self._token_store.issue(user_entity.id)
+            if reset_token is None:
+                logger.warning(f"Too many password reset requests for user {user_entity.id}; no email sent.")
+                return APIResponse[dict](
+                    success=True,
+                    message="If the email address is associated with an account, a password reset link has been sent.",
+                    data=None,
+                    error_code=None,
+                    errors=None
+                )
 
             reset_link = f"{self._base_url}/api/v1/auth/reset-password?token={reset_token}"
 
@@ -1,16 +1,17 @@
-import bcrypt
 import os
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
 from backend.application.repositories.user_repository import UserRepository
+from backend.application.password_hasher.password_hasher import PasswordHasher
 from backend.core.models.user import User as CoreUser
 from backend.application.dtos.auth_dtos import LoginUserRequest, LoginUserResponse
 from backend.application.dtos.user import UserResponse
 from backend.application.dtos.api_response import APIResponse
 
 class LoginUserUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, password_hasher: PasswordHasher):
         self._user_repo = user_repository
+        self._password_hasher = password_hasher
         self.JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
         self.JWT_REFRESH_SECRET_KEY = os.getenv("JWT_REFRESH_SECRET_KEY")
         if not self.JWT_SECRET_KEY:
@@ -23,9 +24,7 @@ class LoginUserUseCase:
 
     async def execute(self, request_dto: LoginUserRequest) -> APIResponse[LoginUserResponse]:
         try:
-            user_entity: CoreUser = await self._user_repo.find_by_username(request_dto.identifier)
-            if not user_entity:
-                user_entity = await self._user_repo.find_by_email(request_dto.identifier)
+            user_entity: CoreUser = await self._user_repo.find_by_identifier(request_dto.identifier)
 
             if not user_entity:
                 return APIResponse[LoginUserResponse](
@@ -45,9 +44,9 @@ class LoginUserUseCase:
                     data=None
                 )
 
-            is_password_valid = bcrypt.checkpw(
-                request_dto.password.encode('utf-8'),
-                hashed_password=user_entity.hashed_password.value.encode('utf-8')
+            is_password_valid = await self._password_hasher.verify(
+                request_dto.password,
+                hashed_password=user_entity.hashed_password.value
             )
 
             if not is_password_valid:
@@ -1,28 +1,31 @@
-import bcrypt
 import logging
 from backend.application.repositories.user_repository import UserRepository
+from backend.application.cache.user_cache import UserCache
+from backend.application.password_hasher.password_hasher import PasswordHasher
 from backend.application.dtos.auth_dtos import ResetPasswordRequest
 from backend.application.dtos.api_response import APIResponse
 from backend.core.models.user import User as CoreUser
 from backend.core.value_objects.hashed_password import HashedPassword
-import redis.asyncio as redis
+from backend.application.token_store.token_store import PasswordResetTokenStore
 
 logger = logging.getLogger(__name__)
 
 class ResetPasswordUseCase:
-    def __init__(self, user_repository: UserRepository, redis_client: redis.Redis):
+    def __init__(self, user_repository: UserRepository, token_store: PasswordResetTokenStore, user_cache: UserCache,
+                 password_hasher: PasswordHasher):
         self._user_repository = user_repository
-        self._redis_client = redis_client
+        self._password_hasher = password_hasher
+        self._token_store = token_store
+        self._user_cache = user_cache
 
     async def execute(self, request_dto: ResetPasswordRequest) -> APIResponse[dict]:
         try:
             token = request_dto.token
             new_password = request_dto.new_password
 
-            redis_key = f"reset_token:{token}"
-            user_id_str = await self._redis_client.get(redis_key)
+            user_id = await self._token_store.consume(token)
 
-            if not user_id_str:
+            if user_id is None:
                 return APIResponse[dict](
                     success=False,
                     message="Invalid or expired reset token.",
@@ -31,18 +34,6 @@ class ResetPasswordUseCase:
                     data=None
                 )
 
-            try:
-                user_id = int(user_id_str)
-            except ValueError:
-                logger.error(f"Invalid user ID format retrieved from Redis for token {token}: {user_id_str}")
-                return APIResponse[dict](
-                    success=False,
-                    message="An error for password reset.",
-                    error_code="REDIS_DATA_ERROR",
-                    errors=["An internal error occurred while processing the token."],
-                    data=None
-                )
-
             user_entity: CoreUser = await self._user_repository.find_by_id(user_id)
             if not user_entity:
                 logger.warning(f"User with ID {user_id} not found for reset token {token}")
@@ -54,8 +45,7 @@ class ResetPasswordUseCase:
                     data=None
                 )
 
-            password_hash_bytes = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt())
-            password_hash_str = password_hash_bytes.decode('utf-8')
+            password_hash_str = await self._password_hasher.hash(new_password)
             new_hashed_password_vo = HashedPassword(value=password_hash_str)
 
             print(
@@ -70,6 +60,7 @@ class ResetPasswordUseCase:
             user_entity.is_active = True
 
             updated_user_entity = await self._user_repository.update(user_entity, updated_by_user_id=user_id)
+            await self._user_cache.invalidate(user_id)
             print(
                 f"[DEBUG] ResetPasswordUseCase: Updated entity returned - "
                 f"ID: {updated_user_entity.id if updated_user_entity else 'None'}, "
@@ -85,8 +76,6 @@ class ResetPasswordUseCase:
                     data=None
                  )
 
-            await self._redis_client.delete(redis_key)
-
             return APIResponse[dict](
                 success=True,
                 message="Password reset successfully.",
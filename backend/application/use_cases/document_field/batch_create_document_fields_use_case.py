@@ -28,50 +28,61 @@ class BatchCreateDocumentFieldsUseCase:
             errors_occurred = False
             error_messages = []
 
+            new_field_entities = []
             for field_request_item in request_dto.fields:
                 try:
-                    existing_field = await self._document_field_repo.find_by_name_and_document_type(
-                        name=field_request_item.name, document_type_id=request_dto.document_type_id
+                    new_field_entities.append(
+                        CoreDocumentField(
+                            id=None,
+                            document_type_id=request_dto.document_type_id,
+                            name=field_request_item.name,
+                            field_type=field_request_item.type,
+                            is_required=field_request_item.required,
+                            description=field_request_item.description
+                        )
                     )
-                    if existing_field:
-                        error_msg = f"A field with the name '{field_request_item.name}' already exists for DocumentType ID {request_dto.document_type_id}."
-                        error_messages.append(error_msg)
-                        errors_occurred = True
-                        continue
-
-                    new_field_entity = CoreDocumentField(
-                        id=None,
-                        document_type_id=request_dto.document_type_id,
-                        name=field_request_item.name,
-                        field_type=field_request_item.type,
-                        is_required=field_request_item.required,
-                        description=field_request_item.description
-                    )
-
-                    saved_field_entity = await self._document_field_repo.save(new_field_entity)
-
-                    field_response_dto = DocumentFieldResponse(
-                        id=saved_field_entity.id,
-                        document_type_id=saved_field_entity.document_type_id,
-                        name=saved_field_entity.name,
-                        field_type=saved_field_entity.field_type,
-                        is_required=saved_field_entity.is_required,
-                        description=saved_field_entity.description
-                    )
-
-                    created_fields.append(field_response_dto)
-
                 except ValueError as ve:
                     error_msg = f"Validation error for field '{field_request_item.name}': {str(ve)}"
                     error_messages.append(error_msg)
                     errors_occurred = True
-                    continue
-                except Exception as e:
-                    error_msg = f"Error creating field '{field_request_item.name}': {str(e)}"
+
+            existing_fields = await self._document_field_repo.find_by_names_and_document_type(
+                names=[entity.name for entity in new_field_entities], document_type_id=request_dto.document_type_id
+            )
+            taken_names = {field.name.casefold() for field in existing_fields}
+
+            fields_to_save = []
+            for new_field_entity in new_field_entities:
+                if new_field_entity.name.casefold() in taken_names:
+                    error_msg = f"A field with the name '{new_field_entity.name}' already exists for DocumentType ID {request_dto.document_type_id}."
                     error_messages.append(error_msg)
                     errors_occurred = True
                     continue
 
+                taken_names.add(new_field_entity.name.casefold())
+                fields_to_save.append(new_field_entity)
+
+            try:
+                saved_field_entities = await self._document_field_repo.save_all(fields_to_save)
+            except Exception as e:
+                saved_field_entities = []
+                for unsaved_field_entity in fields_to_save:
+                    error_msg = f"Error creating field '{unsaved_field_entity.name}': {str(e)}"
+                    error_messages.append(error_msg)
+                    errors_occurred = True
+
+            for saved_field_entity in saved_field_entities:
+                field_response_dto = DocumentFieldResponse(
+                    id=saved_field_entity.id,
+                    document_type_id=saved_field_entity.document_type_id,
+                    name=saved_field_entity.name,
+                    field_type=saved_field_entity.field_type,
+                    is_required=saved_field_entity.is_required,
+                    description=saved_field_entity.description
+                )
+
+                created_fields.append(field_response_dto)
+
             if errors_occurred:
                 return APIResponse[List[DocumentFieldResponse]](
                     success=False,
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from backend.application.dtos.api_response import APIResponse
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsRequest, GenerateDocumentFieldsResponse
+from backend.application.use_cases.document_field.suggest_document_fields_use_case import SuggestDocumentFieldsUseCase
+
+class BatchSuggestDocumentFieldsUseCase:
+    def __init__(
+        self,
+        suggest_use_case: SuggestDocumentFieldsUseCase,
+        max_concurrency: int = 4,
+        max_batch_size: int = 50
+    ):
+        self._suggest_use_case = suggest_use_case
+        self._max_concurrency = max_concurrency
+        self._max_batch_size = max_batch_size
+
+    async def execute_stream(
+        self,
+        request_dtos: List[GenerateDocumentFieldsRequest],
+        current_user_id: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if len(request_dtos) > self._max_batch_size:
+            yield {"event": "result", "data": APIResponse[dict](
+                success=False,
+                message="Too many document types in a single batch.",
+                error_code="BATCH_TOO_LARGE",
+                errors=[f"At most {self._max_batch_size} document types can be suggested per batch, got {len(request_dtos)}."],
+                data=None
+            ).model_dump(mode="json")}
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def suggest(index: int, request_dto: GenerateDocumentFieldsRequest) -> Tuple[int, APIResponse[GenerateDocumentFieldsResponse]]:
+            async with semaphore:
+                return index, await self._suggest_use_case.execute(request_dto, current_user_id)
+
+        tasks = [asyncio.create_task(suggest(index, request_dto)) for index, request_dto in enumerate(request_dtos)]
+        failed_names = []
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                index, response = await next_completed
+                if not response.success:
+                    failed_names.append(request_dtos[index].document_type_name)
+                yield {
+                    "event": "suggestion",
+                    "index": index,
+                    "document_type_name": request_dtos[index].document_type_name,
+                    "data": response.model_dump(mode="json")
+                }
+        finally:
+            # The client may disconnect mid-stream; don't keep spending tokens on suggestions nobody will read.
+            for task in tasks:
+                task.cancel()
+
+        succeeded = len(request_dtos) - len(failed_names)
+        yield {"event": "result", "data": APIResponse[dict](
+            success=not failed_names,
+            message=(
+                "Document fields suggested successfully for all document types." if not failed_names
+                else "Some document field suggestions failed during batch operation."
+            ),
+            error_code=None if not failed_names else "BATCH_SUGGEST_PARTIAL_ERROR",
+            errors=None if not failed_names else [f"Field suggestion failed for '{name}'." for name in failed_names],
+            data={"total": len(request_dtos), "succeeded": succeeded, "failed": len(failed_names)}
+        ).model_dump(mode="json")}
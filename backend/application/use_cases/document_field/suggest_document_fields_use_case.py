@@ -1,32 +1,76 @@
+from typing import Any, AsyncIterator, Dict, Optional
+from pydantic import ValidationError
 from backend.application.dtos.ai_inference import InferenceRequest
 from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsRequest, GenerateDocumentFieldsResponse, SuggestedDocumentField
 from backend.application.dtos.api_response import APIResponse
 from backend.application.ai_gateway.ai_gateway import AIGateway
-from backend.application.prompts import GENERATE_DOCUMENT_FIELDS_PROMPT
+from backend.application.cache.field_suggestion_cache import FieldSuggestionCache
+from backend.application.ai_gateway.structured_output import StreamingJSONArrayExtractor, StructuredOutputMetrics, \
+    extract_json_object
+from backend.application.model_router.model_router import ModelRouter, SUGGEST_DOCUMENT_FIELDS
+from backend.application.prompt_builder import build_document_fields_prompt
 import json
 
 class SuggestDocumentFieldsUseCase:
-    def __init__(self, ai_gateway: AIGateway):
+    def __init__(
+        self,
+        ai_gateway: AIGateway,
+        model_router: ModelRouter,
+        output_metrics: StructuredOutputMetrics,
+        suggestion_cache: FieldSuggestionCache,
+        parse_retry_attempts: int = 1
+    ):
         self._ai_gateway = ai_gateway
+        self._model_router = model_router
+        self._output_metrics = output_metrics
+        self._suggestion_cache = suggestion_cache
+        self._parse_retry_attempts = parse_retry_attempts
 
-    async def execute(self, request_dto: GenerateDocumentFieldsRequest) -> APIResponse[GenerateDocumentFieldsResponse]:
-        prompt = GENERATE_DOCUMENT_FIELDS_PROMPT.format(
-            document_type_name=request_dto.document_type_name,
-            document_type_description=request_dto.document_type_description
+    def _build_inference_request(
+        self,
+        request_dto: GenerateDocumentFieldsRequest,
+        current_user_id: Optional[int]
+    ) -> InferenceRequest:
+        prompt = build_document_fields_prompt(request_dto.document_type_name, request_dto.document_type_description)
+        model_route = self._model_router.route(SUGGEST_DOCUMENT_FIELDS, prompt.estimated_tokens)
+        return InferenceRequest(
+            model=model_route.model,
+            fallback_models=model_route.fallback_models,
+            response_format="json_object",
+            system_prompt=prompt.system_prompt,
+            prompt=prompt.user_prompt,
+            use_case=SUGGEST_DOCUMENT_FIELDS,
+            user_id=current_user_id
         )
 
+    @staticmethod
+    def _to_suggested_field(item: Any) -> Optional[SuggestedDocumentField]:
+        if not isinstance(item, dict):
+            return None
         try:
-            inference_request_dto = InferenceRequest(
-                model="meta-llama/Llama-3.1-8B-Instruct:cerebras",
-                prompt=prompt
+            return SuggestedDocumentField(
+                name=str(item.get("name", "")).strip(),
+                type=item.get("type"),
+                required=item.get("required", False),
+                description=str(item.get("description", "")).strip()
             )
+        except ValidationError:
+            return None
 
-            ai_response = await self._ai_gateway.generate_text(inference_request_dto)
-            json_str = ai_response.generated_text
-
+    def _build_response(
+        self,
+        request_dto: GenerateDocumentFieldsRequest,
+        generated_text: str
+    ) -> APIResponse[GenerateDocumentFieldsResponse]:
+        try:
+            parsed_response = json.loads(generated_text)
+            outcome = "strict"
+        except json.JSONDecodeError:
             try:
-                parsed_response = json.loads(json_str)
+                parsed_response = extract_json_object(generated_text)
+                outcome = "recovered"
             except json.JSONDecodeError as e:
+                self._output_metrics.record(SUGGEST_DOCUMENT_FIELDS, "parse_failed")
                 return APIResponse[GenerateDocumentFieldsResponse](
                     success=False,
                     message="Failed to parse AI response for document fields.",
@@ -34,62 +78,136 @@ class SuggestDocumentFieldsUseCase:
                     errors=[f"Invalid JSON format returned by AI: {str(e)}"],
                     data=None
                 )
+        self._output_metrics.record(SUGGEST_DOCUMENT_FIELDS, outcome)
 
-            suggested_fields_raw = parsed_response.get("fields", [])
-            if not isinstance(suggested_fields_raw, list):
-                 return APIResponse[GenerateDocumentFieldsResponse](
-                     success=False,
-                     message="AI response format is invalid: 'fields' is not a list.",
-                     error_code="AI_RESPONSE_FORMAT_ERROR",
-                     errors=["AI response 'fields' attribute is not an array."],
-                     data=None
-                 )
-
-            suggested_fields_dtos = []
-            for item in suggested_fields_raw:
-                name = item.get("name")
-                field_type = item.get("type")
-                is_required = item.get("required", False)
-                description = item.get("description", "")
-
-                if not name or not field_type:
-                    continue
-
-                field_dto = SuggestedDocumentField(
-                    name=name,
-                    type=field_type,
-                    required=is_required,
-                    description=description
-                )
-                suggested_fields_dtos.append(field_dto)
-
-            response_data_dto = GenerateDocumentFieldsResponse(
-                document_type=parsed_response.get("document_type", request_dto.document_type_name),
-                description=parsed_response.get("description", request_dto.document_type_description),
-                fields=suggested_fields_dtos
+        suggested_fields_raw = parsed_response.get("fields", []) if isinstance(parsed_response, dict) else None
+        if not isinstance(suggested_fields_raw, list):
+            return APIResponse[GenerateDocumentFieldsResponse](
+                success=False,
+                message="AI response format is invalid: 'fields' is not a list.",
+                error_code="AI_RESPONSE_FORMAT_ERROR",
+                errors=["AI response 'fields' attribute is not an array."],
+                data=None
             )
 
-            return APIResponse[GenerateDocumentFieldsResponse](
-                success=True,
-                message="Document fields suggested successfully.",
-                data=response_data_dto,
-                error_code=None,
-                errors=None
+        suggested_fields_dtos = [
+            field for field in map(self._to_suggested_field, suggested_fields_raw) if field is not None
+        ]
+        if len(suggested_fields_dtos) < len(suggested_fields_raw):
+            self._output_metrics.record(
+                SUGGEST_DOCUMENT_FIELDS, "invalid_items", len(suggested_fields_raw) - len(suggested_fields_dtos)
             )
 
-        except KeyError as e:
-            return APIResponse[GenerateDocumentFieldsResponse](
-                success=False,
-                message="AI response is missing expected data structure for fields.",
-                error_code="AI_RESPONSE_STRUCTURE_ERROR",
-                errors=[f"Missing key in AI response: {str(e)}"],
-                data=None
+        response_data_dto = GenerateDocumentFieldsResponse(
+            document_type=parsed_response.get("document_type") or request_dto.document_type_name,
+            description=parsed_response.get("description") or request_dto.document_type_description,
+            fields=suggested_fields_dtos
+        )
+
+        return APIResponse[GenerateDocumentFieldsResponse](
+            success=True,
+            message="Document fields suggested successfully.",
+            data=response_data_dto,
+            error_code=None,
+            errors=None
+        )
+
+    def _unexpected_error_response(self, e: Exception) -> APIResponse[GenerateDocumentFieldsResponse]:
+        return APIResponse[GenerateDocumentFieldsResponse](
+            success=False,
+            message="An unexpected error occurred during document field suggestion.",
+            error_code="SUGGEST_DOC_FIELDS_ERROR",
+            errors=[f"Internal error: {str(e)}"],
+            data=None
+        )
+
+    @staticmethod
+    def _success_response(suggestion: GenerateDocumentFieldsResponse) -> APIResponse[GenerateDocumentFieldsResponse]:
+        return APIResponse[GenerateDocumentFieldsResponse](
+            success=True,
+            message="Document fields suggested successfully.",
+            data=suggestion,
+            error_code=None,
+            errors=None
+        )
+
+    async def _suggest(
+        self,
+        request_dto: GenerateDocumentFieldsRequest,
+        current_user_id: Optional[int]
+    ) -> APIResponse[GenerateDocumentFieldsResponse]:
+        inference_request_dto = self._build_inference_request(request_dto, current_user_id)
+
+        for attempt in range(self._parse_retry_attempts + 1):
+            ai_response = await self._ai_gateway.generate_text(inference_request_dto)
+            response = self._build_response(request_dto, ai_response.generated_text)
+            if response.error_code != "AI_RESPONSE_PARSE_ERROR" or attempt == self._parse_retry_attempts:
+                return response
+            self._output_metrics.record(SUGGEST_DOCUMENT_FIELDS, "retried")
+
+    async def execute(
+        self,
+        request_dto: GenerateDocumentFieldsRequest,
+        current_user_id: Optional[int] = None
+    ) -> APIResponse[GenerateDocumentFieldsResponse]:
+        failed_response: Optional[APIResponse[GenerateDocumentFieldsResponse]] = None
+
+        async def load_suggestion() -> Optional[GenerateDocumentFieldsResponse]:
+            nonlocal failed_response
+            response = await self._suggest(request_dto, current_user_id)
+            if not response.success:
+                failed_response = response
+                return None
+            return response.data
+
+        try:
+            if request_dto.refresh:
+                response = await self._suggest(request_dto, current_user_id)
+                if response.success:
+                    await self._suggestion_cache.set(
+                        request_dto.document_type_name, request_dto.document_type_description, response.data
+                    )
+                return response
+
+            suggestion = await self._suggestion_cache.get_or_load(
+                request_dto.document_type_name, request_dto.document_type_description, load_suggestion
             )
+            if suggestion is not None:
+                return self._success_response(suggestion)
+            # Joined a shared load (e.g. a prefetch) that failed; only failures of our own load are final.
+            return failed_response or await self._suggest(request_dto, current_user_id)
+
         except Exception as e:
-            return APIResponse[GenerateDocumentFieldsResponse](
-                success=False,
-                message="An unexpected error occurred during document field suggestion.",
-                error_code="SUGGEST_DOC_FIELDS_ERROR",
-                errors=[f"Internal error: {str(e)}"],
-                data=None
-            )
\ No newline at end of file
+            return self._unexpected_error_response(e)
+
+    async def execute_stream(
+        self,
+        request_dto: GenerateDocumentFieldsRequest,
+        current_user_id: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        extractor = StreamingJSONArrayExtractor("fields")
+        try:
+            suggestion = None
+            if not request_dto.refresh:
+                suggestion = await self._suggestion_cache.get(request_dto.document_type_name, request_dto.document_type_description)
+            if suggestion is not None:
+                for field in suggestion.fields:
+                    yield {"event": "field", "data": field.model_dump(mode="json")}
+                yield {"event": "result", "data": self._success_response(suggestion).model_dump(mode="json")}
+                return
+
+            inference_request_dto = self._build_inference_request(request_dto, current_user_id)
+            async for chunk in self._ai_gateway.stream_text(inference_request_dto):
+                for item in extractor.feed(chunk):
+                    field = self._to_suggested_field(item)
+                    if field is not None:
+                        yield {"event": "field", "data": field.model_dump(mode="json")}
+            response = self._build_response(request_dto, extractor.text)
+            if response.success:
+                await self._suggestion_cache.set(
+                    request_dto.document_type_name, request_dto.document_type_description, response.data
+                )
+        except Exception as e:
+            response = self._unexpected_error_response(e)
+
+        yield {"event": "result", "data": response.model_dump(mode="json")}
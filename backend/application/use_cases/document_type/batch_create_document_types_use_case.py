@@ -1,26 +1,80 @@
 from backend.application.repositories.document_type_repository import DocumentTypeRepository
-from backend.application.use_cases.document_type.create_document_type_use_case import CreateDocumentTypeUseCase
+from backend.core.models.document_type import DocumentType
 from backend.application.dtos.document_type import CreateDocumentTypeRequest, DocumentTypeResponse
 from backend.application.dtos.api_response import APIResponse
-from typing import List
+from backend.application.cache.field_suggestion_cache import FieldSuggestionPrefetcher
+from typing import List, Optional
 
 class BatchCreateDocumentTypesUseCase:
-    def __init__(self, create_single_use_case: CreateDocumentTypeUseCase):
-        self._create_single_use_case = create_single_use_case
+    def __init__(self, repository: DocumentTypeRepository, suggestion_prefetcher: Optional[FieldSuggestionPrefetcher] = None):
+        self._repository = repository
+        self._suggestion_prefetcher = suggestion_prefetcher
 
-    async def execute(self, request_dtos: List[CreateDocumentTypeRequest]) -> APIResponse[List[DocumentTypeResponse]]:
+    async def execute(
+        self,
+        request_dtos: List[CreateDocumentTypeRequest],
+        current_user_id: Optional[int] = None
+    ) -> APIResponse[List[DocumentTypeResponse]]:
         results = []
         errors_occurred = False
         error_messages = []
 
-        for request_dto in request_dtos:
-            single_result = await self._create_single_use_case.execute(request_dto)
+        try:
+            new_doc_type_entities = []
+            for request_dto in request_dtos:
+                try:
+                    new_doc_type_entities.append(
+                        DocumentType(
+                            id=None,
+                            name=request_dto.name,
+                            description=request_dto.description
+                        )
+                    )
+                except ValueError as ve:
+                    errors_occurred = True
+                    error_messages.append(str(ve))
 
-            if single_result.success:
-                results.append(single_result.data)
-            else:
-                errors_occurred = True
-                error_messages.extend(single_result.errors or [f"Unknown error for item with name '{request_dto.name}'"])
+            existing_doc_types = await self._repository.find_by_names([entity.name for entity in new_doc_type_entities])
+            taken_names = {doc_type.name.casefold() for doc_type in existing_doc_types}
+
+            doc_types_to_save = []
+            for new_doc_type_entity in new_doc_type_entities:
+                if new_doc_type_entity.name.casefold() in taken_names:
+                    errors_occurred = True
+                    error_messages.append(f"A DocumentType with the name '{new_doc_type_entity.name}' already exists.")
+                    continue
+
+                taken_names.add(new_doc_type_entity.name.casefold())
+                doc_types_to_save.append(new_doc_type_entity)
+
+            try:
+                saved_doc_type_entities = await self._repository.save_all(doc_types_to_save)
+            except Exception as e:
+                saved_doc_type_entities = []
+                for unsaved_doc_type_entity in doc_types_to_save:
+                    errors_occurred = True
+                    error_messages.append(f"Internal error creating '{unsaved_doc_type_entity.name}': {str(e)}")
+
+            if saved_doc_type_entities and self._suggestion_prefetcher is not None:
+                self._suggestion_prefetcher.prefetch(saved_doc_type_entities, current_user_id)
+
+            for saved_doc_type_entity in saved_doc_type_entities:
+                results.append(
+                    DocumentTypeResponse(
+                        id=saved_doc_type_entity.id,
+                        name=saved_doc_type_entity.name,
+                        description=saved_doc_type_entity.description
+                    )
+                )
+
+        except Exception as e:
+            return APIResponse[List[DocumentTypeResponse]](
+                success=False,
+                message="An unexpected error occurred during batch document type creation.",
+                error_code="BATCH_CREATE_ERROR",
+                errors=[f"Internal error: {str(e)}"],
+                data=None
+            )
 
         if errors_occurred:
             return APIResponse[List[DocumentTypeResponse]](
@@ -37,4 +91,4 @@ class BatchCreateDocumentTypesUseCase:
             data=results,
             error_code=None,
             errors=None
-        )
\ No newline at end of file
+        )
@@ -2,12 +2,19 @@ from backend.application.repositories.document_type_repository import DocumentTy
 from backend.core.models.document_type import DocumentType
 from backend.application.dtos.document_type import CreateDocumentTypeRequest, DocumentTypeResponse
 from backend.application.dtos.api_response import APIResponse
+from backend.application.cache.field_suggestion_cache import FieldSuggestionPrefetcher
+from typing import Optional
 
 class CreateDocumentTypeUseCase:
-    def __init__(self, repository: DocumentTypeRepository):
+    def __init__(self, repository: DocumentTypeRepository, suggestion_prefetcher: Optional[FieldSuggestionPrefetcher] = None):
         self._repository = repository
+        self._suggestion_prefetcher = suggestion_prefetcher
 
-    async def execute(self, request_dto: CreateDocumentTypeRequest) -> APIResponse[DocumentTypeResponse]:
+    async def execute(
+        self,
+        request_dto: CreateDocumentTypeRequest,
+        current_user_id: Optional[int] = None
+    ) -> APIResponse[DocumentTypeResponse]:
         try:
             existing_doc_type = await self._repository.find_by_name(request_dto.name)
             if existing_doc_type:
@@ -26,6 +33,8 @@ class CreateDocumentTypeUseCase:
             )
 
             saved_doc_type_entity = await self._repository.save(new_doc_type_entity)
+            if self._suggestion_prefetcher is not None:
+                self._suggestion_prefetcher.prefetch([saved_doc_type_entity], current_user_id)
 
             doc_response_dto = DocumentTypeResponse(
                 id=saved_doc_type_entity.id,
@@ -0,0 +1,55 @@
+from backend.application.repositories.document_type_repository import DocumentTypeRepository
+from backend.application.dtos.document_type import DocumentTypeWithFieldsResponse
+from backend.application.dtos.document_field import DocumentFieldResponse
+from backend.application.dtos.api_response import APIResponse
+
+class GetDocumentTypeWithFieldsByIdUseCase:
+    def __init__(self, repository: DocumentTypeRepository):
+        self._repository = repository
+
+    async def execute(self, document_type_id: int) -> APIResponse[DocumentTypeWithFieldsResponse]:
+        try:
+            doc_type_entity = await self._repository.find_by_id_with_fields(document_type_id)
+
+            if not doc_type_entity:
+                return APIResponse[DocumentTypeWithFieldsResponse](
+                    success=False,
+                    message=f"DocumentType with ID {document_type_id} not found.",
+                    error_code="NOT_FOUND",
+                    errors=[f"DocumentType with ID {document_type_id} does not exist."],
+                    data=None
+                )
+
+            doc_type_response_dto = DocumentTypeWithFieldsResponse(
+                id=doc_type_entity.id,
+                name=doc_type_entity.name,
+                description=doc_type_entity.description,
+                fields=[
+                    DocumentFieldResponse(
+                        id=field_entity.id,
+                        document_type_id=field_entity.document_type_id,
+                        name=field_entity.name,
+                        field_type=field_entity.field_type,
+                        is_required=field_entity.is_required,
+                        description=field_entity.description
+                    )
+                    for field_entity in doc_type_entity.fields
+                ]
+            )
+
+            return APIResponse[DocumentTypeWithFieldsResponse](
+                success=True,
+                message="Document type with fields retrieved successfully.",
+                data=doc_type_response_dto,
+                error_code=None,
+                errors=None
+            )
+
+        except Exception as e:
+            return APIResponse[DocumentTypeWithFieldsResponse](
+                success=False,
+                message="An unexpected error occurred while retrieving the document type with its fields.",
+                error_code="GET_DT_WITH_FIELDS_BY_ID_ERROR",
+                errors=[f"Internal error: {str(e)}"],
+                data=None
+            )
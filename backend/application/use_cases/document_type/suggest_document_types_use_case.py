@@ -1,60 +1,113 @@
+from typing import Any, Optional
+from pydantic import ValidationError
 from backend.application.dtos.ai_inference import InferenceRequest
 from backend.application.dtos.document_type_suggestion import GenerateDocumentTypesRequest, GenerateDocumentTypesResponse, SuggestedDocumentType
 from backend.application.dtos.api_response import APIResponse
 from backend.application.ai_gateway.ai_gateway import AIGateway
-from backend.application.prompts import GENERATE_DOCUMENT_TYPES_PROMPT
+from backend.application.ai_gateway.structured_output import StructuredOutputMetrics, extract_json_object
+from backend.application.model_router.model_router import ModelRouter, SUGGEST_DOCUMENT_TYPES
+from backend.application.prompt_builder import build_document_types_prompt
 import json
 
 class SuggestDocumentTypesUseCase:
-    def __init__(self, ai_gateway: AIGateway):
+    def __init__(
+        self,
+        ai_gateway: AIGateway,
+        model_router: ModelRouter,
+        output_metrics: StructuredOutputMetrics,
+        parse_retry_attempts: int = 1
+    ):
         self._ai_gateway = ai_gateway
+        self._model_router = model_router
+        self._output_metrics = output_metrics
+        self._parse_retry_attempts = parse_retry_attempts
 
-    async def execute(self, request_dto: GenerateDocumentTypesRequest) -> APIResponse[GenerateDocumentTypesResponse]:
-        prompt = GENERATE_DOCUMENT_TYPES_PROMPT.format(business_description_input=request_dto.business_description)
-
+    @staticmethod
+    def _to_suggested_type(item: Any) -> Optional[SuggestedDocumentType]:
+        if not isinstance(item, dict):
+            return None
         try:
-            inference_request_dto = InferenceRequest(
-                model="meta-llama/Llama-3.1-8B-Instruct:cerebras",
-                prompt=prompt
+            return SuggestedDocumentType(
+                name=str(item.get("name", "")).strip(),
+                description=str(item.get("description", "")).strip()
             )
+        except ValidationError:
+            return None
 
-            ai_response = await self._ai_gateway.generate_text(inference_request_dto)
-
-            json_str = ai_response.generated_text
-            parsed_response = json.loads(json_str)
-            suggested_types_raw = parsed_response.get("suggested_document_types", [])
-
-            suggested_types_dtos = [
-                SuggestedDocumentType(name=item["name"], description=item["description"])
-                for item in suggested_types_raw
-            ]
-
-            response_data_dto = GenerateDocumentTypesResponse(suggested_document_types=suggested_types_dtos)
-
-            return APIResponse[GenerateDocumentTypesResponse](
-                success=True,
-                message="Document types suggested successfully.",
-                data=response_data_dto,
-                error_code=None,
-                errors=None
-            )
+    def _build_response(self, generated_text: str) -> APIResponse[GenerateDocumentTypesResponse]:
+        try:
+            parsed_response = json.loads(generated_text)
+            outcome = "strict"
+        except json.JSONDecodeError:
+            try:
+                parsed_response = extract_json_object(generated_text)
+                outcome = "recovered"
+            except json.JSONDecodeError as e:
+                self._output_metrics.record(SUGGEST_DOCUMENT_TYPES, "parse_failed")
+                return APIResponse[GenerateDocumentTypesResponse](
+                    success=False,
+                    message="Failed to parse AI response for document types.",
+                    error_code="AI_RESPONSE_PARSE_ERROR",
+                    errors=[f"Invalid JSON format returned by AI: {str(e)}"],
+                    data=None
+                )
+        self._output_metrics.record(SUGGEST_DOCUMENT_TYPES, outcome)
 
-        except json.JSONDecodeError as e:
-            return APIResponse[GenerateDocumentTypesResponse](
-                success=False,
-                message="Failed to parse AI response for document types.",
-                error_code="AI_RESPONSE_PARSE_ERROR",
-                errors=[f"Invalid JSON format returned by AI: {str(e)}"],
-                data=None
-            )
-        except KeyError as e:
+        suggested_types_raw = parsed_response.get("suggested_document_types") if isinstance(parsed_response, dict) else None
+        if not isinstance(suggested_types_raw, list):
             return APIResponse[GenerateDocumentTypesResponse](
                 success=False,
                 message="AI response is missing expected data structure.",
                 error_code="AI_RESPONSE_STRUCTURE_ERROR",
-                errors=[f"Missing key in AI response: {str(e)}"],
+                errors=["AI response 'suggested_document_types' attribute is missing or not an array."],
                 data=None
             )
+
+        suggested_types_dtos = [
+            suggested_type for suggested_type in map(self._to_suggested_type, suggested_types_raw)
+            if suggested_type is not None
+        ]
+        if len(suggested_types_dtos) < len(suggested_types_raw):
+            self._output_metrics.record(
+                SUGGEST_DOCUMENT_TYPES, "invalid_items", len(suggested_types_raw) - len(suggested_types_dtos)
+            )
+
+        response_data_dto = GenerateDocumentTypesResponse(suggested_document_types=suggested_types_dtos)
+
+        return APIResponse[GenerateDocumentTypesResponse](
+            success=True,
+            message="Document types suggested successfully.",
+            data=response_data_dto,
+            error_code=None,
+            errors=None
+        )
+
+    async def execute(
+        self,
+        request_dto: GenerateDocumentTypesRequest,
+        current_user_id: Optional[int] = None
+    ) -> APIResponse[GenerateDocumentTypesResponse]:
+        prompt = build_document_types_prompt(request_dto.business_description)
+
+        try:
+            model_route = self._model_router.route(SUGGEST_DOCUMENT_TYPES, prompt.estimated_tokens)
+            inference_request_dto = InferenceRequest(
+                model=model_route.model,
+                fallback_models=model_route.fallback_models,
+                response_format="json_object",
+                system_prompt=prompt.system_prompt,
+                prompt=prompt.user_prompt,
+                use_case=SUGGEST_DOCUMENT_TYPES,
+                user_id=current_user_id
+            )
+
+            for attempt in range(self._parse_retry_attempts + 1):
+                ai_response = await self._ai_gateway.generate_text(inference_request_dto)
+                response = self._build_response(ai_response.generated_text)
+                if response.error_code != "AI_RESPONSE_PARSE_ERROR" or attempt == self._parse_retry_attempts:
+                    return response
+                self._output_metrics.record(SUGGEST_DOCUMENT_TYPES, "retried")
+
         except Exception as e:
             return APIResponse[GenerateDocumentTypesResponse](
                 success=False,
@@ -62,4 +115,4 @@ class SuggestDocumentTypesUseCase:
                 error_code="SUGGEST_DOC_TYPES_ERROR",
                 errors=[f"Internal error: {str(e)}"],
                 data=None
-            )
\ No newline at end of file
+            )
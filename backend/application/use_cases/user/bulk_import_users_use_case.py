@@ -0,0 +1,190 @@
+import secrets
+import string
+import logging
+import os
+from typing import Any, Dict, List, Optional
+from pydantic import ValidationError
+from backend.application.repositories.user_repository import UserRepository
+from backend.core.models.user import User as CoreUser
+from backend.core.value_objects.hashed_password import HashedPassword
+from backend.application.dtos.user import CreateUserRequest, UserResponse, BulkImportUserRowResult, \
+    BulkImportUsersResponse
+from backend.application.dtos.api_response import APIResponse
+from backend.application.email.email import EmailGateway, OutgoingEmail
+from backend.application.email.templates import build_account_created_email
+from backend.application.password_hasher.password_hasher import PasswordHasher
+from backend.application.token_store.token_store import PasswordResetTokenStore
+
+logger = logging.getLogger(__name__)
+
+class BulkImportUsersUseCase:
+    def __init__(self, repository: UserRepository, email_gateway: EmailGateway, token_store: PasswordResetTokenStore,
+                 password_hasher: PasswordHasher):
+        self._repository = repository
+        self._email_gateway = email_gateway
+        self._token_store = token_store
+        self._password_hasher = password_hasher
+        self._base_url = os.getenv("BASE_URL", "http://localhost:8000")
+        self._max_rows = int(os.getenv("USER_IMPORT_MAX_ROWS", 1000))
+
+    @staticmethod
+    def _generate_temp_password() -> str:
+        alphabet = string.ascii_letters + string.digits
+        return ''.join(secrets.choice(alphabet) for _ in range(12))
+
+    @staticmethod
+    def _row_value(row: Any, key: str) -> Optional[str]:
+        # Echoed back in the report even when the row is malformed, so it must never fail to build.
+        value = row.get(key) if isinstance(row, dict) else None
+        return None if value is None else str(value)
+
+    async def execute(self, rows: List[Dict[str, Any]], created_by_user_id: int) -> APIResponse[BulkImportUsersResponse]:
+        if not rows:
+            return APIResponse[BulkImportUsersResponse](
+                success=False,
+                message="No users to import.",
+                error_code="EMPTY_IMPORT",
+                errors=["The import payload contains no rows."],
+                data=None
+            )
+
+        if len(rows) > self._max_rows:
+            return APIResponse[BulkImportUsersResponse](
+                success=False,
+                message=f"Too many rows to import. The limit is {self._max_rows}.",
+                error_code="IMPORT_TOO_LARGE",
+                errors=[f"The import payload contains {len(rows)} rows; at most {self._max_rows} are allowed."],
+                data=None
+            )
+
+        try:
+            results = [
+                BulkImportUserRowResult(row=index, username=self._row_value(row, "username"),
+                                        email=self._row_value(row, "email"), success=False)
+                for index, row in enumerate(rows, start=1)
+            ]
+
+            candidates = []
+            for result, row in zip(results, rows):
+                try:
+                    request_dto = CreateUserRequest.model_validate(row)
+                    candidates.append((result, request_dto))
+                except ValidationError as ve:
+                    result.errors.extend(
+                        f"{'.'.join(str(loc) for loc in error['loc']) or 'row'}: {error['msg']}" for error in ve.errors()
+                    )
+
+            existing_users = await self._repository.find_by_usernames_or_emails(
+                usernames=[request_dto.username for _, request_dto in candidates],
+                emails=[str(request_dto.email) for _, request_dto in candidates]
+            )
+            taken_usernames = {user.username.casefold() for user in existing_users}
+            taken_emails = {user.email.casefold() for user in existing_users}
+
+            accepted = []
+            for result, request_dto in candidates:
+                username_key = request_dto.username.casefold()
+                email_key = str(request_dto.email).casefold()
+                if username_key in taken_usernames:
+                    result.errors.append(f"Username '{request_dto.username}' is already taken.")
+                if email_key in taken_emails:
+                    result.errors.append(f"Email '{request_dto.email}' is already registered.")
+                if result.errors:
+                    continue
+
+                taken_usernames.add(username_key)
+                taken_emails.add(email_key)
+                accepted.append((result, request_dto))
+
+            # Imported users set their password through the reset link, so the initial one is never used. One hash of a
+            # random secret nobody knows is shared by the whole import instead of queueing a full-cost bcrypt per row
+            # on the executor that logins wait on.
+            placeholder_password_hash = await self._password_hasher.hash(self._generate_temp_password()) if accepted else None
+            new_user_entities = [
+                CoreUser(
+                    id=None,
+                    username=request_dto.username,
+                    email=str(request_dto.email),
+                    hashed_password=HashedPassword(value=placeholder_password_hash),
+                    role=request_dto.role,
+                    is_active=False
+                ) for _, request_dto in accepted
+            ]
+
+            try:
+                saved_user_entities = await self._repository.save_all(new_user_entities, created_by_user_id=created_by_user_id)
+            except Exception as e:
+                logger.error(f"Error during bulk user insert: {e}")
+                saved_user_entities = []
+                for result, _ in accepted:
+                    result.errors.append(f"Internal error creating user: {str(e)}")
+
+            reset_tokens = []
+            tokens_stored = False
+            if saved_user_entities:
+                try:
+                    reset_tokens = await self._token_store.issue_many([user.id for user in saved_user_entities])
+                    tokens_stored = True
+                except Exception as e:
+                    logger.error(f"Error storing reset tokens for bulk import: {e}")
+
+            invites_queued = [False] * len(saved_user_entities)
+            if tokens_stored:
+                emails = []
+                for reset_token, saved_user_entity in zip(reset_tokens, saved_user_entities):
+                    reset_link = f"{self._base_url}/api/v1/auth/reset-password?token={reset_token}"
+                    email_subject, email_body = build_account_created_email(saved_user_entity.username, reset_link)
+                    emails.append(OutgoingEmail(to_email=saved_user_entity.email, subject=email_subject, body=email_body))
+                invites_queued = await self._email_gateway.send_emails(emails)
+
+            for (result, _), saved_user_entity, invite_queued in zip(accepted, saved_user_entities, invites_queued):
+                result.success = True
+                result.invite_queued = invite_queued
+                result.user = UserResponse(
+                    id=saved_user_entity.id,
+                    username=saved_user_entity.username,
+                    email=saved_user_entity.email,
+                    role=saved_user_entity.role,
+                    is_active=saved_user_entity.is_active,
+                    created_at=saved_user_entity.created_at,
+                    updated_at=saved_user_entity.updated_at
+                )
+
+        except Exception as e:
+            logger.error(f"Error during bulk user import: {e}")
+            return APIResponse[BulkImportUsersResponse](
+                success=False,
+                message="An unexpected error occurred during bulk user import.",
+                error_code="BULK_IMPORT_USERS_ERROR",
+                errors=[f"Internal error: {str(e)}"],
+                data=None
+            )
+
+        created = sum(1 for result in results if result.success)
+        report = BulkImportUsersResponse(total=len(results), created=created, failed=len(results) - created, results=results)
+
+        if created < len(results):
+            return APIResponse[BulkImportUsersResponse](
+                success=False,
+                message="Some users failed to be imported.",
+                error_code="BULK_IMPORT_PARTIAL_ERROR",
+                errors=[f"Row {result.row}: {error}" for result in results for error in result.errors],
+                data=report
+            )
+
+        if not all(result.invite_queued for result in results):
+            return APIResponse[BulkImportUsersResponse](
+                success=True,
+                message="All users imported successfully, but some password setup emails could not be queued.",
+                data=report,
+                error_code=None,
+                errors=None
+            )
+
+        return APIResponse[BulkImportUsersResponse](
+            success=True,
+            message="All users imported successfully. Password setup emails have been queued.",
+            data=report,
+            error_code=None,
+            errors=None
+        )
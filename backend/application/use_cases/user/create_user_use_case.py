@@ -1,4 +1,3 @@
-import bcrypt
 import secrets
 import string
 import logging
@@ -9,15 +8,19 @@ from backend.core.value_objects.hashed_password import HashedPassword
 from backend.application.dtos.user import CreateUserRequest, UserResponse
 from backend.application.dtos.api_response import APIResponse
 from backend.application.email.email import EmailGateway
-import redis.asyncio as redis
+from backend.application.email.templates import build_account_created_email
+from backend.application.password_hasher.password_hasher import PasswordHasher
+from backend.application.token_store.token_store import PasswordResetTokenStore
 
 logger = logging.getLogger(__name__)
 
 class CreateUserUseCase:
-    def __init__(self, repository: UserRepository, email_gateway: EmailGateway, redis_client: redis.Redis):
+    def __init__(self, repository: UserRepository, email_gateway: EmailGateway, token_store: PasswordResetTokenStore,
+                 password_hasher: PasswordHasher):
         self._repository = repository
+        self._password_hasher = password_hasher
         self._email_gateway = email_gateway
-        self._redis_client = redis_client
+        self._token_store = token_store
         self._base_url = os.getenv("BASE_URL", "http://localhost:8000")
 
     async def execute(self, request_dto: CreateUserRequest, created_by_user_id: int) -> APIResponse[UserResponse]:
@@ -47,8 +50,7 @@ class CreateUserUseCase:
             temp_password = ''.join(secrets.choice(alphabet) for _ in range(temp_password_length))
             print(f"Temporary password generated for {request_dto.username}: {temp_password}")
 
-            password_hash_bytes = bcrypt.hashpw(temp_password.encode('utf-8'), bcrypt.gensalt())
-            password_hash_str = password_hash_bytes.decode('utf-8')
+            password_hash_str = await self._password_hasher.hash(temp_password)
             hashed_password_vo = HashedPassword(value=password_hash_str)
 
             new_user_entity = CoreUser(
@@ -62,31 +64,11 @@ class CreateUserUseCase:
 
             saved_user_entity = await self._repository.save(new_user_entity, created_by_user_id=created_by_user_id)
 
-            reset_token = secrets.token_urlsafe(32)
-            redis_key = f"reset_token:{reset_token}"
-            user_id_str = str(saved_user_entity.id)
-            token_ttl_seconds = 3600
-
-            await self._redis_client.setex(redis_key, token_ttl_seconds, user_id_str)
+            reset_token = (await self._token_store.issue_many([saved_user_entity.id]))[0]
 
             reset_link = f"{self._base_url}/api/v1/auth/reset-password?token={reset_token}"
 
-            email_subject = "Set Your Password for DocuGenius-AI"
-            email_body = f"""
-            Hello {request_dto.username},
-
-            An account has been created for you on DocuGenius-AI.
-            Please click the link below to set your password:
-
-            {reset_link}
-
-            This link will expire in 1 hour.
-
-            If you did not request this, please ignore this email.
-
-            Best regards,
-            DocuGenius-AI Team
-            """
+            email_subject, email_body = build_account_created_email(request_dto.username, reset_link)
 
             email_sent_success = await self._email_gateway.send_email(
                 to_email=request_dto.email,
@@ -1,9 +1,11 @@
 from backend.application.repositories.user_repository import UserRepository
+from backend.application.cache.user_cache import UserCache
 from backend.application.dtos.api_response import APIResponse
 
 class DeleteUserUseCase:
-    def __init__(self, repository: UserRepository):
+    def __init__(self, repository: UserRepository, user_cache: UserCache):
         self._repository = repository
+        self._user_cache = user_cache
 
     async def execute(self, user_id: int) -> APIResponse[bool]:
         try:
@@ -18,6 +20,7 @@ class DeleteUserUseCase:
                 )
 
             success = await self._repository.delete(user_id)
+            await self._user_cache.invalidate(user_id)
 
             if success:
                 return APIResponse[bool](
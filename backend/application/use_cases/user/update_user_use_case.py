@@ -1,11 +1,13 @@
 from backend.application.repositories.user_repository import UserRepository
+from backend.application.cache.user_cache import UserCache
 from backend.core.models.user import User as CoreUser
 from backend.application.dtos.user import UpdateUserRequest, UserResponse
 from backend.application.dtos.api_response import APIResponse
 
 class UpdateUserUseCase:
-    def __init__(self, repository: UserRepository):
+    def __init__(self, repository: UserRepository, user_cache: UserCache):
         self._repository = repository
+        self._user_cache = user_cache
 
     async def execute(self, user_id: int, request_dto: UpdateUserRequest, updated_by_user_id: int) -> APIResponse[UserResponse]:
         try:
@@ -57,6 +59,7 @@ class UpdateUserUseCase:
             )
 
             saved_user_entity = await self._repository.update(updated_user_entity, updated_by_user_id=updated_by_user_id)
+            await self._user_cache.invalidate(user_id)
 
             if saved_user_entity is None:
                  return APIResponse[UserResponse](
@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+from backend.application.ai_gateway.ai_gateway import AIGateway, AIGatewayError
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.infrastructure.gateways.resilient_ai_gateway import ResilientAIGateway
+
+
+class FakeUpstream(AIGateway):
+    def __init__(self, providers: Dict[str, float], slow_rate: float, slow_seconds: float, error_rate: float):
+        self.providers = providers
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.error_rate = error_rate
+        self.calls = 0
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        self.calls += 1
+        provider = request.model.split(":", 1)[-1]
+        latency = random.uniform(0.5, 1.5) * self.providers[provider]
+        if random.random() < self.slow_rate:
+            latency += self.slow_seconds
+        await asyncio.sleep(latency)
+        if random.random() < self.error_rate:
+            raise AIGatewayError(f"503 from {provider}", retryable=True)
+        return InferenceResponse(generated_text=f"served by {provider}")
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run(label: str, gateway: AIGateway, requests: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                await gateway.generate_text(InferenceRequest(model="benchmark/model:primary", prompt="Say hello."))
+            except AIGatewayError:
+                errors += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    await asyncio.gather(*[one() for _ in range(requests)])
+    print(f"{label:>10}: p50 {percentile(latencies, 0.50) * 1000:7.1f}ms | p95 {percentile(latencies, 0.95) * 1000:7.1f}ms | "
+          f"p99 {percentile(latencies, 0.99) * 1000:7.1f}ms | errors {errors}/{requests}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Tail latency of direct vs. retried and hedged AI calls against a fake upstream.")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--base-ms", type=float, default=100.0)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=float, default=2000.0)
+    parser.add_argument("--error-rate", type=float, default=0.03)
+    args = parser.parse_args()
+
+    random.seed(7)
+    providers = {"primary": args.base_ms / 1000, "secondary": args.base_ms * 1.3 / 1000}
+    upstream = FakeUpstream(providers, args.slow_rate, args.slow_ms / 1000, args.error_rate)
+
+    await run("direct", upstream, args.requests, args.concurrency)
+    direct_calls, upstream.calls = upstream.calls, 0
+
+    gateway = ResilientAIGateway(
+        inner=upstream,
+        fallback_providers=["secondary"],
+        base_backoff_seconds=0.05,
+        hedge_min_samples=20,
+        default_hedge_delay_seconds=args.base_ms * 3 / 1000,
+    )
+    await run("resilient", gateway, args.requests, args.concurrency)
+    print(f"upstream calls: direct {direct_calls} | resilient {upstream.calls}")
+    print(f"gateway stats: {gateway.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
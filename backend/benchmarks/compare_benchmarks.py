@@ -0,0 +1,104 @@
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Compares two runs of the micro-benchmark suite stored by pytest-benchmark. Record a run per commit with:
+#
+#   python -m pytest backend/tests/benchmarks --benchmark-only --benchmark-autosave --benchmark-storage=.benchmarks
+#
+# then, after the next commit's run:
+#
+#   python -m backend.benchmarks.compare_benchmarks --threshold 10
+#
+# Every autosaved file carries the commit it was run on, so --baseline and --candidate take a commit prefix.
+# The command exits with status 1 when any benchmark got slower than the threshold, so that CI can gate on it.
+
+
+@dataclass
+class BenchmarkRun:
+    path: Path
+    commit: str
+    dirty: bool
+    datetime: str
+    stats: Dict[str, Dict[str, float]]
+
+    @property
+    def label(self) -> str:
+        return f"{self.commit[:10]}{' (dirty)' if self.dirty else ''} at {self.datetime}"
+
+
+def load_runs(storage: Path) -> List[BenchmarkRun]:
+    runs = []
+    for path in storage.rglob("*.json"):
+        saved = json.loads(path.read_text())
+        commit_info = saved.get("commit_info", {})
+        runs.append(BenchmarkRun(
+            path=path,
+            commit=commit_info.get("id") or "unknown",
+            dirty=bool(commit_info.get("dirty")),
+            datetime=saved.get("datetime", ""),
+            stats={benchmark["fullname"]: benchmark["stats"] for benchmark in saved.get("benchmarks", [])},
+        ))
+    return sorted(runs, key=lambda run: run.datetime)
+
+
+def select_run(runs: List[BenchmarkRun], commit: Optional[str]) -> Optional[BenchmarkRun]:
+    matching = [run for run in runs if commit is None or run.commit.startswith(commit)]
+    return matching[-1] if matching else None
+
+
+def compare(baseline: BenchmarkRun, candidate: BenchmarkRun, stat: str, threshold: float) -> List[str]:
+    regressions = []
+    print(f"baseline:  {baseline.label}\ncandidate: {candidate.label}\n")
+    print(f"{'benchmark':<80} | {'baseline':>12} | {'candidate':>12} | {'change':>8} |")
+    for fullname in sorted(set(baseline.stats) | set(candidate.stats)):
+        name = fullname.rsplit("/", 1)[-1]
+        if fullname not in baseline.stats or fullname not in candidate.stats:
+            print(f"{name:<80} | {'-':>12} | {'-':>12} | {'-':>8} | {'new' if fullname in candidate.stats else 'removed'}")
+            continue
+        before = baseline.stats[fullname][stat]
+        after = candidate.stats[fullname][stat]
+        change = (after - before) / before * 100 if before else 0.0
+        verdict = ""
+        if change > threshold:
+            verdict = "REGRESSION"
+            regressions.append(fullname)
+        elif change < -threshold:
+            verdict = "improved"
+        print(f"{name:<80} | {before * 1e6:>10.1f}us | {after * 1e6:>10.1f}us | {change:>+7.1f}% | {verdict}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Flag micro-benchmark regressions between two stored runs.")
+    parser.add_argument("--storage", type=Path, default=Path(".benchmarks"))
+    parser.add_argument("--baseline", help="Commit prefix of the baseline run. Defaults to the latest run of another "
+                                           "commit, or the previous run when all runs share a commit.")
+    parser.add_argument("--candidate", help="Commit prefix of the run to check. Defaults to the latest run.")
+    parser.add_argument("--stat", default="median", choices=["min", "mean", "median"])
+    parser.add_argument("--threshold", type=float, default=10.0, help="Slowdown, in percent, reported as a regression.")
+    args = parser.parse_args()
+
+    runs = load_runs(args.storage)
+    candidate = select_run(runs, args.candidate)
+    if candidate is None:
+        sys.exit(f"No stored benchmark run found in {args.storage} for candidate {args.candidate or '(latest)'}.")
+    earlier_runs = [run for run in runs if run.path != candidate.path]
+    baseline = select_run(earlier_runs, args.baseline) if args.baseline else (
+        select_run([run for run in earlier_runs if run.commit != candidate.commit], None) or select_run(earlier_runs, None)
+    )
+    if baseline is None:
+        sys.exit(f"No stored benchmark run found in {args.storage} to compare {candidate.label} against.")
+
+    regressions = compare(baseline, candidate, args.stat, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0f}% ({args.stat}).")
+        sys.exit(1)
+    print(f"\nNo benchmark regressed by more than {args.threshold:.0f}% ({args.stat}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+
+# Drives the running app end to end. A typical local setup, with Redis from docker-compose.example.yml:
+#
+#   python -m backend.benchmarks.fake_openai_server --first-token-median-ms 300 --error-rate 0.02 &
+#   DATABASE_URL=sqlite+aiosqlite:///./loadtest.db HF_OPENAI_BASE_URL=http://127.0.0.1:8090/v1 HF_API_TOKEN=fake \
+#     STORAGE_BACKEND=LOCAL RATE_LIMIT_ENABLED=false uvicorn backend.main:app --port 8000 &
+#   python -m backend.benchmarks.end_to_end_load --base-url http://127.0.0.1:8000 --users 20 --duration 60
+#
+# MySQL works the same way with DATABASE_URL pointing at the db service of docker-compose.example.yml.
+
+SCENARIO_WEIGHTS = {"login": 1, "list": 5, "suggest": 2, "generate": 2, "download": 2}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+class LoadTestResults:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, endpoint: str, started_at: float, response: Optional[httpx.Response], error: Optional[str] = None) -> bool:
+        self.latencies[endpoint].append(time.perf_counter() - started_at)
+        if response is None:
+            self.errors[endpoint][error or "transport"] += 1
+            return False
+        if response.status_code >= 400:
+            self.errors[endpoint][str(response.status_code)] += 1
+            return False
+        if response.headers.get("content-type", "").startswith("application/json"):
+            payload = response.json()
+            if isinstance(payload, dict) and payload.get("success") is False:
+                self.errors[endpoint][payload.get("error_code") or "unsuccessful"] += 1
+                return False
+        return True
+
+    def report(self, elapsed_seconds: float) -> None:
+        print(f"{'endpoint':>10} | {'requests':>8} | {'req/s':>7} | {'p50 ms':>8} | {'p95 ms':>8} | {'p99 ms':>8} | {'errors':>7} | breakdown")
+        for endpoint in SCENARIO_WEIGHTS:
+            latencies = self.latencies.get(endpoint, [])
+            if not latencies:
+                continue
+            failed = sum(self.errors[endpoint].values())
+            print(f"{endpoint:>10} | {len(latencies):>8} | {len(latencies) / elapsed_seconds:>7.2f} | "
+                  f"{percentile(latencies, 0.50) * 1000:>8.1f} | {percentile(latencies, 0.95) * 1000:>8.1f} | "
+                  f"{percentile(latencies, 0.99) * 1000:>8.1f} | {failed / len(latencies) * 100:>6.1f}% | "
+                  f"{dict(self.errors[endpoint]) or '-'}")
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace, document_type_id: int,
+                 admin_token: str, results: LoadTestResults, rng: random.Random):
+        self._client = client
+        self._args = args
+        self._document_type_id = document_type_id
+        self._admin_headers = {"Authorization": f"Bearer {admin_token}"}
+        self._user_headers: Dict[str, str] = {}
+        self._results = results
+        self._rng = rng
+        self._generated: List[str] = []
+
+    async def _call(self, endpoint: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started_at = time.perf_counter()
+        try:
+            response = await self._client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self._results.record(endpoint, started_at, None, type(e).__name__)
+            return None
+        return response if self._results.record(endpoint, started_at, response) else None
+
+    async def login(self) -> None:
+        response = await self._call("login", "POST", "/api/v1/auth/login",
+                                    json={"identifier": self._args.user, "password": self._args.user_password})
+        if response is not None:
+            self._user_headers = {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+    async def list(self) -> None:
+        await self._call("list", "GET", "/api/v1/user/document-types/with-fields", params={"page": 1, "size": 10},
+                         headers=self._user_headers)
+
+    async def suggest(self) -> None:
+        # Unique names bypass the field-suggestion cache so that every call reaches the model.
+        name = f"Load Test Type {uuid.uuid4().hex[:8]}" if self._args.unique_suggestions else "Load Test Type"
+        await self._call("suggest", "POST", "/api/v1/admin/document-fields/suggest", headers=self._admin_headers,
+                         json={"document_type_name": name, "document_type_description": "Contract used for load testing."})
+
+    async def generate(self) -> None:
+        response = await self._call("generate", "POST", "/api/v1/user/document-types/generate-document",
+                                    headers=self._user_headers, json={
+                                        "document_type_id": self._document_type_id,
+                                        "filled_fields": {"Client Name": "ACME Corp.", "Contract Value": 15000},
+                                    })
+        if response is not None:
+            self._generated.append(response.json()["data"]["location_identifier"])
+
+    async def download(self) -> None:
+        if not self._generated:
+            return await self.generate()
+        location_identifier = self._rng.choice(self._generated)
+        await self._call("download", "GET", f"/api/v1/user/documents/download/{location_identifier}",
+                         headers=self._user_headers)
+
+    async def run(self, deadline: float) -> None:
+        await self.login()
+        scenarios, weights = zip(*SCENARIO_WEIGHTS.items())
+        while time.perf_counter() < deadline:
+            scenario = self._rng.choices(scenarios, weights)[0]
+            await getattr(self, scenario)()
+            if self._args.think_ms:
+                await asyncio.sleep(self._rng.uniform(0, 2 * self._args.think_ms) / 1000)
+
+
+async def login(client: httpx.AsyncClient, identifier: str, password: str) -> str:
+    response = await client.post("/api/v1/auth/login", json={"identifier": identifier, "password": password})
+    response.raise_for_status()
+    return response.json()["data"]["access_token"]
+
+
+async def create_document_type(client: httpx.AsyncClient, admin_token: str) -> int:
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = await client.post("/api/v1/admin/document-types/", headers=headers, json={
+        "name": f"Load Test Contract {uuid.uuid4().hex[:8]}",
+        "description": "Service contract used by the end-to-end load test.",
+    })
+    response.raise_for_status()
+    document_type_id = response.json()["data"]["id"]
+    for name, field_type in (("Client Name", "text"), ("Contract Value", "decimal")):
+        response = await client.post("/api/v1/admin/document-fields/", headers=headers, json={
+            "document_type_id": document_type_id, "name": name, "field_type": field_type, "is_required": True,
+        })
+        response.raise_for_status()
+    return document_type_id
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end load test of login, list, suggest, generate and download.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+    parser.add_argument("--think-ms", type=float, default=100.0, help="Mean pause between a user's requests.")
+    parser.add_argument("--admin", default="admin")
+    parser.add_argument("--admin-password", required=True)
+    parser.add_argument("--user", default="common")
+    parser.add_argument("--user-password", required=True)
+    parser.add_argument("--unique-suggestions", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=args.users * 2, max_keepalive_connections=args.users * 2)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        admin_token = await login(client, args.admin, args.admin_password)
+        document_type_id = await create_document_type(client, admin_token)
+
+        results = LoadTestResults()
+        started_at = time.perf_counter()
+        deadline = started_at + args.duration
+        await asyncio.gather(*[
+            VirtualUser(client, args, document_type_id, admin_token, results, random.Random(args.seed + index)).run(deadline)
+            for index in range(args.users)
+        ])
+        elapsed_seconds = time.perf_counter() - started_at
+
+    print(f"{args.users} users for {elapsed_seconds:.1f}s against {args.base_url}")
+    results.report(elapsed_seconds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,176 @@
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from backend.application.prompt_builder import estimate_tokens
+
+# Stand-in for the Hugging Face OpenAI-compatible router, for load tests that must not spend real quota.
+# Point the app at it with HF_OPENAI_BASE_URL=http://127.0.0.1:8090/v1 (any HF_API_TOKEN works).
+
+DOCUMENT_TYPES_RESPONSE = {"suggested_document_types": [
+    {"name": "Service Contract", "description": "Agreement for services provided to clients."},
+    {"name": "Commercial Proposal", "description": "Offer sent to prospective clients."},
+    {"name": "Invoice", "description": "Bill sent to clients for services rendered."},
+]}
+
+DOCUMENT_FIELDS = [
+    {"name": "Contracting Company", "type": "text", "required": True, "description": "Legal name of the client."},
+    {"name": "Service Description", "type": "textarea", "required": True, "description": "Scope of the services."},
+    {"name": "Contract Value", "type": "decimal", "required": True, "description": "Total value of the contract."},
+    {"name": "Start Date", "type": "date", "required": True, "description": "When the services start."},
+    {"name": "Notes", "type": "textarea", "required": False, "description": "Additional terms or remarks."},
+]
+
+CONTENT_PARAGRAPH = ("The parties identified above agree to the terms set out in this document, which shall be "
+                     "interpreted in good faith and in accordance with the applicable law. ")
+
+
+@dataclass
+class FakeLLMConfig:
+    first_token_median_ms: float = 300.0
+    first_token_sigma: float = 0.5
+    token_ms: float = 5.0
+    content_tokens: int = 400
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    seed: int = 7
+
+
+def user_prompt_value(messages: List[dict], label: str) -> str:
+    user_prompt = next((message["content"] for message in reversed(messages) if message["role"] == "user"), "")
+    for line in user_prompt.splitlines():
+        if line.startswith(f"{label}: "):
+            return line.split(": ", 1)[1]
+    return ""
+
+
+def canned_completion(messages: List[dict], config: FakeLLMConfig) -> str:
+    system_prompt = " ".join(message["content"] for message in messages if message["role"] == "system")
+    if "suggested_document_types" in system_prompt:
+        return json.dumps(DOCUMENT_TYPES_RESPONSE)
+    if '"fields"' in system_prompt:
+        return json.dumps({
+            "document_type": user_prompt_value(messages, "Document type"),
+            "description": user_prompt_value(messages, "Description"),
+            "fields": DOCUMENT_FIELDS,
+        })
+    repeats = max(1, math.ceil(config.content_tokens / estimate_tokens(CONTENT_PARAGRAPH)))
+    return f"{user_prompt_value(messages, 'Document type') or 'Document'}\n\n" + CONTENT_PARAGRAPH * repeats
+
+
+def split_into_tokens(text: str) -> List[str]:
+    return [text[i:i + 4] for i in range(0, len(text), 4)]
+
+
+def create_app(config: FakeLLMConfig) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI-compatible LLM")
+    counters: Dict[str, int] = {"requests": 0, "streams": 0, "errors": 0, "rate_limited": 0, "completion_tokens": 0}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        counters["requests"] += 1
+        # Seeded per request so that a run with the same seed and request order is reproducible.
+        rng = random.Random(f"{config.seed}:{counters['requests']}")
+        first_token_seconds = rng.lognormvariate(math.log(config.first_token_median_ms / 1000), config.first_token_sigma)
+
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            counters["rate_limited"] += 1
+            return JSONResponse({"error": {"message": "Rate limit reached.", "type": "rate_limit"}}, status_code=429)
+        if roll < config.rate_limit_rate + config.error_rate:
+            await asyncio.sleep(first_token_seconds)
+            counters["errors"] += 1
+            return JSONResponse({"error": {"message": "Injected upstream failure.", "type": "server_error"}}, status_code=503)
+
+        messages = body.get("messages", [])
+        content = canned_completion(messages, config)
+        tokens = split_into_tokens(content)
+        prompt_tokens = sum(estimate_tokens(message.get("content", "")) for message in messages)
+        counters["completion_tokens"] += len(tokens)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = body.get("model", "fake-model")
+
+        if not body.get("stream"):
+            await asyncio.sleep(first_token_seconds + len(tokens) * config.token_ms / 1000)
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(tokens),
+                          "total_tokens": prompt_tokens + len(tokens)},
+            }
+
+        counters["streams"] += 1
+
+        async def events() -> AsyncIterator[str]:
+            await asyncio.sleep(first_token_seconds)
+            for token in tokens:
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+                await asyncio.sleep(config.token_ms / 1000)
+            done = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            }
+            yield f"data: {json.dumps(done)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def stats():
+        return counters
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in for the Hugging Face router.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--first-token-median-ms", type=float, default=300.0)
+    parser.add_argument("--first-token-sigma", type=float, default=0.5, help="Sigma of the lognormal time to first token.")
+    parser.add_argument("--token-ms", type=float, default=5.0, help="Delay between streamed tokens.")
+    parser.add_argument("--content-tokens", type=int, default=400, help="Approximate length of generated documents.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 503.")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests failing with 429.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(
+        first_token_median_ms=args.first_token_median_ms,
+        first_token_sigma=args.first_token_sigma,
+        token_ms=args.token_ms,
+        content_tokens=args.content_tokens,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
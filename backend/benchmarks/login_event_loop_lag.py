@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List, Optional
+
+import bcrypt
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "benchmark-refresh-secret")
+
+from backend.application.dtos.auth_dtos import LoginUserRequest
+from backend.application.password_hasher.password_hasher import PasswordHasher
+from backend.application.use_cases.auth.login_user_use_case import LoginUserUseCase
+from backend.core.enums.user_role_enum import UserRole
+from backend.core.models.user import User
+from backend.core.value_objects.hashed_password import HashedPassword
+from backend.infrastructure.password_hasher.bcrypt_password_hasher import BcryptPasswordHasher
+
+PASSWORD = "benchmark-password"
+
+
+class InlineBcryptPasswordHasher(PasswordHasher):
+    def __init__(self, rounds: int):
+        self._rounds = rounds
+
+    async def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self._rounds)).decode('utf-8')
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+class InMemoryUserRepository:
+    def __init__(self, user: User):
+        self._user = user
+
+    async def find_by_identifier(self, identifier: str) -> Optional[User]:
+        return self._user if identifier in (self._user.username, self._user.email) else None
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval_seconds: float, lags: List[float]) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + interval_seconds
+        await asyncio.sleep(interval_seconds)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run_scenario(name: str, hasher: PasswordHasher, user: User, concurrency: int) -> None:
+    use_case = LoginUserUseCase(user_repository=InMemoryUserRepository(user), password_hasher=hasher)
+    request_dto = LoginUserRequest(identifier=user.username, password=PASSWORD)
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(measure_loop_lag(stop, 0.005, lags))
+    await asyncio.sleep(0.02)
+
+    started_at = time.perf_counter()
+    responses = await asyncio.gather(*[use_case.execute(request_dto) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started_at
+
+    stop.set()
+    await sampler
+
+    failures = sum(1 for response in responses if not response.success)
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(f"{name:>8}: {concurrency} logins in {elapsed:6.2f}s | loop lag max {lags_ms[-1]:8.1f} ms, "
+          f"p99 {p99:8.1f} ms, median {statistics.median(lags_ms):6.1f} ms | failures {failures}")
+    if isinstance(hasher, BcryptPasswordHasher):
+        print(f"{'':>8}  hasher stats: {hasher.stats()}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Event-loop lag during concurrent logins.")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    user = User(
+        id=1,
+        username="benchmark",
+        email="benchmark@docugeniusai.local",
+        hashed_password=HashedPassword(
+            value=bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt(rounds=args.rounds)).decode('utf-8')
+        ),
+        role=UserRole.COMMON_USER,
+        is_active=True,
+    )
+
+    await run_scenario("inline", InlineBcryptPasswordHasher(rounds=args.rounds), user, args.concurrency)
+    await run_scenario("pooled", BcryptPasswordHasher(max_concurrency=args.workers, rounds=args.rounds), user, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "benchmark-refresh-secret")
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.application.dtos.auth_dtos import LoginUserRequest
+from backend.application.use_cases.auth.login_user_use_case import LoginUserUseCase
+from backend.core.enums.user_role_enum import UserRole
+from backend.core.models.user import User
+from backend.core.value_objects.hashed_password import HashedPassword
+from backend.infrastructure.models.base import Base
+from backend.infrastructure.password_hasher.bcrypt_password_hasher import BcryptPasswordHasher
+from backend.infrastructure.repositories.mysql_user_repository import MySqlUserRepository
+
+PASSWORD = "benchmark-password"
+
+
+class LegacyLookupUserRepository(MySqlUserRepository):
+    async def find_by_identifier(self, identifier: str):
+        user = await self.find_by_username(identifier)
+        if not user:
+            user = await self.find_by_email(identifier)
+        return user
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Queries per login for username and email identifiers (requires aiosqlite).")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--logins", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    statement_count = [0]
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda *_: statement_count.__setitem__(0, statement_count[0] + 1))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    password_hasher = BcryptPasswordHasher(max_concurrency=1, rounds=4)
+
+    async with session_factory() as session:
+        await MySqlUserRepository(session).save(User(
+            id=None,
+            username="benchmark",
+            email="benchmark@docugeniusai.local",
+            hashed_password=HashedPassword(value=await password_hasher.hash(PASSWORD)),
+            role=UserRole.COMMON_USER,
+            is_active=True,
+        ))
+
+    for repository_class in (LegacyLookupUserRepository, MySqlUserRepository):
+        for identifier in ("benchmark", "benchmark@docugeniusai.local"):
+            async with session_factory() as session:
+                use_case = LoginUserUseCase(user_repository=repository_class(session), password_hasher=password_hasher)
+                request_dto = LoginUserRequest(identifier=identifier, password=PASSWORD)
+
+                statement_count[0] = 0
+                started_at = time.perf_counter()
+                for _ in range(args.logins):
+                    response = await use_case.execute(request_dto)
+                    assert response.success, response.errors
+                elapsed = time.perf_counter() - started_at
+
+            print(f"{repository_class.__name__:>28} | {identifier:>30} | "
+                  f"{statement_count[0] / args.logins:.1f} queries/login | {elapsed / args.logins * 1000:6.2f} ms/login")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
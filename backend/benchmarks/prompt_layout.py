@@ -0,0 +1,184 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+from backend.application.prompt_builder import BuiltPrompt, build_document_content_prompt, build_document_fields_prompt, \
+    build_document_types_prompt, estimate_tokens
+
+# Single-message templates used before prompts were split into a static system prefix and a per-request user message.
+LEGACY_GENERATE_DOCUMENT_TYPES_PROMPT = """
+You are an expert in business processes and document management. Based on the description of a business or sector, suggest a list of common and essential document types used within that field.
+
+Business Description: {business_description_input}
+
+Respond ONLY with a structured JSON object in the following format. Do not include any introductory text, explanations, or concluding remarks before or after the JSON block.
+
+{{
+  "suggested_document_types": [
+    {{
+      "name": "Document Type Name", // e.g., "Service Contract", "Commercial Proposal", "Employment Agreement". Use clear, business-appropriate terminology.
+      "description": "A brief description of the document type and its purpose within the business context." // e.g., "Template for standard service agreements between the company and its clients."
+    }}    
+  ]
+}}
+
+Ensure the suggestions are relevant, specific to the business type described, and cover core operational or administrative needs.
+"""
+
+LEGACY_GENERATE_DOCUMENT_FIELDS_PROMPT = """
+You are an expert in document structure and business processes.
+Given a document type, identify and list the essential fields required to define that document.
+These fields will be used to dynamically generate an HTML form for users to fill out.
+
+The document type is: {document_type_name}
+Description: {document_type_description}
+
+IMPORTANT: Respond ONLY with the structured JSON data, nothing else. Do not add any introductory text, explanations, or concluding remarks before or after the JSON block. Only return the JSON object itself.
+
+{{
+  "document_type": "{document_type_name}",
+  "description": "{document_type_description}",
+  "fields": [
+    {{
+      "name": "field_identifier", // e.g., "Contracting Company", "Service Value", "Start Date". Use readable format with spaces and capitalization suitable for labels.
+      "type": "html_input_type", // Use ONE OF THE FOLLOWING EXACT VALUES: "text", "email", "integer", "decimal", "date", "checkbox", "textarea", "select", "radio", "password", "tel", "url", "search", "range", "color", "hidden", "file".
+                                  // Use "textarea" for fields that will hold longer, multi-line text (e.g., descriptions, notes, terms, addresses with multiple lines).
+                                  // Use "text" for shorter, single-line text (e.g., names, codes, simple identifiers).
+                                  // For numbers: use "integer" for whole numbers (e.g., number of employees) and "decimal" for numbers with fractional parts (e.g., monetary values, percentages).
+                                  // These special "integer" and "decimal" types will be mapped to HTML <input type="number"> with appropriate "step" attributes in the frontend.
+      "required": true/false, // Boolean, true if mandatory, false if optional
+      "description": "Short explanation of the field's purpose. If this description implies a long or multi-line text input, use 'textarea' for the type."
+    }}    
+  ]
+}}
+
+For numeric fields, use "integer" for whole numbers and "decimal" for numbers with fractional parts, instead of the generic "number" type. The frontend will map "integer" to <input type="number" step="1"> and "decimal" to <input type="number" step="0.01"> (or similar precision).
+For fields that are expected to contain longer, multi-line text (like detailed descriptions, notes, terms, comments), ALWAYS use "type": "textarea". Consider the field's "description" to determine if it's likely to hold substantial text. Use "type": "text" only for short, single-line inputs.
+"""
+
+LEGACY_GENERATE_DOCUMENT_CONTENT_PROMPT = """
+You are an expert in drafting professional documents.
+Generate the complete content for a document of type '{document_type_name}' described as: '{document_type_description}'.
+Use the following field values provided by the user to populate the document:
+
+{filled_fields_json}
+
+Structure the document appropriately (e.g., title, sections, clauses, signature blocks), incorporating the provided data accurately and professionally.
+Ensure the generated text is coherent, follows a logical flow, and adheres to standard conventions for this type of document.
+If certain information is missing or marked as optional but impacts the structure, generate placeholder text or a standard clause indicating its absence (e.g., "[Optional clause not provided]" or "Standard terms apply unless otherwise specified").
+Focus on clarity, correctness, and relevance to the field values given.
+"""
+
+DOCUMENT_TYPE_NAME = "Service Contract"
+DOCUMENT_TYPE_DESCRIPTION = "Standard template for service contracts between parties for service provision."
+BUSINESS_DESCRIPTIONS = [
+    "Law firm specialized in labor law.",
+    "Small bakery with two stores and a catering service.",
+    "Software consultancy building CRM integrations for retailers.",
+    "Dental clinic with four practitioners.",
+]
+
+
+def make_filled_fields(count: int) -> Dict[str, object]:
+    fields: Dict[str, object] = {
+        "Contracting Company": "TechSolutions Inc.",
+        "Service Provider": "AnotherParty Corp.",
+        "Service Description": "CRM Development",
+        "Contract Value": "$15,000",
+        "Execution Period": "6 months",
+        "Notice Period Days": 30,
+        "Penalty Percentage": 20,
+    }
+    for index in range(len(fields), count):
+        fields[f"Additional Clause {index}"] = f"The parties agree to obligation number {index} as described in annex {index}."
+    return fields
+
+
+def legacy_prompts(field_count: int, variant: int) -> Dict[str, BuiltPrompt]:
+    business_description = BUSINESS_DESCRIPTIONS[variant % len(BUSINESS_DESCRIPTIONS)]
+    document_type_name = f"{DOCUMENT_TYPE_NAME} {variant}"
+    return {
+        "types": BuiltPrompt("", LEGACY_GENERATE_DOCUMENT_TYPES_PROMPT.format(business_description_input=business_description)),
+        "fields": BuiltPrompt("", LEGACY_GENERATE_DOCUMENT_FIELDS_PROMPT.format(
+            document_type_name=document_type_name,
+            document_type_description=DOCUMENT_TYPE_DESCRIPTION,
+        )),
+        "content": BuiltPrompt("", LEGACY_GENERATE_DOCUMENT_CONTENT_PROMPT.format(
+            document_type_name=document_type_name,
+            document_type_description=DOCUMENT_TYPE_DESCRIPTION,
+            filled_fields_json=json.dumps(make_filled_fields(field_count), indent=2, ensure_ascii=False),
+        )),
+    }
+
+
+def built_prompts(field_count: int, variant: int) -> Dict[str, BuiltPrompt]:
+    business_description = BUSINESS_DESCRIPTIONS[variant % len(BUSINESS_DESCRIPTIONS)]
+    document_type_name = f"{DOCUMENT_TYPE_NAME} {variant}"
+    return {
+        "types": build_document_types_prompt(business_description),
+        "fields": build_document_fields_prompt(document_type_name, DOCUMENT_TYPE_DESCRIPTION),
+        "content": build_document_content_prompt(document_type_name, DOCUMENT_TYPE_DESCRIPTION, make_filled_fields(field_count)),
+    }
+
+
+# Charges prefill time per input token; tokens of a previously seen prefix are billed at a discount.
+class FakePrefixCachingUpstream:
+    def __init__(self, prefill_ms_per_token: float, cached_token_discount: float):
+        self.prefill_ms_per_token = prefill_ms_per_token
+        self.cached_token_discount = cached_token_discount
+        self._seen_prompts: List[str] = []
+
+    def _cached_chars(self, text: str) -> int:
+        longest = 0
+        for seen in self._seen_prompts:
+            common = os.path.commonprefix([seen, text])
+            longest = max(longest, len(common))
+        return longest
+
+    async def prefill(self, prompt: BuiltPrompt) -> Tuple[int, int]:
+        text = prompt.system_prompt + "\n" + prompt.user_prompt if prompt.system_prompt else prompt.user_prompt
+        cached_tokens = min(estimate_tokens(text[:self._cached_chars(text)]), prompt.estimated_tokens)
+        uncached_tokens = prompt.estimated_tokens - cached_tokens
+        self._seen_prompts.append(text)
+        cost_ms = (uncached_tokens + cached_tokens * (1 - self.cached_token_discount)) * self.prefill_ms_per_token
+        await asyncio.sleep(cost_ms / 1000)
+        return cached_tokens, uncached_tokens
+
+
+async def run(label: str, build: Callable[[int, int], Dict[str, BuiltPrompt]], field_count: int, requests: int,
+              upstream: FakePrefixCachingUpstream) -> Dict[str, float]:
+    tokens = cached = 0
+    started_at = time.perf_counter()
+    for variant in range(requests):
+        for prompt in build(field_count, variant).values():
+            cached_tokens, uncached_tokens = await upstream.prefill(prompt)
+            tokens += cached_tokens + uncached_tokens
+            cached += cached_tokens
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    print(f"{label:>8} | {field_count:>3} fields: {tokens / requests:7.1f} tokens/request | "
+          f"{cached / max(tokens, 1) * 100:5.1f}% prefix-cached | prefill {elapsed_ms / requests:6.1f}ms/request")
+    return {"tokens": tokens / requests, "latency_ms": elapsed_ms / requests}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Input tokens and modelled prefill latency of the legacy vs. cache-friendly prompt layout.")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--field-counts", type=int, nargs="+", default=[7, 25, 100])
+    parser.add_argument("--prefill-ms-per-token", type=float, default=0.05)
+    parser.add_argument("--cached-token-discount", type=float, default=0.9)
+    args = parser.parse_args()
+
+    for field_count in args.field_counts:
+        legacy = await run("legacy", legacy_prompts, field_count, args.requests,
+                           FakePrefixCachingUpstream(args.prefill_ms_per_token, args.cached_token_discount))
+        built = await run("builder", built_prompts, field_count, args.requests,
+                          FakePrefixCachingUpstream(args.prefill_ms_per_token, args.cached_token_discount))
+        print(f"{'':>8} | {field_count:>3} fields: tokens {(1 - built['tokens'] / legacy['tokens']) * 100:5.1f}% fewer | "
+              f"prefill {(1 - built['latency_ms'] / legacy['latency_ms']) * 100:5.1f}% faster")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
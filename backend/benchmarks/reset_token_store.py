@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import secrets
+import time
+
+import redis.asyncio as redis
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeAsyncRedisConnection
+
+from backend.infrastructure.redis.redis_token_store import RedisPasswordResetTokenStore
+
+
+class RoundTripCountingConnection(FakeAsyncRedisConnection):
+    round_trips = 0
+    round_trip_seconds = 0.0
+
+    async def send_packed_command(self, command, check_health=True):
+        RoundTripCountingConnection.round_trips += 1
+        # Emulates network latency to a real Redis; fakeredis itself answers in-process.
+        await asyncio.sleep(RoundTripCountingConnection.round_trip_seconds)
+        return await super().send_packed_command(command, check_health)
+
+
+class LegacyTokenFlow:
+    def __init__(self, redis_client: redis.Redis):
+        self._redis_client = redis_client
+
+    async def issue(self, user_id: int) -> str:
+        token = secrets.token_urlsafe(32)
+        await self._redis_client.setex(f"reset_token:{token}", 3600, str(user_id))
+        return token
+
+    async def consume(self, token: str):
+        user_id_str = await self._redis_client.get(f"reset_token:{token}")
+        if not user_id_str:
+            return None
+        # The user update happens here in ResetPasswordUseCase before the token is deleted.
+        await asyncio.sleep(0)
+        await self._redis_client.delete(f"reset_token:{token}")
+        return int(user_id_str)
+
+
+async def measure(label: str, flow, operations: int) -> None:
+    RoundTripCountingConnection.round_trips = 0
+    started_at = time.perf_counter()
+    tokens = [await flow.issue(user_id) for user_id in range(operations)]
+    issue_elapsed = time.perf_counter() - started_at
+    issue_round_trips = RoundTripCountingConnection.round_trips
+
+    RoundTripCountingConnection.round_trips = 0
+    started_at = time.perf_counter()
+    for token in tokens:
+        await flow.consume(token)
+    consume_elapsed = time.perf_counter() - started_at
+    consume_round_trips = RoundTripCountingConnection.round_trips
+
+    race_token = await flow.issue(10_000)
+    winners = sum(1 for user_id in await asyncio.gather(*[flow.consume(race_token) for _ in range(10)]) if user_id)
+
+    print(f"{label:>12} | issue {issue_round_trips / operations:.1f} RT/op {issue_elapsed / operations * 1000:6.2f} ms/op | "
+          f"consume {consume_round_trips / operations:.1f} RT/op {consume_elapsed / operations * 1000:6.2f} ms/op | "
+          f"10 concurrent consumes of one token succeeded {winners}x")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Password reset token issue/consume against fakeredis.")
+    parser.add_argument("--operations", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    RoundTripCountingConnection.round_trip_seconds = args.rtt_ms / 1000
+    pool = redis.ConnectionPool(connection_class=RoundTripCountingConnection, server=FakeServer(), decode_responses=True)
+    redis_client = redis.Redis(connection_pool=pool)
+
+    await measure("legacy", LegacyTokenFlow(redis_client), args.operations)
+    await measure("token store", RedisPasswordResetTokenStore(redis_client, max_issues_per_window=args.operations), args.operations)
+
+    await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
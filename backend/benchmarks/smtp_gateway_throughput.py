@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import os
+import smtplib
+import time
+from email.mime.text import MIMEText
+from typing import List
+
+from backend.application.email.email import OutgoingEmail
+
+
+class SMTPStandIn:
+    def __init__(self, session_setup_delay_seconds: float):
+        self.session_setup_delay_seconds = session_setup_delay_seconds
+        self.sessions = 0
+        self.messages = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.sessions += 1
+
+        async def reply(line: str) -> None:
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        await reply("220 stand-in ESMTP")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode().strip().upper()
+                if command.startswith("EHLO"):
+                    await reply("250-stand-in")
+                    await reply("250 AUTH PLAIN LOGIN")
+                elif command.startswith("HELO"):
+                    await reply("250 stand-in")
+                elif command.startswith("AUTH"):
+                    # Stands in for the TLS handshake and credential check of a real provider.
+                    await asyncio.sleep(self.session_setup_delay_seconds)
+                    await reply("235 Authentication successful")
+                elif command.startswith("DATA"):
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    while (await reader.readline()) not in (b".\r\n", b""):
+                        pass
+                    self.messages += 1
+                    await reply("250 OK")
+                elif command.startswith("QUIT"):
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("250 OK")
+        finally:
+            writer.close()
+
+
+def send_with_new_connection(host: str, port: int, email: OutgoingEmail) -> None:
+    server = smtplib.SMTP(host, port)
+    server.login("benchmark@docugeniusai.local", "password")
+    msg = MIMEText(email.body)
+    msg['Subject'] = email.subject
+    server.sendmail("benchmark@docugeniusai.local", email.to_email, msg.as_string())
+    server.quit()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Pooled SMTP gateway against a local SMTP stand-in.")
+    parser.add_argument("--emails", type=int, default=50)
+    parser.add_argument("--session-setup-ms", type=float, default=50.0)
+    parser.add_argument("--pool-size", type=int, default=2)
+    args = parser.parse_args()
+
+    stand_in = SMTPStandIn(session_setup_delay_seconds=args.session_setup_ms / 1000)
+    server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    os.environ.update({
+        "SMTP_SERVER": host,
+        "SMTP_PORT": str(port),
+        "EMAIL_ADDRESS": "benchmark@docugeniusai.local",
+        "EMAIL_PASSWORD": "password",
+        "SMTP_USE_STARTTLS": "false",
+        "SMTP_POOL_SIZE": str(args.pool_size),
+    })
+    from backend.infrastructure.email.smtp_email import SMTPEmailGateway
+
+    emails: List[OutgoingEmail] = [
+        OutgoingEmail(to_email=f"user{i}@docugeniusai.local", subject="Benchmark", body="Hello") for i in range(args.emails)
+    ]
+
+    async with server:
+        stand_in.sessions = stand_in.messages = 0
+        started_at = time.perf_counter()
+        for email in emails:
+            await asyncio.to_thread(send_with_new_connection, host, port, email)
+        elapsed = time.perf_counter() - started_at
+        print(f"connection per email: {args.emails} emails in {elapsed:6.2f}s | {stand_in.sessions} SMTP sessions")
+
+        gateway = SMTPEmailGateway()
+        for label, send in (
+            ("pooled send_email", lambda: asyncio.gather(*[gateway.send_email(e.to_email, e.subject, e.body) for e in emails])),
+            ("pooled send_emails", lambda: gateway.send_emails(emails)),
+        ):
+            stand_in.sessions = stand_in.messages = 0
+            started_at = time.perf_counter()
+            results = await send()
+            elapsed = time.perf_counter() - started_at
+            print(f"{label:>20}: {args.emails} emails in {elapsed:6.2f}s | {stand_in.sessions} new SMTP sessions | "
+                  f"{results.count(True)} delivered")
+        print(f"gateway stats: {gateway.stats()}")
+        await gateway.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,7 @@
+from enum import Enum
+
+class EmailOutboxStatus(Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
@@ -1,11 +1,14 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, List
+
+from backend.core.models.document_field import DocumentField
 
 @dataclass
 class DocumentType:
     id: Optional[int]
     name: str
     description: Optional[str] = None
+    fields: List[DocumentField] = field(default_factory=list)
 
     def __post_init__(self):
         if not self.name or not self.name.strip():
@@ -0,0 +1,29 @@
+import asyncio
+import os
+from typing import Optional
+from backend.infrastructure.ai_usage.batched_ai_usage_sink import BatchedAIUsageSink
+from backend.infrastructure.database.mysql_config import async_sessionmaker_instance
+
+AI_USAGE_ENABLED = os.getenv("AI_USAGE_ENABLED", "true").lower() == "true"
+
+ai_usage_sink = BatchedAIUsageSink(
+    session_factory=async_sessionmaker_instance,
+    batch_size=int(os.getenv("AI_USAGE_BATCH_SIZE", 200)),
+    flush_interval_seconds=float(os.getenv("AI_USAGE_FLUSH_INTERVAL_SECONDS", 5)),
+    max_buffered_records=int(os.getenv("AI_USAGE_MAX_BUFFERED_RECORDS", 10000)),
+)
+
+def get_ai_usage_sink() -> BatchedAIUsageSink:
+    return ai_usage_sink
+
+def start_ai_usage_sink() -> Optional[asyncio.Task]:
+    if not AI_USAGE_ENABLED:
+        return None
+    return asyncio.create_task(ai_usage_sink.run())
+
+async def close_ai_usage_sink() -> None:
+    if AI_USAGE_ENABLED:
+        await ai_usage_sink.close()
+
+def get_ai_usage_stats() -> dict:
+    return {"enabled": AI_USAGE_ENABLED, **ai_usage_sink.stats()}
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import case, func, insert, select
+from backend.application.ai_usage.ai_usage import AI_USAGE_GROUP_BY, AIUsageRecord, AIUsageSink
+from backend.infrastructure.models.ai_usage_model import AIUsageModel
+
+logger = logging.getLogger(__name__)
+
+class BatchedAIUsageSink(AIUsageSink):
+    def __init__(
+        self,
+        session_factory,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 5.0,
+        max_buffered_records: int = 10000,
+    ):
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_buffered_records = max_buffered_records
+        self._buffer: List[AIUsageRecord] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+
+    def record(self, usage_record: AIUsageRecord) -> None:
+        # Called on the request path: never awaits, and sheds records rather than grow without bound.
+        if len(self._buffer) >= self._max_buffered_records:
+            self.dropped += 1
+            return
+        self._buffer.append(usage_record)
+        self.recorded += 1
+        if len(self._buffer) >= self._batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        if not self._buffer:
+            return 0
+        batch, self._buffer = self._buffer[:self._batch_size], self._buffer[self._batch_size:]
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(AIUsageModel), [asdict(usage_record) for usage_record in batch])
+                await session.commit()
+        except Exception as e:
+            self.errors += 1
+            self.dropped += len(batch)
+            logger.warning(f"Failed to write {len(batch)} AI usage records: {e}")
+            return 0
+        self.batches += 1
+        self.written += len(batch)
+        return len(batch)
+
+    async def run(self) -> None:
+        self._wakeup = asyncio.Event()
+        while True:
+            self._wakeup.clear()
+            if len(self._buffer) < self._batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval_seconds)
+            await self.flush()
+
+    async def close(self) -> None:
+        while self._buffer and await self.flush():
+            pass
+
+    async def summarize(self, group_by: List[str], since: datetime) -> List[dict]:
+        invalid = [column for column in group_by if column not in AI_USAGE_GROUP_BY]
+        if invalid:
+            raise ValueError(f"Cannot group AI usage by {invalid}; expected any of {list(AI_USAGE_GROUP_BY)}.")
+
+        group_columns = [getattr(AIUsageModel, column) for column in group_by]
+        total_tokens = func.sum(AIUsageModel.prompt_tokens + AIUsageModel.completion_tokens)
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(
+                    *group_columns,
+                    func.count(AIUsageModel.id).label("calls"),
+                    func.sum(case((AIUsageModel.status != "ok", 1), else_=0)).label("failed_calls"),
+                    func.sum(AIUsageModel.prompt_tokens).label("prompt_tokens"),
+                    func.sum(AIUsageModel.completion_tokens).label("completion_tokens"),
+                    func.sum(AIUsageModel.latency_ms).label("total_latency_ms"),
+                    func.avg(AIUsageModel.latency_ms).label("avg_latency_ms"),
+                    func.max(AIUsageModel.latency_ms).label("max_latency_ms"),
+                    func.avg(AIUsageModel.time_to_first_token_ms).label("avg_time_to_first_token_ms"),
+                )
+                .where(AIUsageModel.created_at >= since)
+                .group_by(*group_columns)
+                .order_by(total_tokens.desc())
+            )
+            rows = result.mappings().all()
+
+        return [
+            {
+                **{column: row[column] for column in group_by},
+                "calls": row["calls"],
+                "failed_calls": int(row["failed_calls"] or 0),
+                "prompt_tokens": int(row["prompt_tokens"] or 0),
+                "completion_tokens": int(row["completion_tokens"] or 0),
+                "total_latency_ms": round(float(row["total_latency_ms"] or 0), 1),
+                "avg_latency_ms": round(float(row["avg_latency_ms"] or 0), 1),
+                "max_latency_ms": round(float(row["max_latency_ms"] or 0), 1),
+                "avg_time_to_first_token_ms": (
+                    round(float(row["avg_time_to_first_token_ms"]), 1)
+                    if row["avg_time_to_first_token_ms"] is not None else None
+                ),
+            }
+            for row in rows
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self._buffer),
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "errors": self.errors,
+        }
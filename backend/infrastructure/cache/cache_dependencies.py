@@ -0,0 +1,88 @@
+import os
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+from backend.infrastructure.cache.user_cache import TwoTierUserCache, NoOpUserCache
+from backend.infrastructure.cache.field_suggestion_cache import TwoTierFieldSuggestionCache, NoOpFieldSuggestionCache
+from backend.application.cache.user_cache import UserCache
+from backend.application.cache.field_suggestion_cache import FieldSuggestionCache
+from backend.infrastructure.database.mysql_dependencies import get_db_session
+from backend.infrastructure.redis.redis_dependencies import get_shared_redis_client
+from backend.infrastructure.repositories.cached_document_field_repository import CachedDocumentFieldRepository
+from backend.infrastructure.repositories.cached_document_type_repository import CachedDocumentTypeRepository
+from backend.infrastructure.repositories.mysql_document_field_repository import MySqlDocumentFieldRepository
+from backend.infrastructure.repositories.mysql_document_type_repository import MySqlDocumentTypeRepository
+from backend.infrastructure.tracing.tracing_dependencies import traced
+
+SCHEMA_CACHE_ENABLED = os.getenv("SCHEMA_CACHE_ENABLED", "true").lower() == "true"
+USER_CACHE_ENABLED = os.getenv("USER_CACHE_ENABLED", "true").lower() == "true"
+FIELD_SUGGESTION_CACHE_ENABLED = os.getenv("FIELD_SUGGESTION_CACHE_ENABLED", "true").lower() == "true"
+
+document_schema_cache = TwoTierCache(
+    namespace="docugenius:schema",
+    redis_client_provider=get_shared_redis_client,
+    local_cache=TTLLRUCache(
+        max_entries=int(os.getenv("SCHEMA_CACHE_LOCAL_MAX_ENTRIES", 1024)),
+        ttl_seconds=float(os.getenv("SCHEMA_CACHE_LOCAL_TTL_SECONDS", 30)),
+    ),
+    redis_ttl_seconds=int(os.getenv("SCHEMA_CACHE_REDIS_TTL_SECONDS", 300)),
+)
+
+authenticated_user_cache = TwoTierCache(
+    namespace="docugenius:auth_user",
+    redis_client_provider=get_shared_redis_client,
+    local_cache=TTLLRUCache(
+        max_entries=int(os.getenv("USER_CACHE_LOCAL_MAX_ENTRIES", 4096)),
+        ttl_seconds=float(os.getenv("USER_CACHE_LOCAL_TTL_SECONDS", 15)),
+    ),
+    redis_ttl_seconds=int(os.getenv("USER_CACHE_REDIS_TTL_SECONDS", 60)),
+)
+
+field_suggestion_cache = TwoTierFieldSuggestionCache(TwoTierCache(
+    namespace="docugenius:field_suggestions",
+    redis_client_provider=get_shared_redis_client,
+    local_cache=TTLLRUCache(
+        max_entries=int(os.getenv("FIELD_SUGGESTION_CACHE_LOCAL_MAX_ENTRIES", 256)),
+        ttl_seconds=float(os.getenv("FIELD_SUGGESTION_CACHE_LOCAL_TTL_SECONDS", 600)),
+    ),
+    redis_ttl_seconds=int(os.getenv("FIELD_SUGGESTION_CACHE_REDIS_TTL_SECONDS", 3600)),
+))
+
+def get_active_caches() -> list:
+    caches = []
+    if SCHEMA_CACHE_ENABLED:
+        caches.append(document_schema_cache)
+    if USER_CACHE_ENABLED:
+        caches.append(authenticated_user_cache)
+    return caches
+
+def get_user_cache() -> UserCache:
+    if not USER_CACHE_ENABLED:
+        return NoOpUserCache()
+    return TwoTierUserCache(authenticated_user_cache)
+
+def get_field_suggestion_cache() -> FieldSuggestionCache:
+    if not FIELD_SUGGESTION_CACHE_ENABLED:
+        return NoOpFieldSuggestionCache()
+    return field_suggestion_cache
+
+def get_cached_document_type_repository(session: AsyncSession = Depends(get_db_session)):
+    repository = traced(MySqlDocumentTypeRepository(session), "repository")
+    if not SCHEMA_CACHE_ENABLED:
+        return repository
+    return traced(CachedDocumentTypeRepository(repository, document_schema_cache), "repository")
+
+def get_cached_document_field_repository(session: AsyncSession = Depends(get_db_session)):
+    repository = traced(MySqlDocumentFieldRepository(session), "repository")
+    if not SCHEMA_CACHE_ENABLED:
+        return repository
+    return traced(CachedDocumentFieldRepository(repository, document_schema_cache), "repository")
+
+def get_cache_stats() -> dict:
+    return {
+        "document_schema": {"enabled": SCHEMA_CACHE_ENABLED, **document_schema_cache.stats()},
+        "authenticated_user": {"enabled": USER_CACHE_ENABLED, **authenticated_user_cache.stats()},
+        "field_suggestions": {"enabled": FIELD_SUGGESTION_CACHE_ENABLED, **field_suggestion_cache.stats()},
+    }
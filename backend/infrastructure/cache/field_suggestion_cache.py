@@ -0,0 +1,93 @@
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, Dict, Optional
+
+from backend.application.cache.field_suggestion_cache import FieldSuggestionCache
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsResponse
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+
+
+def field_suggestion_key(document_type_name: str, document_type_description: str) -> str:
+    normalized = f"{document_type_name.strip().casefold()}\n{document_type_description.strip()}"
+    return f"fields:{hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:32]}"
+
+def encode_suggestion(suggestion: GenerateDocumentFieldsResponse) -> dict:
+    return suggestion.model_dump(mode="json")
+
+def decode_suggestion(payload: dict) -> GenerateDocumentFieldsResponse:
+    return GenerateDocumentFieldsResponse.model_validate(payload)
+
+
+class TwoTierFieldSuggestionCache(FieldSuggestionCache):
+    def __init__(self, cache: TwoTierCache):
+        self._cache = cache
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+
+        self.joined_in_flight = 0
+        self.abandoned_loads = 0
+
+    async def get(self, document_type_name: str, document_type_description: str) -> Optional[GenerateDocumentFieldsResponse]:
+        return await self._cache.get(field_suggestion_key(document_type_name, document_type_description), decode=decode_suggestion)
+
+    async def get_or_load(
+        self,
+        document_type_name: str,
+        document_type_description: str,
+        loader: Callable[[], Awaitable[Optional[GenerateDocumentFieldsResponse]]]
+    ) -> Optional[GenerateDocumentFieldsResponse]:
+        key = field_suggestion_key(document_type_name, document_type_description)
+        # A click that lands while the prefetch for the same type is still running waits for it instead of
+        # paying for a second upstream call.
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.joined_in_flight += 1
+            return await self._wait_for(in_flight)
+
+        load = asyncio.ensure_future(
+            self._cache.get_or_load(key, loader=loader, encode=encode_suggestion, decode=decode_suggestion)
+        )
+        self._in_flight[key] = load
+        load.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await self._wait_for(load)
+
+    async def _wait_for(self, load: asyncio.Future) -> Optional[GenerateDocumentFieldsResponse]:
+        # Shielded so that one caller going away does not cancel a load others are still waiting on. Once the
+        # last waiter is gone nobody will read the result, so the upstream call is cancelled rather than paid for.
+        self._waiters[load] = self._waiters.get(load, 0) + 1
+        try:
+            return await asyncio.shield(load)
+        finally:
+            self._waiters[load] -= 1
+            if not self._waiters[load]:
+                del self._waiters[load]
+                if not load.done():
+                    load.cancel()
+                    self.abandoned_loads += 1
+
+    async def set(self, document_type_name: str, document_type_description: str, suggestion: GenerateDocumentFieldsResponse) -> None:
+        await self._cache.set(field_suggestion_key(document_type_name, document_type_description), suggestion, encode=encode_suggestion)
+
+    def stats(self) -> dict:
+        return {
+            **self._cache.stats(),
+            "in_flight": len(self._in_flight),
+            "joined_in_flight": self.joined_in_flight,
+            "abandoned_loads": self.abandoned_loads,
+        }
+
+
+class NoOpFieldSuggestionCache(FieldSuggestionCache):
+    async def get(self, document_type_name: str, document_type_description: str) -> Optional[GenerateDocumentFieldsResponse]:
+        return None
+
+    async def get_or_load(
+        self,
+        document_type_name: str,
+        document_type_description: str,
+        loader: Callable[[], Awaitable[Optional[GenerateDocumentFieldsResponse]]]
+    ) -> Optional[GenerateDocumentFieldsResponse]:
+        return await loader()
+
+    async def set(self, document_type_name: str, document_type_description: str, suggestion: GenerateDocumentFieldsResponse) -> None:
+        return None
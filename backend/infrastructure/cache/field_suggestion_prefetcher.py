@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Callable, List, Optional, Set
+
+from backend.application.cache.field_suggestion_cache import FieldSuggestionPrefetcher
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsRequest
+from backend.application.use_cases.document_field.suggest_document_fields_use_case import SuggestDocumentFieldsUseCase
+from backend.core.models.document_type import DocumentType
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundFieldSuggestionPrefetcher(FieldSuggestionPrefetcher):
+    def __init__(
+        self,
+        suggest_use_case_provider: Callable[[], SuggestDocumentFieldsUseCase],
+        max_concurrency: int = 4,
+        max_pending: int = 100,
+    ):
+        self._suggest_use_case_provider = suggest_use_case_provider
+        self._max_concurrency = max_concurrency
+        self._max_pending = max_pending
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.scheduled = 0
+        self.skipped = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    def prefetch(self, document_types: List[DocumentType], user_id: Optional[int] = None) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        for document_type in document_types:
+            # Suggestions need a description, and the prefetch queue is shed rather than left to grow.
+            if not (document_type.description or "").strip() or len(self._tasks) >= self._max_pending:
+                self.skipped += 1
+                continue
+            request_dto = GenerateDocumentFieldsRequest(
+                document_type_name=document_type.name,
+                document_type_description=document_type.description
+            )
+            task = asyncio.create_task(self._prefetch_one(request_dto, user_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            self.scheduled += 1
+
+    async def _prefetch_one(self, request_dto: GenerateDocumentFieldsRequest, user_id: Optional[int]) -> None:
+        async with self._semaphore:
+            try:
+                response = await self._suggest_use_case_provider().execute(request_dto, current_user_id=user_id)
+            except Exception as e:
+                response = None
+                logger.warning(f"Field suggestion prefetch for '{request_dto.document_type_name}' failed: {e}")
+
+        if response is not None and response.success:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        for task in list(self._tasks):
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self._max_concurrency,
+            "pending": len(self._tasks),
+            "scheduled": self.scheduled,
+            "skipped": self.skipped,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
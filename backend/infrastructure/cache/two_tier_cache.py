@@ -0,0 +1,185 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class TwoTierCache:
+    def __init__(
+        self,
+        namespace: str,
+        redis_client_provider: Callable[[], redis.Redis],
+        local_cache: TTLLRUCache,
+        redis_ttl_seconds: int = 300,
+        redis_retry_after_seconds: float = 5.0,
+    ):
+        self._namespace = namespace
+        self._redis_client_provider = redis_client_provider
+        self._local = local_cache
+        self._redis_ttl_seconds = redis_ttl_seconds
+        self._channel = f"{namespace}:invalidations"
+        self._invalidation_epoch = 0
+        self._redis_retry_after_seconds = redis_retry_after_seconds
+        self._redis_unavailable_until = 0.0
+
+        self.redis_hits = 0
+        self.loads = 0
+        self.invalidations = 0
+        self.redis_errors = 0
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_unavailable_until
+
+    def _record_redis_error(self, action: str, e: Exception) -> None:
+        self.redis_errors += 1
+        self._redis_unavailable_until = time.monotonic() + self._redis_retry_after_seconds
+        logger.warning(f"Redis {action} failed for cache namespace '{self._namespace}': {e}")
+
+    async def _read(self, key: str) -> Tuple[bool, Any]:
+        found, payload = self._local.get(key)
+        if found:
+            return True, payload
+
+        raw = None
+        if self._redis_available():
+            try:
+                raw = await self._redis_client_provider().get(self._redis_key(key))
+            except RedisError as e:
+                self._record_redis_error("read", e)
+
+        if raw is None:
+            return False, None
+
+        self.redis_hits += 1
+        payload = json.loads(raw)
+        self._local.set(key, payload)
+        return True, payload
+
+    async def get(self, key: str, decode: Callable[[Any], Any]) -> Optional[Any]:
+        found, payload = await self._read(key)
+        return decode(payload) if found else None
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        encode: Callable[[Any], Any],
+        decode: Callable[[Any], Any],
+    ) -> Optional[Any]:
+        found, payload = await self._read(key)
+        if found:
+            return decode(payload)
+
+        epoch_before_load = self._invalidation_epoch
+        self.loads += 1
+        value = await loader()
+        if value is None:
+            return None
+
+        payload = encode(value)
+        # An invalidation that raced with the load means the loaded value may already be stale.
+        if epoch_before_load != self._invalidation_epoch:
+            return value
+
+        self._local.set(key, payload)
+        if self._redis_available():
+            try:
+                await self._redis_client_provider().set(self._redis_key(key), json.dumps(payload), ex=self._redis_ttl_seconds)
+            except RedisError as e:
+                self._record_redis_error("write", e)
+
+        return value
+
+    async def set(self, key: str, value: Any, encode: Callable[[Any], Any]) -> None:
+        # Replaces a value other instances may hold locally, so it is published like an invalidation.
+        payload = encode(value)
+        self._evict_local([key])
+        self._local.set(key, payload)
+        if not self._redis_available():
+            return
+        try:
+            async with self._redis_client_provider().pipeline(transaction=False) as pipe:
+                pipe.set(self._redis_key(key), json.dumps(payload), ex=self._redis_ttl_seconds)
+                pipe.publish(self._channel, json.dumps([key]))
+                await pipe.execute()
+        except RedisError as e:
+            self._record_redis_error("write", e)
+
+    def _evict_local(self, keys: Iterable[str]) -> None:
+        self._invalidation_epoch += 1
+        for key in keys:
+            self._local.delete(key)
+
+    async def invalidate(self, *keys: str) -> None:
+        if not keys:
+            return
+
+        self.invalidations += 1
+        self._evict_local(keys)
+
+        try:
+            async with self._redis_client_provider().pipeline(transaction=False) as pipe:
+                pipe.delete(*[self._redis_key(key) for key in keys])
+                pipe.publish(self._channel, json.dumps(list(keys)))
+                await pipe.execute()
+        except RedisError as e:
+            self._record_redis_error("invalidation", e)
+
+    async def listen_for_invalidations(self, retry_delay_seconds: float = 5.0) -> None:
+        while True:
+            pubsub = self._redis_client_provider().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._channel)
+                # Anything published while we were disconnected is lost, so start from a clean slate.
+                self._invalidation_epoch += 1
+                self._local.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        keys = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        logger.warning(f"Ignoring malformed invalidation message on '{self._channel}'.")
+                        continue
+                    self._evict_local(keys)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Invalidation listener for '{self._channel}' disconnected: {e}")
+                await asyncio.sleep(retry_delay_seconds)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def stats(self) -> dict:
+        local_stats = self._local.stats()
+        lookups = local_stats["hits"] + local_stats["misses"]
+        return {
+            "namespace": self._namespace,
+            "local": local_stats,
+            "redis_hits": self.redis_hits,
+            "loads": self.loads,
+            "overall_hit_rate": ((local_stats["hits"] + self.redis_hits) / lookups) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "redis_errors": self.redis_errors,
+            "redis_ttl_seconds": self._redis_ttl_seconds,
+            "max_staleness_seconds": local_stats["ttl_seconds"],
+        }
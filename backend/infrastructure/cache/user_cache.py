@@ -0,0 +1,51 @@
+from typing import Awaitable, Callable, Optional
+
+from backend.application.cache.user_cache import UserCache
+from backend.core.enums.user_role_enum import UserRole
+from backend.core.models.user import User
+from backend.core.value_objects.hashed_password import HashedPassword
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+
+
+# Cached users are what authentication and authorization read: identity, role and the active flag. The password
+# hash stays in the database, which is where logins and password changes read it from, so decoded users carry a
+# placeholder that no password verifies against.
+UNCACHED_PASSWORD_HASH = HashedPassword(value="$2b$12$" + "." * 53)
+
+def encode_user(user: User) -> dict:
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "role": user.role.value,
+        "is_active": user.is_active,
+    }
+
+def decode_user(payload: dict) -> User:
+    return User(
+        id=payload["id"],
+        username=payload["username"],
+        email=payload["email"],
+        hashed_password=UNCACHED_PASSWORD_HASH,
+        role=UserRole(payload["role"]),
+        is_active=payload["is_active"],
+    )
+
+
+class TwoTierUserCache(UserCache):
+    def __init__(self, cache: TwoTierCache):
+        self._cache = cache
+
+    async def get(self, user_id: int, loader: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        return await self._cache.get_or_load(f"user:{user_id}", loader=loader, encode=encode_user, decode=decode_user)
+
+    async def invalidate(self, user_id: int) -> None:
+        await self._cache.invalidate(f"user:{user_id}")
+
+
+class NoOpUserCache(UserCache):
+    async def get(self, user_id: int, loader: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        return await loader()
+
+    async def invalidate(self, user_id: int) -> None:
+        return None
@@ -1,12 +1,14 @@
 from typing import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import QueuePool
 
-from backend.infrastructure.database.mysql_config import async_sessionmaker_instance
+from backend.infrastructure.database.mysql_config import async_sessionmaker_instance, engine
 from backend.infrastructure.repositories.mysql_document_field_repository import MySqlDocumentFieldRepository
 from backend.infrastructure.repositories.mysql_document_type_repository import MySqlDocumentTypeRepository
 from backend.infrastructure.repositories.mysql_generated_document_repository import MySqlGeneratedDocumentRepository
 from backend.infrastructure.repositories.mysql_user_repository import MySqlUserRepository
+from backend.infrastructure.tracing.tracing_dependencies import traced
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -14,13 +16,29 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 def get_mysql_document_type_repository(session: AsyncSession = Depends(get_db_session)):
-    return MySqlDocumentTypeRepository(session)
+    return traced(MySqlDocumentTypeRepository(session), "repository")
 
 def get_mysql_user_repository(session: AsyncSession = Depends(get_db_session)):
-    return MySqlUserRepository(session)
+    return traced(MySqlUserRepository(session), "repository")
 
 def get_mysql_document_field_repository(session: AsyncSession = Depends(get_db_session)):
-    return MySqlDocumentFieldRepository(session)
+    return traced(MySqlDocumentFieldRepository(session), "repository")
 
 def get_mysql_generated_document_repository(session: AsyncSession = Depends(get_db_session)):
-    return MySqlGeneratedDocumentRepository(session)
\ No newline at end of file
+    return traced(MySqlGeneratedDocumentRepository(session), "repository")
+
+def get_db_pool_stats() -> dict:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pooled": False}
+
+    checked_out = pool.checkedout()
+    return {
+        "pooled": True,
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out_connections": checked_out,
+        "checked_in_connections": pool.checkedin(),
+        "overflow_connections": max(0, pool.overflow()),
+        "utilization": checked_out / max(1, pool.size() + max(0, pool._max_overflow)),
+    }
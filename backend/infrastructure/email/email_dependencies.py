@@ -1,5 +1,64 @@
-from backend.infrastructure.email.smtp_email import SMTPEmailGateway
+import asyncio
+import logging
+import os
+from typing import Optional
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.infrastructure.database.mysql_config import async_sessionmaker_instance
+from backend.infrastructure.database.mysql_dependencies import get_db_session
+from backend.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+from backend.infrastructure.email.outbox_email import OutboxEmailGateway
+from backend.infrastructure.email.smtp_email import SMTPEmailGateway, missing_smtp_settings
+from backend.infrastructure.tracing.tracing_dependencies import traced
 from backend.application.email.email import EmailGateway
 
-def get_email_gateway() -> EmailGateway:
-    return SMTPEmailGateway()
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+EMAIL_OUTBOX_ENABLED = os.getenv("EMAIL_OUTBOX_ENABLED", "true").lower() == "true"
+
+_smtp_email_gateway: Optional[SMTPEmailGateway] = None
+
+def get_smtp_email_gateway() -> SMTPEmailGateway:
+    global _smtp_email_gateway
+    if _smtp_email_gateway is None:
+        _smtp_email_gateway = traced(SMTPEmailGateway(), "email")
+    return _smtp_email_gateway
+
+email_outbox_dispatcher = EmailOutboxDispatcher(
+    session_factory=async_sessionmaker_instance,
+    email_gateway_provider=get_smtp_email_gateway,
+    batch_size=int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 50)),
+    poll_interval_seconds=float(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL_SECONDS", 2)),
+    max_attempts=int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 5)),
+    base_backoff_seconds=float(os.getenv("EMAIL_OUTBOX_BASE_BACKOFF_SECONDS", 10)),
+    max_backoff_seconds=float(os.getenv("EMAIL_OUTBOX_MAX_BACKOFF_SECONDS", 900)),
+    sent_retention_seconds=float(os.getenv("EMAIL_OUTBOX_SENT_RETENTION_SECONDS", 7 * 24 * 3600)),
+    purge_interval_seconds=float(os.getenv("EMAIL_OUTBOX_PURGE_INTERVAL_SECONDS", 3600)),
+)
+
+def get_email_gateway(session: AsyncSession = Depends(get_db_session)) -> EmailGateway:
+    if not EMAIL_OUTBOX_ENABLED:
+        return get_smtp_email_gateway()
+    return traced(OutboxEmailGateway(session, on_enqueued=email_outbox_dispatcher.notify), "email")
+
+def start_email_outbox_dispatcher() -> Optional[asyncio.Task]:
+    if not EMAIL_OUTBOX_ENABLED:
+        return None
+    missing_settings = missing_smtp_settings()
+    if missing_settings:
+        # Queued emails stay in the outbox and go out once the dispatcher starts with SMTP configured.
+        logger.warning(f"Email outbox dispatcher not started: {', '.join(missing_settings)} not set.")
+        return None
+    return asyncio.create_task(email_outbox_dispatcher.run())
+
+async def close_email_gateway() -> None:
+    if _smtp_email_gateway is not None:
+        await _smtp_email_gateway.close()
+
+async def get_email_gateway_stats() -> dict:
+    stats = {"outbox_enabled": EMAIL_OUTBOX_ENABLED}
+    if _smtp_email_gateway is not None:
+        stats["smtp"] = _smtp_email_gateway.stats()
+    if EMAIL_OUTBOX_ENABLED:
+        stats["outbox"] = await email_outbox_dispatcher.queue_stats()
+    return stats
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import random
+import time
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Tuple
+from opentelemetry.context import Context
+from opentelemetry.propagate import extract
+from opentelemetry.trace import Link, get_current_span
+from sqlalchemy import delete, select, update, func
+from backend.application.email.email import EmailGateway, OutgoingEmail
+from backend.core.enums.email_outbox_status_enum import EmailOutboxStatus
+from backend.infrastructure.models.email_outbox_model import EmailOutboxModel
+from backend.infrastructure.tracing.tracing_dependencies import get_tracer
+
+logger = logging.getLogger(__name__)
+
+ClaimedEmail = Tuple[int, OutgoingEmail, int, Optional[str]]
+
+class EmailOutboxDispatcher:
+    def __init__(
+        self,
+        session_factory,
+        email_gateway_provider: Callable[[], EmailGateway],
+        batch_size: int = 50,
+        poll_interval_seconds: float = 2.0,
+        max_attempts: int = 5,
+        base_backoff_seconds: float = 10.0,
+        max_backoff_seconds: float = 900.0,
+        lease_seconds: float = 300.0,
+        sent_retention_seconds: float = 7 * 24 * 3600,
+        purge_interval_seconds: float = 3600.0,
+        purge_batch_size: int = 1000,
+    ):
+        self._session_factory = session_factory
+        self._email_gateway_provider = email_gateway_provider
+        self._batch_size = batch_size
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_attempts = max_attempts
+        self._base_backoff_seconds = base_backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._lease_seconds = lease_seconds
+        self._sent_retention_seconds = sent_retention_seconds
+        self._purge_interval_seconds = purge_interval_seconds
+        self._purge_batch_size = purge_batch_size
+        self._next_purge_at = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.batches = 0
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.purged = 0
+        self.errors = 0
+
+    def notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _backoff_seconds(self, attempts: int) -> float:
+        backoff = min(self._max_backoff_seconds, self._base_backoff_seconds * (2 ** (attempts - 1)))
+        return backoff * random.uniform(0.8, 1.2)
+
+    async def _claim_batch(self) -> List[ClaimedEmail]:
+        async with self._session_factory() as session:
+            now = datetime.now(timezone.utc)
+            result = await session.execute(
+                select(EmailOutboxModel)
+                .where(
+                    EmailOutboxModel.status.in_([EmailOutboxStatus.PENDING, EmailOutboxStatus.SENDING]),
+                    EmailOutboxModel.next_attempt_at <= now
+                )
+                .order_by(EmailOutboxModel.next_attempt_at, EmailOutboxModel.id)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.scalars().all()
+            if not rows:
+                await session.rollback()
+                return []
+
+            # Rows stay claimed for the lease; if this worker dies mid-send they become claimable again. Every claim
+            # counts as an attempt, so a message whose sends keep outliving the lease still runs out of attempts.
+            lease_until = now + timedelta(seconds=self._lease_seconds)
+            claimed = []
+            for row in rows:
+                if row.attempts >= self._max_attempts:
+                    row.status = EmailOutboxStatus.FAILED
+                    row.last_error = "Delivery did not finish within the lease."
+                    self.failed += 1
+                    logger.error(f"Giving up on outbox email {row.id} to {row.to_email} after {row.attempts} attempts.")
+                    continue
+                row.status = EmailOutboxStatus.SENDING
+                row.attempts += 1
+                row.next_attempt_at = lease_until
+                claimed.append((
+                    row.id, OutgoingEmail(to_email=row.to_email, subject=row.subject, body=row.body), row.attempts,
+                    row.trace_context
+                ))
+            await session.commit()
+            return claimed
+
+    async def _record_results(self, claimed: List[ClaimedEmail], results: List[bool], error: str) -> None:
+        now = datetime.now(timezone.utc)
+        sent_ids = [email_id for (email_id, _, _, _), success in zip(claimed, results) if success]
+
+        async with self._session_factory() as session:
+            if sent_ids:
+                await session.execute(
+                    update(EmailOutboxModel)
+                    .where(EmailOutboxModel.id.in_(sent_ids))
+                    .values(status=EmailOutboxStatus.SENT, sent_at=now, last_error=None)
+                )
+
+            for (email_id, email, attempts, _), success in zip(claimed, results):
+                if success:
+                    continue
+                if attempts >= self._max_attempts:
+                    values = {"status": EmailOutboxStatus.FAILED}
+                    self.failed += 1
+                    logger.error(f"Giving up on outbox email {email_id} to {email.to_email} after {attempts} attempts.")
+                else:
+                    values = {
+                        "status": EmailOutboxStatus.PENDING,
+                        "next_attempt_at": now + timedelta(seconds=self._backoff_seconds(attempts))
+                    }
+                    self.retried += 1
+                await session.execute(
+                    update(EmailOutboxModel)
+                    .where(EmailOutboxModel.id == email_id)
+                    .values(last_error=error[:500], **values)
+                )
+
+            await session.commit()
+        self.sent += len(sent_ids)
+
+    @staticmethod
+    def _trace_parent_and_links(claimed: List[ClaimedEmail]) -> Tuple[Optional[Context], List[Link]]:
+        # A batch sent for a single request continues that request's trace; a batch mixing several requests
+        # starts its own trace and links back to each of them.
+        trace_contexts = {trace_context for _, _, _, trace_context in claimed if trace_context}
+        contexts = [extract({"traceparent": trace_context}) for trace_context in trace_contexts]
+        if len(contexts) == 1:
+            return contexts[0], []
+        return None, [Link(get_current_span(context).get_span_context()) for context in contexts]
+
+    async def dispatch_once(self) -> int:
+        claimed = await self._claim_batch()
+        if not claimed:
+            return 0
+
+        self.batches += 1
+        error = "Delivery failed."
+        parent_context, links = self._trace_parent_and_links(claimed)
+        with get_tracer().start_as_current_span(
+            "EmailOutboxDispatcher.dispatch_once",
+            context=parent_context,
+            links=links,
+            attributes={"docugenius.component": "email", "docugenius.email.batch_size": len(claimed)},
+        ):
+            try:
+                # Resolved only once there is mail to send, so an idle outbox never touches the gateway.
+                email_gateway = self._email_gateway_provider()
+                results = await email_gateway.send_emails([email for _, email, _, _ in claimed])
+            except Exception as e:
+                results = [False] * len(claimed)
+                error = str(e)
+
+        await self._record_results(claimed, results, error)
+        return len(claimed)
+
+    async def purge_sent(self) -> int:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self._sent_retention_seconds)
+        purged = 0
+        # Deleted in id batches so a large backlog never holds one long-running delete against the dispatcher.
+        while True:
+            async with self._session_factory() as session:
+                result = await session.execute(
+                    select(EmailOutboxModel.id)
+                    .where(EmailOutboxModel.status == EmailOutboxStatus.SENT, EmailOutboxModel.sent_at < cutoff)
+                    .order_by(EmailOutboxModel.id)
+                    .limit(self._purge_batch_size)
+                )
+                ids = result.scalars().all()
+                if ids:
+                    await session.execute(delete(EmailOutboxModel).where(EmailOutboxModel.id.in_(ids)))
+                    await session.commit()
+            purged += len(ids)
+            if len(ids) < self._purge_batch_size:
+                break
+        self.purged += purged
+        return purged
+
+    async def _purge_if_due(self) -> None:
+        if time.monotonic() < self._next_purge_at:
+            return
+        self._next_purge_at = time.monotonic() + self._purge_interval_seconds
+        purged = await self.purge_sent()
+        if purged:
+            logger.info(f"Purged {purged} sent outbox emails older than {self._sent_retention_seconds}s.")
+
+    async def run(self) -> None:
+        self._wakeup = asyncio.Event()
+        while True:
+            self._wakeup.clear()
+            try:
+                await self._purge_if_due()
+                processed = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Email outbox dispatch failed: {e}")
+                processed = 0
+
+            if processed < self._batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval_seconds)
+
+    async def queue_stats(self) -> dict:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(EmailOutboxModel.status, func.count(EmailOutboxModel.id)).group_by(EmailOutboxModel.status)
+            )
+            counts = {status.value: count for status, count in result.all()}
+        return {
+            "queue": {status.value: counts.get(status.value, 0) for status in EmailOutboxStatus},
+            "batches": self.batches,
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "purged": self.purged,
+            "errors": self.errors,
+        }
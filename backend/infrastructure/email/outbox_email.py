@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from opentelemetry.propagate import inject
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.application.email.email import EmailGateway, OutgoingEmail
+from backend.core.enums.email_outbox_status_enum import EmailOutboxStatus
+from backend.infrastructure.models.email_outbox_model import EmailOutboxModel
+
+class OutboxEmailGateway(EmailGateway):
+    def __init__(self, db_session: AsyncSession, on_enqueued: Optional[Callable[[], None]] = None):
+        self._db_session = db_session
+        self._on_enqueued = on_enqueued
+
+    async def send_email(self, to_email: str, subject: str, body: str) -> bool:
+        results = await self.send_emails([OutgoingEmail(to_email=to_email, subject=subject, body=body)])
+        return results[0]
+
+    async def send_emails(self, emails: List[OutgoingEmail]) -> List[bool]:
+        if not emails:
+            return []
+
+        now = datetime.now(timezone.utc)
+        # The W3C traceparent of the request that queued the emails, so the dispatcher can continue its trace.
+        carrier: Dict[str, str] = {}
+        inject(carrier)
+        try:
+            await self._db_session.execute(
+                insert(EmailOutboxModel).values([
+                    {
+                        "to_email": email.to_email,
+                        "subject": email.subject,
+                        "body": email.body,
+                        "status": EmailOutboxStatus.PENDING,
+                        "attempts": 0,
+                        "next_attempt_at": now,
+                        "created_at": now,
+                        "trace_context": carrier.get("traceparent"),
+                    }
+                    for email in emails
+                ])
+            )
+            await self._db_session.commit()
+        except Exception as e:
+            await self._db_session.rollback()
+            print(f"An error occurred while enqueueing {len(emails)} email(s) to the outbox: {e}")
+            return [False] * len(emails)
+
+        if self._on_enqueued:
+            self._on_enqueued()
+        return [True] * len(emails)
@@ -1,8 +1,33 @@
+import asyncio
 import smtplib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from backend.application.email.email import EmailGateway
+from typing import List, Optional
+from backend.application.email.email import EmailGateway, OutgoingEmail
+
+SERVICE_NOT_AVAILABLE_CODE = 421
+REQUIRED_SMTP_SETTINGS = ("SMTP_SERVER", "EMAIL_ADDRESS", "EMAIL_PASSWORD")
+
+def missing_smtp_settings() -> List[str]:
+    return [name for name in REQUIRED_SMTP_SETTINGS if not os.getenv(name)]
+
+def _is_reconnectable(error: Exception) -> bool:
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == SERVICE_NOT_AVAILABLE_CODE
+    # SMTPException subclasses OSError; anything else from the socket layer means the session is gone.
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+class _PooledConnection:
+    def __init__(self):
+        self.server: Optional[smtplib.SMTP] = None
+        self.last_used_at = 0.0
+        self.messages_sent = 0
 
 class SMTPEmailGateway(EmailGateway):
     def __init__(self):
@@ -10,35 +35,156 @@ class SMTPEmailGateway(EmailGateway):
         self.smtp_port = int(os.getenv("SMTP_PORT", 587))
         self.email_address = os.getenv("EMAIL_ADDRESS")
         self.email_password = os.getenv("EMAIL_PASSWORD")
+        self.use_starttls = os.getenv("SMTP_USE_STARTTLS", "true").lower() == "true"
+        self.pool_size = int(os.getenv("SMTP_POOL_SIZE", 2))
+        self.timeout_seconds = float(os.getenv("SMTP_TIMEOUT_SECONDS", 30))
+        self.idle_timeout_seconds = float(os.getenv("SMTP_IDLE_TIMEOUT_SECONDS", 60))
+        self.max_messages_per_connection = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", 100))
 
-        if not all([self.smtp_server, self.email_address, self.email_password]):
+        if missing_smtp_settings():
             raise ValueError(
                 "SMTP_SERVER, EMAIL_ADDRESS, and EMAIL_PASSWORD must be set in environment variables."
             )
 
-    async def send_email(self, to_email: str, subject: str, body: str) -> bool:
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.email_address
-            msg['To'] = to_email
-            msg['Subject'] = subject
+        # Each worker thread owns one persistent SMTP session, so the executor size is the pool size.
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="smtp")
+        self._thread_local = threading.local()
+        self._connections: List[_PooledConnection] = []
+        self._lock = threading.Lock()
+
+        self.connections_opened = 0
+        self.reconnects = 0
+        self.messages_sent = 0
+        self.messages_failed = 0
 
-            msg.attach(MIMEText(body, 'plain'))
+    def _connection(self) -> _PooledConnection:
+        connection = getattr(self._thread_local, "connection", None)
+        if connection is None:
+            connection = _PooledConnection()
+            self._thread_local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
 
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
+    def _open(self, connection: _PooledConnection) -> None:
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout_seconds)
+        try:
+            if self.use_starttls:
+                server.starttls()
             server.login(self.email_address, self.email_password)
+        except Exception:
+            self._quietly_close(server)
+            raise
+        connection.server = server
+        connection.messages_sent = 0
+        connection.last_used_at = time.monotonic()
+        with self._lock:
+            self.connections_opened += 1
 
-            text = msg.as_string()
-            server.sendmail(self.email_address, to_email, text)
+    @staticmethod
+    def _quietly_close(server: Optional[smtplib.SMTP]) -> None:
+        if server is None:
+            return
+        try:
             server.quit()
+        except Exception:
+            server.close()
+
+    def _close(self, connection: _PooledConnection) -> None:
+        self._quietly_close(connection.server)
+        connection.server = None
+
+    def _ensure_open(self, connection: _PooledConnection) -> None:
+        expired = (
+            time.monotonic() - connection.last_used_at > self.idle_timeout_seconds
+            or connection.messages_sent >= self.max_messages_per_connection
+        )
+        if connection.server is not None and expired:
+            self._close(connection)
+        if connection.server is None:
+            self._open(connection)
 
-            print(f"Email sent successfully to {to_email}")
-            return True
+    def _build_message(self, email: OutgoingEmail) -> str:
+        msg = MIMEMultipart()
+        msg['From'] = self.email_address
+        msg['To'] = email.to_email
+        msg['Subject'] = email.subject
 
-        except smtplib.SMTPException as e:
-            print(f"SMTP error occurred while sending email to {to_email}: {e}")
-            return False
+        msg.attach(MIMEText(email.body, 'plain'))
+        return msg.as_string()
+
+    def _send_on_connection(self, connection: _PooledConnection, email: OutgoingEmail) -> None:
+        text = self._build_message(email)
+        try:
+            self._ensure_open(connection)
+            connection.server.sendmail(self.email_address, email.to_email, text)
         except Exception as e:
-            print(f"An error occurred while sending email to {to_email}: {e}")
-            return False
\ No newline at end of file
+            if not _is_reconnectable(e):
+                raise
+            self._close(connection)
+            with self._lock:
+                self.reconnects += 1
+            self._open(connection)
+            connection.server.sendmail(self.email_address, email.to_email, text)
+        connection.messages_sent += 1
+        connection.last_used_at = time.monotonic()
+
+    def _send_batch_sync(self, emails: List[OutgoingEmail]) -> List[bool]:
+        connection = self._connection()
+        results = []
+        for email in emails:
+            try:
+                self._send_on_connection(connection, email)
+                print(f"Email sent successfully to {email.to_email}")
+                results.append(True)
+            except smtplib.SMTPException as e:
+                print(f"SMTP error occurred while sending email to {email.to_email}: {e}")
+                results.append(False)
+            except Exception as e:
+                print(f"An error occurred while sending email to {email.to_email}: {e}")
+                self._close(connection)
+                results.append(False)
+
+        with self._lock:
+            self.messages_sent += results.count(True)
+            self.messages_failed += results.count(False)
+        return results
+
+    async def send_email(self, to_email: str, subject: str, body: str) -> bool:
+        results = await self.send_emails([OutgoingEmail(to_email=to_email, subject=subject, body=body)])
+        return results[0]
+
+    async def send_emails(self, emails: List[OutgoingEmail]) -> List[bool]:
+        if not emails:
+            return []
+
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(emails) // self.pool_size)
+        chunks = [emails[i:i + chunk_size] for i in range(0, len(emails), chunk_size)]
+        chunk_results = await asyncio.gather(
+            *[loop.run_in_executor(self._executor, self._send_batch_sync, chunk) for chunk in chunks]
+        )
+        return [result for results in chunk_results for result in results]
+
+    def _close_all_sync(self) -> None:
+        # Sessions are not thread-safe: let every worker finish its current send before quitting the sessions it owns.
+        # Chunks that have not started yet are dropped; the outbox sends them again once their lease expires.
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            self._close(connection)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close_all_sync)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "open_connections": sum(1 for connection in self._connections if connection.server is not None),
+                "connections_opened": self.connections_opened,
+                "reconnects": self.reconnects,
+                "messages_sent": self.messages_sent,
+                "messages_failed": self.messages_failed,
+            }
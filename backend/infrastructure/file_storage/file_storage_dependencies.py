@@ -1,16 +1,25 @@
+from typing import Optional
 from backend.application.file_storage.file_storage import FileStorageGateway
 from backend.infrastructure.file_storage.local_file_storage import LocalFileStorageGateway
 import os
 from backend.infrastructure.file_storage.s3_file_storage import S3FileStorageGateway
+from backend.infrastructure.tracing.tracing_dependencies import traced
+
+_file_storage_gateway: Optional[FileStorageGateway] = None
 
 
 def get_file_storage_gateway() -> FileStorageGateway:
+    # Built once: boto3.client() loads service models from disk and blocks the event loop for tens of milliseconds.
+    global _file_storage_gateway
+    if _file_storage_gateway is not None:
+        return _file_storage_gateway
 
     storage_backend = os.getenv("STORAGE_BACKEND", "LOCAL")
 
     if storage_backend.upper() == "S3":
         print("Using S3 File Storage Gateway")
-        return S3FileStorageGateway()
+        _file_storage_gateway = traced(S3FileStorageGateway(), "file_storage")
     else:
         print("Using Local File Storage Gateway")
-        return LocalFileStorageGateway(storage_directory="backend/temp_generated_docs")
\ No newline at end of file
+        _file_storage_gateway = traced(LocalFileStorageGateway(storage_directory="backend/temp_generated_docs"), "file_storage")
+    return _file_storage_gateway
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import os
+from typing import Optional
+from dotenv import load_dotenv
+
+from backend.application.ai_gateway.ai_gateway import AIGateway
+from backend.application.dtos.ai_inference import InferenceRequest
+from backend.application.ai_gateway.structured_output import StructuredOutputMetrics
+from backend.application.cache.field_suggestion_cache import FieldSuggestionPrefetcher
+from backend.application.use_cases.document_field.suggest_document_fields_use_case import SuggestDocumentFieldsUseCase
+from backend.application.model_router.model_router import GENERATE_DOCUMENT, SUGGEST_DOCUMENT_FIELDS, \
+    SUGGEST_DOCUMENT_TYPES, ModelRoute, ModelRouter
+from backend.infrastructure.ai_usage.ai_usage_dependencies import AI_USAGE_ENABLED, get_ai_usage_sink
+from backend.infrastructure.cache.cache_dependencies import get_field_suggestion_cache
+from backend.infrastructure.cache.field_suggestion_prefetcher import BackgroundFieldSuggestionPrefetcher
+from backend.infrastructure.gateways.hf_openai_ai_gateway import HuggingFaceOpenAIAIGateway
+from backend.infrastructure.gateways.metered_ai_gateway import MeteredAIGateway
+from backend.infrastructure.gateways.model_registry import ModelRegistry, PolicyModelRouter, RoutingPolicy
+from backend.infrastructure.gateways.rate_limited_ai_gateway import ModelBudget, RateLimitedAIGateway
+from backend.infrastructure.gateways.resilient_ai_gateway import ResilientAIGateway
+from backend.infrastructure.redis.redis_dependencies import get_shared_redis_client
+from backend.infrastructure.redis.redis_token_bucket import RedisTokenBucket
+from backend.infrastructure.tracing.tracing_dependencies import traced
+
+load_dotenv()
+
+_hf_openai_ai_gateway: Optional[HuggingFaceOpenAIAIGateway] = None
+_rate_limited_ai_gateway: Optional[RateLimitedAIGateway] = None
+_resilient_ai_gateway: Optional[ResilientAIGateway] = None
+
+def _load_pinned_routes() -> dict:
+    # AI_MODEL_ROUTES='{"generate_document": {"model": "<model>", "fallbacks": ["<model>"]}}'
+    raw_routes = json.loads(os.getenv("AI_MODEL_ROUTES", "{}"))
+    return {
+        use_case: ModelRoute(use_case=use_case, model=route["model"], fallback_models=list(route.get("fallbacks", [])))
+        for use_case, route in raw_routes.items()
+    }
+
+max_fallback_models = int(os.getenv("AI_MAX_FALLBACK_MODELS", 1))
+
+model_router = PolicyModelRouter(
+    # AI_MODEL_REGISTRY='[{"id": "<model>", "capabilities": ["chat", "json"], "context_length": 32768,
+    #   "input_cost_per_million_tokens": 0.1, "output_cost_per_million_tokens": 0.1, "latency_class": "fast"}]'
+    registry=ModelRegistry.from_config(json.loads(os.getenv("AI_MODEL_REGISTRY", "[]"))),
+    policies={
+        SUGGEST_DOCUMENT_TYPES: RoutingPolicy(("json",), "fast", max_fallback_models),
+        SUGGEST_DOCUMENT_FIELDS: RoutingPolicy(("json",), "fast", max_fallback_models),
+        GENERATE_DOCUMENT: RoutingPolicy(("long_form",), "standard", max_fallback_models),
+    },
+    pinned_routes=_load_pinned_routes(),
+)
+
+def get_model_router() -> ModelRouter:
+    return model_router
+
+structured_output_metrics = StructuredOutputMetrics()
+AI_PARSE_RETRY_ATTEMPTS = int(os.getenv("AI_PARSE_RETRY_ATTEMPTS", 1))
+AI_BATCH_SUGGEST_MAX_CONCURRENCY = int(os.getenv("AI_BATCH_SUGGEST_MAX_CONCURRENCY", 4))
+AI_BATCH_SUGGEST_MAX_SIZE = int(os.getenv("AI_BATCH_SUGGEST_MAX_SIZE", 50))
+
+def get_structured_output_metrics() -> StructuredOutputMetrics:
+    return structured_output_metrics
+
+def _load_model_budgets() -> dict:
+    # AI_MODEL_BUDGETS='{"<model>": {"rpm": 30, "tpm": 60000}}'
+    raw_budgets = json.loads(os.getenv("AI_MODEL_BUDGETS", "{}"))
+    return {
+        model: ModelBudget(requests_per_minute=int(budget["rpm"]), tokens_per_minute=int(budget["tpm"]))
+        for model, budget in raw_budgets.items()
+    }
+
+def get_hf_openai_ai_gateway() -> HuggingFaceOpenAIAIGateway:
+    global _hf_openai_ai_gateway
+    if _hf_openai_ai_gateway is None:
+        hf_token = os.getenv("HF_API_TOKEN")
+        if not hf_token:
+            raise ValueError("HF_API_TOKEN not found in environment variables.")
+        base_url = os.getenv("HF_OPENAI_BASE_URL", "https://router.huggingface.co/v1")
+        _hf_openai_ai_gateway = HuggingFaceOpenAIAIGateway(
+            hf_token=hf_token,
+            base_url=base_url,
+            timeout_seconds=float(os.getenv("AI_REQUEST_TIMEOUT_SECONDS", 120)),
+        )
+    return _hf_openai_ai_gateway
+
+def _inference_span_attributes(request: Optional[InferenceRequest] = None, *args, **kwargs) -> dict:
+    if request is None:
+        return {}
+    return {"gen_ai.request.model": request.model, "docugenius.use_case": request.use_case or ""}
+
+def get_upstream_ai_gateway() -> AIGateway:
+    # Metered innermost so that every upstream attempt, including retries and hedges, is accounted for.
+    # Traced at this level too, so each attempt shows up as its own span under the call that made it.
+    upstream_ai_gateway = traced(get_hf_openai_ai_gateway(), "ai_provider", _inference_span_attributes)
+    if not AI_USAGE_ENABLED:
+        return upstream_ai_gateway
+    return MeteredAIGateway(inner=upstream_ai_gateway, usage_sink=get_ai_usage_sink())
+
+def get_rate_limited_ai_gateway() -> RateLimitedAIGateway:
+    global _rate_limited_ai_gateway
+    if _rate_limited_ai_gateway is None:
+        _rate_limited_ai_gateway = RateLimitedAIGateway(
+            inner=get_upstream_ai_gateway(),
+            token_bucket=RedisTokenBucket(redis_client_provider=get_shared_redis_client),
+            default_budget=ModelBudget(
+                requests_per_minute=int(os.getenv("AI_DEFAULT_REQUESTS_PER_MINUTE", 60)),
+                tokens_per_minute=int(os.getenv("AI_DEFAULT_TOKENS_PER_MINUTE", 100000)),
+            ),
+            model_budgets=_load_model_budgets(),
+            max_concurrency=int(os.getenv("AI_MAX_CONCURRENCY", 8)),
+            queue_deadline_seconds=float(os.getenv("AI_QUEUE_DEADLINE_SECONDS", 30)),
+            estimated_completion_tokens=int(os.getenv("AI_ESTIMATED_COMPLETION_TOKENS", 512)),
+        )
+    return _rate_limited_ai_gateway
+
+def get_resilient_ai_gateway() -> ResilientAIGateway:
+    global _resilient_ai_gateway
+    if _resilient_ai_gateway is None:
+        _resilient_ai_gateway = ResilientAIGateway(
+            inner=get_rate_limited_ai_gateway(),
+            fallback_providers=[provider.strip() for provider in os.getenv("AI_FALLBACK_PROVIDERS", "").split(",") if provider.strip()],
+            max_attempts=int(os.getenv("AI_MAX_ATTEMPTS", 3)),
+            base_backoff_seconds=float(os.getenv("AI_RETRY_BASE_BACKOFF_SECONDS", 0.25)),
+            max_backoff_seconds=float(os.getenv("AI_RETRY_MAX_BACKOFF_SECONDS", 4)),
+            hedging_enabled=os.getenv("AI_HEDGING_ENABLED", "true").lower() == "true",
+            hedge_percentile=float(os.getenv("AI_HEDGE_PERCENTILE", 0.95)),
+            default_hedge_delay_seconds=float(os.getenv("AI_DEFAULT_HEDGE_DELAY_SECONDS", 10)),
+            failure_threshold=int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", 5)),
+            reset_timeout_seconds=float(os.getenv("AI_CIRCUIT_RESET_TIMEOUT_SECONDS", 30)),
+        )
+    return _resilient_ai_gateway
+
+def get_ai_gateway() -> AIGateway:
+    return traced(get_resilient_ai_gateway(), "ai_gateway", _inference_span_attributes)
+
+FIELD_SUGGESTION_PREFETCH_ENABLED = os.getenv("FIELD_SUGGESTION_PREFETCH_ENABLED", "false").lower() == "true"
+
+field_suggestion_prefetcher = BackgroundFieldSuggestionPrefetcher(
+    suggest_use_case_provider=lambda: traced(SuggestDocumentFieldsUseCase(
+        ai_gateway=get_ai_gateway(),
+        model_router=model_router,
+        output_metrics=structured_output_metrics,
+        suggestion_cache=get_field_suggestion_cache(),
+        parse_retry_attempts=AI_PARSE_RETRY_ATTEMPTS
+    ), "use_case"),
+    max_concurrency=int(os.getenv("FIELD_SUGGESTION_PREFETCH_MAX_CONCURRENCY", 4)),
+    max_pending=int(os.getenv("FIELD_SUGGESTION_PREFETCH_MAX_PENDING", 100)),
+)
+
+def get_field_suggestion_prefetcher() -> Optional[FieldSuggestionPrefetcher]:
+    if not FIELD_SUGGESTION_PREFETCH_ENABLED:
+        return None
+    return field_suggestion_prefetcher
+
+async def warm_ai_gateway() -> None:
+    # Building the OpenAI client loads the CA bundle and resource modules, so it is done off the loop at startup
+    # rather than inside the first request. Without a token the error is still raised on first use.
+    if os.getenv("HF_API_TOKEN"):
+        await asyncio.to_thread(get_hf_openai_ai_gateway)
+
+async def close_ai_gateway() -> None:
+    global _hf_openai_ai_gateway, _rate_limited_ai_gateway, _resilient_ai_gateway
+    await field_suggestion_prefetcher.close()
+    if _hf_openai_ai_gateway is not None:
+        await _hf_openai_ai_gateway.close()
+    _hf_openai_ai_gateway = None
+    _rate_limited_ai_gateway = None
+    _resilient_ai_gateway = None
+
+def get_ai_gateway_stats() -> dict:
+    stats = {
+        "initialized": _resilient_ai_gateway is not None,
+        "routing": model_router.stats(),
+        "structured_output": structured_output_metrics.stats(),
+        "field_suggestion_prefetch": {"enabled": FIELD_SUGGESTION_PREFETCH_ENABLED, **field_suggestion_prefetcher.stats()},
+    }
+    if _resilient_ai_gateway is not None:
+        stats["rate_limit"] = _rate_limited_ai_gateway.stats()
+        stats["resilience"] = _resilient_ai_gateway.stats()
+    return stats
@@ -1,20 +1,78 @@
-from openai import OpenAI
-from backend.application.ai_gateway.ai_gateway import AIGateway
+import logging
+from typing import AsyncIterator, Set
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, BadRequestError, UnprocessableEntityError
+from backend.application.ai_gateway.ai_gateway import AIGateway, AIGatewayError
 from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
 
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
 class HuggingFaceOpenAIAIGateway(AIGateway):
-    def __init__(self, hf_token: str, base_url: str = "https://router.huggingface.co/v1"):
-        self._client = OpenAI(base_url=base_url, api_key=hf_token)
+    def __init__(self, hf_token: str, base_url: str = "https://router.huggingface.co/v1", timeout_seconds: float = 120.0):
+        self._client = AsyncOpenAI(base_url=base_url, api_key=hf_token, timeout=timeout_seconds, max_retries=0)
+        # client.chat imports its resource modules on first access, a few hundred milliseconds that would otherwise
+        # block the event loop on the first completion.
+        self._completions = self._client.chat.completions
+        self._models_without_response_format: Set[str] = set()
 
-    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+    async def _create_completion(self, request: InferenceRequest, stream: bool):
+        kwargs = {}
+        messages = [{"role": "user", "content": request.prompt}]
+        if request.system_prompt:
+            messages.insert(0, {"role": "system", "content": request.system_prompt})
+        if request.response_format and request.model not in self._models_without_response_format:
+            kwargs["response_format"] = {"type": request.response_format}
         try:
-            completion = self._client.chat.completions.create(
-                model=request.model,
-                messages=[
-                    {"role": "user", "content": request.prompt}
-                ],
+            try:
+                return await self._completions.create(
+                    model=request.model,
+                    messages=messages,
+                    stream=stream,
+                    **kwargs,
+                )
+            except (BadRequestError, UnprocessableEntityError) as e:
+                if "response_format" not in kwargs or "response_format" not in str(e):
+                    raise
+                # Not every provider behind the router supports JSON mode; remember it and rely on the prompt.
+                logger.info(f"Model '{request.model}' rejected response_format, retrying without it.")
+                self._models_without_response_format.add(request.model)
+                return await self._create_completion(request, stream)
+        except APIStatusError as e:
+            raise AIGatewayError(
+                f"Error calling Hugging Face Inference API via OpenAI client: {e}",
+                retryable=e.status_code in RETRYABLE_STATUS_CODES or e.status_code >= 500,
             )
+        except APIConnectionError as e:
+            raise AIGatewayError(f"Error calling Hugging Face Inference API via OpenAI client: {e}", retryable=True)
+        except AIGatewayError:
+            raise
+        except Exception as e:
+            raise AIGatewayError(f"Error calling Hugging Face Inference API via OpenAI client: {e}")
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        completion = await self._create_completion(request, stream=False)
+        try:
             generated_text = completion.choices[0].message.content
-            return InferenceResponse(generated_text=generated_text)
+            usage = completion.usage
+            return InferenceResponse(
+                generated_text=generated_text,
+                prompt_tokens=usage.prompt_tokens if usage else None,
+                completion_tokens=usage.completion_tokens if usage else None,
+            )
         except Exception as e:
-            raise RuntimeError(f"Error calling Hugging Face Inference API via OpenAI client: {e}")
\ No newline at end of file
+            raise AIGatewayError(f"Unexpected response from Hugging Face Inference API: {e}")
+
+    async def stream_text(self, request: InferenceRequest) -> AsyncIterator[str]:
+        stream = await self._create_completion(request, stream=True)
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except APIConnectionError as e:
+            raise AIGatewayError(f"Hugging Face Inference API stream interrupted: {e}", retryable=True)
+        finally:
+            await stream.close()
+
+    async def close(self) -> None:
+        await self._client.close()
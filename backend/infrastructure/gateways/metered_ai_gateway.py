@@ -0,0 +1,87 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
+from backend.application.ai_gateway.ai_gateway import AIGateway
+from backend.application.ai_usage.ai_usage import AIUsageRecord, AIUsageSink
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.application.prompt_builder import estimate_tokens
+
+class MeteredAIGateway(AIGateway):
+    def __init__(self, inner: AIGateway, usage_sink: AIUsageSink):
+        self._inner = inner
+        self._usage_sink = usage_sink
+
+    def _record(
+        self,
+        request: InferenceRequest,
+        status: str,
+        started_at: float,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        generated_text: str = "",
+        time_to_first_token_ms: Optional[float] = None,
+    ) -> None:
+        # Providers report usage for completed, non-streamed calls only; otherwise fall back to estimates.
+        tokens_estimated = prompt_tokens is None or completion_tokens is None
+        if prompt_tokens is None:
+            prompt_tokens = estimate_tokens(request.system_prompt or "") + estimate_tokens(request.prompt)
+        if completion_tokens is None:
+            completion_tokens = estimate_tokens(generated_text)
+
+        self._usage_sink.record(AIUsageRecord(
+            use_case=request.use_case,
+            user_id=request.user_id,
+            document_type_id=request.document_type_id,
+            model=request.model,
+            status=status,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            tokens_estimated=tokens_estimated,
+            latency_ms=(time.perf_counter() - started_at) * 1000,
+            time_to_first_token_ms=time_to_first_token_ms,
+            created_at=datetime.now(timezone.utc),
+        ))
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        started_at = time.perf_counter()
+        try:
+            response = await self._inner.generate_text(request)
+        except asyncio.CancelledError:
+            self._record(request, "cancelled", started_at)
+            raise
+        except Exception:
+            self._record(request, "error", started_at)
+            raise
+
+        self._record(
+            request, "ok", started_at,
+            prompt_tokens=response.prompt_tokens,
+            completion_tokens=response.completion_tokens,
+            generated_text=response.generated_text,
+        )
+        return response
+
+    async def stream_text(self, request: InferenceRequest) -> AsyncIterator[str]:
+        started_at = time.perf_counter()
+        time_to_first_token_ms: Optional[float] = None
+        chunks: List[str] = []
+        status = "ok"
+        try:
+            async for chunk in self._inner.stream_text(request):
+                if time_to_first_token_ms is None:
+                    time_to_first_token_ms = (time.perf_counter() - started_at) * 1000
+                chunks.append(chunk)
+                yield chunk
+        except (asyncio.CancelledError, GeneratorExit):
+            status = "cancelled"
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self._record(
+                request, status, started_at,
+                generated_text="".join(chunks),
+                time_to_first_token_ms=time_to_first_token_ms,
+            )
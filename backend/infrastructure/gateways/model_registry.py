@@ -0,0 +1,143 @@
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.application.model_router.model_router import ModelRoute, ModelRouter, ModelSpec
+
+logger = logging.getLogger(__name__)
+
+LATENCY_CLASSES = ("fast", "standard", "slow")
+
+DEFAULT_MODEL_SPECS = (
+    ModelSpec(
+        id="meta-llama/Llama-3.1-8B-Instruct:cerebras",
+        capabilities=("chat", "json", "long_form"),
+        context_length=32768,
+        input_cost_per_million_tokens=0.10,
+        output_cost_per_million_tokens=0.10,
+        latency_class="fast",
+    ),
+    ModelSpec(
+        id="meta-llama/Llama-3.3-70B-Instruct:cerebras",
+        capabilities=("chat", "json", "long_form"),
+        context_length=65536,
+        input_cost_per_million_tokens=0.85,
+        output_cost_per_million_tokens=1.20,
+        latency_class="standard",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class RoutingPolicy:
+    required_capabilities: Tuple[str, ...]
+    preferred_latency_class: str
+    max_fallbacks: int = 1
+
+
+class ModelRegistry:
+    def __init__(self, specs: Iterable[ModelSpec]):
+        self._specs: Dict[str, ModelSpec] = {spec.id: spec for spec in specs}
+
+    @classmethod
+    def from_config(cls, raw_specs: List[dict]) -> "ModelRegistry":
+        registry = cls(DEFAULT_MODEL_SPECS)
+        for raw_spec in raw_specs:
+            registry.register(ModelSpec(
+                id=raw_spec["id"],
+                capabilities=tuple(raw_spec.get("capabilities", ("chat",))),
+                context_length=int(raw_spec.get("context_length", 8192)),
+                input_cost_per_million_tokens=float(raw_spec.get("input_cost_per_million_tokens", 0.0)),
+                output_cost_per_million_tokens=float(raw_spec.get("output_cost_per_million_tokens", 0.0)),
+                latency_class=raw_spec.get("latency_class", "standard"),
+            ))
+        return registry
+
+    def register(self, spec: ModelSpec) -> None:
+        if spec.latency_class not in LATENCY_CLASSES:
+            raise ValueError(f"Unknown latency class '{spec.latency_class}' for model '{spec.id}'.")
+        self._specs[spec.id] = spec
+
+    def get(self, model_id: str) -> Optional[ModelSpec]:
+        return self._specs.get(model_id)
+
+    def all(self) -> List[ModelSpec]:
+        return list(self._specs.values())
+
+
+class PolicyModelRouter(ModelRouter):
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        policies: Dict[str, RoutingPolicy],
+        pinned_routes: Optional[Dict[str, ModelRoute]] = None,
+    ):
+        self._registry = registry
+        self._policies = policies
+        self._pinned_routes = pinned_routes or {}
+        self._routes_by_use_case: Dict[str, Dict[str, int]] = {}
+        self._estimated_input_tokens: Dict[str, int] = {}
+        self._estimated_input_cost: Dict[str, float] = {}
+
+    def _rank(self, spec: ModelSpec, policy: RoutingPolicy) -> Tuple[int, float]:
+        latency_distance = abs(LATENCY_CLASSES.index(spec.latency_class) - LATENCY_CLASSES.index(policy.preferred_latency_class))
+        return latency_distance, spec.input_cost_per_million_tokens + spec.output_cost_per_million_tokens
+
+    def _select(self, use_case: str, prompt_tokens: int) -> ModelRoute:
+        if use_case in self._pinned_routes:
+            return self._pinned_routes[use_case]
+
+        policy = self._policies[use_case]
+        capable = [
+            spec for spec in self._registry.all()
+            if set(policy.required_capabilities).issubset(spec.capabilities)
+        ]
+        if not capable:
+            raise ValueError(f"No registered model has the capabilities required by '{use_case}': {policy.required_capabilities}.")
+
+        fitting = sorted((spec for spec in capable if spec.context_length >= prompt_tokens), key=lambda spec: self._rank(spec, policy))
+        if not fitting:
+            logger.warning(f"Prompt for '{use_case}' (~{prompt_tokens} tokens) exceeds every model's context; using the largest.")
+            fitting = sorted(capable, key=lambda spec: -spec.context_length)
+
+        return ModelRoute(
+            use_case=use_case,
+            model=fitting[0].id,
+            fallback_models=[spec.id for spec in fitting[1:1 + policy.max_fallbacks]],
+        )
+
+    def route(self, use_case: str, estimated_prompt_tokens: int) -> ModelRoute:
+        route = self._select(use_case, estimated_prompt_tokens)
+
+        use_case_routes = self._routes_by_use_case.setdefault(use_case, {})
+        use_case_routes[route.model] = use_case_routes.get(route.model, 0) + 1
+        self._estimated_input_tokens[use_case] = self._estimated_input_tokens.get(use_case, 0) + estimated_prompt_tokens
+        spec = self._registry.get(route.model)
+        if spec is not None:
+            self._estimated_input_cost[use_case] = (
+                self._estimated_input_cost.get(use_case, 0.0) + estimated_prompt_tokens * spec.input_cost_per_million_tokens / 1_000_000
+            )
+        return route
+
+    def stats(self) -> dict:
+        return {
+            "models": {
+                spec.id: {
+                    "capabilities": list(spec.capabilities),
+                    "context_length": spec.context_length,
+                    "input_cost_per_million_tokens": spec.input_cost_per_million_tokens,
+                    "output_cost_per_million_tokens": spec.output_cost_per_million_tokens,
+                    "latency_class": spec.latency_class,
+                }
+                for spec in self._registry.all()
+            },
+            "use_cases": {
+                use_case: {
+                    "pinned": use_case in self._pinned_routes,
+                    "routes": self._routes_by_use_case.get(use_case, {}),
+                    "estimated_input_tokens": self._estimated_input_tokens.get(use_case, 0),
+                    "estimated_input_cost_usd": round(self._estimated_input_cost.get(use_case, 0.0), 6),
+                }
+                for use_case in sorted(set(self._policies) | set(self._pinned_routes))
+            },
+        }
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+
+from redis.exceptions import RedisError
+
+from backend.application.ai_gateway.ai_gateway import AIGateway, AIGatewayError
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.application.prompt_builder import estimate_tokens
+from backend.infrastructure.redis.redis_token_bucket import RedisTokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class AIGatewayQueueTimeoutError(AIGatewayError):
+    pass
+
+
+@dataclass(frozen=True)
+class ModelBudget:
+    requests_per_minute: int
+    tokens_per_minute: int
+
+
+def estimate_request_tokens(request: InferenceRequest, completion_tokens: int) -> int:
+    return estimate_tokens(request.system_prompt or "") + estimate_tokens(request.prompt) + completion_tokens
+
+
+class RateLimitedAIGateway(AIGateway):
+    def __init__(
+        self,
+        inner: AIGateway,
+        token_bucket: RedisTokenBucket,
+        default_budget: ModelBudget,
+        model_budgets: Optional[Dict[str, ModelBudget]] = None,
+        max_concurrency: int = 8,
+        queue_deadline_seconds: float = 30.0,
+        estimated_completion_tokens: int = 512,
+        redis_retry_after_seconds: float = 5.0,
+    ):
+        self._inner = inner
+        self._token_bucket = token_bucket
+        self._default_budget = default_budget
+        self._model_budgets = model_budgets or {}
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queue_deadline_seconds = queue_deadline_seconds
+        self._estimated_completion_tokens = estimated_completion_tokens
+        self._redis_retry_after_seconds = redis_retry_after_seconds
+        self._redis_unavailable_until = 0.0
+        # One FIFO lock per model: only the head of a model's queue polls the shared bucket, so callers are
+        # admitted in arrival order and a throttled model does not hold up the others.
+        self._admission_locks: Dict[str, asyncio.Lock] = {}
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.throttled = 0
+        self.queue_timeouts = 0
+        self.redis_errors = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def inner(self) -> AIGateway:
+        return self._inner
+
+    def budget_for(self, model: str) -> ModelBudget:
+        return self._model_budgets.get(model, self._default_budget)
+
+    async def _acquire_budget(self, request: InferenceRequest) -> None:
+        budget = self.budget_for(request.model)
+        tokens = estimate_request_tokens(request, self._estimated_completion_tokens)
+        throttled = False
+        while time.monotonic() >= self._redis_unavailable_until:
+            try:
+                acquired, wait_ms = await self._token_bucket.try_acquire(
+                    request.model, budget.requests_per_minute, budget.tokens_per_minute, tokens
+                )
+            except RedisError as e:
+                # The per-process semaphore still bounds concurrency while the shared budget is unreachable.
+                self.redis_errors += 1
+                self._redis_unavailable_until = time.monotonic() + self._redis_retry_after_seconds
+                logger.warning(f"AI budget check failed open for model '{request.model}': {e}")
+                return
+            if acquired:
+                return
+            if not throttled:
+                throttled = True
+                self.throttled += 1
+            await asyncio.sleep(wait_ms / 1000)
+
+    async def _wait_for_budget(self, request: InferenceRequest, admission_lock: asyncio.Lock) -> None:
+        async with admission_lock:
+            await self._acquire_budget(request)
+
+    async def _admit(self, request: InferenceRequest) -> None:
+        enqueued_at = time.monotonic()
+        admission_lock = self._admission_locks.setdefault(request.model, asyncio.Lock())
+        self.waiting += 1
+        try:
+            try:
+                await asyncio.wait_for(self._wait_for_budget(request, admission_lock), timeout=self._queue_deadline_seconds)
+            except asyncio.TimeoutError:
+                self.queue_timeouts += 1
+                raise AIGatewayQueueTimeoutError(
+                    f"AI request for model '{request.model}' waited longer than {self._queue_deadline_seconds}s for capacity."
+                )
+            # The deadline only covers the shared budget: once it has been charged, timing out here would spend
+            # rpm/tpm on a request that never runs, so an admitted request always waits for its slot.
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        wait_seconds = time.monotonic() - enqueued_at
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        await self._admit(request)
+        self.in_flight += 1
+        try:
+            response = await self._inner.generate_text(request)
+            self.completed += 1
+            return response
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    async def stream_text(self, request: InferenceRequest) -> AsyncIterator[str]:
+        await self._admit(request)
+        self.in_flight += 1
+        try:
+            async for chunk in self._inner.stream_text(request):
+                yield chunk
+            self.completed += 1
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        admitted = self.completed + self.failed + self.in_flight
+        return {
+            "max_concurrency": self._max_concurrency,
+            "queue_depth": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "throttled": self.throttled,
+            "queue_timeouts": self.queue_timeouts,
+            "redis_errors": self.redis_errors,
+            "avg_wait_seconds": (self.total_wait_seconds / admitted) if admitted else 0.0,
+            "max_wait_seconds": self.max_wait_seconds,
+            "queue_deadline_seconds": self._queue_deadline_seconds,
+            "default_budget": {
+                "requests_per_minute": self._default_budget.requests_per_minute,
+                "tokens_per_minute": self._default_budget.tokens_per_minute,
+            },
+            "model_budgets": {
+                model: {"requests_per_minute": budget.requests_per_minute, "tokens_per_minute": budget.tokens_per_minute}
+                for model, budget in self._model_budgets.items()
+            },
+        }
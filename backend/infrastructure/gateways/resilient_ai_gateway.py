@@ -0,0 +1,324 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional
+
+from backend.application.ai_gateway.ai_gateway import AIGateway, AIGatewayError
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderHealth:
+    def __init__(self, failure_threshold: int, reset_timeout_seconds: float, ewma_alpha: float, latency_samples: int):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._ewma_alpha = ewma_alpha
+        self._latencies = deque(maxlen=latency_samples)
+        self._opened_until: Optional[float] = None
+        self._probe_in_flight = False
+
+        self.ewma_latency_seconds: Optional[float] = None
+        self.consecutive_failures = 0
+        self.successes = 0
+        self.failures = 0
+        self.circuit_opens = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_until is None:
+            return "closed"
+        if time.monotonic() < self._opened_until:
+            return "open"
+        return "half_open"
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def observe_latency(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+        if self.ewma_latency_seconds is None:
+            self.ewma_latency_seconds = seconds
+        else:
+            self.ewma_latency_seconds += self._ewma_alpha * (seconds - self.ewma_latency_seconds)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+    @property
+    def latency_sample_count(self) -> int:
+        return len(self._latencies)
+
+    def record_success(self, seconds: float) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self._opened_until = None
+        self._probe_in_flight = False
+        self.observe_latency(seconds)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self._probe_in_flight or self.consecutive_failures >= self._failure_threshold:
+            if self.state == "closed":
+                self.circuit_opens += 1
+            self._opened_until = time.monotonic() + self._reset_timeout_seconds
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "ewma_latency_seconds": self.ewma_latency_seconds,
+            "p95_latency_seconds": self.latency_percentile(0.95),
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_opens": self.circuit_opens,
+        }
+
+
+class ResilientAIGateway(AIGateway):
+    def __init__(
+        self,
+        inner: AIGateway,
+        fallback_providers: Optional[List[str]] = None,
+        max_attempts: int = 3,
+        base_backoff_seconds: float = 0.25,
+        max_backoff_seconds: float = 4.0,
+        hedging_enabled: bool = True,
+        hedge_percentile: float = 0.95,
+        default_hedge_delay_seconds: float = 10.0,
+        hedge_min_samples: int = 20,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        ewma_alpha: float = 0.2,
+        latency_samples: int = 200,
+    ):
+        self._inner = inner
+        self._fallback_providers = fallback_providers or []
+        self._max_attempts = max_attempts
+        self._base_backoff_seconds = base_backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._hedging_enabled = hedging_enabled
+        self._hedge_percentile = hedge_percentile
+        self._default_hedge_delay_seconds = default_hedge_delay_seconds
+        self._hedge_min_samples = hedge_min_samples
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._ewma_alpha = ewma_alpha
+        self._latency_samples = latency_samples
+        self._providers: Dict[str, ProviderHealth] = {}
+
+        self.requests = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+        self.exhausted = 0
+
+    def _health(self, model: str) -> ProviderHealth:
+        if model not in self._providers:
+            self._providers[model] = ProviderHealth(
+                failure_threshold=self._failure_threshold,
+                reset_timeout_seconds=self._reset_timeout_seconds,
+                ewma_alpha=self._ewma_alpha,
+                latency_samples=self._latency_samples,
+            )
+        return self._providers[model]
+
+    def _candidates(self, model: str) -> List[str]:
+        # The HF router picks the serving provider from a ":<provider>" suffix on the model id.
+        base_model = model.split(":", 1)[0]
+        candidates = [model]
+        for provider in self._fallback_providers:
+            candidate = f"{base_model}:{provider}"
+            if candidate not in candidates:
+                candidates.append(candidate)
+        # Fastest recent provider first. Providers without samples sort ahead so each one gets measured.
+        return sorted(candidates, key=lambda candidate: self._health(candidate).ewma_latency_seconds or 0.0)
+
+    def _hedge_delay_seconds(self, model: str) -> float:
+        health = self._health(model)
+        if health.latency_sample_count < self._hedge_min_samples:
+            return self._default_hedge_delay_seconds
+        return health.latency_percentile(self._hedge_percentile)
+
+    def _backoff_seconds(self, attempt: int) -> float:
+        return random.uniform(0, min(self._max_backoff_seconds, self._base_backoff_seconds * (2 ** attempt)))
+
+    async def _call_provider(self, request: InferenceRequest, model: str) -> InferenceResponse:
+        health = self._health(model)
+        started = time.monotonic()
+        try:
+            response = await self._inner.generate_text(request.model_copy(update={"model": model}))
+        except asyncio.CancelledError:
+            # A cancelled hedge loser never finished, so it has no latency to record: its elapsed time is just the
+            # hedge delay plus the winner's latency, and would drag the hedge delay percentile towards itself.
+            health.release_probe()
+            raise
+        except AIGatewayError as e:
+            if e.retryable:
+                health.record_failure()
+            else:
+                health.release_probe()
+            raise
+        except Exception:
+            health.release_probe()
+            raise
+        health.record_success(time.monotonic() - started)
+        return response
+
+    async def _call_hedged(self, request: InferenceRequest, primary: str, hedge: Optional[str]) -> InferenceResponse:
+        primary_task = asyncio.create_task(self._call_provider(request, primary))
+        pending = {primary_task}
+        try:
+            if hedge is not None:
+                done, pending = await asyncio.wait(pending, timeout=self._hedge_delay_seconds(primary))
+                if done:
+                    return primary_task.result()
+                if self._health(hedge).allow_request():
+                    self.hedges += 1
+                    pending.add(asyncio.create_task(self._call_provider(request, hedge)))
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary_task:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _ordered_candidates(self, request: InferenceRequest, failed_providers: set) -> List[str]:
+        # Retries move on to providers that have not failed this request yet, when there are any.
+        # Fallback models come after every provider of the requested model.
+        return sorted(
+            dict.fromkeys(
+                candidate
+                for model in [request.model, *request.fallback_models]
+                for candidate in self._candidates(model)
+                if self._health(candidate).state != "open"
+            ),
+            key=lambda candidate: candidate in failed_providers,
+        )
+
+    def _select_primary(self, request: InferenceRequest, candidates: List[str]) -> Optional[str]:
+        primary = next((candidate for candidate in candidates if self._health(candidate).allow_request()), None)
+        if primary is not None and primary != request.model:
+            self.failovers += 1
+        return primary
+
+    async def _back_off(self, attempt: int, primary: str, error: Exception) -> None:
+        self.retries += 1
+        backoff_seconds = self._backoff_seconds(attempt)
+        logger.warning(f"AI request to '{primary}' failed, retrying in {backoff_seconds:.2f}s: {error}")
+        await asyncio.sleep(backoff_seconds)
+
+    def _exhausted_error(self, request: InferenceRequest, last_error: Optional[Exception]) -> AIGatewayError:
+        self.exhausted += 1
+        if last_error is not None:
+            return AIGatewayError(f"AI request failed after {self._max_attempts} attempts: {last_error}")
+        return AIGatewayError(f"No AI provider available for model '{request.model}': all circuits are open.")
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        self.requests += 1
+        last_error: Optional[Exception] = None
+        failed_providers = set()
+
+        for attempt in range(self._max_attempts):
+            candidates = self._ordered_candidates(request, failed_providers)
+            primary = self._select_primary(request, candidates)
+            if primary is None:
+                break
+
+            hedge = None
+            if self._hedging_enabled:
+                # Hedges stay on the primary's model; a fallback model may answer differently.
+                base_model = primary.split(":", 1)[0]
+                hedge = next(
+                    (candidate for candidate in candidates if candidate != primary and candidate.split(":", 1)[0] == base_model),
+                    primary,
+                )
+
+            try:
+                return await self._call_hedged(request, primary, hedge)
+            except AIGatewayError as e:
+                if not e.retryable:
+                    raise
+                last_error = e
+                failed_providers.add(primary)
+
+            if attempt + 1 < self._max_attempts:
+                await self._back_off(attempt, primary, last_error)
+
+        raise self._exhausted_error(request, last_error)
+
+    async def stream_text(self, request: InferenceRequest) -> AsyncIterator[str]:
+        # Streams are not hedged, and once text has reached the caller a failure can no longer be retried.
+        self.requests += 1
+        last_error: Optional[Exception] = None
+        failed_providers = set()
+
+        for attempt in range(self._max_attempts):
+            primary = self._select_primary(request, self._ordered_candidates(request, failed_providers))
+            if primary is None:
+                break
+
+            health = self._health(primary)
+            started = time.monotonic()
+            streamed = False
+            try:
+                async for chunk in self._inner.stream_text(request.model_copy(update={"model": primary})):
+                    streamed = True
+                    yield chunk
+            except AIGatewayError as e:
+                if e.retryable:
+                    health.record_failure()
+                else:
+                    health.release_probe()
+                if streamed or not e.retryable:
+                    raise
+                last_error = e
+                failed_providers.add(primary)
+            except BaseException:
+                health.release_probe()
+                raise
+            else:
+                health.record_success(time.monotonic() - started)
+                return
+
+            if attempt + 1 < self._max_attempts:
+                await self._back_off(attempt, primary, last_error)
+
+        raise self._exhausted_error(request, last_error)
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+            "exhausted": self.exhausted,
+            "hedging_enabled": self._hedging_enabled,
+            "providers": {model: health.stats() for model, health in self._providers.items()},
+        }
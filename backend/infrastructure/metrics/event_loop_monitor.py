@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+from typing import NamedTuple, Optional, Tuple
+from prometheus_client import CollectorRegistry, Histogram
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+APP_PACKAGE = __name__.split(".")[0]
+
+
+def blocking_call_site(frame: FrameType) -> Tuple[str, Optional[str]]:
+    # The innermost frame names the module doing the blocking work (docx, bcrypt, ssl...),
+    # the innermost frame of our own package names the line that called into it.
+    culprit = frame.f_globals.get("__name__", "?")
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module == APP_PACKAGE or module.startswith(f"{APP_PACKAGE}."):
+            return culprit, f"{module}:{frame.f_lineno}"
+        frame = frame.f_back
+    return culprit, None
+
+
+class BlockingCall(NamedTuple):
+    expected_wakeup: float
+    culprit: str
+    call_site: Optional[str]
+    stack: str
+
+
+class EventLoopMonitor:
+    # A task sleeping for a fixed interval wakes up late by exactly the time other callbacks held the loop,
+    # so the wake-up delay is the event-loop lag every request waiting on I/O paid at that moment.
+    # With a blocking threshold set, a watchdog thread also captures the loop thread's stack while it is still
+    # blocked, which is the only point at which the offending call can be seen, and the sampler logs it with the
+    # full duration once the loop is free again.
+    def __init__(self, registry: CollectorRegistry, interval_seconds: float = 0.05,
+                 blocking_threshold_seconds: Optional[float] = None):
+        self._lag = Histogram(
+            "docugenius_event_loop_lag_seconds",
+            "Delay between when the event loop was due to wake a sleeping task and when it did.",
+            buckets=LOOP_LAG_BUCKETS,
+            registry=registry,
+        )
+        self._interval_seconds = interval_seconds
+        self._blocking_threshold_seconds = blocking_threshold_seconds
+        self._loop_thread_id: Optional[int] = None
+        self._expected_wakeup: Optional[float] = None
+        self._samples = 0
+        self._max_lag_seconds = 0.0
+        self._blocked_callbacks = 0
+        self._blocking_call: Optional[BlockingCall] = None
+
+    async def run(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        stopped = threading.Event()
+        if self._blocking_threshold_seconds is not None:
+            threading.Thread(target=self._watch, args=(stopped,), name="event-loop-watchdog", daemon=True).start()
+        try:
+            while True:
+                self._expected_wakeup = time.perf_counter() + self._interval_seconds
+                await asyncio.sleep(self._interval_seconds)
+                lag = max(0.0, time.perf_counter() - self._expected_wakeup)
+                self._lag.observe(lag)
+                self._samples += 1
+                self._max_lag_seconds = max(self._max_lag_seconds, lag)
+                if self._blocking_call is not None:
+                    self._report(self._blocking_call, lag)
+                    self._blocking_call = None
+        finally:
+            self._expected_wakeup = None
+            stopped.set()
+
+    def _watch(self, stopped: threading.Event) -> None:
+        reported_wakeup = None
+        while not stopped.wait(self._blocking_threshold_seconds / 4):
+            expected_wakeup = self._expected_wakeup
+            if expected_wakeup is None or expected_wakeup == reported_wakeup:
+                continue
+            blocked_seconds = time.perf_counter() - expected_wakeup
+            if blocked_seconds < self._blocking_threshold_seconds:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            # Captured once per late wake-up, while the loop is still stuck in the call.
+            reported_wakeup = expected_wakeup
+            self._blocked_callbacks += 1
+            culprit, call_site = blocking_call_site(frame)
+            self._blocking_call = BlockingCall(expected_wakeup, culprit, call_site, "".join(traceback.format_stack(frame)))
+
+    def _report(self, blocking_call: BlockingCall, lag: float) -> None:
+        duration = f"{lag * 1000:.0f} ms" if blocking_call.expected_wakeup == self._expected_wakeup \
+            else f"more than {self._blocking_threshold_seconds * 1000:.0f} ms"
+        called_from = f" (called from {blocking_call.call_site})" if blocking_call.call_site else ""
+        logger.warning(f"Event loop blocked for {duration} in {blocking_call.culprit}{called_from}:\n{blocking_call.stack}")
+
+    def stats(self) -> dict:
+        return {
+            "interval_ms": self._interval_seconds * 1000,
+            "samples": self._samples,
+            "max_lag_ms": round(self._max_lag_seconds * 1000, 3),
+            "blocking_detector_enabled": self._blocking_threshold_seconds is not None,
+            "blocked_callbacks": self._blocked_callbacks,
+        }
@@ -0,0 +1,71 @@
+import asyncio
+import hmac
+import os
+from typing import Optional
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, GCCollector, PlatformCollector, ProcessCollector, \
+    generate_latest
+from backend.application.metrics.metrics import StageMetrics
+from backend.infrastructure.ai_usage.ai_usage_dependencies import get_ai_usage_stats
+from backend.infrastructure.cache.cache_dependencies import get_cache_stats
+from backend.infrastructure.database.mysql_dependencies import get_db_pool_stats
+from backend.infrastructure.gateways.ai_gateway_dependencies import get_ai_gateway_stats
+from backend.infrastructure.metrics.event_loop_monitor import EventLoopMonitor
+from backend.infrastructure.metrics.prometheus_metrics import NoOpStageMetrics, PrometheusHTTPMetrics, \
+    PrometheusStageMetrics, StatsCollector
+from backend.infrastructure.password_hasher.password_hasher_dependencies import get_password_hasher_stats
+from backend.infrastructure.rate_limit.rate_limit_dependencies import get_rate_limit_stats
+from backend.infrastructure.redis.redis_dependencies import get_redis_pool_stats
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+# Scrapers must send "Authorization: Bearer <token>"; with no token configured /metrics refuses every request.
+METRICS_BEARER_TOKEN = os.getenv("METRICS_BEARER_TOKEN", "")
+EVENT_LOOP_MONITOR_ENABLED = METRICS_ENABLED and os.getenv("EVENT_LOOP_MONITOR_ENABLED", "true").lower() == "true"
+# Debug mode: logs the loop thread's stack whenever a single callback holds the loop past the threshold.
+BLOCKING_CALL_DETECTOR_ENABLED = os.getenv("BLOCKING_CALL_DETECTOR_ENABLED", "false").lower() == "true"
+
+metrics_registry = CollectorRegistry()
+ProcessCollector(registry=metrics_registry)
+PlatformCollector(registry=metrics_registry)
+GCCollector(registry=metrics_registry)
+
+http_metrics = PrometheusHTTPMetrics(metrics_registry)
+stage_metrics: StageMetrics = PrometheusStageMetrics(metrics_registry) if METRICS_ENABLED else NoOpStageMetrics()
+event_loop_monitor = EventLoopMonitor(
+    metrics_registry,
+    interval_seconds=float(os.getenv("EVENT_LOOP_LAG_INTERVAL_MS", 50)) / 1000,
+    blocking_threshold_seconds=(
+        float(os.getenv("BLOCKING_CALL_THRESHOLD_MS", 100)) / 1000 if BLOCKING_CALL_DETECTOR_ENABLED else None
+    ),
+)
+
+metrics_registry.register(StatsCollector({
+    "db_pool": get_db_pool_stats,
+    "redis_pool": get_redis_pool_stats,
+    "ai_gateway": get_ai_gateway_stats,
+    "ai_usage": get_ai_usage_stats,
+    "cache": get_cache_stats,
+    "password_hasher": get_password_hasher_stats,
+    "rate_limit": get_rate_limit_stats,
+    "event_loop": event_loop_monitor.stats,
+}))
+
+def get_http_metrics() -> PrometheusHTTPMetrics:
+    return http_metrics
+
+def get_stage_metrics() -> StageMetrics:
+    return stage_metrics
+
+def start_event_loop_monitor() -> Optional[asyncio.Task]:
+    if not EVENT_LOOP_MONITOR_ENABLED:
+        return None
+    return asyncio.create_task(event_loop_monitor.run())
+
+def is_metrics_request_authorized(authorization: Optional[str]) -> bool:
+    if not METRICS_BEARER_TOKEN or not authorization:
+        return False
+    scheme, _, token = authorization.partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(token.encode('utf-8'), METRICS_BEARER_TOKEN.encode('utf-8'))
+
+def render_metrics() -> bytes:
+    return generate_latest(metrics_registry)
@@ -0,0 +1,102 @@
+import logging
+from typing import Callable, Dict, Iterator, Tuple
+from prometheus_client import CollectorRegistry, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Label lookups take a lock and build a tuple key on every call, so the children are cached per label set.
+# Label values come from route templates, methods, status codes and fixed stage names, which keeps the caches small.
+
+class PrometheusHTTPMetrics:
+    def __init__(self, registry: CollectorRegistry):
+        self._request_duration = Histogram(
+            "docugenius_http_request_duration_seconds",
+            "Time to serve an HTTP request, including streamed bodies, by route template and status.",
+            ["method", "route", "status"],
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self._requests_in_flight = Gauge(
+            "docugenius_http_requests_in_flight",
+            "HTTP requests currently being served.",
+            ["method"],
+            registry=registry,
+        )
+        self._duration_children: Dict[Tuple[str, str, str], Histogram] = {}
+        self._in_flight_children: Dict[str, Gauge] = {}
+
+    def _in_flight(self, method: str) -> Gauge:
+        child = self._in_flight_children.get(method)
+        if child is None:
+            child = self._in_flight_children[method] = self._requests_in_flight.labels(method)
+        return child
+
+    def request_started(self, method: str) -> None:
+        self._in_flight(method).inc()
+
+    def request_finished(self, method: str, route: str, status: int, seconds: float) -> None:
+        self._in_flight(method).dec()
+        key = (method, route, str(status))
+        child = self._duration_children.get(key)
+        if child is None:
+            child = self._duration_children[key] = self._request_duration.labels(*key)
+        child.observe(seconds)
+
+
+class PrometheusStageMetrics:
+    def __init__(self, registry: CollectorRegistry):
+        self._stage_duration = Histogram(
+            "docugenius_use_case_stage_duration_seconds",
+            "Time spent in each stage of a use case.",
+            ["operation", "stage"],
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self._children: Dict[Tuple[str, str], Histogram] = {}
+
+    def observe_stage(self, operation: str, stage: str, seconds: float) -> None:
+        key = (operation, stage)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._stage_duration.labels(*key)
+        child.observe(seconds)
+
+
+class NoOpStageMetrics:
+    def observe_stage(self, operation: str, stage: str, seconds: float) -> None:
+        return None
+
+
+def flatten_stats(stats: dict, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    for key, value in stats.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten_stats(value, f"{path}.")
+        elif isinstance(value, (bool, int, float)):
+            yield path, float(value)
+
+
+class StatsCollector(Collector):
+    # Reads the existing stats providers only when Prometheus scrapes, so pools and gateways pay nothing per call.
+    def __init__(self, stats_providers: Dict[str, Callable[[], dict]]):
+        self._stats_providers = stats_providers
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        for component, stats_provider in self._stats_providers.items():
+            try:
+                stats = stats_provider()
+            except Exception as e:
+                logger.warning(f"Could not collect {component} stats for metrics: {e}")
+                continue
+            family = GaugeMetricFamily(
+                f"docugenius_{component}_stats",
+                f"Numeric {component.replace('_', ' ')} statistics, keyed by their path in the admin stats endpoint.",
+                labels=["stat"],
+            )
+            for path, value in flatten_stats(stats):
+                family.add_metric([path], value)
+            yield family
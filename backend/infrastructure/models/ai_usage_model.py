@@ -0,0 +1,27 @@
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String
+from backend.infrastructure.models.base import Base
+
+class AIUsageModel(Base):
+    __tablename__ = "ai_usage"
+    __table_args__ = (
+        Index("ix_ai_usage_created_at", "created_at"),
+        Index("ix_ai_usage_document_type_id_created_at", "document_type_id", "created_at"),
+        Index("ix_ai_usage_user_id_created_at", "user_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    use_case = Column(String(50), nullable=True)
+    user_id = Column(Integer, nullable=True)
+    document_type_id = Column(Integer, nullable=True)
+    model = Column(String(255), nullable=False)
+    status = Column(String(20), nullable=False)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    tokens_estimated = Column(Boolean, nullable=False, default=False)
+    latency_ms = Column(Float, nullable=False)
+    time_to_first_token_ms = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return (f"<AIUsageModel(id={self.id}, use_case='{self.use_case}', model='{self.model}', status='{self.status}', "
+                f"prompt_tokens={self.prompt_tokens}, completion_tokens={self.completion_tokens}, latency_ms={self.latency_ms})>")
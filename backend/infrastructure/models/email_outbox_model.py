@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index
+from backend.infrastructure.models.base import Base
+from backend.core.enums.email_outbox_status_enum import EmailOutboxStatus
+
+class EmailOutboxModel(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    to_email = Column(String(120), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(SQLEnum(EmailOutboxStatus), nullable=False, default=EmailOutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(String(500), nullable=True)
+    trace_context = Column(String(64), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return (f"<EmailOutboxModel(id={self.id}, to_email='{self.to_email}', status={self.status}, "
+                f"attempts={self.attempts}, next_attempt_at={self.next_attempt_at})>")
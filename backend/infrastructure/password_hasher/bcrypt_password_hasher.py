@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import bcrypt
+
+from backend.application.password_hasher.password_hasher import PasswordHasher
+
+
+class BcryptPasswordHasher(PasswordHasher):
+    def __init__(self, max_concurrency: int = 4, rounds: int = 12):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        self._max_concurrency = max_concurrency
+        self._rounds = rounds
+        # bcrypt releases the GIL while hashing, so worker threads run in parallel without blocking the event loop.
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+
+        self._queued = 0
+        self._in_flight = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._total_work_seconds = 0.0
+
+    def _run_timed(self, enqueued_at: float, fn: Callable[..., Any], *args: Any) -> Any:
+        started_at = time.perf_counter()
+        wait_seconds = started_at - enqueued_at
+        with self._lock:
+            self._queued -= 1
+            self._in_flight += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+                self._total_work_seconds += time.perf_counter() - started_at
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._executor, self._run_timed, time.perf_counter(), fn, *args)
+        except RuntimeError:
+            # The executor has been shut down.
+            with self._lock:
+                self._queued -= 1
+            raise
+        return await future
+
+    def _hash_sync(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self._rounds)).decode('utf-8')
+
+    @staticmethod
+    def _verify_sync(password: str, hashed_password: str) -> bool:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self._hash_sync, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._submit(self._verify_sync, password, hashed_password)
+
+    def shutdown(self) -> None:
+        # Queued hashes are dropped; callers still awaiting them are being torn down with the event loop anyway.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_concurrency": self._max_concurrency,
+                "rounds": self._rounds,
+                "queued": self._queued,
+                "in_flight": self._in_flight,
+                "peak_queued": self._peak_queued,
+                "completed": self._completed,
+                "avg_wait_ms": (self._total_wait_seconds / self._completed * 1000) if self._completed else 0.0,
+                "max_wait_ms": self._max_wait_seconds * 1000,
+                "avg_work_ms": (self._total_work_seconds / self._completed * 1000) if self._completed else 0.0,
+            }
@@ -0,0 +1,18 @@
+import os
+
+from backend.application.password_hasher.password_hasher import PasswordHasher
+from backend.infrastructure.password_hasher.bcrypt_password_hasher import BcryptPasswordHasher
+
+bcrypt_password_hasher = BcryptPasswordHasher(
+    max_concurrency=int(os.getenv("PASSWORD_HASHER_MAX_CONCURRENCY", min(4, os.cpu_count() or 1))),
+    rounds=int(os.getenv("BCRYPT_ROUNDS", 12)),
+)
+
+def get_password_hasher() -> PasswordHasher:
+    return bcrypt_password_hasher
+
+def close_password_hasher() -> None:
+    bcrypt_password_hasher.shutdown()
+
+def get_password_hasher_stats() -> dict:
+    return bcrypt_password_hasher.stats()
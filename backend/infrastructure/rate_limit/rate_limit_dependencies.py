@@ -0,0 +1,85 @@
+import os
+from typing import Optional
+
+from fastapi import Request
+from dotenv import load_dotenv
+
+from backend.infrastructure.rate_limit.sliding_window_rate_limiter import RateLimit, RateLimitPolicy, \
+    SlidingWindowRateLimiter
+from backend.infrastructure.redis.redis_dependencies import get_shared_redis_client
+
+load_dotenv()
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_TRUST_FORWARDED_FOR = os.getenv("RATE_LIMIT_TRUST_FORWARDED_FOR", "false").lower() == "true"
+
+# Limits are "<requests>/<window seconds>"; "off" disables a window.
+rate_limit_policies = {
+    "login": RateLimitPolicy(
+        name="login",
+        per_ip=RateLimit.parse(os.getenv("RATE_LIMIT_LOGIN_PER_IP", "10/60")),
+        per_route=RateLimit.parse(os.getenv("RATE_LIMIT_LOGIN_PER_ROUTE", "600/60")),
+    ),
+    "forgot_password": RateLimitPolicy(
+        name="forgot_password",
+        per_ip=RateLimit.parse(os.getenv("RATE_LIMIT_FORGOT_PASSWORD_PER_IP", "5/300")),
+    ),
+    "suggest": RateLimitPolicy(
+        name="suggest",
+        per_ip=RateLimit.parse(os.getenv("RATE_LIMIT_SUGGEST_PER_IP", "30/60")),
+        per_user=RateLimit.parse(os.getenv("RATE_LIMIT_SUGGEST_PER_USER", "10/60")),
+        per_route=RateLimit.parse(os.getenv("RATE_LIMIT_SUGGEST_PER_ROUTE", "120/60")),
+    ),
+    "suggest_batch": RateLimitPolicy(
+        name="suggest_batch",
+        per_ip=RateLimit.parse(os.getenv("RATE_LIMIT_SUGGEST_BATCH_PER_IP", "5/300")),
+        per_user=RateLimit.parse(os.getenv("RATE_LIMIT_SUGGEST_BATCH_PER_USER", "3/300")),
+        per_route=RateLimit.parse(os.getenv("RATE_LIMIT_SUGGEST_BATCH_PER_ROUTE", "20/300")),
+    ),
+    "generate_document": RateLimitPolicy(
+        name="generate_document",
+        per_ip=RateLimit.parse(os.getenv("RATE_LIMIT_GENERATE_DOCUMENT_PER_IP", "60/60")),
+        per_user=RateLimit.parse(os.getenv("RATE_LIMIT_GENERATE_DOCUMENT_PER_USER", "20/60")),
+        per_route=RateLimit.parse(os.getenv("RATE_LIMIT_GENERATE_DOCUMENT_PER_ROUTE", "300/60")),
+    ),
+}
+
+# Unauthenticated routes are limited by the middleware before the request body is parsed.
+rate_limit_path_policies = {
+    ("POST", "/api/v1/auth/login"): "login",
+    ("POST", "/api/v1/auth/forgot-password"): "forgot_password",
+}
+
+rate_limiter = SlidingWindowRateLimiter(
+    redis_client_provider=get_shared_redis_client,
+    key_prefix=os.getenv("RATE_LIMIT_KEY_PREFIX", "docugenius:rate_limit"),
+    redis_retry_after_seconds=float(os.getenv("RATE_LIMIT_REDIS_RETRY_AFTER_SECONDS", 5)),
+)
+
+def get_rate_limiter() -> SlidingWindowRateLimiter:
+    return rate_limiter
+
+def get_rate_limit_policy(name: str) -> RateLimitPolicy:
+    return rate_limit_policies[name]
+
+def get_client_ip(request: Request) -> Optional[str]:
+    if RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else None
+
+def get_rate_limit_stats() -> dict:
+    return {
+        "enabled": RATE_LIMIT_ENABLED,
+        "limiter": rate_limiter.stats(),
+        "policies": {
+            name: {
+                scope: (f"{rate_limit.limit}/{rate_limit.window_seconds}" if rate_limit else None)
+                for scope, rate_limit in (
+                    ("per_ip", policy.per_ip), ("per_user", policy.per_user), ("per_route", policy.per_route)
+                )
+            }
+            for name, policy in rate_limit_policies.items()
+        },
+    }
@@ -0,0 +1,159 @@
+import logging
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Every window is a sorted set of admitted request timestamps (ms). All windows of a policy are
+# trimmed, counted and, only if none is exhausted, appended to in a single atomic script call.
+SLIDING_WINDOW_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local member = now .. '-' .. ARGV[1]
+local retry_after_ms = 0
+local remaining = -1
+
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[i * 2])
+    local window_ms = tonumber(ARGV[i * 2 + 1])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window_ms)
+    local count = redis.call('ZCARD', key)
+    if count >= limit then
+        local blocking = redis.call('ZRANGE', key, count - limit, count - limit, 'WITHSCORES')
+        local wait_ms = math.max(tonumber(blocking[2]) + window_ms - now, 1)
+        if wait_ms > retry_after_ms then
+            retry_after_ms = wait_ms
+        end
+    elseif remaining < 0 or limit - count - 1 < remaining then
+        remaining = limit - count - 1
+    end
+end
+
+if retry_after_ms > 0 then
+    return {0, 0, retry_after_ms}
+end
+
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, member)
+    redis.call('PEXPIRE', key, tonumber(ARGV[i * 2 + 1]))
+end
+return {1, remaining, 0}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    limit: int
+    window_seconds: int
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional["RateLimit"]:
+        if not value or value.strip().lower() in ("0", "off", "none"):
+            return None
+        limit, _, window_seconds = value.partition("/")
+        return cls(limit=int(limit), window_seconds=int(window_seconds or 60))
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    per_ip: Optional[RateLimit] = None
+    per_user: Optional[RateLimit] = None
+    per_route: Optional[RateLimit] = None
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    remaining: Optional[int] = None
+    retry_after_seconds: int = 0
+
+
+class SlidingWindowRateLimiter:
+    def __init__(
+        self,
+        redis_client_provider: Callable[[], redis.Redis],
+        key_prefix: str = "docugenius:rate_limit",
+        redis_retry_after_seconds: float = 5.0,
+    ):
+        self._redis_client_provider = redis_client_provider
+        self._key_prefix = key_prefix
+        self._redis_retry_after_seconds = redis_retry_after_seconds
+        self._redis_unavailable_until = 0.0
+        self._script = None
+
+        self.allowed = 0
+        self.limited = 0
+        self.failed_open = 0
+        self.redis_errors = 0
+        self.limited_by_policy: dict = {}
+
+    def _windows(self, policy: RateLimitPolicy, client_ip: Optional[str], user_id: Optional[int]) -> List[Tuple[str, RateLimit]]:
+        windows = []
+        if policy.per_ip and client_ip:
+            windows.append((f"{self._key_prefix}:{policy.name}:ip:{client_ip}", policy.per_ip))
+        if policy.per_user and user_id is not None:
+            windows.append((f"{self._key_prefix}:{policy.name}:user:{user_id}", policy.per_user))
+        if policy.per_route:
+            windows.append((f"{self._key_prefix}:{policy.name}:route", policy.per_route))
+        return windows
+
+    async def hit(
+        self,
+        policy: RateLimitPolicy,
+        client_ip: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> RateLimitDecision:
+        windows = self._windows(policy, client_ip, user_id)
+        if not windows:
+            return RateLimitDecision(allowed=True)
+
+        if time.monotonic() < self._redis_unavailable_until:
+            self.failed_open += 1
+            return RateLimitDecision(allowed=True)
+
+        args = [uuid.uuid4().hex]
+        for _, rate_limit in windows:
+            args.extend([rate_limit.limit, rate_limit.window_seconds * 1000])
+
+        try:
+            redis_client = self._redis_client_provider()
+            if self._script is None:
+                self._script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+            allowed, remaining, retry_after_ms = await self._script(
+                keys=[key for key, _ in windows], args=args, client=redis_client
+            )
+        except RedisError as e:
+            self.redis_errors += 1
+            self.failed_open += 1
+            self._redis_unavailable_until = time.monotonic() + self._redis_retry_after_seconds
+            logger.warning(f"Rate limiter failed open for policy '{policy.name}': {e}")
+            return RateLimitDecision(allowed=True)
+
+        if int(allowed) == 1:
+            self.allowed += 1
+            return RateLimitDecision(allowed=True, remaining=int(remaining))
+
+        self.limited += 1
+        self.limited_by_policy[policy.name] = self.limited_by_policy.get(policy.name, 0) + 1
+        return RateLimitDecision(
+            allowed=False,
+            remaining=0,
+            retry_after_seconds=max(1, math.ceil(int(retry_after_ms) / 1000)),
+        )
+
+    def stats(self) -> dict:
+        return {
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "limited_by_policy": dict(self.limited_by_policy),
+            "failed_open": self.failed_open,
+            "redis_errors": self.redis_errors,
+            "redis_available": time.monotonic() >= self._redis_unavailable_until,
+        }
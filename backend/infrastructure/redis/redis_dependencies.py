@@ -1,18 +1,73 @@
 import redis.asyncio as redis
 import os
+from typing import Optional
+from backend.application.token_store.token_store import PasswordResetTokenStore
+from backend.infrastructure.redis.redis_token_store import RedisPasswordResetTokenStore
 
-async def get_redis_client() -> redis.Redis:
+_connection_pool: Optional[redis.BlockingConnectionPool] = None
+_shared_client: Optional[redis.Redis] = None
+
+def create_redis_connection_pool() -> redis.BlockingConnectionPool:
     host = os.getenv("REDIS_HOST", "localhost")
     port = int(os.getenv("REDIS_PORT", 6379))
     password = os.getenv("REDIS_PASSWORD", None)
     db = int(os.getenv("REDIS_DB", 0))
 
-    client = redis.Redis(
+    return redis.BlockingConnectionPool(
         host=host,
         port=port,
         password=password,
         db=db,
         decode_responses=True,
-        health_check_interval=30,
+        max_connections=int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", 50)),
+        timeout=float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", 5)),
+        health_check_interval=int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", 30)),
+        socket_connect_timeout=float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS", 5)),
+        socket_keepalive=True,
+    )
+
+def init_redis_connection_pool() -> redis.Redis:
+    global _connection_pool, _shared_client
+    _connection_pool = create_redis_connection_pool()
+    _shared_client = redis.Redis(connection_pool=_connection_pool)
+    return _shared_client
+
+async def close_redis_connection_pool() -> None:
+    global _connection_pool, _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    if _connection_pool is not None:
+        await _connection_pool.aclose()
+    _connection_pool = None
+    _shared_client = None
+
+def get_shared_redis_client() -> redis.Redis:
+    if _shared_client is None:
+        return init_redis_connection_pool()
+    return _shared_client
+
+async def get_redis_client() -> redis.Redis:
+    return get_shared_redis_client()
+
+def get_redis_pool_stats() -> dict:
+    if _connection_pool is None:
+        return {"initialized": False}
+
+    available = len(_connection_pool._available_connections)
+    in_use = len(_connection_pool._in_use_connections)
+    return {
+        "initialized": True,
+        "max_connections": _connection_pool.max_connections,
+        "created_connections": available + in_use,
+        "in_use_connections": in_use,
+        "available_connections": available,
+        "utilization": in_use / _connection_pool.max_connections,
+    }
+
+def get_password_reset_token_store() -> PasswordResetTokenStore:
+    return RedisPasswordResetTokenStore(
+        redis_client=get_shared_redis_client(),
+        ttl_seconds=int(os.getenv("RESET_TOKEN_TTL_SECONDS", 3600)),
+        max_issues_per_window=int(os.getenv("RESET_TOKEN_MAX_ISSUES_PER_WINDOW", 5)),
+        rate_window_seconds=int(os.getenv("RESET_TOKEN_RATE_WINDOW_SECONDS", 3600)),
     )
-    return client
\ No newline at end of file
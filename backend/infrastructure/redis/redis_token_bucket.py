@@ -0,0 +1,55 @@
+from typing import Callable, Tuple
+
+import redis.asyncio as redis
+
+# Each bucket is a hash of the remaining tokens and the last refill time. Buckets refill continuously at
+# capacity per minute. Every bucket passed in is charged, or none is, and the caller learns how long to
+# wait until all of them can pay.
+TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+local wait_ms = 0
+local levels = {}
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local cost = math.min(tonumber(ARGV[i * 2]), capacity)
+    local refill_per_ms = capacity / 60000
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local last_refill = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - last_refill) * refill_per_ms)
+    levels[i] = tokens - cost
+    if tokens < cost then
+        wait_ms = math.max(wait_ms, math.ceil((cost - tokens) / refill_per_ms))
+    end
+end
+
+if wait_ms > 0 then
+    return {0, wait_ms}
+end
+
+for i, key in ipairs(KEYS) do
+    redis.call('HSET', key, 'tokens', tostring(levels[i]), 'ts', now)
+    redis.call('PEXPIRE', key, 120000)
+end
+return {1, 0}
+"""
+
+
+class RedisTokenBucket:
+    def __init__(self, redis_client_provider: Callable[[], redis.Redis], key_prefix: str = "docugenius:ai_budget"):
+        self._redis_client_provider = redis_client_provider
+        self._key_prefix = key_prefix
+        self._script = None
+
+    async def try_acquire(self, name: str, requests_per_minute: int, tokens_per_minute: int, tokens: int) -> Tuple[bool, int]:
+        redis_client = self._redis_client_provider()
+        if self._script is None:
+            self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+        acquired, wait_ms = await self._script(
+            keys=[f"{self._key_prefix}:{name}:rpm", f"{self._key_prefix}:{name}:tpm"],
+            args=[requests_per_minute, 1, tokens_per_minute, tokens],
+            client=redis_client,
+        )
+        return int(acquired) == 1, int(wait_ms)
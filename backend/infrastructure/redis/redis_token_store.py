@@ -0,0 +1,59 @@
+import logging
+import secrets
+from typing import List, Optional
+import redis.asyncio as redis
+from backend.application.token_store.token_store import PasswordResetTokenStore
+
+logger = logging.getLogger(__name__)
+
+class RedisPasswordResetTokenStore(PasswordResetTokenStore):
+    def __init__(self, redis_client: redis.Redis, ttl_seconds: int = 3600, max_issues_per_window: int = 5,
+                 rate_window_seconds: int = 3600):
+        self._redis_client = redis_client
+        self._ttl_seconds = ttl_seconds
+        self._max_issues_per_window = max_issues_per_window
+        self._rate_window_seconds = rate_window_seconds
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return f"reset_token:{token}"
+
+    @staticmethod
+    def _rate_key(user_id: int) -> str:
+        return f"reset_token_rate:{user_id}"
+
+    async def issue(self, user_id: int) -> Optional[str]:
+        token = secrets.token_urlsafe(32)
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            pipe.set(self._rate_key(user_id), 0, ex=self._rate_window_seconds, nx=True)
+            pipe.incr(self._rate_key(user_id))
+            pipe.set(self._token_key(token), str(user_id), ex=self._ttl_seconds)
+            _, issued_in_window, _ = await pipe.execute()
+
+        if issued_in_window > self._max_issues_per_window:
+            # Over the limit: drop the token we just wrote. Only abusive callers pay this extra round trip.
+            await self._redis_client.delete(self._token_key(token))
+            logger.warning(f"Password reset token rate limit reached for user {user_id}.")
+            return None
+        return token
+
+    async def issue_many(self, user_ids: List[int]) -> List[str]:
+        tokens = [secrets.token_urlsafe(32) for _ in user_ids]
+        if not tokens:
+            return tokens
+
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            for token, user_id in zip(tokens, user_ids):
+                pipe.set(self._token_key(token), str(user_id), ex=self._ttl_seconds)
+            await pipe.execute()
+        return tokens
+
+    async def consume(self, token: str) -> Optional[int]:
+        user_id_str = await self._redis_client.getdel(self._token_key(token))
+        if user_id_str is None:
+            return None
+        try:
+            return int(user_id_str)
+        except ValueError:
+            logger.error(f"Invalid user ID format stored for reset token: {user_id_str}")
+            return None
@@ -0,0 +1,87 @@
+from typing import Optional, List
+from backend.application.repositories.document_field_repository import DocumentFieldRepository
+from backend.core.enums.field_type_enum import FieldType
+from backend.core.models.document_field import DocumentField as CoreDocumentField
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+
+
+def encode_document_field(document_field: CoreDocumentField) -> dict:
+    return {
+        "id": document_field.id,
+        "document_type_id": document_field.document_type_id,
+        "name": document_field.name,
+        "field_type": document_field.field_type.value,
+        "is_required": document_field.is_required,
+        "description": document_field.description
+    }
+
+def decode_document_field(payload: dict) -> CoreDocumentField:
+    return CoreDocumentField(
+        id=payload["id"],
+        document_type_id=payload["document_type_id"],
+        name=payload["name"],
+        field_type=FieldType(payload["field_type"]),
+        is_required=payload["is_required"],
+        description=payload["description"]
+    )
+
+def document_schema_cache_keys(document_type_id: int) -> List[str]:
+    return [
+        f"type:{document_type_id}",
+        f"type_with_fields:{document_type_id}",
+        f"fields_by_type:{document_type_id}",
+    ]
+
+
+class CachedDocumentFieldRepository(DocumentFieldRepository):
+    def __init__(self, inner: DocumentFieldRepository, cache: TwoTierCache):
+        self._inner = inner
+        self._cache = cache
+
+    async def _invalidate_document_types(self, document_type_ids: set) -> None:
+        keys = [key for document_type_id in document_type_ids for key in document_schema_cache_keys(document_type_id)]
+        await self._cache.invalidate(*keys)
+
+    async def save(self, document_field: CoreDocumentField) -> CoreDocumentField:
+        saved = await self._inner.save(document_field)
+        await self._invalidate_document_types({saved.document_type_id})
+        return saved
+
+    async def save_all(self, document_fields: List[CoreDocumentField]) -> List[CoreDocumentField]:
+        saved = await self._inner.save_all(document_fields)
+        await self._invalidate_document_types({field.document_type_id for field in saved})
+        return saved
+
+    async def find_by_id(self, id: int) -> Optional[CoreDocumentField]:
+        return await self._inner.find_by_id(id)
+
+    async def find_by_name_and_document_type(self, name: str, document_type_id: int) -> Optional[CoreDocumentField]:
+        return await self._inner.find_by_name_and_document_type(name, document_type_id)
+
+    async def find_by_names_and_document_type(self, names: List[str], document_type_id: int) -> List[CoreDocumentField]:
+        return await self._inner.find_by_names_and_document_type(names, document_type_id)
+
+    async def find_all_by_document_type(self, document_type_id: int) -> List[CoreDocumentField]:
+        return await self._cache.get_or_load(
+            f"fields_by_type:{document_type_id}",
+            loader=lambda: self._inner.find_all_by_document_type(document_type_id),
+            encode=lambda fields: [encode_document_field(field) for field in fields],
+            decode=lambda payload: [decode_document_field(item) for item in payload],
+        )
+
+    async def update(self, id: int, document_field: CoreDocumentField) -> Optional[CoreDocumentField]:
+        existing = await self._inner.find_by_id(id)
+        updated = await self._inner.update(id, document_field)
+        # A field moved to another document type must also disappear from its previous type's cached schema.
+        document_type_ids = {document_field.document_type_id}
+        if existing:
+            document_type_ids.add(existing.document_type_id)
+        await self._invalidate_document_types(document_type_ids)
+        return updated
+
+    async def delete(self, id: int) -> bool:
+        existing = await self._inner.find_by_id(id)
+        success = await self._inner.delete(id)
+        if existing:
+            await self._invalidate_document_types({existing.document_type_id})
+        return success
@@ -0,0 +1,93 @@
+from typing import Optional, List
+from backend.application.repositories.document_type_repository import DocumentTypeRepository
+from backend.core.models.document_type import DocumentType as CoreDocumentType
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+from backend.infrastructure.repositories.cached_document_field_repository import encode_document_field, \
+    decode_document_field, document_schema_cache_keys
+
+
+def encode_document_type(document_type: CoreDocumentType) -> dict:
+    return {
+        "id": document_type.id,
+        "name": document_type.name,
+        "description": document_type.description,
+        "fields": [encode_document_field(field) for field in document_type.fields]
+    }
+
+def decode_document_type(payload: dict) -> CoreDocumentType:
+    return CoreDocumentType(
+        id=payload["id"],
+        name=payload["name"],
+        description=payload["description"],
+        fields=[decode_document_field(item) for item in payload["fields"]]
+    )
+
+
+class CachedDocumentTypeRepository(DocumentTypeRepository):
+    def __init__(self, inner: DocumentTypeRepository, cache: TwoTierCache):
+        self._inner = inner
+        self._cache = cache
+
+    async def _invalidate(self, *document_type_ids: int) -> None:
+        keys = [key for document_type_id in document_type_ids for key in document_schema_cache_keys(document_type_id)]
+        await self._cache.invalidate(*keys)
+
+    async def save(self, document_type: CoreDocumentType) -> CoreDocumentType:
+        saved = await self._inner.save(document_type)
+        await self._invalidate(saved.id)
+        return saved
+
+    async def save_all(self, document_types: List[CoreDocumentType]) -> List[CoreDocumentType]:
+        saved = await self._inner.save_all(document_types)
+        await self._invalidate(*[dt.id for dt in saved])
+        return saved
+
+    async def find_by_id(self, id: int) -> Optional[CoreDocumentType]:
+        return await self._cache.get_or_load(
+            f"type:{id}",
+            loader=lambda: self._inner.find_by_id(id),
+            encode=encode_document_type,
+            decode=decode_document_type,
+        )
+
+    async def find_by_id_with_fields(self, id: int) -> Optional[CoreDocumentType]:
+        return await self._cache.get_or_load(
+            f"type_with_fields:{id}",
+            loader=lambda: self._inner.find_by_id_with_fields(id),
+            encode=encode_document_type,
+            decode=decode_document_type,
+        )
+
+    async def find_by_name(self, name: str) -> Optional[CoreDocumentType]:
+        return await self._inner.find_by_name(name)
+
+    async def find_by_names(self, names: List[str]) -> List[CoreDocumentType]:
+        return await self._inner.find_by_names(names)
+
+    async def find_all(self) -> List[CoreDocumentType]:
+        return await self._inner.find_all()
+
+    async def update(self, id: int, document_type: CoreDocumentType) -> Optional[CoreDocumentType]:
+        updated = await self._inner.update(id, document_type)
+        await self._invalidate(id)
+        return updated
+
+    async def delete(self, id: int) -> bool:
+        success = await self._inner.delete(id)
+        await self._invalidate(id)
+        return success
+
+    async def find_all_paginated(self, offset: int, limit: int) -> List[CoreDocumentType]:
+        return await self._inner.find_all_paginated(offset, limit)
+
+    async def count_all(self) -> int:
+        return await self._inner.count_all()
+
+    async def find_with_fields(self) -> List[CoreDocumentType]:
+        return await self._inner.find_with_fields()
+
+    async def find_with_fields_paginated(self, offset: int, limit: int) -> List[CoreDocumentType]:
+        return await self._inner.find_with_fields_paginated(offset, limit)
+
+    async def count_with_fields(self) -> int:
+        return await self._inner.count_with_fields()
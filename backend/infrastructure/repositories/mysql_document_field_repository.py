@@ -1,7 +1,7 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete, update, func
+from sqlalchemy import delete, update, func, insert, tuple_
 from backend.application.repositories.document_field_repository import DocumentFieldRepository
 from backend.core.models.document_field import DocumentField as CoreDocumentField
 from backend.infrastructure.models.document_field_model import DocumentFieldModel
@@ -90,6 +90,76 @@ class MySqlDocumentFieldRepository(DocumentFieldRepository):
             ) for field in infra_doc_fields
         ]
 
+    async def find_by_names_and_document_type(self, names: List[str], document_type_id: int) -> List[CoreDocumentField]:
+        if not names:
+            return []
+
+        result = await self._db_session.execute(
+            select(DocumentFieldModel)
+            .where(DocumentFieldModel.document_type_id == document_type_id)
+            .where(DocumentFieldModel.name.in_(names))
+        )
+        infra_doc_fields = result.scalars().all()
+        return [
+            CoreDocumentField(
+                id=field.id,
+                document_type_id=field.document_type_id,
+                name=field.name,
+                field_type=field.field_type,
+                is_required=field.is_required,
+                description=field.description
+            ) for field in infra_doc_fields
+        ]
+
+    async def save_all(self, document_fields: List[CoreDocumentField]) -> List[CoreDocumentField]:
+        if not document_fields:
+            return []
+
+        try:
+            await self._db_session.execute(
+                insert(DocumentFieldModel).values([
+                    {
+                        "document_type_id": field.document_type_id,
+                        "name": field.name,
+                        "field_type": field.field_type,
+                        "is_required": field.is_required,
+                        "description": field.description
+                    } for field in document_fields
+                ])
+            )
+
+            # MySQL has no RETURNING, so the generated IDs are read back in the same transaction.
+            result = await self._db_session.execute(
+                select(DocumentFieldModel).where(
+                    tuple_(DocumentFieldModel.document_type_id, DocumentFieldModel.name).in_(
+                        [(field.document_type_id, field.name) for field in document_fields]
+                    )
+                )
+            )
+            infra_doc_fields = result.scalars().all()
+            await self._db_session.commit()
+        except Exception:
+            await self._db_session.rollback()
+            raise
+
+        saved_by_key = {
+            (field.document_type_id, field.name.casefold()): field for field in infra_doc_fields
+        }
+        saved_core_entities = []
+        for document_field in document_fields:
+            infra_doc_field = saved_by_key[(document_field.document_type_id, document_field.name.casefold())]
+            saved_core_entities.append(
+                CoreDocumentField(
+                    id=infra_doc_field.id,
+                    document_type_id=infra_doc_field.document_type_id,
+                    name=infra_doc_field.name,
+                    field_type=infra_doc_field.field_type,
+                    is_required=infra_doc_field.is_required,
+                    description=infra_doc_field.description
+                )
+            )
+        return saved_core_entities
+
     async def update(self, id: int, document_field: CoreDocumentField) -> Optional[CoreDocumentField]:
         stmt = (
             update(DocumentFieldModel).
@@ -2,9 +2,10 @@ from typing import Optional, List
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete, update, func, asc, exists
+from sqlalchemy import delete, update, func, asc, exists, insert
 from backend.application.repositories.document_type_repository import DocumentTypeRepository
 from backend.core.models.document_type import DocumentType as CoreDocumentType
+from backend.core.models.document_field import DocumentField as CoreDocumentField
 from backend.infrastructure.models.document_type_model import DocumentTypeModel as InfraDocumentType
 from backend.infrastructure.models.document_field_model import DocumentFieldModel as InfraDocumentField
 
@@ -47,6 +48,34 @@ class MySqlDocumentTypeRepository(DocumentTypeRepository):
             )
         return None
 
+    async def find_by_id_with_fields(self, id: int) -> Optional[CoreDocumentType]:
+        result = await self._db_session.execute(
+            select(InfraDocumentType, InfraDocumentField)
+            .outerjoin(InfraDocumentField, InfraDocumentField.document_type_id == InfraDocumentType.id)
+            .where(InfraDocumentType.id == id)
+            .order_by(InfraDocumentField.id.asc())
+        )
+        rows = result.all()
+        if not rows:
+            return None
+
+        infra_doc_type = rows[0][0]
+        return CoreDocumentType(
+            id=infra_doc_type.id,
+            name=infra_doc_type.name,
+            description=infra_doc_type.description,
+            fields=[
+                CoreDocumentField(
+                    id=infra_doc_field.id,
+                    document_type_id=infra_doc_field.document_type_id,
+                    name=infra_doc_field.name,
+                    field_type=infra_doc_field.field_type,
+                    is_required=infra_doc_field.is_required,
+                    description=infra_doc_field.description
+                ) for _, infra_doc_field in rows if infra_doc_field is not None
+            ]
+        )
+
     async def find_by_name(self, name: str) -> Optional[CoreDocumentType]:
         result = await self._db_session.execute(
             select(InfraDocumentType).where(InfraDocumentType.name == name)
@@ -60,6 +89,52 @@ class MySqlDocumentTypeRepository(DocumentTypeRepository):
             )
         return None
 
+    async def find_by_names(self, names: List[str]) -> List[CoreDocumentType]:
+        if not names:
+            return []
+
+        result = await self._db_session.execute(
+            select(InfraDocumentType).where(InfraDocumentType.name.in_(names))
+        )
+        infra_doc_types = result.scalars().all()
+        return [
+            CoreDocumentType(
+                id=dt.id,
+                name=dt.name,
+                description=dt.description
+            ) for dt in infra_doc_types
+        ]
+
+    async def save_all(self, document_types: List[CoreDocumentType]) -> List[CoreDocumentType]:
+        if not document_types:
+            return []
+
+        try:
+            await self._db_session.execute(
+                insert(InfraDocumentType).values([
+                    {"name": dt.name, "description": dt.description} for dt in document_types
+                ])
+            )
+
+            # MySQL has no RETURNING, so the generated IDs are read back in the same transaction.
+            result = await self._db_session.execute(
+                select(InfraDocumentType).where(InfraDocumentType.name.in_([dt.name for dt in document_types]))
+            )
+            infra_doc_types = result.scalars().all()
+            await self._db_session.commit()
+        except Exception:
+            await self._db_session.rollback()
+            raise
+
+        saved_by_name = {dt.name.casefold(): dt for dt in infra_doc_types}
+        return [
+            CoreDocumentType(
+                id=saved_by_name[dt.name.casefold()].id,
+                name=saved_by_name[dt.name.casefold()].name,
+                description=saved_by_name[dt.name.casefold()].description
+            ) for dt in document_types
+        ]
+
     async def find_all(self) -> List[CoreDocumentType]:
         result = await self._db_session.execute(select(InfraDocumentType))
         infra_doc_types = result.scalars().all()
@@ -119,7 +194,7 @@ class MySqlDocumentTypeRepository(DocumentTypeRepository):
             InfraDocumentField.document_type_id == InfraDocumentType.id).exists()
 
         query = select(InfraDocumentType).where(subq)
-        logger.info(f"DEBUG: Executing query: {query}")
+        logger.debug("Executing query: %s", query)
         result = await self._db_session.execute(query)
         infra_doc_types = result.scalars().all()
         logger.info(f"DEBUG: find_with_fields returned {len(infra_doc_types)} items")
@@ -137,7 +212,7 @@ class MySqlDocumentTypeRepository(DocumentTypeRepository):
             InfraDocumentField.document_type_id == InfraDocumentType.id).exists()
 
         query = select(InfraDocumentType).where(subq).order_by(InfraDocumentType.name.asc()).offset(offset).limit(limit)
-        logger.info(f"DEBUG: Executing query: {query}")
+        logger.debug("Executing query: %s", query)
         result = await self._db_session.execute(query)
         infra_doc_types = result.scalars().all()
         logger.info(f"DEBUG: find_with_fields_paginated returned {len(infra_doc_types)} items")
@@ -155,7 +230,7 @@ class MySqlDocumentTypeRepository(DocumentTypeRepository):
             InfraDocumentField.document_type_id == InfraDocumentType.id).exists()
 
         query = select(func.count(InfraDocumentType.id)).where(subq)
-        logger.info(f"DEBUG: Executing query: {query}")
+        logger.debug("Executing query: %s", query)
         result = await self._db_session.execute(query)
         count_result = result.scalar() or 0
         logger.info(f"DEBUG: count_with_fields returned {count_result}")
@@ -1,7 +1,7 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete, update, func
+from sqlalchemy import delete, update, insert, func, or_, case
 from backend.application.repositories.user_repository import UserRepository
 from backend.core.enums.user_role_enum import UserRole
 from backend.core.models.user import User as CoreUser
@@ -98,6 +98,92 @@ class MySqlUserRepository(UserRepository):
             )
         return None
 
+    async def find_by_identifier(self, identifier: str) -> Optional[CoreUser]:
+        result = await self._db_session.execute(
+            select(UserModel)
+            .where(or_(UserModel.username == identifier, UserModel.email == identifier))
+            .order_by(case((UserModel.username == identifier, 0), else_=1))
+            .limit(1)
+        )
+        infra_user = result.scalars().first()
+        if infra_user:
+            return CoreUser(
+                id=infra_user.id,
+                username=infra_user.username,
+                email=infra_user.email,
+                hashed_password=HashedPassword(value=infra_user.password_hash),
+                role=infra_user.role,
+                is_active=infra_user.is_active,
+                created_at=infra_user.created_at,
+                updated_at=infra_user.updated_at
+            )
+        return None
+
+    async def find_by_usernames_or_emails(self, usernames: List[str], emails: List[str]) -> List[CoreUser]:
+        if not usernames and not emails:
+            return []
+
+        result = await self._db_session.execute(
+            select(UserModel).where(or_(UserModel.username.in_(usernames), UserModel.email.in_(emails)))
+        )
+        return [
+            CoreUser(
+                id=infra_user.id,
+                username=infra_user.username,
+                email=infra_user.email,
+                hashed_password=HashedPassword(value=infra_user.password_hash),
+                role=infra_user.role,
+                is_active=infra_user.is_active,
+                created_at=infra_user.created_at,
+                updated_at=infra_user.updated_at
+            ) for infra_user in result.scalars().all()
+        ]
+
+    async def save_all(self, users: List[CoreUser], created_by_user_id: int = None) -> List[CoreUser]:
+        if not users:
+            return []
+
+        try:
+            await self._db_session.execute(
+                insert(UserModel).values([
+                    {
+                        "username": user.username,
+                        "email": user.email,
+                        "password_hash": user.hashed_password.value,
+                        "role": user.role,
+                        "is_active": user.is_active,
+                        "created_by_user_id": created_by_user_id
+                    } for user in users
+                ])
+            )
+
+            # MySQL has no RETURNING, so the generated IDs are read back in the same transaction.
+            result = await self._db_session.execute(
+                select(UserModel).where(UserModel.username.in_([user.username for user in users]))
+            )
+            infra_users = result.scalars().all()
+            await self._db_session.commit()
+        except Exception:
+            await self._db_session.rollback()
+            raise
+
+        saved_by_username = {infra_user.username.casefold(): infra_user for infra_user in infra_users}
+        saved_users = []
+        for user in users:
+            infra_user = saved_by_username[user.username.casefold()]
+            saved_users.append(CoreUser(
+                id=infra_user.id,
+                username=infra_user.username,
+                email=infra_user.email,
+                hashed_password=HashedPassword(value=infra_user.password_hash),
+                role=infra_user.role,
+                is_active=infra_user.is_active,
+                created_at=infra_user.created_at,
+                updated_at=infra_user.updated_at,
+                created_by_user_id=created_by_user_id
+            ))
+        return saved_users
+
     async def find_all(self) -> List[CoreUser]:
         result = await self._db_session.execute(select(UserModel))
         infra_users = result.scalars().all()
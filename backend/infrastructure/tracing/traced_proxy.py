@@ -0,0 +1,71 @@
+import inspect
+from typing import Any, Callable, Dict, Optional
+from opentelemetry.trace import Span, Status, StatusCode, Tracer
+
+SpanAttributes = Callable[..., Dict[str, Any]]
+
+# Wraps a use case, repository or gateway so that every public coroutine method runs in a span named after the
+# wrapped class and method. Wrappers are built on first access and cached on the proxy, so later calls cost one
+# attribute lookup plus the span itself; synchronous methods and attributes are passed through untouched.
+class TracedProxy:
+    def __init__(self, target: Any, tracer: Tracer, component: str, span_attributes: Optional[SpanAttributes] = None):
+        self._target = target
+        self._tracer = tracer
+        self._component = component
+        self._span_attributes = span_attributes
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith("_"):
+            return attribute
+        if inspect.iscoroutinefunction(attribute):
+            wrapper = self._trace_coroutine(name, attribute)
+        elif inspect.isasyncgenfunction(attribute):
+            wrapper = self._trace_async_generator(name, attribute)
+        else:
+            return attribute
+        self.__dict__[name] = wrapper
+        return wrapper
+
+    def _start_attributes(self, args: tuple, kwargs: dict) -> Dict[str, Any]:
+        attributes = {"docugenius.component": self._component}
+        if self._span_attributes is not None:
+            attributes.update(self._span_attributes(*args, **kwargs))
+        return attributes
+
+    @staticmethod
+    def _record_result(span: Span, result: Any) -> None:
+        # Use cases report failures as APIResponse(success=False) rather than raising.
+        if span.is_recording() and getattr(result, "success", True) is False:
+            span.set_attribute("docugenius.success", False)
+            span.set_attribute("docugenius.error_code", getattr(result, "error_code", None) or "")
+
+    def _trace_coroutine(self, name: str, method: Callable) -> Callable:
+        span_name = f"{type(self._target).__name__}.{name}"
+
+        async def traced_call(*args, **kwargs):
+            with self._tracer.start_as_current_span(span_name, attributes=self._start_attributes(args, kwargs)) as span:
+                result = await method(*args, **kwargs)
+                self._record_result(span, result)
+                return result
+
+        return traced_call
+
+    def _trace_async_generator(self, name: str, method: Callable) -> Callable:
+        span_name = f"{type(self._target).__name__}.{name}"
+
+        # The span is not made current: a streamed body may be closed from another task, where detaching the
+        # context it was attached in would fail. Calls made while streaming are traced as siblings instead.
+        async def traced_stream(*args, **kwargs):
+            span = self._tracer.start_span(span_name, attributes=self._start_attributes(args, kwargs))
+            try:
+                async for item in method(*args, **kwargs):
+                    yield item
+            except Exception as e:
+                span.record_exception(e)
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                raise
+            finally:
+                span.end()
+
+        return traced_stream
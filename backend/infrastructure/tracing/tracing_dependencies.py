@@ -0,0 +1,45 @@
+import os
+from typing import Any, Optional, TypeVar
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from backend.infrastructure.tracing.traced_proxy import SpanAttributes, TracedProxy
+
+T = TypeVar("T")
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+# "otlp" sends to OTEL_EXPORTER_OTLP_ENDPOINT (http://localhost:4318 by default); "console" prints spans to stdout.
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "otlp").lower()
+# Sampled at the root only; downstream spans follow the parent's decision, so a trace is kept or dropped whole.
+TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", 0.05))
+
+_tracer_provider: Optional[TracerProvider] = None
+
+def configure_tracing() -> None:
+    global _tracer_provider
+    if not TRACING_ENABLED or _tracer_provider is not None:
+        return
+
+    _tracer_provider = TracerProvider(
+        resource=Resource.create({"service.name": os.getenv("OTEL_SERVICE_NAME", "docugenius-ai-backend")}),
+        sampler=ParentBased(TraceIdRatioBased(TRACING_SAMPLE_RATIO)),
+    )
+    exporter = ConsoleSpanExporter() if TRACING_EXPORTER == "console" else OTLPSpanExporter()
+    _tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_tracer_provider)
+
+def shutdown_tracing() -> None:
+    if _tracer_provider is not None:
+        _tracer_provider.shutdown()
+
+def get_tracer() -> trace.Tracer:
+    return trace.get_tracer("backend")
+
+def traced(target: T, component: str, span_attributes: Optional[SpanAttributes] = None) -> T:
+    if not TRACING_ENABLED:
+        return target
+    proxy: Any = TracedProxy(target, get_tracer(), component, span_attributes)
+    return proxy
@@ -1,6 +1,8 @@
+import json
 from typing import List
 
 from fastapi import APIRouter, Depends, status, Path
+from fastapi.responses import StreamingResponse
 from backend.application.dtos.document_field import CreateDocumentFieldRequest, DocumentFieldResponse, \
     BatchCreateDocumentFieldsRequest, DocumentFieldListResponse, UpdateDocumentFieldRequest
 from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsResponse, \
@@ -8,6 +10,8 @@ from backend.application.dtos.document_field_suggestion import GenerateDocumentF
 from backend.application.dtos.enum_dtos import EnumListResponse
 from backend.application.use_cases.document_field.batch_create_document_fields_use_case import \
     BatchCreateDocumentFieldsUseCase
+from backend.application.use_cases.document_field.batch_suggest_document_fields_use_case import \
+    BatchSuggestDocumentFieldsUseCase
 from backend.application.use_cases.document_field.create_document_field_use_case import CreateDocumentFieldUseCase
 from backend.application.use_cases.document_field.delete_document_field_use_case import DeleteDocumentFieldUseCase
 from backend.application.use_cases.document_field.get_document_field_by_id_use_case import GetDocumentFieldByIdUseCase
@@ -22,7 +26,7 @@ from backend.core.models.user import User
 from backend.interfaces.dependencies import get_create_document_field_use_case, get_suggest_document_fields_use_case, \
     get_batch_create_document_fields_use_case, get_list_document_fields_by_document_type_use_case, \
     get_get_document_field_by_id_use_case, get_update_document_field_use_case, get_delete_document_field_use_case, \
-    get_get_field_types_use_case, role_checker
+    get_get_field_types_use_case, get_batch_suggest_document_fields_use_case, role_checker, rate_limit
 from backend.application.dtos.api_response import APIResponse
 
 router = APIRouter(prefix="/document-fields", tags=["Document Fields - Admin"])
@@ -67,9 +71,46 @@ async def batch_create_document_fields(
 async def suggest_document_fields(
     request_dto: GenerateDocumentFieldsRequest,
     current_user: User = Depends(role_checker([UserRole.ADMIN])),
+    rate_limited_user: User = Depends(rate_limit("suggest")),
     use_case: SuggestDocumentFieldsUseCase = Depends(get_suggest_document_fields_use_case)
 ) -> APIResponse[GenerateDocumentFieldsResponse]:
-    return await use_case.execute(request_dto=request_dto)
+    return await use_case.execute(request_dto=request_dto, current_user_id=current_user.id)
+
+@router.post(
+    "/suggest/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream suggested fields for a new document type (Admin)",
+    description="Streams fields suggested by the AI as newline-delimited JSON. Each suggested field is sent as a 'field' event as soon as it is complete, followed by a final 'result' event with the full response. Access restricted to administrators. Version: v1.",
+)
+async def stream_suggest_document_fields(
+    request_dto: GenerateDocumentFieldsRequest,
+    current_user: User = Depends(role_checker([UserRole.ADMIN])),
+    rate_limited_user: User = Depends(rate_limit("suggest")),
+    use_case: SuggestDocumentFieldsUseCase = Depends(get_suggest_document_fields_use_case)
+) -> StreamingResponse:
+    async def ndjson_events():
+        async for event in use_case.execute_stream(request_dto=request_dto, current_user_id=current_user.id):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(ndjson_events(), media_type="application/x-ndjson")
+
+@router.post(
+    "/suggest/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Suggest fields for many document types at once (Admin)",
+    description="Calls the AI to suggest fields for each given document type concurrently, under a concurrency cap, and streams the results as newline-delimited JSON. Each document type's response is sent as a 'suggestion' event, with its index in the request, as soon as it completes, followed by a final 'result' event summarizing the batch. Access restricted to administrators. Version: v1.",
+)
+async def batch_suggest_document_fields(
+    request_dtos: List[GenerateDocumentFieldsRequest],
+    current_user: User = Depends(role_checker([UserRole.ADMIN])),
+    rate_limited_user: User = Depends(rate_limit("suggest_batch")),
+    use_case: BatchSuggestDocumentFieldsUseCase = Depends(get_batch_suggest_document_fields_use_case)
+) -> StreamingResponse:
+    async def ndjson_events():
+        async for event in use_case.execute_stream(request_dtos=request_dtos, current_user_id=current_user.id):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(ndjson_events(), media_type="application/x-ndjson")
 
 @router.get(
     "/{id}",
@@ -15,7 +15,7 @@ from backend.core.enums.user_role_enum import UserRole
 from backend.core.models.user import User
 from backend.interfaces.dependencies import get_create_document_type_use_case, get_update_document_type_use_case, \
     get_delete_document_type_use_case, get_batch_create_document_types_use_case, \
-    get_suggest_document_types_use_case, role_checker
+    get_suggest_document_types_use_case, role_checker, rate_limit
 from backend.application.dtos.api_response import APIResponse
 
 router = APIRouter(prefix="/document-types", tags=["Document Types - Admin"])
@@ -33,7 +33,7 @@ async def create_document_type(
     current_user: User = Depends(role_checker([UserRole.ADMIN])),
     use_case: CreateDocumentTypeUseCase = Depends(get_create_document_type_use_case)
 ) -> APIResponse[DocumentTypeResponse]:
-    return await use_case.execute(request_dto)
+    return await use_case.execute(request_dto, current_user_id=current_user.id)
 
 
 @router.post(
@@ -48,7 +48,7 @@ async def batch_create_document_types(
     current_user: User = Depends(role_checker([UserRole.ADMIN])),
     use_case: BatchCreateDocumentTypesUseCase = Depends(get_batch_create_document_types_use_case)
 ) -> APIResponse[List[DocumentTypeResponse]]:
-    return await use_case.execute(request_dtos=request_dtos)
+    return await use_case.execute(request_dtos=request_dtos, current_user_id=current_user.id)
 
 
 @router.put(
@@ -92,7 +92,8 @@ async def delete_document_type(
 async def suggest_document_types(
     request_dto: GenerateDocumentTypesRequest,
     current_user: User = Depends(role_checker([UserRole.ADMIN])),
+    rate_limited_user: User = Depends(rate_limit("suggest")),
     use_case: SuggestDocumentTypesUseCase = Depends(get_suggest_document_types_use_case)
 ) -> APIResponse[GenerateDocumentTypesResponse]:
-    return await use_case.execute(request_dto=request_dto)
+    return await use_case.execute(request_dto=request_dto, current_user_id=current_user.id)
 
@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+from fastapi import APIRouter, Depends, Query, status
+
+from backend.application.dtos.api_response import APIResponse
+from backend.core.enums.user_role_enum import UserRole
+from backend.core.models.user import User
+from backend.infrastructure.cache.cache_dependencies import get_cache_stats
+from backend.infrastructure.password_hasher.password_hasher_dependencies import get_password_hasher_stats
+from backend.infrastructure.redis.redis_dependencies import get_redis_pool_stats
+from backend.infrastructure.email.email_dependencies import get_email_gateway_stats
+from backend.infrastructure.rate_limit.rate_limit_dependencies import get_rate_limit_stats
+from backend.infrastructure.gateways.ai_gateway_dependencies import get_ai_gateway_stats
+from backend.infrastructure.ai_usage.ai_usage_dependencies import get_ai_usage_sink, get_ai_usage_stats
+from backend.application.ai_usage.ai_usage import AI_USAGE_GROUP_BY, AIUsageSink
+from backend.interfaces.dependencies import role_checker
+
+router = APIRouter(prefix="/system", tags=["System - Admin"])
+
+@router.get(
+    "/cache-stats",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_200_OK,
+    summary="Get cache statistics (Admin)",
+    description="Returns hit rates, evictions and staleness bounds of the application caches. Access restricted to administrators. Version: v1.",
+)
+async def get_system_cache_stats(
+    current_user: User = Depends(role_checker([UserRole.ADMIN]))
+) -> APIResponse[dict]:
+    return APIResponse[dict](
+        success=True,
+        message="Cache statistics retrieved successfully.",
+        data=get_cache_stats(),
+        error_code=None,
+        errors=None
+    )
+
+
+@router.get(
+    "/password-hasher-stats",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_200_OK,
+    summary="Get password hasher statistics (Admin)",
+    description="Returns queue depth, wait times and throughput of the password hashing pool. Access restricted to administrators. Version: v1.",
+)
+async def get_system_password_hasher_stats(
+    current_user: User = Depends(role_checker([UserRole.ADMIN]))
+) -> APIResponse[dict]:
+    return APIResponse[dict](
+        success=True,
+        message="Password hasher statistics retrieved successfully.",
+        data=get_password_hasher_stats(),
+        error_code=None,
+        errors=None
+    )
+
+
+@router.get(
+    "/redis-pool-stats",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_200_OK,
+    summary="Get Redis connection pool statistics (Admin)",
+    description="Returns size and usage of the shared Redis connection pool. Access restricted to administrators. Version: v1.",
+)
+async def get_system_redis_pool_stats(
+    current_user: User = Depends(role_checker([UserRole.ADMIN]))
+) -> APIResponse[dict]:
+    return APIResponse[dict](
+        success=True,
+        message="Redis pool statistics retrieved successfully.",
+        data=get_redis_pool_stats(),
+        error_code=None,
+        errors=None
+    )
+
+
+@router.get(
+    "/email-gateway-stats",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_200_OK,
+    summary="Get email gateway statistics (Admin)",
+    description="Returns pooled SMTP connection, delivery and email outbox counters. Access restricted to administrators. Version: v1.",
+)
+async def get_system_email_gateway_stats(
+    current_user: User = Depends(role_checker([UserRole.ADMIN]))
+) -> APIResponse[dict]:
+    return APIResponse[dict](
+        success=True,
+        message="Email gateway statistics retrieved successfully.",
+        data=await get_email_gateway_stats(),
+        error_code=None,
+        errors=None
+    )
+
+
+@router.get(
+    "/rate-limit-stats",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_200_OK,
+    summary="Get rate limiter statistics (Admin)",
+    description="Returns the configured rate limit policies and how many requests were admitted, rejected or let through while Redis was unavailable. Access restricted to administrators. Version: v1.",
+)
+async def get_system_rate_limit_stats(
+    current_user: User = Depends(role_checker([UserRole.ADMIN]))
+) -> APIResponse[dict]:
+    return APIResponse[dict](
+        success=True,
+        message="Rate limiter statistics retrieved successfully.",
+        data=get_rate_limit_stats(),
+        error_code=None,
+        errors=None
+    )
+
+
+@router.get(
+    "/ai-gateway-stats",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_200_OK,
+    summary="Get AI gateway statistics (Admin)",
+    description="Returns queue depth, wait times, per-model budgets, retries, hedging and per-provider circuit breaker state of upstream AI calls. Access restricted to administrators. Version: v1.",
+)
+async def get_system_ai_gateway_stats(
+    current_user: User = Depends(role_checker([UserRole.ADMIN]))
+) -> APIResponse[dict]:
+    return APIResponse[dict](
+        success=True,
+        message="AI gateway statistics retrieved successfully.",
+        data=get_ai_gateway_stats(),
+        error_code=None,
+        errors=None
+    )
+
+
+@router.get(
+    "/ai-usage",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_200_OK,
+    summary="Get AI token and latency usage (Admin)",
+    description="Aggregates calls, prompt and completion tokens, latency and time to first token of upstream AI calls over a time window, grouped by use case, user, document type and/or model and ordered by total tokens. Access restricted to administrators. Version: v1.",
+)
+async def get_system_ai_usage(
+    group_by: List[str] = Query(["document_type_id", "model"], description=f"Any of {', '.join(AI_USAGE_GROUP_BY)}."),
+    since_hours: float = Query(24, gt=0, description="Size of the time window, in hours."),
+    current_user: User = Depends(role_checker([UserRole.ADMIN])),
+    usage_sink: AIUsageSink = Depends(get_ai_usage_sink)
+) -> APIResponse[dict]:
+    invalid_group_by = [column for column in group_by if column not in AI_USAGE_GROUP_BY]
+    if invalid_group_by:
+        return APIResponse[dict](
+            success=False,
+            message="Invalid AI usage grouping.",
+            error_code="INVALID_AI_USAGE_GROUP_BY",
+            errors=[f"Cannot group by '{column}'; expected any of {list(AI_USAGE_GROUP_BY)}." for column in invalid_group_by],
+            data=None
+        )
+
+    since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
+    return APIResponse[dict](
+        success=True,
+        message="AI usage retrieved successfully.",
+        data={
+            "since": since.isoformat(),
+            "group_by": group_by,
+            "usage": await usage_sink.summarize(group_by, since),
+            "sink": get_ai_usage_stats(),
+        },
+        error_code=None,
+        errors=None
+    )
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, status, Path, Query
+import csv
+import io
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, status, Path, Query, Request
 
 from backend.application.dtos.enum_dtos import EnumListResponse
-from backend.application.dtos.user import CreateUserRequest, UserResponse, UpdateUserRequest, UserListResponse
+from backend.application.dtos.user import CreateUserRequest, UserResponse, UpdateUserRequest, UserListResponse, \
+    BulkImportUsersResponse
 from backend.application.dtos.pagination_params import PaginationParams
 from backend.application.use_cases.enum.get_user_roles_use_case import GetUserRolesUseCase
 from backend.application.use_cases.user.create_user_use_case import CreateUserUseCase
+from backend.application.use_cases.user.bulk_import_users_use_case import BulkImportUsersUseCase
 from backend.application.use_cases.user.delete_user_use_case import DeleteUserUseCase
 from backend.application.use_cases.user.get_user_by_email_use_case import GetUserByEmailUseCase
 from backend.application.use_cases.user.get_user_by_id_use_case import GetUserByIdUseCase
@@ -16,11 +22,34 @@ from backend.core.models.user import User
 from backend.interfaces.dependencies import get_create_user_use_case, get_update_user_use_case, \
     get_delete_user_use_case, get_get_user_by_id_use_case, get_get_user_by_username_use_case, \
     get_get_user_by_email_use_case, get_list_users_use_case, get_get_user_roles_use_case, \
-    role_checker
+    role_checker, get_bulk_import_users_use_case
 from backend.application.dtos.api_response import APIResponse
 
 router = APIRouter(prefix="/users", tags=["Users - Admin"])
 
+def _parse_user_import_payload(body: bytes, content_type: str) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return None, "The import payload must be UTF-8 encoded."
+
+    if "csv" in content_type:
+        reader = csv.DictReader(io.StringIO(text))
+        if not reader.fieldnames:
+            return None, "The CSV payload must start with a header row (username,email,role)."
+        return [
+            {key.strip().lower(): value.strip() for key, value in row.items() if key and value and value.strip()}
+            for row in reader
+        ], None
+
+    try:
+        rows = json.loads(text)
+    except json.JSONDecodeError as e:
+        return None, f"Invalid JSON payload: {e.msg}."
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return None, "The JSON payload must be a list of user objects."
+    return rows, None
+
 @router.post(
     "/",
     response_model=APIResponse[UserResponse],
@@ -36,6 +65,38 @@ async def create_user(
     return await use_case.execute(request_dto=request_dto, created_by_user_id=current_user.id)
 
 
+@router.post(
+    "/bulk-import",
+    response_model=APIResponse[BulkImportUsersResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Import users in bulk from JSON or CSV (Admin)",
+    description="Creates many users at once from a JSON list of user objects or a CSV body (Content-Type: text/csv) with a username,email,role header. Each created user receives a password setup email. Returns a per-row report. Access restricted to administrators. Version: v1.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": CreateUserRequest.model_json_schema()}},
+                "text/csv": {"schema": {"type": "string", "example": "username,email,role\njane,jane@example.com,common"}},
+            },
+        }
+    },
+)
+async def bulk_import_users(
+    request: Request,
+    current_user: User = Depends(role_checker([UserRole.ADMIN])),
+    use_case: BulkImportUsersUseCase = Depends(get_bulk_import_users_use_case)
+) -> APIResponse[BulkImportUsersResponse]:
+    rows, parse_error = _parse_user_import_payload(await request.body(), request.headers.get("content-type", ""))
+    if parse_error:
+        return APIResponse[BulkImportUsersResponse](
+            success=False,
+            message="The import payload could not be read.",
+            error_code="INVALID_IMPORT_PAYLOAD",
+            errors=[parse_error],
+            data=None
+        )
+    return await use_case.execute(rows=rows, created_by_user_id=current_user.id)
+
 @router.put(
     "/{id}",
     response_model=APIResponse[UserResponse],
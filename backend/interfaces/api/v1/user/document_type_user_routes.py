@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, status, Query, Path
 
 from backend.application.dtos.document_generation import GenerateDocumentRequest
-from backend.application.dtos.document_type import DocumentTypeListResponse, DocumentTypeResponse
+from backend.application.dtos.document_type import DocumentTypeListResponse, DocumentTypeResponse, \
+    DocumentTypeWithFieldsResponse
 from backend.application.dtos.pagination_params import PaginationParams
 from backend.application.use_cases.document_type.generate_document_use_case import GenerateDocumentUseCase
 from backend.application.use_cases.document_type.get_document_type_by_id_use_case import GetDocumentTypeByIdUseCase
 from backend.application.use_cases.document_type.get_document_type_by_name_use_case import GetDocumentTypeByNameUseCase
 from backend.application.use_cases.document_type.get_document_types_with_fields_use_case import GetDocumentTypesWithFieldsUseCase
+from backend.application.use_cases.document_type.get_document_type_with_fields_by_id_use_case import GetDocumentTypeWithFieldsByIdUseCase
 from backend.application.use_cases.document_type.list_document_types_use_case import ListDocumentTypesUseCase
 from backend.core.enums.user_role_enum import UserRole
 from backend.core.models.user import User
-from backend.interfaces.dependencies import get_list_document_types_use_case, get_get_document_type_by_id_use_case, get_get_document_type_by_name_use_case, role_checker, get_generate_document_use_case, get_get_document_types_with_fields_use_case
+from backend.interfaces.dependencies import get_list_document_types_use_case, get_get_document_type_by_id_use_case, get_get_document_type_by_name_use_case, role_checker, rate_limit, get_generate_document_use_case, get_get_document_types_with_fields_use_case, get_get_document_type_with_fields_by_id_use_case
 from backend.application.dtos.api_response import APIResponse
 
 router = APIRouter(prefix="/document-types", tags=["Document Types - User/Admin"])
@@ -46,6 +48,20 @@ async def get_document_type_by_id(
 ) -> APIResponse[DocumentTypeResponse]:
     return await use_case.execute(document_type_id=id)
 
+@router.get(
+    "/by-id/{id}/with-fields",
+    response_model=APIResponse[DocumentTypeWithFieldsResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get a document type with its fields by ID (User/Admin)",
+    description="Retrieves a document type together with all of its field definitions in a single request, as needed by the generation form. Accessible by regular users. Version: v1.",
+)
+async def get_document_type_with_fields_by_id(
+    id: int = Path(..., title="The ID of the DocumentType to retrieve"),
+    current_user: User = Depends(role_checker([UserRole.COMMON_USER, UserRole.ADMIN])),
+    use_case: GetDocumentTypeWithFieldsByIdUseCase = Depends(get_get_document_type_with_fields_by_id_use_case)
+) -> APIResponse[DocumentTypeWithFieldsResponse]:
+    return await use_case.execute(document_type_id=id)
+
 @router.get(
     "/by-name",
     response_model=APIResponse[DocumentTypeResponse],
@@ -86,6 +102,7 @@ async def list_document_types_with_fields(
 async def generate_document(
     request_dto: GenerateDocumentRequest,
     current_user: User = Depends(role_checker([UserRole.COMMON_USER, UserRole.ADMIN])),
+    rate_limited_user: User = Depends(rate_limit("generate_document")),
     use_case: GenerateDocumentUseCase = Depends(get_generate_document_use_case)
 ) -> APIResponse[dict]:
     return await use_case.execute(request_dto=request_dto, current_user_id=current_user.id)
\ No newline at end of file
@@ -1,9 +1,10 @@
-from typing import Annotated, List
-from fastapi import Depends,HTTPException, status
+from typing import Annotated, List, Optional
+from fastapi import Depends,HTTPException, Request, status
 from fastapi.security import HTTPBearer,HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 
 from backend.application.ai_gateway.ai_gateway import AIGateway
+from backend.application.cache.field_suggestion_cache import FieldSuggestionCache, FieldSuggestionPrefetcher
 from backend.application.email.email import EmailGateway
 from backend.application.file_storage.file_storage import FileStorageGateway
 from backend.application.repositories.document_field_repository import DocumentFieldRepository
@@ -15,6 +16,8 @@ from backend.application.use_cases.auth.login_user_use_case import LoginUserUseC
 from backend.application.use_cases.auth.reset_password_use_case import ResetPasswordUseCase
 from backend.application.use_cases.document_field.batch_create_document_fields_use_case import \
     BatchCreateDocumentFieldsUseCase
+from backend.application.use_cases.document_field.batch_suggest_document_fields_use_case import \
+    BatchSuggestDocumentFieldsUseCase
 from backend.application.use_cases.document_field.create_document_field_use_case import CreateDocumentFieldUseCase
 from backend.application.use_cases.document_field.delete_document_field_use_case import DeleteDocumentFieldUseCase
 from backend.application.use_cases.document_field.get_document_field_by_id_use_case import GetDocumentFieldByIdUseCase
@@ -31,12 +34,15 @@ from backend.application.use_cases.document_type.get_document_type_by_id_use_cas
 from backend.application.use_cases.document_type.get_document_type_by_name_use_case import GetDocumentTypeByNameUseCase
 from backend.application.use_cases.document_type.get_document_types_with_fields_use_case import \
     GetDocumentTypesWithFieldsUseCase
+from backend.application.use_cases.document_type.get_document_type_with_fields_by_id_use_case import \
+    GetDocumentTypeWithFieldsByIdUseCase
 from backend.application.use_cases.document_type.list_document_types_use_case import ListDocumentTypesUseCase
 from backend.application.use_cases.document_type.suggest_document_types_use_case import SuggestDocumentTypesUseCase
 from backend.application.use_cases.document_type.update_document_type_use_case import UpdateDocumentTypeUseCase
 from backend.application.use_cases.enum.get_field_types_use_case import GetFieldTypesUseCase
 from backend.application.use_cases.enum.get_user_roles_use_case import GetUserRolesUseCase
 from backend.application.use_cases.user.create_user_use_case import CreateUserUseCase
+from backend.application.use_cases.user.bulk_import_users_use_case import BulkImportUsersUseCase
 from backend.application.use_cases.user.delete_user_use_case import DeleteUserUseCase
 from backend.application.use_cases.user.get_user_by_email_use_case import GetUserByEmailUseCase
 from backend.application.use_cases.user.get_user_by_id_use_case import GetUserByIdUseCase
@@ -45,14 +51,28 @@ from backend.application.use_cases.user.list_users_use_case import ListUsersUseC
 from backend.application.use_cases.user.update_user_use_case import UpdateUserUseCase
 from backend.application.use_cases.document_type.generate_document_use_case import GenerateDocumentUseCase
 from backend.core.enums.user_role_enum import UserRole
-from backend.infrastructure.database.mysql_dependencies import get_mysql_document_type_repository, \
-    get_mysql_user_repository, get_mysql_document_field_repository, get_mysql_generated_document_repository
+from backend.infrastructure.cache.cache_dependencies import get_cached_document_type_repository, \
+    get_cached_document_field_repository, get_user_cache, get_field_suggestion_cache
+from backend.application.cache.user_cache import UserCache
+from backend.application.password_hasher.password_hasher import PasswordHasher
+from backend.infrastructure.password_hasher.password_hasher_dependencies import get_password_hasher
+from backend.infrastructure.database.mysql_dependencies import get_mysql_user_repository, \
+    get_mysql_generated_document_repository
 from backend.infrastructure.file_storage.file_storage_dependencies import get_file_storage_gateway
-from backend.infrastructure.gateways.hf_openai_ai_gateway import HuggingFaceOpenAIAIGateway
+from backend.infrastructure.gateways.ai_gateway_dependencies import AI_PARSE_RETRY_ATTEMPTS, get_ai_gateway, \
+    get_model_router, get_structured_output_metrics, get_field_suggestion_prefetcher, AI_BATCH_SUGGEST_MAX_CONCURRENCY, \
+    AI_BATCH_SUGGEST_MAX_SIZE
+from backend.application.ai_gateway.structured_output import StructuredOutputMetrics
+from backend.application.model_router.model_router import ModelRouter
+from backend.application.metrics.metrics import StageMetrics
+from backend.infrastructure.metrics.metrics_dependencies import get_stage_metrics
+from backend.infrastructure.tracing.tracing_dependencies import traced
 from backend.core.models.user import User as CoreUser
-from backend.infrastructure.redis.redis_dependencies import get_redis_client
+from backend.infrastructure.redis.redis_dependencies import get_password_reset_token_store
+from backend.application.token_store.token_store import PasswordResetTokenStore
 from backend.infrastructure.email.email_dependencies import get_email_gateway
-import redis.asyncio as redis
+from backend.infrastructure.rate_limit.rate_limit_dependencies import RATE_LIMIT_ENABLED, get_client_ip, \
+    get_rate_limit_policy, get_rate_limiter
 
 import os
 from dotenv import load_dotenv
@@ -71,7 +91,8 @@ ALGORITHM = "HS256"
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    user_repo: UserRepository = Depends(get_mysql_user_repository)
+    user_repo: UserRepository = Depends(get_mysql_user_repository),
+    user_cache: UserCache = Depends(get_user_cache)
 ) -> CoreUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -90,7 +111,7 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user_entity = await user_repo.find_by_id(int(user_id))
+    user_entity = await user_cache.get(int(user_id), loader=lambda: user_repo.find_by_id(int(user_id)))
 
     if user_entity is None:
         raise credentials_exception
@@ -118,184 +139,250 @@ def role_checker(allowed_roles: List[UserRole]):
         return current_user
     return check_user_role
 
+def rate_limit(policy_name: str):
+    policy = get_rate_limit_policy(policy_name)
+
+    async def check_rate_limit(request: Request, current_user: CoreUser = Depends(get_current_user)):
+        if not RATE_LIMIT_ENABLED:
+            return current_user
+
+        decision = await get_rate_limiter().hit(policy, client_ip=get_client_ip(request), user_id=current_user.id)
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please try again later.",
+                headers={"Retry-After": str(decision.retry_after_seconds)},
+            )
+
+        return current_user
+    return check_rate_limit
+
 def get_login_user_use_case(
-    user_repo: Annotated[UserRepository, Depends(get_mysql_user_repository)]
+    user_repo: Annotated[UserRepository, Depends(get_mysql_user_repository)],
+    password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)]
 ) -> LoginUserUseCase:
-    return LoginUserUseCase(user_repository=user_repo)
+    return traced(LoginUserUseCase(user_repository=user_repo, password_hasher=password_hasher), "use_case")
 
 
 # User
 def get_create_user_use_case(
     user_repo: Annotated[UserRepository, Depends(get_mysql_user_repository)],
     email_gateway: Annotated[EmailGateway, Depends(get_email_gateway)],
-    redis_client: Annotated[redis.Redis, Depends(get_redis_client)]
+    token_store: Annotated[PasswordResetTokenStore, Depends(get_password_reset_token_store)],
+    password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)]
 ) -> CreateUserUseCase:
-    return CreateUserUseCase(
+    return traced(CreateUserUseCase(
         repository=user_repo,
         email_gateway=email_gateway,
-        redis_client=redis_client
-    )
+        token_store=token_store,
+        password_hasher=password_hasher
+    ), "use_case")
+
+def get_bulk_import_users_use_case(
+    user_repo: Annotated[UserRepository, Depends(get_mysql_user_repository)],
+    email_gateway: Annotated[EmailGateway, Depends(get_email_gateway)],
+    token_store: Annotated[PasswordResetTokenStore, Depends(get_password_reset_token_store)],
+    password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)]
+) -> BulkImportUsersUseCase:
+    return traced(BulkImportUsersUseCase(
+        repository=user_repo,
+        email_gateway=email_gateway,
+        token_store=token_store,
+        password_hasher=password_hasher
+    ), "use_case")
 
 def get_forgot_password_use_case(
     user_repo: UserRepository = Depends(get_mysql_user_repository),
     email_gw: EmailGateway = Depends(get_email_gateway),
-    redis_client: redis.Redis = Depends(get_redis_client)
+    token_store: PasswordResetTokenStore = Depends(get_password_reset_token_store)
 ) -> ForgotPasswordUseCase:
-    return ForgotPasswordUseCase(user_repository=user_repo, email_gateway=email_gw, redis_client=redis_client)
+    return traced(ForgotPasswordUseCase(user_repository=user_repo, email_gateway=email_gw, token_store=token_store), "use_case")
 
 
 def get_reset_password_use_case(
     user_repo: UserRepository = Depends(get_mysql_user_repository),
-    redis_client: redis.Redis = Depends(get_redis_client)
+    token_store: PasswordResetTokenStore = Depends(get_password_reset_token_store),
+    user_cache: UserCache = Depends(get_user_cache),
+    password_hasher: PasswordHasher = Depends(get_password_hasher)
 ) -> ResetPasswordUseCase:
-    return ResetPasswordUseCase(user_repository=user_repo, redis_client=redis_client)
+    return traced(ResetPasswordUseCase(user_repository=user_repo, token_store=token_store, user_cache=user_cache,
+                                       password_hasher=password_hasher), "use_case")
 
 def get_update_user_use_case(
-    repository: Annotated[UserRepository, Depends(get_mysql_user_repository)]
+    repository: Annotated[UserRepository, Depends(get_mysql_user_repository)],
+    user_cache: Annotated[UserCache, Depends(get_user_cache)]
 ) -> UpdateUserUseCase:
-    return UpdateUserUseCase(repository=repository)
+    return traced(UpdateUserUseCase(repository=repository, user_cache=user_cache), "use_case")
 
 def get_delete_user_use_case(
-    repository: Annotated[UserRepository, Depends(get_mysql_user_repository)]
+    repository: Annotated[UserRepository, Depends(get_mysql_user_repository)],
+    user_cache: Annotated[UserCache, Depends(get_user_cache)]
 ) -> DeleteUserUseCase:
-    return DeleteUserUseCase(repository=repository)
+    return traced(DeleteUserUseCase(repository=repository, user_cache=user_cache), "use_case")
 
 def get_get_user_by_id_use_case(
     repository: Annotated[UserRepository, Depends(get_mysql_user_repository)]
 ) -> GetUserByIdUseCase:
-    return GetUserByIdUseCase(repository=repository)
+    return traced(GetUserByIdUseCase(repository=repository), "use_case")
 
 def get_get_user_by_username_use_case(
     repository: Annotated[UserRepository, Depends(get_mysql_user_repository)]
 ) -> GetUserByUsernameUseCase:
-    return GetUserByUsernameUseCase(repository=repository)
+    return traced(GetUserByUsernameUseCase(repository=repository), "use_case")
 
 def get_get_user_by_email_use_case(
     repository: Annotated[UserRepository, Depends(get_mysql_user_repository)]
 ) -> GetUserByEmailUseCase:
-    return GetUserByEmailUseCase(repository=repository)
+    return traced(GetUserByEmailUseCase(repository=repository), "use_case")
 
 def get_list_users_use_case(
     repository: Annotated[UserRepository, Depends(get_mysql_user_repository)]
 ) -> ListUsersUseCase:
-    return ListUsersUseCase(repository=repository)
+    return traced(ListUsersUseCase(repository=repository), "use_case")
 
 def get_get_user_roles_use_case() -> GetUserRolesUseCase:
-    return GetUserRolesUseCase()
+    return traced(GetUserRolesUseCase(), "use_case")
 
 
 # Document Type
 def get_create_document_type_use_case(
-    repository: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)],
+    suggestion_prefetcher: Annotated[Optional[FieldSuggestionPrefetcher], Depends(get_field_suggestion_prefetcher)]
 ) -> CreateDocumentTypeUseCase:
-    return CreateDocumentTypeUseCase(repository=repository)
+    return traced(CreateDocumentTypeUseCase(repository=repository, suggestion_prefetcher=suggestion_prefetcher), "use_case")
 
 def get_batch_create_document_types_use_case(
-    create_single_use_case: Annotated[CreateDocumentTypeUseCase, Depends(get_create_document_type_use_case)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)],
+    suggestion_prefetcher: Annotated[Optional[FieldSuggestionPrefetcher], Depends(get_field_suggestion_prefetcher)]
 ) -> BatchCreateDocumentTypesUseCase:
-    return BatchCreateDocumentTypesUseCase(create_single_use_case=create_single_use_case)
+    return traced(BatchCreateDocumentTypesUseCase(repository=repository, suggestion_prefetcher=suggestion_prefetcher), "use_case")
 
 def get_update_document_type_use_case(
-    repository: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> UpdateDocumentTypeUseCase:
-    return UpdateDocumentTypeUseCase(repository=repository)
+    return traced(UpdateDocumentTypeUseCase(repository=repository), "use_case")
 
 def get_delete_document_type_use_case(
-    repository: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> DeleteDocumentTypeUseCase:
-    return DeleteDocumentTypeUseCase(repository=repository)
+    return traced(DeleteDocumentTypeUseCase(repository=repository), "use_case")
 
 def get_list_document_types_use_case(
-    repository: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> ListDocumentTypesUseCase:
-    return ListDocumentTypesUseCase(repository=repository)
+    return traced(ListDocumentTypesUseCase(repository=repository), "use_case")
 
 def get_get_document_types_with_fields_use_case(
-    repository: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> GetDocumentTypesWithFieldsUseCase:
-    return GetDocumentTypesWithFieldsUseCase(repository=repository)
+    return traced(GetDocumentTypesWithFieldsUseCase(repository=repository), "use_case")
 
 
 def get_get_document_type_by_id_use_case(
-    repository: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> GetDocumentTypeByIdUseCase:
-    return GetDocumentTypeByIdUseCase(repository=repository)
+    return traced(GetDocumentTypeByIdUseCase(repository=repository), "use_case")
+
+def get_get_document_type_with_fields_by_id_use_case(
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
+) -> GetDocumentTypeWithFieldsByIdUseCase:
+    return traced(GetDocumentTypeWithFieldsByIdUseCase(repository=repository), "use_case")
 
 def get_get_document_type_by_name_use_case(
-    repository: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    repository: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> GetDocumentTypeByNameUseCase:
-    return GetDocumentTypeByNameUseCase(repository=repository)
+    return traced(GetDocumentTypeByNameUseCase(repository=repository), "use_case")
 
 
 
 
 # DOCUMENT FIELD
 def get_create_document_field_use_case(
-    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_mysql_document_field_repository)],
-    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_cached_document_field_repository)],
+    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> CreateDocumentFieldUseCase:
-    return CreateDocumentFieldUseCase(document_field_repository=document_field_repo, document_type_repository=document_type_repo)
+    return traced(CreateDocumentFieldUseCase(document_field_repository=document_field_repo, document_type_repository=document_type_repo), "use_case")
 
 def get_batch_create_document_fields_use_case(
-    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)],
-    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_mysql_document_field_repository)]
+    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)],
+    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_cached_document_field_repository)]
 ) -> BatchCreateDocumentFieldsUseCase:
-    return BatchCreateDocumentFieldsUseCase(document_type_repo=document_type_repo, document_field_repo=document_field_repo)
+    return traced(BatchCreateDocumentFieldsUseCase(document_type_repo=document_type_repo, document_field_repo=document_field_repo), "use_case")
 
 def get_get_document_field_by_id_use_case(
-    repository: Annotated[DocumentFieldRepository, Depends(get_mysql_document_field_repository)]
+    repository: Annotated[DocumentFieldRepository, Depends(get_cached_document_field_repository)]
 ) -> GetDocumentFieldByIdUseCase:
-    return GetDocumentFieldByIdUseCase(repository=repository)
+    return traced(GetDocumentFieldByIdUseCase(repository=repository), "use_case")
 
 def get_update_document_field_use_case(
-    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_mysql_document_field_repository)],
-    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)]
+    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_cached_document_field_repository)],
+    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)]
 ) -> UpdateDocumentFieldUseCase:
-    return UpdateDocumentFieldUseCase(document_field_repo=document_field_repo, document_type_repo=document_type_repo)
+    return traced(UpdateDocumentFieldUseCase(document_field_repo=document_field_repo, document_type_repo=document_type_repo), "use_case")
 
 def get_list_document_fields_by_document_type_use_case(
-    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)],
-    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_mysql_document_field_repository)]
+    document_type_repo: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)],
+    document_field_repo: Annotated[DocumentFieldRepository, Depends(get_cached_document_field_repository)]
 ) -> ListDocumentFieldsByDocumentTypeUseCase:
-    return ListDocumentFieldsByDocumentTypeUseCase(document_type_repo=document_type_repo, document_field_repo=document_field_repo)
+    return traced(ListDocumentFieldsByDocumentTypeUseCase(document_type_repo=document_type_repo, document_field_repo=document_field_repo), "use_case")
 
 def get_delete_document_field_use_case(
-    repository: Annotated[DocumentFieldRepository, Depends(get_mysql_document_field_repository)]
+    repository: Annotated[DocumentFieldRepository, Depends(get_cached_document_field_repository)]
 ) -> DeleteDocumentFieldUseCase:
-    return DeleteDocumentFieldUseCase(repository=repository)
+    return traced(DeleteDocumentFieldUseCase(repository=repository), "use_case")
 
 def get_get_field_types_use_case() -> GetFieldTypesUseCase:
-    return GetFieldTypesUseCase()
+    return traced(GetFieldTypesUseCase(), "use_case")
 
 # AI
-def get_hf_openai_ai_gateway() -> HuggingFaceOpenAIAIGateway:
-    hf_token = os.getenv("HF_API_TOKEN")
-    if not hf_token:
-        raise ValueError("HF_API_TOKEN not found in environment variables.")
-    base_url = os.getenv("HF_OPENAI_BASE_URL", "https://router.huggingface.co/v1")
-    return HuggingFaceOpenAIAIGateway(hf_token=hf_token, base_url=base_url)
-
 def get_suggest_document_types_use_case(
-    impl: Annotated[AIGateway, Depends(get_hf_openai_ai_gateway)],
+    impl: Annotated[AIGateway, Depends(get_ai_gateway)],
+    model_router: Annotated[ModelRouter, Depends(get_model_router)],
+    output_metrics: Annotated[StructuredOutputMetrics, Depends(get_structured_output_metrics)]
 ) -> SuggestDocumentTypesUseCase:
-    return SuggestDocumentTypesUseCase(ai_gateway=impl)
+    return traced(SuggestDocumentTypesUseCase(
+        ai_gateway=impl,
+        model_router=model_router,
+        output_metrics=output_metrics,
+        parse_retry_attempts=AI_PARSE_RETRY_ATTEMPTS
+    ), "use_case")
 
 def get_suggest_document_fields_use_case(
-    impl: Annotated[AIGateway, Depends(get_hf_openai_ai_gateway)]
+    impl: Annotated[AIGateway, Depends(get_ai_gateway)],
+    model_router: Annotated[ModelRouter, Depends(get_model_router)],
+    output_metrics: Annotated[StructuredOutputMetrics, Depends(get_structured_output_metrics)],
+    suggestion_cache: Annotated[FieldSuggestionCache, Depends(get_field_suggestion_cache)]
 ) -> SuggestDocumentFieldsUseCase:
-    return SuggestDocumentFieldsUseCase(ai_gateway=impl)
+    return traced(SuggestDocumentFieldsUseCase(
+        ai_gateway=impl,
+        model_router=model_router,
+        output_metrics=output_metrics,
+        suggestion_cache=suggestion_cache,
+        parse_retry_attempts=AI_PARSE_RETRY_ATTEMPTS
+    ), "use_case")
+
+def get_batch_suggest_document_fields_use_case(
+    suggest_use_case: Annotated[SuggestDocumentFieldsUseCase, Depends(get_suggest_document_fields_use_case)]
+) -> BatchSuggestDocumentFieldsUseCase:
+    return traced(BatchSuggestDocumentFieldsUseCase(
+        suggest_use_case=suggest_use_case,
+        max_concurrency=AI_BATCH_SUGGEST_MAX_CONCURRENCY,
+        max_batch_size=AI_BATCH_SUGGEST_MAX_SIZE
+    ), "use_case")
 
 def get_generate_document_use_case(
-    doc_type_repo: Annotated[DocumentTypeRepository, Depends(get_mysql_document_type_repository)],
-    doc_field_repo: Annotated[DocumentFieldRepository, Depends(get_mysql_document_field_repository)],
+    doc_type_repo: Annotated[DocumentTypeRepository, Depends(get_cached_document_type_repository)],
     gen_doc_repo: Annotated[GeneratedDocumentRepository, Depends(get_mysql_generated_document_repository)],
-    ai_gw: Annotated[AIGateway, Depends(get_hf_openai_ai_gateway)],
-    file_storage_gw: Annotated[FileStorageGateway, Depends(get_file_storage_gateway)]
+    ai_gw: Annotated[AIGateway, Depends(get_ai_gateway)],
+    file_storage_gw: Annotated[FileStorageGateway, Depends(get_file_storage_gateway)],
+    model_router: Annotated[ModelRouter, Depends(get_model_router)],
+    stage_metrics: Annotated[StageMetrics, Depends(get_stage_metrics)]
 ) -> GenerateDocumentUseCase:
-    return GenerateDocumentUseCase(
+    return traced(GenerateDocumentUseCase(
         document_type_repo=doc_type_repo,
-        document_field_repo=doc_field_repo,
         generated_document_repo=gen_doc_repo,
         ai_gateway=ai_gw,
-        file_storage_gateway=file_storage_gw
-    )
\ No newline at end of file
+        model_router=model_router,
+        file_storage_gateway=file_storage_gw,
+        stage_metrics=stage_metrics
+    ), "use_case")
\ No newline at end of file
@@ -0,0 +1,37 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.infrastructure.metrics.prometheus_metrics import PrometheusHTTPMetrics
+
+# A plain ASGI middleware rather than BaseHTTPMiddleware: it adds no task or body buffering per request, and it
+# sees the end of streamed bodies, so NDJSON and document streams are timed until their last chunk.
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, http_metrics: PrometheusHTTPMetrics):
+        self.app = app
+        self._http_metrics = http_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.perf_counter()
+        self._http_metrics.request_started(method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the scope; labelling by its template keeps one series per
+            # endpoint instead of one per document id. Unmatched paths share a single label for the same reason.
+            route = scope.get("route")
+            self._http_metrics.request_finished(
+                method, getattr(route, "path", "unmatched"), status_code, time.perf_counter() - started_at
+            )
@@ -0,0 +1,26 @@
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.infrastructure.rate_limit.rate_limit_dependencies import RATE_LIMIT_ENABLED, get_client_ip, \
+    get_rate_limit_policy, get_rate_limiter, rate_limit_path_policies
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        policy_name = rate_limit_path_policies.get((request.method, request.url.path.rstrip("/")))
+        if not RATE_LIMIT_ENABLED or policy_name is None:
+            return await call_next(request)
+
+        decision = await get_rate_limiter().hit(get_rate_limit_policy(policy_name), client_ip=get_client_ip(request))
+        if not decision.allowed:
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Too many requests. Please try again later."},
+                headers={"Retry-After": str(decision.retry_after_seconds)},
+            )
+
+        response = await call_next(request)
+        if decision.remaining is not None:
+            response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        return response
@@ -1,9 +1,11 @@
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, Request, Response
 from fastapi.security import HTTPBearer
 
 from backend.core.models.user import User
 from backend.infrastructure.database.mysql_dependencies import get_mysql_user_repository
+from backend.infrastructure.password_hasher.password_hasher_dependencies import close_password_hasher, get_password_hasher
 from backend.infrastructure.models.document_type_model import DocumentTypeModel
 from backend.infrastructure.database.mysql_config import engine, async_sessionmaker_instance
 from fastapi.middleware.cors import CORSMiddleware
@@ -14,23 +16,40 @@ from backend.interfaces.api.v1.admin.user_routes import router as user_router
 from backend.interfaces.api.v1.auth.auth_routes import router as auth_router
 from backend.interfaces.api.v1.user.document_download_routes import router as document_download_router
 from backend.interfaces.api.v1.user.document_field_user_routes import router as user_document_field_router
+from backend.interfaces.api.v1.admin.system_routes import router as system_router
+from backend.infrastructure.cache.cache_dependencies import get_active_caches
+from backend.infrastructure.redis.redis_dependencies import init_redis_connection_pool, close_redis_connection_pool
+from backend.infrastructure.email.email_dependencies import close_email_gateway, start_email_outbox_dispatcher
+from backend.infrastructure.gateways.ai_gateway_dependencies import close_ai_gateway, warm_ai_gateway
+from backend.infrastructure.ai_usage.ai_usage_dependencies import close_ai_usage_sink, start_ai_usage_sink
+from backend.infrastructure.metrics.metrics_dependencies import METRICS_CONTENT_TYPE, METRICS_ENABLED, get_http_metrics, \
+    is_metrics_request_authorized, render_metrics, start_event_loop_monitor
+from backend.interfaces.middleware.rate_limit_middleware import RateLimitMiddleware
+from backend.interfaces.middleware.metrics_middleware import MetricsMiddleware
+from backend.infrastructure.tracing.tracing_dependencies import TRACING_ENABLED, configure_tracing, get_tracer, \
+    shutdown_tracing
+from backend.interfaces.middleware.tracing_middleware import TracingMiddleware
 import os
 from dotenv import load_dotenv
 import logging
 
 load_dotenv()
 logger = logging.getLogger(__name__)
+configure_tracing()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("Starting application...")
 
+    init_redis_connection_pool()
+
     async with engine.begin() as conn:
         await conn.run_sync(DocumentTypeModel.metadata.create_all)
 
     async with async_sessionmaker_instance() as session:
         user_repo = get_mysql_user_repository(session=session)
+        password_hasher = get_password_hasher()
 
         existing_admin_user = await user_repo.find_by_username("admin")
 
@@ -42,9 +61,7 @@ async def lifespan(app: FastAPI):
                 logger.error("INITIAL_ADMIN_PASSWORD not set in environment.")
                 raise ValueError("INITIAL_ADMIN_PASSWORD environment variable is required for initial admin creation.")
 
-            import bcrypt
-            password_hash_bytes = bcrypt.hashpw(initial_admin_password.encode('utf-8'), bcrypt.gensalt())
-            password_hash_str = password_hash_bytes.decode('utf-8')
+            password_hash_str = await password_hasher.hash(initial_admin_password)
 
             from backend.core.value_objects.hashed_password import HashedPassword
             hashed_password_vo = HashedPassword(value=password_hash_str)
@@ -79,9 +96,7 @@ async def lifespan(app: FastAPI):
                 logger.error("INITIAL_USER_PASSWORD not set in environment.")
                 raise ValueError("INITIAL_USER_PASSWORD environment variable is required for initial common creation.")
 
-            import bcrypt
-            password_hash_bytes = bcrypt.hashpw(initial_common_password.encode('utf-8'), bcrypt.gensalt())
-            password_hash_str = password_hash_bytes.decode('utf-8')
+            password_hash_str = await password_hasher.hash(initial_common_password)
 
             from backend.core.value_objects.hashed_password import HashedPassword
             hashed_password_vo = HashedPassword(value=password_hash_str)
@@ -106,10 +121,46 @@ async def lifespan(app: FastAPI):
         else:
             print(f"Common user 'common' already exists (ID: {existing_common_user.id}). Skipping initial common creation.")
 
+    await warm_ai_gateway()
+
+    cache_listeners = [asyncio.create_task(cache.listen_for_invalidations()) for cache in get_active_caches()]
+    email_outbox_task = start_email_outbox_dispatcher()
+    ai_usage_task = start_ai_usage_sink()
+    event_loop_monitor_task = start_event_loop_monitor()
+
     print("Application started successfully!")
     yield
     print("Shutting down application...")
 
+    for cache_listener in cache_listeners:
+        cache_listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await cache_listener
+
+    if email_outbox_task:
+        email_outbox_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await email_outbox_task
+
+    if ai_usage_task:
+        ai_usage_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await ai_usage_task
+
+    if event_loop_monitor_task:
+        event_loop_monitor_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await event_loop_monitor_task
+
+    # The AI gateway cancels the suggestion prefetches, which still use Redis, and the usage sink flushes what they
+    # recorded; the Redis pool is closed only after both.
+    await close_ai_gateway()
+    await close_ai_usage_sink()
+    await close_email_gateway()
+    await close_redis_connection_pool()
+    close_password_hasher()
+    shutdown_tracing()
+
 
 security_scheme = HTTPBearer(
     scheme_name="JWT",
@@ -119,6 +170,14 @@ security_scheme = HTTPBearer(
 
 app = FastAPI(title="DocuGeniusAI API", lifespan=lifespan, openapi_security=[{"JWT": []}])
 
+app.add_middleware(RateLimitMiddleware)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, http_metrics=get_http_metrics())
+
+if TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware, tracer=get_tracer())
+
+# Added last so that it is outermost: responses produced by the other middleware, such as 429s, still carry CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
@@ -134,6 +193,7 @@ app.include_router(user_document_field_router, prefix="/api/v1/user")
 app.include_router(document_download_router, prefix="/api/v1/user")
 app.include_router(admin_document_field_router, prefix="/api/v1/admin")
 app.include_router(user_router, prefix="/api/v1/admin")
+app.include_router(system_router, prefix="/api/v1/admin")
 
 
 @app.get("/")
@@ -143,4 +203,13 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    if not METRICS_ENABLED:
+        return Response(status_code=404)
+    if not is_metrics_request_authorized(request.headers.get("Authorization")):
+        return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
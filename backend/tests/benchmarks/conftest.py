@@ -0,0 +1,13 @@
+import asyncio
+import os
+import pytest
+
+# The auth benchmarks import the FastAPI dependencies, which create the database engine at import time.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+@pytest.fixture
+def run_async():
+    # One loop per benchmark, so that rounds measure the coroutine rather than loop start-up.
+    loop = asyncio.new_event_loop()
+    yield lambda coroutine_factory: loop.run_until_complete(coroutine_factory())
+    loop.close()
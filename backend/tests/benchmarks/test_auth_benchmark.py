@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("aiosqlite")
+
+from backend.core.models.user import User
+from backend.core.value_objects.hashed_password import HashedPassword
+from backend.infrastructure.cache.user_cache import NoOpUserCache
+from backend.interfaces.dependencies import ALGORITHM, SECRET_KEY, get_current_user
+
+class FakeUserRepository:
+    def __init__(self):
+        self._user = User(id=1, username="common", email="common@example.com",
+                          hashed_password=HashedPassword(value="$2b$12$" + "a" * 53))
+
+    async def find_by_id(self, id):
+        return self._user
+
+def make_credentials() -> HTTPAuthorizationCredentials:
+    token = jwt.encode(
+        {"sub": "1", "type": "access", "exp": datetime.now(timezone.utc) + timedelta(hours=1)}, SECRET_KEY, algorithm=ALGORITHM
+    )
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+def test_jwt_decode(benchmark):
+    credentials = make_credentials()
+    payload = benchmark(jwt.decode, credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+    assert payload["sub"] == "1"
+
+def test_get_current_user(benchmark, run_async):
+    credentials = make_credentials()
+    user_repo = FakeUserRepository()
+    user_cache = NoOpUserCache()
+
+    user = benchmark(run_async, lambda: get_current_user(credentials, user_repo, user_cache))
+    assert user.id == 1
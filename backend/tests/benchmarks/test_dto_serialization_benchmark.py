@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.application.dtos.api_response import APIResponse
+from backend.application.dtos.document_field import DocumentFieldResponse
+from backend.application.dtos.document_type import DocumentTypeListResponse, DocumentTypeResponse, \
+    DocumentTypeWithFieldsResponse
+from backend.core.enums.field_type_enum import FieldType
+
+def make_list_response(size: int) -> APIResponse[DocumentTypeListResponse]:
+    return APIResponse[DocumentTypeListResponse](
+        success=True,
+        message="Document types retrieved successfully.",
+        data=DocumentTypeListResponse(
+            items=[DocumentTypeResponse(id=i, name=f"Document Type {i}", description=f"Description {i}") for i in range(size)],
+            total=size, page=1, size=size, pages=1
+        )
+    )
+
+def make_with_fields_response(field_count: int) -> APIResponse[DocumentTypeWithFieldsResponse]:
+    return APIResponse[DocumentTypeWithFieldsResponse](
+        success=True,
+        message="Document type retrieved successfully.",
+        data=DocumentTypeWithFieldsResponse(id=1, name="Service Contract", description="Agreement for services.", fields=[
+            DocumentFieldResponse(id=i, document_type_id=1, name=f"Field {i}", field_type=FieldType.TEXT,
+                                  is_required=i % 2 == 0, description=f"Purpose of field {i}.") for i in range(field_count)
+        ])
+    )
+
+def test_build_document_type_list_response(benchmark):
+    response = benchmark(make_list_response, 100)
+    assert len(response.data.items) == 100
+
+def test_serialize_document_type_list_response(benchmark):
+    response = make_list_response(100)
+    assert benchmark(response.model_dump_json).startswith('{"success":true')
+
+def test_serialize_document_type_with_fields_response(benchmark):
+    response = make_with_fields_response(50)
+    assert benchmark(response.model_dump_json).startswith('{"success":true')
@@ -0,0 +1,64 @@
+import pytest
+from prometheus_client import CollectorRegistry
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.application.dtos.document_generation import GenerateDocumentRequest
+from backend.application.model_router.model_router import ModelRoute
+from backend.application.use_cases.document_type.generate_document_use_case import GenerateDocumentUseCase, render_docx
+from backend.core.enums.field_type_enum import FieldType
+from backend.core.models.document_field import DocumentField
+from backend.core.models.document_type import DocumentType
+from backend.core.models.generated_document import GeneratedDocument
+from backend.infrastructure.metrics.prometheus_metrics import PrometheusStageMetrics
+
+# Roughly one page of a generated contract.
+PAGE = ("The parties identified above agree to the terms set out in this document, which shall be interpreted "
+        "in good faith and in accordance with the applicable law. ") * 20 + "\n"
+
+class FakeDocumentTypeRepository:
+    async def find_by_id_with_fields(self, id):
+        return DocumentType(id=id, name="Service Contract", description="Agreement for services.", fields=[
+            DocumentField(id=1, document_type_id=id, name="Client Name", field_type=FieldType.TEXT, is_required=True),
+            DocumentField(id=2, document_type_id=id, name="Contract Value", field_type=FieldType.DECIMAL, is_required=True),
+        ])
+
+class FakeGeneratedDocumentRepository:
+    async def save(self, entity: GeneratedDocument) -> GeneratedDocument:
+        entity.id = 1
+        return entity
+
+class FakeAIGateway:
+    def __init__(self, generated_text: str):
+        self._generated_text = generated_text
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        return InferenceResponse(generated_text=self._generated_text)
+
+class FakeFileStorageGateway:
+    async def save_document(self, content: bytes, filename: str) -> str:
+        return filename
+
+    async def get_file_url(self, location_identifier: str) -> str:
+        return f"/documents/{location_identifier}"
+
+class FakeModelRouter:
+    def route(self, use_case, estimated_prompt_tokens):
+        return ModelRoute(use_case=use_case, model="fake-model")
+
+@pytest.mark.parametrize("pages", [1, 10, 100])
+def test_render_docx(benchmark, pages):
+    content = PAGE * pages
+    rendered = benchmark(render_docx, content)
+    assert rendered.startswith(b"PK")
+
+def test_generate_document_use_case(benchmark, run_async):
+    use_case = GenerateDocumentUseCase(
+        FakeDocumentTypeRepository(), FakeGeneratedDocumentRepository(), FakeAIGateway(PAGE * 2),
+        FakeFileStorageGateway(), FakeModelRouter(), PrometheusStageMetrics(CollectorRegistry())
+    )
+    request_dto = GenerateDocumentRequest(document_type_id=1, filled_fields={"Client Name": "ACME Corp.", "Contract Value": 15000})
+
+    response = benchmark(run_async, lambda: use_case.execute(request_dto, current_user_id=1))
+    assert response.success
@@ -0,0 +1,36 @@
+import pytest
+from prometheus_client import CollectorRegistry
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.infrastructure.metrics.prometheus_metrics import PrometheusHTTPMetrics, PrometheusStageMetrics
+from backend.interfaces.middleware.metrics_middleware import MetricsMiddleware
+
+class FakeRoute:
+    path = "/api/v1/user/documents/download/{location_identifier}"
+
+async def endpoint(scope, receive, send):
+    scope["route"] = FakeRoute()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+async def send(message):
+    return None
+
+def make_scope() -> dict:
+    return {"type": "http", "method": "GET", "path": "/api/v1/user/documents/download/generated_doc_1.docx"}
+
+# Compare the two to read the per-request cost of the middleware.
+def test_request_without_metrics(benchmark, run_async):
+    benchmark(run_async, lambda: endpoint(make_scope(), receive, send))
+
+def test_request_with_metrics(benchmark, run_async):
+    app = MetricsMiddleware(endpoint, PrometheusHTTPMetrics(CollectorRegistry()))
+    benchmark(run_async, lambda: app(make_scope(), receive, send))
+
+def test_observe_stage(benchmark):
+    stage_metrics = PrometheusStageMetrics(CollectorRegistry())
+    benchmark(stage_metrics.observe_stage, "generate_document", "llm", 0.42)
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("aiosqlite")
+
+from backend.core.enums.field_type_enum import FieldType
+from backend.core.enums.user_role_enum import UserRole
+from backend.infrastructure.models.base import Base
+from backend.infrastructure.models.document_field_model import DocumentFieldModel
+from backend.infrastructure.models.document_type_model import DocumentTypeModel
+from backend.infrastructure.models.user_model import UserModel
+from backend.infrastructure.repositories.mysql_document_type_repository import MySqlDocumentTypeRepository
+from backend.infrastructure.repositories.mysql_user_repository import MySqlUserRepository
+
+ROWS = 10_000
+PASSWORD_HASH = "$2b$12$" + "a" * 53
+
+@pytest.fixture
+def session_factory(run_async):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    async def seed():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.execute(insert(UserModel), [
+                {"username": f"user{i}", "email": f"user{i}@example.com", "password_hash": PASSWORD_HASH,
+                 "role": UserRole.COMMON_USER, "is_active": True} for i in range(ROWS)
+            ])
+            await connection.execute(insert(DocumentTypeModel), [
+                {"id": i + 1, "name": f"Document Type {i}", "description": f"Description {i}"} for i in range(ROWS)
+            ])
+            await connection.execute(insert(DocumentFieldModel), [
+                {"document_type_id": 1, "name": f"Field {i}", "field_type": FieldType.TEXT, "is_required": i % 2 == 0,
+                 "description": f"Description {i}"} for i in range(ROWS)
+            ])
+
+    run_async(seed)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    run_async(engine.dispose)
+
+# A fresh session per round, so that the identity map never hands back already-hydrated rows.
+def test_find_all_users(benchmark, run_async, session_factory):
+    async def find_all():
+        async with session_factory() as session:
+            return await MySqlUserRepository(session).find_all()
+
+    users = benchmark(run_async, find_all)
+    assert len(users) == ROWS
+
+def test_find_all_document_types(benchmark, run_async, session_factory):
+    async def find_all():
+        async with session_factory() as session:
+            return await MySqlDocumentTypeRepository(session).find_all()
+
+    document_types = benchmark(run_async, find_all)
+    assert len(document_types) == ROWS
+
+def test_find_document_type_with_fields(benchmark, run_async, session_factory):
+    async def find_with_fields():
+        async with session_factory() as session:
+            return await MySqlDocumentTypeRepository(session).find_by_id_with_fields(1)
+
+    document_type = benchmark(run_async, find_with_fields)
+    assert len(document_type.fields) == ROWS
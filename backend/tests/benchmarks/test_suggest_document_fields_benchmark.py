@@ -0,0 +1,48 @@
+import json
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.application.ai_gateway.structured_output import StructuredOutputMetrics
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsRequest
+from backend.application.model_router.model_router import ModelRoute
+from backend.application.use_cases.document_field.suggest_document_fields_use_case import SuggestDocumentFieldsUseCase
+from backend.infrastructure.cache.field_suggestion_cache import NoOpFieldSuggestionCache
+
+SUGGESTION = json.dumps({
+    "document_type": "Service Contract",
+    "description": "Agreement for services provided to clients.",
+    "fields": [
+        {"name": f"Field {i}", "type": "text", "required": i % 2 == 0, "description": f"Purpose of field {i}."}
+        for i in range(20)
+    ],
+})
+
+GENERATED_TEXTS = {
+    "strict": SUGGESTION,
+    "recovered": f"Sure! Here are the fields for this document type:\n```json\n{SUGGESTION}\n```\nLet me know if you need more.",
+}
+
+class FakeAIGateway:
+    def __init__(self, generated_text: str):
+        self._generated_text = generated_text
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        return InferenceResponse(generated_text=self._generated_text)
+
+class FakeModelRouter:
+    def route(self, use_case, estimated_prompt_tokens):
+        return ModelRoute(use_case=use_case, model="fake-model")
+
+@pytest.mark.parametrize("outcome", GENERATED_TEXTS)
+def test_suggest_document_fields_parsing(benchmark, run_async, outcome):
+    use_case = SuggestDocumentFieldsUseCase(
+        FakeAIGateway(GENERATED_TEXTS[outcome]), FakeModelRouter(), StructuredOutputMetrics(), NoOpFieldSuggestionCache()
+    )
+    request_dto = GenerateDocumentFieldsRequest(
+        document_type_name="Service Contract", document_type_description="Agreement for services provided to clients."
+    )
+
+    response = benchmark(run_async, lambda: use_case.execute(request_dto))
+    assert response.success and len(response.data.fields) == 20
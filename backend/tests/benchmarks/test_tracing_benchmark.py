@@ -0,0 +1,40 @@
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+pytest.importorskip("pytest_benchmark")
+
+from backend.infrastructure.tracing.traced_proxy import TracedProxy
+
+class DroppingSpanExporter(SpanExporter):
+    def export(self, spans):
+        return SpanExportResult.SUCCESS
+
+class FakeRepository:
+    async def find_by_id(self, id):
+        return {"id": id}
+
+class FakeUseCase:
+    def __init__(self, repository):
+        self._repository = repository
+
+    async def execute(self, id):
+        return await self._repository.find_by_id(id)
+
+def make_use_case(sample_ratio: float):
+    provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(sample_ratio)))
+    provider.add_span_processor(BatchSpanProcessor(DroppingSpanExporter()))
+    tracer = provider.get_tracer("benchmark")
+    return TracedProxy(FakeUseCase(TracedProxy(FakeRepository(), tracer, "repository")), tracer, "use_case"), provider
+
+def test_use_case_without_tracing(benchmark, run_async):
+    use_case = FakeUseCase(FakeRepository())
+    benchmark(run_async, lambda: use_case.execute(1))
+
+# Two nested spans per call; compare with the untraced call above to read the cost per span.
+@pytest.mark.parametrize("sample_ratio", [0.05, 1.0])
+def test_use_case_with_tracing(benchmark, run_async, sample_ratio):
+    use_case, provider = make_use_case(sample_ratio)
+    benchmark(run_async, lambda: use_case.execute(1))
+    provider.shutdown()
@@ -0,0 +1,25 @@
+import json
+from backend.application.prompt_builder import build_document_content_prompt, build_document_fields_prompt, \
+    build_document_types_prompt, compact_json, estimate_tokens
+
+class TestPromptBuilder:
+
+    def test_system_prompt_is_identical_across_requests(self):
+        first = build_document_fields_prompt("Invoice", "Bill sent to customers.")
+        second = build_document_fields_prompt("Service Contract", "Agreement between parties.")
+        assert first.system_prompt == second.system_prompt
+        assert "Invoice" not in first.system_prompt
+        assert first.user_prompt == "Document type: Invoice\nDescription: Bill sent to customers."
+
+    def test_content_prompt_serializes_fields_compactly(self):
+        filled_fields = {"Contract Value": "€15.000", "Notice Period Days": 30}
+        prompt = build_document_content_prompt("Service Contract", None, filled_fields)
+        assert prompt.user_prompt.endswith('Field values: {"Contract Value":"€15.000","Notice Period Days":30}')
+        assert json.loads(compact_json(filled_fields)) == filled_fields
+
+    def test_estimates_tokens_for_prefix_and_total(self):
+        prompt = build_document_types_prompt("  Law firm specialized in labor law.  ")
+        assert prompt.user_prompt == "Business description: Law firm specialized in labor law."
+        assert estimate_tokens("abcde") == 2
+        assert prompt.estimated_prefix_tokens == estimate_tokens(prompt.system_prompt)
+        assert prompt.estimated_tokens == prompt.estimated_prefix_tokens + estimate_tokens(prompt.user_prompt)
@@ -0,0 +1,55 @@
+import json
+import pytest
+from backend.application.ai_gateway.structured_output import StreamingJSONArrayExtractor, StructuredOutputMetrics, \
+    extract_json_object
+
+NOISY_OUTPUT = '''Here are the fields:
+```json
+{
+  "document_type": "Invoice", // echoed hint
+  "description": "Says \\"pay {now}\\"",
+  "fields": [
+    {"name": "Total", "type": "decimal", "required": true, "description": "See http://example.com"},
+    {"name": "Due Date", "type": "date", "required": true, "description": "When",},
+  ],
+}
+```
+Let me know if you need more {fields}.'''
+
+class TestExtractJsonObject:
+
+    def test_extracts_object_surrounded_by_prose(self):
+        parsed = extract_json_object(NOISY_OUTPUT)
+        assert parsed["description"] == 'Says "pay {now}"'
+        assert [field["name"] for field in parsed["fields"]] == ["Total", "Due Date"]
+        assert parsed["fields"][0]["description"] == "See http://example.com"
+
+    def test_raises_when_no_object_present(self):
+        with pytest.raises(json.JSONDecodeError):
+            extract_json_object("I cannot help with that.")
+
+class TestStreamingJSONArrayExtractor:
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64])
+    def test_yields_each_array_item_once_complete(self, chunk_size):
+        extractor = StreamingJSONArrayExtractor("fields")
+        items = []
+        for start in range(0, len(NOISY_OUTPUT), chunk_size):
+            items.extend(extractor.feed(NOISY_OUTPUT[start:start + chunk_size]))
+        assert [item["name"] for item in items] == ["Total", "Due Date"]
+        assert extractor.text == NOISY_OUTPUT
+
+    def test_ignores_arrays_under_other_keys(self):
+        extractor = StreamingJSONArrayExtractor("fields")
+        assert extractor.feed('{"examples": [{"name": "x"}], "fields": [{"name": "y"}]}') == [{"name": "y"}]
+
+class TestStructuredOutputMetrics:
+
+    def test_rates_are_relative_to_parsed_responses(self):
+        metrics = StructuredOutputMetrics()
+        metrics.record("suggest", "parse_failed")
+        metrics.record("suggest", "retried")
+        metrics.record("suggest", "recovered")
+        stats = metrics.stats()["suggest"]
+        assert stats["parse_failure_rate"] == 0.5
+        assert stats["retry_rate"] == 0.5
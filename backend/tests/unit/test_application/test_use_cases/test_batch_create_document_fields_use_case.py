@@ -0,0 +1,85 @@
+import asyncio
+from backend.application.dtos.document_field import BatchCreateDocumentFieldsRequest, CreateDocumentFieldRequestForBatch
+from backend.application.use_cases.document_field.batch_create_document_fields_use_case import \
+    BatchCreateDocumentFieldsUseCase
+from backend.core.enums.field_type_enum import FieldType
+from backend.core.models.document_field import DocumentField
+from backend.core.models.document_type import DocumentType
+
+class InMemoryDocumentTypeRepository:
+    async def find_by_id(self, id):
+        return DocumentType(id=id, name="Invoice", description=None) if id == 1 else None
+
+class InMemoryDocumentFieldRepository:
+    # Name lookups are case-insensitive, like the MySQL collation.
+    def __init__(self, existing_names=(), save_error=None):
+        self.fields = [DocumentField(id=i + 1, document_type_id=1, name=name, field_type=FieldType.TEXT, is_required=False)
+                       for i, name in enumerate(existing_names)]
+        self.save_error = save_error
+        self.save_all_calls = []
+
+    async def find_by_names_and_document_type(self, names, document_type_id):
+        wanted = {name.casefold() for name in names}
+        return [field for field in self.fields
+                if field.document_type_id == document_type_id and field.name.casefold() in wanted]
+
+    async def save_all(self, document_fields):
+        self.save_all_calls.append([field.name for field in document_fields])
+        if self.save_error:
+            raise self.save_error
+        # Hands IDs out in reverse so that a result matched up by position rather than by entity would show.
+        next_id = len(self.fields) + len(document_fields)
+        saved = []
+        for field in document_fields:
+            saved.append(DocumentField(id=next_id, document_type_id=field.document_type_id, name=field.name,
+                                       field_type=field.field_type, is_required=field.is_required,
+                                       description=field.description))
+            next_id -= 1
+        self.fields.extend(saved)
+        return saved
+
+def make_request(*names, document_type_id=1):
+    return BatchCreateDocumentFieldsRequest(document_type_id=document_type_id, fields=[
+        CreateDocumentFieldRequestForBatch(name=name, type=FieldType.NUMBER, required=True, description=f"{name} value")
+        for name in names
+    ])
+
+class TestBatchCreateDocumentFieldsUseCase:
+
+    def test_case_insensitive_duplicates_are_rejected_and_the_rest_saved_in_order(self):
+        field_repository = InMemoryDocumentFieldRepository(existing_names=["Total"])
+        use_case = BatchCreateDocumentFieldsUseCase(InMemoryDocumentTypeRepository(), field_repository)
+
+        response = asyncio.run(use_case.execute(make_request("Due Date", "TOTAL", "Tax", "due date", "Discount")))
+
+        assert response.error_code == "BATCH_CREATE_FIELDS_PARTIAL_ERROR"
+        assert response.errors == [
+            "A field with the name 'TOTAL' already exists for DocumentType ID 1.",
+            "A field with the name 'due date' already exists for DocumentType ID 1.",
+        ]
+        assert field_repository.save_all_calls == [["Due Date", "Tax", "Discount"]]
+        assert [(item.id, item.name) for item in response.data] == [(4, "Due Date"), (3, "Tax"), (2, "Discount")]
+        assert all(item.document_type_id == 1 and item.field_type == FieldType.NUMBER for item in response.data)
+
+    def test_save_all_failure_reports_every_unsaved_field(self):
+        field_repository = InMemoryDocumentFieldRepository(save_error=RuntimeError("Deadlock found"))
+        use_case = BatchCreateDocumentFieldsUseCase(InMemoryDocumentTypeRepository(), field_repository)
+
+        response = asyncio.run(use_case.execute(make_request("Due Date", "Tax")))
+
+        assert response.success is False
+        assert response.error_code == "BATCH_CREATE_FIELDS_PARTIAL_ERROR"
+        assert response.errors == [
+            "Error creating field 'Due Date': Deadlock found",
+            "Error creating field 'Tax': Deadlock found",
+        ]
+        assert response.data == []
+
+    def test_unknown_document_type_is_rejected(self):
+        field_repository = InMemoryDocumentFieldRepository()
+        use_case = BatchCreateDocumentFieldsUseCase(InMemoryDocumentTypeRepository(), field_repository)
+
+        response = asyncio.run(use_case.execute(make_request("Tax", document_type_id=2)))
+
+        assert response.error_code == "PARENT_DOC_TYPE_NOT_FOUND"
+        assert field_repository.save_all_calls == []
@@ -0,0 +1,83 @@
+import asyncio
+from backend.application.dtos.document_type import CreateDocumentTypeRequest
+from backend.application.use_cases.document_type.batch_create_document_types_use_case import \
+    BatchCreateDocumentTypesUseCase
+from backend.core.models.document_type import DocumentType
+
+class InMemoryDocumentTypeRepository:
+    # Name lookups are case-insensitive, like the MySQL collation.
+    def __init__(self, existing_names=(), save_error=None):
+        self.document_types = [DocumentType(id=i + 1, name=name, description=None) for i, name in enumerate(existing_names)]
+        self.save_error = save_error
+        self.save_all_calls = []
+
+    async def find_by_names(self, names):
+        wanted = {name.casefold() for name in names}
+        return [document_type for document_type in self.document_types if document_type.name.casefold() in wanted]
+
+    async def save_all(self, document_types):
+        self.save_all_calls.append([document_type.name for document_type in document_types])
+        if self.save_error:
+            raise self.save_error
+        # Hands IDs out in reverse so that a result matched up by position rather than by entity would show.
+        next_id = len(self.document_types) + len(document_types)
+        saved = []
+        for document_type in document_types:
+            saved.append(DocumentType(id=next_id, name=document_type.name, description=document_type.description))
+            next_id -= 1
+        self.document_types.extend(saved)
+        return saved
+
+class RecordingPrefetcher:
+    def __init__(self):
+        self.prefetched = []
+
+    def prefetch(self, document_types, user_id):
+        self.prefetched.extend(document_type.name for document_type in document_types)
+
+def requests(*names):
+    return [CreateDocumentTypeRequest(name=name, description=f"{name} description") for name in names]
+
+class TestBatchCreateDocumentTypesUseCase:
+
+    def test_case_insensitive_duplicates_are_rejected_and_the_rest_saved_in_order(self):
+        repository = InMemoryDocumentTypeRepository(existing_names=["Invoice"])
+        prefetcher = RecordingPrefetcher()
+        use_case = BatchCreateDocumentTypesUseCase(repository, prefetcher)
+
+        response = asyncio.run(use_case.execute(requests("Contract", "INVOICE", "Receipt", "contract", "Quote")))
+
+        assert response.error_code == "BATCH_CREATE_PARTIAL_ERROR"
+        assert response.errors == [
+            "A DocumentType with the name 'INVOICE' already exists.",
+            "A DocumentType with the name 'contract' already exists.",
+        ]
+        assert repository.save_all_calls == [["Contract", "Receipt", "Quote"]]
+        assert [(item.id, item.name) for item in response.data] == [(4, "Contract"), (3, "Receipt"), (2, "Quote")]
+        assert [item.description for item in response.data] == \
+            ["Contract description", "Receipt description", "Quote description"]
+        assert prefetcher.prefetched == ["Contract", "Receipt", "Quote"]
+
+    def test_save_all_failure_reports_every_unsaved_document_type(self):
+        repository = InMemoryDocumentTypeRepository(save_error=RuntimeError("Duplicate entry"))
+        prefetcher = RecordingPrefetcher()
+        use_case = BatchCreateDocumentTypesUseCase(repository, prefetcher)
+
+        response = asyncio.run(use_case.execute(requests("Contract", "Receipt")))
+
+        assert response.success is False
+        assert response.error_code == "BATCH_CREATE_PARTIAL_ERROR"
+        assert response.errors == [
+            "Internal error creating 'Contract': Duplicate entry",
+            "Internal error creating 'Receipt': Duplicate entry",
+        ]
+        assert response.data == []
+        assert prefetcher.prefetched == []
+
+    def test_all_created(self):
+        use_case = BatchCreateDocumentTypesUseCase(InMemoryDocumentTypeRepository())
+
+        response = asyncio.run(use_case.execute(requests("Contract", "Receipt")))
+
+        assert response.success is True
+        assert [item.name for item in response.data] == ["Contract", "Receipt"]
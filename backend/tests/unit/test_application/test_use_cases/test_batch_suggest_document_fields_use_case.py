@@ -0,0 +1,119 @@
+import asyncio
+import time
+from redis.exceptions import ConnectionError as RedisConnectionError
+from backend.application.dtos.api_response import APIResponse
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsRequest, GenerateDocumentFieldsResponse
+from backend.application.use_cases.document_field.batch_suggest_document_fields_use_case import \
+    BatchSuggestDocumentFieldsUseCase
+from backend.infrastructure.cache.field_suggestion_cache import TwoTierFieldSuggestionCache
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+
+class FakeSuggestUseCase:
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.started = 0
+
+    async def execute(self, request_dto, current_user_id=None):
+        self.started += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays[request_dto.document_type_name])
+        finally:
+            self.active -= 1
+        if request_dto.document_type_name == "Broken":
+            return APIResponse[GenerateDocumentFieldsResponse](success=False, message="failed", error_code="AI_RESPONSE_PARSE_ERROR")
+        return APIResponse[GenerateDocumentFieldsResponse](success=True, message="ok", data=GenerateDocumentFieldsResponse(
+            document_type=request_dto.document_type_name, description=request_dto.document_type_description, fields=[]
+        ))
+
+class UnavailableRedis:
+    async def get(self, key):
+        raise RedisConnectionError("connection refused")
+
+class CachedSuggestUseCase:
+    # Loads through the real suggestion cache, which shields loads shared between callers.
+    def __init__(self):
+        self.cache = TwoTierFieldSuggestionCache(TwoTierCache(
+            namespace="test:field_suggestions",
+            redis_client_provider=UnavailableRedis,
+            local_cache=TTLLRUCache(max_entries=100, ttl_seconds=60),
+            redis_retry_after_seconds=60,
+        ))
+        self.started = 0
+        self.completed = 0
+
+    async def execute(self, request_dto, current_user_id=None):
+        async def load():
+            self.started += 1
+            await asyncio.sleep(0.05)
+            self.completed += 1
+            return GenerateDocumentFieldsResponse(
+                document_type=request_dto.document_type_name, description=request_dto.document_type_description, fields=[]
+            )
+
+        suggestion = await self.cache.get_or_load(request_dto.document_type_name, request_dto.document_type_description, load)
+        return APIResponse[GenerateDocumentFieldsResponse](success=True, message="ok", data=suggestion)
+
+def make_requests(names):
+    return [GenerateDocumentFieldsRequest(document_type_name=name, document_type_description="Description") for name in names]
+
+class TestBatchSuggestDocumentFieldsUseCase:
+
+    def test_streams_results_in_completion_order_under_concurrency_cap(self):
+        suggest = FakeSuggestUseCase({"Slow": 0.1, "Fast": 0.01, "Broken": 0.02, "Medium": 0.05})
+        use_case = BatchSuggestDocumentFieldsUseCase(suggest, max_concurrency=2)
+
+        async def run():
+            started_at = time.perf_counter()
+            return [(event, time.perf_counter() - started_at)
+                    async for event in use_case.execute_stream(make_requests(["Slow", "Fast", "Broken", "Medium"]), 1)]
+
+        events = asyncio.run(run())
+        assert [event["index"] for event, _ in events[:-1]] == [1, 2, 3, 0]
+        assert events[0][1] < 0.05
+        assert suggest.peak == 2
+
+        summary = events[-1][0]
+        assert summary["event"] == "result"
+        assert summary["data"]["data"] == {"total": 4, "succeeded": 3, "failed": 1}
+        assert summary["data"]["error_code"] == "BATCH_SUGGEST_PARTIAL_ERROR"
+
+    def test_stops_pending_suggestions_when_client_goes_away(self):
+        suggest = FakeSuggestUseCase({f"Type {i}": 0.05 for i in range(10)})
+        use_case = BatchSuggestDocumentFieldsUseCase(suggest, max_concurrency=2)
+
+        async def run():
+            stream = use_case.execute_stream(make_requests([f"Type {i}" for i in range(10)]))
+            await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0.1)
+
+        asyncio.run(run())
+        assert suggest.started < 10
+
+    def test_client_going_away_cancels_upstream_loads_behind_the_cache(self):
+        suggest = CachedSuggestUseCase()
+        use_case = BatchSuggestDocumentFieldsUseCase(suggest, max_concurrency=2)
+
+        async def run():
+            stream = use_case.execute_stream(make_requests([f"Type {i}" for i in range(10)]))
+            await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0.1)
+
+        asyncio.run(run())
+        assert suggest.completed == 2
+        assert suggest.started - suggest.completed == suggest.cache.stats()["abandoned_loads"] == 2
+
+    def test_rejects_oversized_batches(self):
+        use_case = BatchSuggestDocumentFieldsUseCase(FakeSuggestUseCase({}), max_batch_size=2)
+
+        async def run():
+            return [event async for event in use_case.execute_stream(make_requests(["A", "B", "C"]))]
+
+        [event] = asyncio.run(run())
+        assert event["data"]["error_code"] == "BATCH_TOO_LARGE"
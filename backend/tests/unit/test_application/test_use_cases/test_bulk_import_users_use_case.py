@@ -0,0 +1,66 @@
+import asyncio
+import bcrypt
+from backend.application.use_cases.user.bulk_import_users_use_case import BulkImportUsersUseCase
+
+class FakeUserRepository:
+    def __init__(self):
+        self.saved = []
+
+    async def find_by_usernames_or_emails(self, usernames, emails):
+        return []
+
+    async def save_all(self, users, created_by_user_id=None):
+        for user in users:
+            user.id = len(self.saved) + 1
+            self.saved.append(user)
+        return users
+
+class FakeTokenStore:
+    async def issue_many(self, user_ids):
+        return [f"token-{user_id}" for user_id in user_ids]
+
+class FakeEmailGateway:
+    async def send_emails(self, emails):
+        return [True] * len(emails)
+
+class CountingPasswordHasher:
+    def __init__(self):
+        self.hashed = 0
+
+    async def hash(self, password):
+        self.hashed += 1
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=4)).decode('utf-8')
+
+class TestBulkImportUsersUseCase:
+
+    def test_malformed_rows_are_reported_without_aborting_the_import(self):
+        repository = FakeUserRepository()
+        hasher = CountingPasswordHasher()
+        use_case = BulkImportUsersUseCase(repository, FakeEmailGateway(), FakeTokenStore(), hasher)
+
+        response = asyncio.run(use_case.execute([
+            {"username": "alice", "email": "alice@example.com"},
+            {"username": 123, "email": "numeric@example.com"},
+            "not an object",
+            {"username": "bob", "email": "bob@example.com", "role": "admin"},
+        ], created_by_user_id=1))
+
+        assert response.error_code == "BULK_IMPORT_PARTIAL_ERROR"
+        results = response.data.results
+        assert [result.success for result in results] == [True, False, False, True]
+        assert results[1].username == "123" and results[1].errors
+        assert results[2].username is None and results[2].errors
+        assert [user.username for user in repository.saved] == ["alice", "bob"]
+
+    def test_imported_users_share_one_placeholder_hash(self):
+        repository = FakeUserRepository()
+        hasher = CountingPasswordHasher()
+        use_case = BulkImportUsersUseCase(repository, FakeEmailGateway(), FakeTokenStore(), hasher)
+
+        response = asyncio.run(use_case.execute(
+            [{"username": f"user{i}", "email": f"user{i}@example.com"} for i in range(20)], created_by_user_id=1
+        ))
+
+        assert response.success and response.data.created == 20
+        assert hasher.hashed == 1
+        assert len({user.hashed_password.value for user in repository.saved}) == 1
@@ -0,0 +1,77 @@
+import asyncio
+import json
+from redis.exceptions import ConnectionError as RedisConnectionError
+from backend.application.ai_gateway.structured_output import StructuredOutputMetrics
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsRequest
+from backend.application.model_router.model_router import ModelRoute
+from backend.application.use_cases.document_field.suggest_document_fields_use_case import SuggestDocumentFieldsUseCase
+from backend.infrastructure.cache.field_suggestion_cache import TwoTierFieldSuggestionCache
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+
+class UnavailableRedis:
+    async def get(self, key):
+        raise RedisConnectionError("connection refused")
+
+class CountingAIGateway:
+    def __init__(self):
+        self.calls = 0
+
+    def _suggestion(self) -> str:
+        self.calls += 1
+        return json.dumps({"fields": [{"name": f"Field {self.calls}", "type": "text", "required": True, "description": "-"}]})
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        return InferenceResponse(generated_text=self._suggestion())
+
+    async def stream_text(self, request: InferenceRequest):
+        text = self._suggestion()
+        for i in range(0, len(text), 7):
+            yield text[i:i + 7]
+
+class FakeModelRouter:
+    def route(self, use_case, estimated_prompt_tokens):
+        return ModelRoute(use_case=use_case, model="fake-model")
+
+def make_use_case():
+    cache = TwoTierFieldSuggestionCache(TwoTierCache(
+        namespace="test:field_suggestions",
+        redis_client_provider=UnavailableRedis,
+        local_cache=TTLLRUCache(max_entries=100, ttl_seconds=60),
+        redis_retry_after_seconds=60,
+    ))
+    gateway = CountingAIGateway()
+    return SuggestDocumentFieldsUseCase(gateway, FakeModelRouter(), StructuredOutputMetrics(), cache), gateway
+
+def make_request(refresh=False):
+    return GenerateDocumentFieldsRequest(document_type_name="Invoice", document_type_description="A bill", refresh=refresh)
+
+def field_names(response):
+    return [field.name for field in response.data.fields]
+
+class TestSuggestDocumentFieldsUseCase:
+
+    def test_refresh_bypasses_and_replaces_the_cached_suggestion(self):
+        use_case, gateway = make_use_case()
+
+        async def run():
+            return [await use_case.execute(make_request()), await use_case.execute(make_request()),
+                    await use_case.execute(make_request(refresh=True)), await use_case.execute(make_request())]
+
+        first, cached, refreshed, after_refresh = asyncio.run(run())
+        assert field_names(first) == field_names(cached) == ["Field 1"]
+        assert field_names(refreshed) == field_names(after_refresh) == ["Field 2"]
+        assert gateway.calls == 2
+
+    def test_streamed_suggestion_is_written_back_to_the_cache(self):
+        use_case, gateway = make_use_case()
+
+        async def run():
+            events = [event async for event in use_case.execute_stream(make_request())]
+            return events, await use_case.execute(make_request())
+
+        events, cached = asyncio.run(run())
+        assert [event["event"] for event in events] == ["field", "result"]
+        assert field_names(cached) == ["Field 1"]
+        assert gateway.calls == 1
@@ -1,5 +1,7 @@
 import pytest
 from backend.core.models.document_type import DocumentType
+from backend.core.models.document_field import DocumentField
+from backend.core.enums.field_type_enum import FieldType
 
 class TestDocumentType:
 
@@ -110,4 +112,14 @@ class TestDocumentType:
         assert "DocumentType" in repr_str
         assert f"id={id_val}" in repr_str
         assert f"name='{name_val}'" in repr_str
-        assert "description='None'" in repr_str
\ No newline at end of file
+        assert "description='None'" in repr_str
+
+    def test_fields_default_to_empty_list(self):
+        doc_type = DocumentType(id=1, name="Service Contract")
+        assert doc_type.fields == []
+
+    def test_eq_ignores_fields(self):
+        field = DocumentField(id=1, document_type_id=1, name="Company", field_type=FieldType.TEXT, is_required=True)
+        doc1 = DocumentType(id=1, name="A", description="Desc A", fields=[field])
+        doc2 = DocumentType(id=1, name="A", description="Desc A")
+        assert doc1 == doc2
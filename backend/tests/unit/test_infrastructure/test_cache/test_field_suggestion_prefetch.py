@@ -0,0 +1,91 @@
+import asyncio
+from redis.exceptions import ConnectionError as RedisConnectionError
+from backend.application.dtos.api_response import APIResponse
+from backend.application.dtos.document_field_suggestion import GenerateDocumentFieldsResponse
+from backend.core.models.document_type import DocumentType
+from backend.infrastructure.cache.field_suggestion_cache import TwoTierFieldSuggestionCache
+from backend.infrastructure.cache.field_suggestion_prefetcher import BackgroundFieldSuggestionPrefetcher
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+
+class UnavailableRedis:
+    async def get(self, key):
+        raise RedisConnectionError("connection refused")
+
+def make_cache() -> TwoTierFieldSuggestionCache:
+    return TwoTierFieldSuggestionCache(TwoTierCache(
+        namespace="test:field_suggestions",
+        redis_client_provider=UnavailableRedis,
+        local_cache=TTLLRUCache(max_entries=100, ttl_seconds=60),
+    ))
+
+class SlowSuggestUseCase:
+    def __init__(self, cache: TwoTierFieldSuggestionCache):
+        self.cache = cache
+        self.active = 0
+        self.peak = 0
+        self.loads = 0
+
+    async def execute(self, request_dto, current_user_id=None):
+        async def load():
+            self.loads += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.02)
+            self.active -= 1
+            return GenerateDocumentFieldsResponse(
+                document_type=request_dto.document_type_name, description=request_dto.document_type_description, fields=[]
+            )
+
+        suggestion = await self.cache.get_or_load(request_dto.document_type_name, request_dto.document_type_description, load)
+        return APIResponse[GenerateDocumentFieldsResponse](success=True, message="ok", data=suggestion)
+
+class TestFieldSuggestionPrefetch:
+
+    def test_prefetches_batch_under_concurrency_cap_into_cache(self):
+        cache = make_cache()
+        use_case = SlowSuggestUseCase(cache)
+        prefetcher = BackgroundFieldSuggestionPrefetcher(lambda: use_case, max_concurrency=3)
+        document_types = [DocumentType(id=i, name=f"Type {i}", description=f"Description {i}") for i in range(10)]
+        document_types.append(DocumentType(id=10, name="No description"))
+
+        async def run():
+            prefetcher.prefetch(document_types, user_id=1)
+            while prefetcher.stats()["pending"]:
+                await asyncio.sleep(0.01)
+            return await cache.get("type 4", "Description 4")
+
+        cached = asyncio.run(run())
+        assert cached.document_type == "Type 4"
+        assert use_case.peak == 3
+        assert prefetcher.stats()["succeeded"] == 10 and prefetcher.stats()["skipped"] == 1
+
+    def test_concurrent_requests_for_the_same_type_share_one_load(self):
+        cache = make_cache()
+        use_case = SlowSuggestUseCase(cache)
+        request_dto = type("Request", (), {"document_type_name": "Invoice", "document_type_description": "A bill"})
+
+        async def run():
+            return await asyncio.gather(*[use_case.execute(request_dto) for _ in range(5)])
+
+        responses = asyncio.run(run())
+        assert all(response.data.document_type == "Invoice" for response in responses)
+        assert use_case.loads == 1
+        assert cache.stats()["joined_in_flight"] == 4
+
+    def test_shared_load_survives_one_waiter_going_away(self):
+        cache = make_cache()
+        use_case = SlowSuggestUseCase(cache)
+        request_dto = type("Request", (), {"document_type_name": "Invoice", "document_type_description": "A bill"})
+
+        async def run():
+            prefetch = asyncio.create_task(use_case.execute(request_dto))
+            click = asyncio.create_task(use_case.execute(request_dto))
+            await asyncio.sleep(0.005)
+            click.cancel()
+            return await prefetch
+
+        response = asyncio.run(run())
+        assert response.data.document_type == "Invoice"
+        assert use_case.loads == 1
+        assert cache.stats()["abandoned_loads"] == 0
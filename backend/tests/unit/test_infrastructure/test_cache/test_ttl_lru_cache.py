@@ -0,0 +1,53 @@
+import pytest
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestTTLLRUCache:
+
+    def test_get_returns_stored_value(self):
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=10)
+        cache.set("a", {"id": 1})
+        assert cache.get("a") == (True, {"id": 1})
+        assert cache.get("b") == (False, None)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entry_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == (True, 1)
+        clock.now = 10.0
+        assert cache.get("a") == (False, None)
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLLRUCache(max_entries=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+        assert cache.evictions == 1
+
+    def test_delete_removes_entry(self):
+        cache = TTLLRUCache()
+        cache.set("a", 1)
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert cache.get("a") == (False, None)
+
+    @pytest.mark.parametrize("max_entries, ttl_seconds", [(0, 10), (10, 0)])
+    def test_invalid_configuration_raises_value_error(self, max_entries, ttl_seconds):
+        with pytest.raises(ValueError):
+            TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
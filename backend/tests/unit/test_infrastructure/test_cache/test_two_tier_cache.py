@@ -0,0 +1,117 @@
+import asyncio
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class CountingLoader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.value
+
+def make_cache(redis_client, clock=None, redis_ttl_seconds=300) -> TwoTierCache:
+    local_cache = TTLLRUCache(max_entries=100, ttl_seconds=10, clock=clock) if clock else TTLLRUCache(max_entries=100)
+    return TwoTierCache(
+        namespace="test:schema",
+        redis_client_provider=lambda: redis_client,
+        local_cache=local_cache,
+        redis_ttl_seconds=redis_ttl_seconds,
+    )
+
+def identity(value):
+    return value
+
+async def wait_until(predicate, timeout_seconds=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout_seconds
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+class TestTwoTierCache:
+
+    def test_local_tier_serves_repeat_reads_and_redis_serves_other_instances(self):
+        loader = CountingLoader({"id": 1})
+
+        async def run():
+            server = FakeServer()
+            first, second = make_cache(FakeRedis(server=server)), make_cache(FakeRedis(server=server))
+            await first.get_or_load("type:1", loader, identity, identity)
+            await first.get_or_load("type:1", loader, identity, identity)
+            from_redis = await second.get_or_load("type:1", loader, identity, identity)
+            return first, second, from_redis
+
+        first, second, from_redis = asyncio.run(run())
+        assert from_redis == {"id": 1}
+        assert loader.calls == 1
+        assert first.stats()["local"]["hits"] == 1
+        assert second.stats()["redis_hits"] == 1
+
+    def test_expired_local_entry_falls_through_to_redis_with_the_configured_ttl(self):
+        clock = FakeClock()
+        loader = CountingLoader({"id": 1})
+        redis_client = FakeRedis()
+
+        async def run():
+            cache = make_cache(redis_client, clock=clock, redis_ttl_seconds=120)
+            await cache.get_or_load("type:1", loader, identity, identity)
+            clock.now = 10.0
+            value = await cache.get_or_load("type:1", loader, identity, identity)
+            return cache, value, await redis_client.ttl("test:schema:type:1")
+
+        cache, value, redis_ttl = asyncio.run(run())
+        assert value == {"id": 1}
+        assert loader.calls == 1
+        assert cache.stats()["local"]["expirations"] == 1
+        assert cache.stats()["redis_hits"] == 1
+        assert 0 < redis_ttl <= 120
+
+    def test_invalidation_is_published_to_other_instances(self):
+        loader = CountingLoader({"id": 1})
+
+        async def run():
+            server = FakeServer()
+            writer, reader = make_cache(FakeRedis(server=server)), make_cache(FakeRedis(server=server))
+            listener = asyncio.create_task(reader.listen_for_invalidations())
+            await asyncio.sleep(0.05)
+            await reader.get_or_load("type:1", loader, identity, identity)
+
+            loader.value = {"id": 1, "name": "renamed"}
+            await writer.invalidate("type:1")
+            await wait_until(lambda: reader.stats()["local"]["entries"] == 0)
+            value = await reader.get_or_load("type:1", loader, identity, identity)
+
+            listener.cancel()
+            await asyncio.gather(listener, return_exceptions=True)
+            return value
+
+        assert asyncio.run(run()) == {"id": 1, "name": "renamed"}
+        assert loader.calls == 2
+
+    def test_load_racing_an_invalidation_is_not_cached(self):
+        redis_client = FakeRedis()
+
+        async def run():
+            cache = make_cache(redis_client)
+
+            async def stale_loader():
+                await cache.invalidate("type:1")
+                return {"id": 1}
+
+            value = await cache.get_or_load("type:1", stale_loader, identity, identity)
+            return cache, value, await redis_client.exists("test:schema:type:1")
+
+        cache, value, exists_in_redis = asyncio.run(run())
+        assert value == {"id": 1}
+        assert cache.stats()["local"]["entries"] == 0
+        assert exists_in_redis == 0
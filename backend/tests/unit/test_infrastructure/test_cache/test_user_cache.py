@@ -0,0 +1,77 @@
+import asyncio
+import bcrypt
+from fakeredis.aioredis import FakeRedis
+from backend.application.dtos.user import UpdateUserRequest
+from backend.application.use_cases.user.delete_user_use_case import DeleteUserUseCase
+from backend.application.use_cases.user.update_user_use_case import UpdateUserUseCase
+from backend.core.enums.user_role_enum import UserRole
+from backend.core.models.user import User
+from backend.core.value_objects.hashed_password import HashedPassword
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+from backend.infrastructure.cache.user_cache import TwoTierUserCache, decode_user, encode_user
+
+PASSWORD_HASH = bcrypt.hashpw(b"secret-password", bcrypt.gensalt(rounds=4)).decode('utf-8')
+
+def make_user(role=UserRole.COMMON_USER) -> User:
+    return User(id=7, username="alice", email="alice@example.com", hashed_password=HashedPassword(value=PASSWORD_HASH),
+                role=role, is_active=True)
+
+class InMemoryUserRepository:
+    def __init__(self, user: User):
+        self.users = {user.id: user}
+        self.lookups = 0
+
+    async def find_by_id(self, id):
+        self.lookups += 1
+        return self.users.get(id)
+
+    async def update(self, user, updated_by_user_id=None):
+        self.users[user.id] = user
+        return user
+
+    async def delete(self, id):
+        return self.users.pop(id, None) is not None
+
+def make_cache(redis_client) -> TwoTierUserCache:
+    return TwoTierUserCache(TwoTierCache(
+        namespace="test:auth_user",
+        redis_client_provider=lambda: redis_client,
+        local_cache=TTLLRUCache(max_entries=100, ttl_seconds=60),
+    ))
+
+class TestUserCache:
+
+    def test_round_trip_keeps_identity_and_role_but_not_the_password_hash(self):
+        user = make_user(role=UserRole.ADMIN)
+
+        payload = encode_user(user)
+        decoded = decode_user(payload)
+
+        assert PASSWORD_HASH not in str(payload)
+        assert (decoded.id, decoded.username, decoded.email, decoded.role, decoded.is_active) == \
+            (7, "alice", "alice@example.com", UserRole.ADMIN, True)
+        assert not bcrypt.checkpw(b"secret-password", decoded.hashed_password.value.encode('utf-8'))
+
+    def test_update_and_delete_invalidate_the_cached_user(self):
+        repository = InMemoryUserRepository(make_user())
+
+        async def run():
+            cache = make_cache(FakeRedis())
+            load = lambda: repository.find_by_id(7)
+            await cache.get(7, loader=load)
+            cached = await cache.get(7, loader=load)
+            lookups_while_cached = repository.lookups
+
+            await UpdateUserUseCase(repository, cache).execute(7, UpdateUserRequest(role="admin"), updated_by_user_id=1)
+            after_update = await cache.get(7, loader=load)
+
+            await DeleteUserUseCase(repository, cache).execute(7)
+            after_delete = await cache.get(7, loader=load)
+            return cached, lookups_while_cached, after_update, after_delete
+
+        cached, lookups_while_cached, after_update, after_delete = asyncio.run(run())
+        assert cached.role == UserRole.COMMON_USER
+        assert lookups_while_cached == 1
+        assert after_update.role == UserRole.ADMIN
+        assert after_delete is None
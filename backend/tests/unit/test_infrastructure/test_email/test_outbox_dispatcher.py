@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# email_dependencies creates the database engine at import time.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from backend.core.enums.email_outbox_status_enum import EmailOutboxStatus
+from backend.infrastructure.email import email_dependencies
+from backend.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+from backend.infrastructure.models.base import Base
+from backend.infrastructure.models.email_outbox_model import EmailOutboxModel
+
+class RecordingEmailGateway:
+    def __init__(self, failing_addresses=(), error=None):
+        self.failing_addresses = set(failing_addresses)
+        self.error = error
+        self.sent = []
+
+    async def send_emails(self, emails):
+        if self.error:
+            raise self.error
+        self.sent.extend(email.to_email for email in emails)
+        return [email.to_email not in self.failing_addresses for email in emails]
+
+def outbox_row(to_email, status=EmailOutboxStatus.PENDING, attempts=0, due_in_seconds=-1, sent_at=None):
+    now = datetime.now(timezone.utc)
+    return {"to_email": to_email, "subject": "Welcome", "body": "Hello", "status": status, "attempts": attempts,
+            "next_attempt_at": now + timedelta(seconds=due_in_seconds), "created_at": now, "sent_at": sent_at}
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands datetimes back without their offset.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+async def with_outbox(rows, scenario):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all, tables=[EmailOutboxModel.__table__])
+            await connection.execute(insert(EmailOutboxModel), rows)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        result = await scenario(session_factory)
+        async with session_factory() as session:
+            outbox = (await session.execute(select(EmailOutboxModel).order_by(EmailOutboxModel.id))).scalars().all()
+        return result, {row.to_email: row for row in outbox}
+    finally:
+        await engine.dispose()
+
+def make_dispatcher(session_factory, gateway, **kwargs) -> EmailOutboxDispatcher:
+    return EmailOutboxDispatcher(session_factory=session_factory, email_gateway_provider=lambda: gateway, **kwargs)
+
+class TestEmailOutboxDispatcher:
+
+    def test_sends_due_emails_and_reclaims_expired_leases(self):
+        gateway = RecordingEmailGateway()
+        rows = [
+            outbox_row("due@example.com"),
+            outbox_row("lease-expired@example.com", status=EmailOutboxStatus.SENDING),
+            outbox_row("later@example.com", due_in_seconds=600),
+            outbox_row("leased@example.com", status=EmailOutboxStatus.SENDING, due_in_seconds=600),
+            outbox_row("done@example.com", status=EmailOutboxStatus.SENT, sent_at=datetime.now(timezone.utc)),
+        ]
+
+        async def scenario(session_factory):
+            dispatcher = make_dispatcher(session_factory, gateway)
+            return dispatcher, await dispatcher.dispatch_once(), await dispatcher.dispatch_once()
+
+        (dispatcher, first, second), outbox = asyncio.run(with_outbox(rows, scenario))
+
+        assert (first, second) == (2, 0)
+        assert sorted(gateway.sent) == ["due@example.com", "lease-expired@example.com"]
+        for address in ("due@example.com", "lease-expired@example.com"):
+            assert outbox[address].status == EmailOutboxStatus.SENT
+            assert outbox[address].sent_at is not None
+        assert outbox["later@example.com"].status == EmailOutboxStatus.PENDING
+        assert outbox["leased@example.com"].status == EmailOutboxStatus.SENDING
+        assert dispatcher.sent == 2
+
+    def test_failed_deliveries_back_off_and_give_up_after_max_attempts(self):
+        gateway = RecordingEmailGateway(failing_addresses={"retry@example.com", "last-try@example.com"})
+        rows = [
+            outbox_row("ok@example.com"),
+            outbox_row("retry@example.com"),
+            outbox_row("last-try@example.com", attempts=2),
+        ]
+
+        async def scenario(session_factory):
+            dispatcher = make_dispatcher(session_factory, gateway, max_attempts=3, base_backoff_seconds=100)
+            return dispatcher, await dispatcher.dispatch_once(), await dispatcher.dispatch_once()
+
+        (dispatcher, first, second), outbox = asyncio.run(with_outbox(rows, scenario))
+
+        assert (first, second) == (3, 0)
+        assert outbox["ok@example.com"].status == EmailOutboxStatus.SENT
+        retry = outbox["retry@example.com"]
+        assert (retry.status, retry.attempts, retry.last_error) == (EmailOutboxStatus.PENDING, 1, "Delivery failed.")
+        backoff = (as_utc(retry.next_attempt_at) - datetime.now(timezone.utc)).total_seconds()
+        assert 70 <= backoff <= 120
+        assert (outbox["last-try@example.com"].status, outbox["last-try@example.com"].attempts) == \
+            (EmailOutboxStatus.FAILED, 3)
+        assert (dispatcher.sent, dispatcher.retried, dispatcher.failed) == (1, 1, 1)
+
+    def test_gateway_error_is_recorded_on_every_claimed_email(self):
+        gateway = RecordingEmailGateway(error=ConnectionError("SMTP server unreachable"))
+        rows = [outbox_row("first@example.com"), outbox_row("second@example.com")]
+
+        async def scenario(session_factory):
+            return await make_dispatcher(session_factory, gateway).dispatch_once()
+
+        processed, outbox = asyncio.run(with_outbox(rows, scenario))
+
+        assert processed == 2
+        assert {(row.status, row.attempts, row.last_error) for row in outbox.values()} == \
+            {(EmailOutboxStatus.PENDING, 1, "SMTP server unreachable")}
+
+    def test_purge_removes_only_sent_emails_past_retention(self):
+        now = datetime.now(timezone.utc)
+        rows = [outbox_row(f"old-{i}@example.com", status=EmailOutboxStatus.SENT, sent_at=now - timedelta(days=8))
+                for i in range(5)]
+        rows += [
+            outbox_row("recent@example.com", status=EmailOutboxStatus.SENT, sent_at=now - timedelta(days=1)),
+            outbox_row("failed@example.com", status=EmailOutboxStatus.FAILED, due_in_seconds=-8 * 24 * 3600),
+            outbox_row("pending@example.com", due_in_seconds=-8 * 24 * 3600),
+        ]
+
+        async def scenario(session_factory):
+            dispatcher = make_dispatcher(session_factory, RecordingEmailGateway(),
+                                         sent_retention_seconds=7 * 24 * 3600, purge_batch_size=2)
+            return dispatcher, await dispatcher.purge_sent()
+
+        (dispatcher, purged), outbox = asyncio.run(with_outbox(rows, scenario))
+
+        assert purged == 5
+        assert sorted(outbox) == ["failed@example.com", "pending@example.com", "recent@example.com"]
+        assert dispatcher.purged == 5
+
+    def test_run_loop_purges_before_dispatching(self):
+        rows = [
+            outbox_row("old@example.com", status=EmailOutboxStatus.SENT,
+                       sent_at=datetime.now(timezone.utc) - timedelta(days=8)),
+            outbox_row("due@example.com"),
+        ]
+
+        async def scenario(session_factory):
+            dispatcher = make_dispatcher(session_factory, RecordingEmailGateway(), poll_interval_seconds=60)
+            task = asyncio.create_task(dispatcher.run())
+            while dispatcher.sent == 0:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return dispatcher
+
+        dispatcher, outbox = asyncio.run(with_outbox(rows, scenario))
+
+        assert list(outbox) == ["due@example.com"]
+        assert outbox["due@example.com"].status == EmailOutboxStatus.SENT
+        assert (dispatcher.purged, dispatcher.errors) == (1, 0)
+
+    def test_expired_leases_count_as_attempts_and_give_up_at_max_attempts(self):
+        gateway = RecordingEmailGateway()
+        rows = [
+            outbox_row("reclaimed@example.com", status=EmailOutboxStatus.SENDING, attempts=1),
+            outbox_row("stuck@example.com", status=EmailOutboxStatus.SENDING, attempts=3),
+        ]
+
+        async def scenario(session_factory):
+            dispatcher = make_dispatcher(session_factory, gateway, max_attempts=3)
+            return dispatcher, await dispatcher.dispatch_once()
+
+        (dispatcher, processed), outbox = asyncio.run(with_outbox(rows, scenario))
+
+        assert processed == 1
+        assert gateway.sent == ["reclaimed@example.com"]
+        reclaimed, stuck = outbox["reclaimed@example.com"], outbox["stuck@example.com"]
+        assert (reclaimed.status, reclaimed.attempts) == (EmailOutboxStatus.SENT, 2)
+        assert (stuck.status, stuck.attempts) == (EmailOutboxStatus.FAILED, 3)
+        assert stuck.last_error == "Delivery did not finish within the lease."
+        assert (dispatcher.sent, dispatcher.failed) == (1, 1)
+
+    def test_idle_outbox_does_not_resolve_the_gateway(self):
+        provider_calls = []
+
+        def unconfigured_gateway():
+            provider_calls.append(True)
+            raise ValueError("SMTP_SERVER, EMAIL_ADDRESS, and EMAIL_PASSWORD must be set in environment variables.")
+
+        async def scenario(session_factory):
+            dispatcher = EmailOutboxDispatcher(session_factory=session_factory, email_gateway_provider=unconfigured_gateway)
+            return await dispatcher.dispatch_once()
+
+        processed, outbox = asyncio.run(with_outbox([outbox_row("later@example.com", due_in_seconds=600)], scenario))
+
+        assert processed == 0
+        assert provider_calls == []
+        assert outbox["later@example.com"].attempts == 0
+
+    def test_dispatcher_is_not_started_without_smtp_settings(self, monkeypatch, caplog):
+        monkeypatch.setattr(email_dependencies, "EMAIL_OUTBOX_ENABLED", True)
+        monkeypatch.setenv("SMTP_SERVER", "smtp.example.com")
+        monkeypatch.delenv("EMAIL_ADDRESS", raising=False)
+        monkeypatch.delenv("EMAIL_PASSWORD", raising=False)
+
+        with caplog.at_level(logging.WARNING, logger=email_dependencies.__name__):
+            task = email_dependencies.start_email_outbox_dispatcher()
+
+        assert task is None
+        [record] = caplog.records
+        assert "EMAIL_ADDRESS, EMAIL_PASSWORD" in record.getMessage()
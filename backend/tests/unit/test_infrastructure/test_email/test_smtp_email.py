@@ -0,0 +1,168 @@
+import asyncio
+import smtplib
+import threading
+import pytest
+from backend.application.email.email import OutgoingEmail
+from backend.infrastructure.email import smtp_email
+from backend.infrastructure.email.smtp_email import SMTPEmailGateway, _is_reconnectable
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class FakeSMTP:
+    # One instance per opened session; failures maps a recipient to the errors its next sends raise, in order.
+    sessions = []
+    failures = {}
+    # Holds each login until every pool worker has one, so that chunks cannot be served by a single reused thread.
+    login_barrier = None
+
+    def __init__(self, host, port, timeout=None):
+        self.host = host
+        self.sent = []
+        self.threads = set()
+        self.logged_in = False
+        self.closed = False
+        FakeSMTP.sessions.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        if FakeSMTP.login_barrier is not None:
+            FakeSMTP.login_barrier.wait()
+        self.logged_in = True
+
+    def sendmail(self, from_address, to_address, message):
+        self.threads.add(threading.current_thread().name)
+        errors = FakeSMTP.failures.get(to_address)
+        if errors:
+            raise errors.pop(0)
+        self.sent.append(to_address)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+@pytest.fixture
+def make_gateway(monkeypatch):
+    FakeSMTP.sessions = []
+    FakeSMTP.failures = {}
+    FakeSMTP.login_barrier = None
+    monkeypatch.setattr(smtp_email.smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setenv("SMTP_SERVER", "smtp.example.com")
+    monkeypatch.setenv("EMAIL_ADDRESS", "noreply@example.com")
+    monkeypatch.setenv("EMAIL_PASSWORD", "secret")
+
+    def make(pool_size=1, max_messages_per_connection=100, idle_timeout_seconds=60):
+        if pool_size > 1:
+            FakeSMTP.login_barrier = threading.Barrier(pool_size, timeout=5)
+        monkeypatch.setenv("SMTP_POOL_SIZE", str(pool_size))
+        monkeypatch.setenv("SMTP_MAX_MESSAGES_PER_CONNECTION", str(max_messages_per_connection))
+        monkeypatch.setenv("SMTP_IDLE_TIMEOUT_SECONDS", str(idle_timeout_seconds))
+        return SMTPEmailGateway()
+
+    return make
+
+def emails(*addresses):
+    return [OutgoingEmail(to_email=address, subject="Welcome", body="Hello") for address in addresses]
+
+class TestIsReconnectable:
+
+    @pytest.mark.parametrize("error, expected", [
+        (smtplib.SMTPServerDisconnected("gone"), True),
+        (smtplib.SMTPResponseException(421, b"Service not available"), True),
+        (ConnectionResetError("reset by peer"), True),
+        (smtplib.SMTPResponseException(550, b"Mailbox unavailable"), False),
+        (smtplib.SMTPRecipientsRefused({"a@example.com": (550, b"No such user")}), False),
+        (ValueError("bad address"), False),
+    ])
+    def test_only_lost_sessions_are_reconnectable(self, error, expected):
+        assert _is_reconnectable(error) is expected
+
+class TestSMTPEmailGateway:
+
+    def test_reconnects_and_resends_when_the_session_drops(self, make_gateway):
+        gateway = make_gateway()
+        FakeSMTP.failures = {"bob@example.com": [smtplib.SMTPServerDisconnected("Connection unexpectedly closed")]}
+
+        results = asyncio.run(gateway.send_emails(emails("alice@example.com", "bob@example.com")))
+
+        assert results == [True, True]
+        first, second = FakeSMTP.sessions
+        assert (first.sent, first.closed) == (["alice@example.com"], True)
+        assert (second.sent, second.logged_in) == (["bob@example.com"], True)
+        assert gateway.stats()["reconnects"] == 1
+        assert gateway.stats()["connections_opened"] == 2
+
+    def test_rejected_recipient_fails_only_its_own_email(self, make_gateway):
+        gateway = make_gateway()
+        FakeSMTP.failures = {"bob@example.com": [smtplib.SMTPRecipientsRefused({"bob@example.com": (550, b"No")})]}
+
+        results = asyncio.run(gateway.send_emails(emails("alice@example.com", "bob@example.com", "carol@example.com")))
+
+        assert results == [True, False, True]
+        [session] = FakeSMTP.sessions
+        assert session.sent == ["alice@example.com", "carol@example.com"]
+        assert gateway.stats()["messages_failed"] == 1
+
+    def test_rotates_sessions_after_max_messages(self, make_gateway):
+        gateway = make_gateway(max_messages_per_connection=2)
+
+        results = asyncio.run(gateway.send_emails(emails("a@example.com", "b@example.com", "c@example.com")))
+
+        assert results == [True] * 3
+        assert [session.sent for session in FakeSMTP.sessions] == [["a@example.com", "b@example.com"], ["c@example.com"]]
+        assert FakeSMTP.sessions[0].closed
+
+    def test_rotates_idle_sessions(self, make_gateway, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(smtp_email.time, "monotonic", clock)
+        gateway = make_gateway(idle_timeout_seconds=60)
+
+        async def run():
+            await gateway.send_emails(emails("a@example.com"))
+            clock.now += 30
+            await gateway.send_emails(emails("b@example.com"))
+            clock.now += 61
+            await gateway.send_emails(emails("c@example.com"))
+
+        asyncio.run(run())
+
+        assert [session.sent for session in FakeSMTP.sessions] == [["a@example.com", "b@example.com"], ["c@example.com"]]
+        assert FakeSMTP.sessions[0].closed
+
+    def test_splits_a_batch_across_the_pool_and_keeps_result_order(self, make_gateway):
+        gateway = make_gateway(pool_size=2)
+        addresses = [f"user{i}@example.com" for i in range(5)]
+        FakeSMTP.failures = {"user3@example.com": [smtplib.SMTPRecipientsRefused({"user3@example.com": (550, b"No")})]}
+
+        results = asyncio.run(gateway.send_emails(emails(*addresses)))
+
+        assert results == [True, True, True, False, True]
+        assert sorted(len(session.sent) for session in FakeSMTP.sessions) == [1, 3]
+        assert sorted(address for session in FakeSMTP.sessions for address in session.sent) == \
+            [address for address in addresses if address != "user3@example.com"]
+        assert all(len(session.threads) == 1 for session in FakeSMTP.sessions)
+        assert FakeSMTP.sessions[0].threads != FakeSMTP.sessions[1].threads
+        assert asyncio.run(gateway.send_emails([])) == []
+
+    def test_close_stops_the_workers_and_quits_every_session(self, make_gateway):
+        gateway = make_gateway(pool_size=2)
+
+        async def run():
+            await gateway.send_emails(emails("a@example.com", "b@example.com"))
+            await gateway.close()
+
+        asyncio.run(run())
+
+        assert len(FakeSMTP.sessions) == 2
+        assert all(session.closed for session in FakeSMTP.sessions)
+        assert gateway.stats()["open_connections"] == 0
+        with pytest.raises(RuntimeError):
+            asyncio.run(gateway.send_emails(emails("c@example.com")))
@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from backend.application.ai_gateway.ai_gateway import AIGatewayError
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.infrastructure.gateways.metered_ai_gateway import MeteredAIGateway
+
+class RecordingSink:
+    def __init__(self):
+        self.records = []
+
+    def record(self, usage_record):
+        self.records.append(usage_record)
+
+class FakeAIGateway:
+    def __init__(self, delay_seconds: float = 0.0, fail: bool = False):
+        self.delay_seconds = delay_seconds
+        self.fail = fail
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        await asyncio.sleep(self.delay_seconds)
+        if self.fail:
+            raise AIGatewayError("503", retryable=True)
+        return InferenceResponse(generated_text="Hello there.", prompt_tokens=12, completion_tokens=3)
+
+    async def stream_text(self, request: InferenceRequest):
+        for chunk in ["Hello", " there", "."]:
+            await asyncio.sleep(self.delay_seconds)
+            yield chunk
+
+REQUEST = InferenceRequest(model="test-model", system_prompt="Be brief.", prompt="Say hello.",
+                           use_case="generate_document", user_id=7, document_type_id=3)
+
+class TestMeteredAIGateway:
+
+    def test_records_provider_usage_with_tags(self):
+        sink = RecordingSink()
+        response = asyncio.run(MeteredAIGateway(FakeAIGateway(), sink).generate_text(REQUEST))
+
+        assert response.generated_text == "Hello there."
+        [usage] = sink.records
+        assert (usage.use_case, usage.user_id, usage.document_type_id, usage.model) == ("generate_document", 7, 3, "test-model")
+        assert (usage.status, usage.prompt_tokens, usage.completion_tokens, usage.tokens_estimated) == ("ok", 12, 3, False)
+        assert usage.time_to_first_token_ms is None
+
+    def test_records_failures_and_cancellations(self):
+        sink = RecordingSink()
+        with pytest.raises(AIGatewayError):
+            asyncio.run(MeteredAIGateway(FakeAIGateway(fail=True), sink).generate_text(REQUEST))
+
+        async def cancelled():
+            task = asyncio.create_task(MeteredAIGateway(FakeAIGateway(delay_seconds=1), sink).generate_text(REQUEST))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancelled())
+        assert [usage.status for usage in sink.records] == ["error", "cancelled"]
+        assert all(usage.tokens_estimated and usage.prompt_tokens == 6 for usage in sink.records)
+
+    def test_measures_time_to_first_token_of_streams(self):
+        sink = RecordingSink()
+
+        async def consume():
+            return [chunk async for chunk in MeteredAIGateway(FakeAIGateway(delay_seconds=0.02), sink).stream_text(REQUEST)]
+
+        assert "".join(asyncio.run(consume())) == "Hello there."
+        [usage] = sink.records
+        assert usage.status == "ok" and usage.tokens_estimated
+        assert usage.completion_tokens == 3
+        assert 15 <= usage.time_to_first_token_ms < usage.latency_ms
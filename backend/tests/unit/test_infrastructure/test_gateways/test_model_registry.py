@@ -0,0 +1,45 @@
+import pytest
+from backend.application.model_router.model_router import ModelRoute, ModelSpec
+from backend.infrastructure.gateways.model_registry import ModelRegistry, PolicyModelRouter, RoutingPolicy
+
+SMALL = ModelSpec(id="small", capabilities=("chat", "json"), context_length=8192,
+                  input_cost_per_million_tokens=0.1, output_cost_per_million_tokens=0.1, latency_class="fast")
+LARGE = ModelSpec(id="large", capabilities=("chat", "json", "long_form"), context_length=65536,
+                  input_cost_per_million_tokens=0.9, output_cost_per_million_tokens=1.2, latency_class="standard")
+
+def make_router(pinned_routes=None) -> PolicyModelRouter:
+    return PolicyModelRouter(
+        registry=ModelRegistry([SMALL, LARGE]),
+        policies={
+            "suggest": RoutingPolicy(("json",), "fast"),
+            "generate": RoutingPolicy(("long_form",), "standard"),
+        },
+        pinned_routes=pinned_routes,
+    )
+
+class TestPolicyModelRouter:
+
+    def test_fast_policy_prefers_small_model_with_fallback(self):
+        route = make_router().route("suggest", 4)
+        assert route.model == "small"
+        assert route.fallback_models == ["large"]
+
+    def test_required_capabilities_filter_models(self):
+        route = make_router().route("generate", 5)
+        assert route.model == "large"
+        assert route.fallback_models == []
+
+    def test_prompt_longer_than_context_skips_small_model(self):
+        route = make_router().route("suggest", 10000)
+        assert route.model == "large"
+
+    def test_pinned_route_overrides_policy(self):
+        router = make_router({"suggest": ModelRoute(use_case="suggest", model="large", fallback_models=["small"])})
+        assert router.route("suggest", 4).model == "large"
+        assert router.stats()["use_cases"]["suggest"]["routes"] == {"large": 1}
+
+    def test_unknown_latency_class_is_rejected(self):
+        registry = ModelRegistry([])
+        with pytest.raises(ValueError):
+            registry.register(ModelSpec(id="odd", capabilities=("chat",), context_length=1, input_cost_per_million_tokens=0,
+                                        output_cost_per_million_tokens=0, latency_class="instant"))
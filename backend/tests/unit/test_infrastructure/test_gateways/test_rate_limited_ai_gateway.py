@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.infrastructure.gateways.rate_limited_ai_gateway import AIGatewayQueueTimeoutError, ModelBudget, \
+    RateLimitedAIGateway
+
+class SlowAIGateway:
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+        self.active = 0
+        self.peak = 0
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay_seconds)
+        self.active -= 1
+        return InferenceResponse(generated_text="ok")
+
+class UnavailableTokenBucket:
+    async def try_acquire(self, name, requests_per_minute, tokens_per_minute, tokens):
+        raise RedisConnectionError("connection refused")
+
+class CountingTokenBucket:
+    def __init__(self):
+        self.charged = 0
+
+    async def try_acquire(self, name, requests_per_minute, tokens_per_minute, tokens):
+        self.charged += 1
+        return True, 0
+
+class ExhaustedTokenBucket:
+    async def try_acquire(self, name, requests_per_minute, tokens_per_minute, tokens):
+        return False, 60000
+
+REQUEST = InferenceRequest(model="test-model", prompt="Say hello.")
+
+class TestRateLimitedAIGateway:
+
+    def test_caps_concurrency_and_fails_open_without_redis(self):
+        inner = SlowAIGateway(delay_seconds=0.01)
+        gateway = RateLimitedAIGateway(inner=inner, token_bucket=UnavailableTokenBucket(),
+                                       default_budget=ModelBudget(60, 1000), max_concurrency=2)
+
+        async def run():
+            return await asyncio.gather(*[gateway.generate_text(REQUEST) for _ in range(6)])
+
+        responses = asyncio.run(run())
+
+        assert [response.generated_text for response in responses] == ["ok"] * 6
+        assert inner.peak == 2
+        assert gateway.stats()["completed"] == 6
+        assert gateway.stats()["redis_errors"] == 1
+
+    def test_waiting_past_deadline_raises(self):
+        gateway = RateLimitedAIGateway(inner=SlowAIGateway(delay_seconds=0), token_bucket=ExhaustedTokenBucket(),
+                                       default_budget=ModelBudget(1, 1000), queue_deadline_seconds=0.05)
+
+        with pytest.raises(AIGatewayQueueTimeoutError):
+            asyncio.run(gateway.generate_text(REQUEST))
+
+        assert gateway.stats()["queue_timeouts"] == 1
+        assert gateway.stats()["throttled"] == 1
+        assert gateway.stats()["queue_depth"] == 0
+
+    def test_request_that_was_charged_waits_for_a_slot_past_the_deadline(self):
+        inner = SlowAIGateway(delay_seconds=0.1)
+        token_bucket = CountingTokenBucket()
+        gateway = RateLimitedAIGateway(inner=inner, token_bucket=token_bucket, default_budget=ModelBudget(60, 1000),
+                                       max_concurrency=1, queue_deadline_seconds=0.02)
+
+        async def run():
+            return await asyncio.gather(gateway.generate_text(REQUEST), gateway.generate_text(REQUEST))
+
+        responses = asyncio.run(run())
+
+        assert [response.generated_text for response in responses] == ["ok", "ok"]
+        assert token_bucket.charged == 2
+        assert inner.peak == 1
+        assert gateway.stats()["queue_timeouts"] == 0
+        assert gateway.stats()["max_wait_seconds"] >= 0.1
@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+from backend.application.ai_gateway.ai_gateway import AIGatewayError
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.infrastructure.gateways.resilient_ai_gateway import ResilientAIGateway
+
+class ScriptedAIGateway:
+    def __init__(self, delays=None, failing_models=(), retryable=True):
+        self.delays = delays or {}
+        self.failing_models = set(failing_models)
+        self.retryable = retryable
+        self.calls = []
+
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        self.calls.append(request.model)
+        await asyncio.sleep(self.delays.get(request.model, 0))
+        if request.model in self.failing_models:
+            raise AIGatewayError(f"{request.model} unavailable", retryable=self.retryable)
+        return InferenceResponse(generated_text=request.model)
+
+REQUEST = InferenceRequest(model="llama:cerebras", prompt="Say hello.")
+
+class TestResilientAIGateway:
+
+    def test_retries_on_fallback_provider(self):
+        inner = ScriptedAIGateway(failing_models={"llama:cerebras"})
+        gateway = ResilientAIGateway(inner=inner, fallback_providers=["groq"], hedging_enabled=False,
+                                     base_backoff_seconds=0)
+
+        response = asyncio.run(gateway.generate_text(REQUEST))
+
+        assert response.generated_text == "llama:groq"
+        assert inner.calls == ["llama:cerebras", "llama:groq"]
+        assert gateway.stats()["retries"] == 1
+
+    def test_non_retryable_error_is_raised_immediately(self):
+        inner = ScriptedAIGateway(failing_models={"llama:cerebras"}, retryable=False)
+        gateway = ResilientAIGateway(inner=inner, fallback_providers=["groq"], hedging_enabled=False)
+
+        with pytest.raises(AIGatewayError):
+            asyncio.run(gateway.generate_text(REQUEST))
+
+        assert inner.calls == ["llama:cerebras"]
+        assert gateway.stats()["providers"]["llama:cerebras"]["failures"] == 0
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        inner = ScriptedAIGateway(failing_models={"llama:cerebras"})
+        gateway = ResilientAIGateway(inner=inner, hedging_enabled=False, max_attempts=2, failure_threshold=2,
+                                     base_backoff_seconds=0)
+
+        with pytest.raises(AIGatewayError):
+            asyncio.run(gateway.generate_text(REQUEST))
+        with pytest.raises(AIGatewayError, match="circuits are open"):
+            asyncio.run(gateway.generate_text(REQUEST))
+
+        assert len(inner.calls) == 2
+        assert gateway.stats()["providers"]["llama:cerebras"]["state"] == "open"
+
+    def test_hedged_request_wins_when_primary_is_slow(self):
+        inner = ScriptedAIGateway(delays={"llama:cerebras": 1.0})
+        gateway = ResilientAIGateway(inner=inner, fallback_providers=["groq"], default_hedge_delay_seconds=0.01)
+
+        response = asyncio.run(gateway.generate_text(REQUEST))
+
+        assert response.generated_text == "llama:groq"
+        assert gateway.stats()["hedges"] == 1
+        assert gateway.stats()["hedge_wins"] == 1
+
+    def test_cancelled_hedge_loser_records_no_latency(self):
+        inner = ScriptedAIGateway(delays={"llama:cerebras": 1.0})
+        gateway = ResilientAIGateway(inner=inner, fallback_providers=["groq"], default_hedge_delay_seconds=0.01)
+
+        async def run():
+            response = await gateway.generate_text(REQUEST)
+            # Let the cancelled primary call unwind before looking at its health.
+            await asyncio.sleep(0.01)
+            return response
+
+        response = asyncio.run(run())
+
+        providers = gateway.stats()["providers"]
+        assert response.generated_text == "llama:groq"
+        assert providers["llama:cerebras"]["ewma_latency_seconds"] is None
+        assert providers["llama:cerebras"]["p95_latency_seconds"] is None
+        assert providers["llama:groq"]["ewma_latency_seconds"] is not None
+
+    def test_falls_back_to_next_model_after_providers_fail(self):
+        inner = ScriptedAIGateway(failing_models={"llama:cerebras"})
+        gateway = ResilientAIGateway(inner=inner, hedging_enabled=False, base_backoff_seconds=0)
+        request = InferenceRequest(model="llama:cerebras", prompt="Say hello.", fallback_models=["qwen:groq"])
+
+        response = asyncio.run(gateway.generate_text(request))
+
+        assert response.generated_text == "qwen:groq"
+        assert gateway.stats()["failovers"] == 1
@@ -0,0 +1,38 @@
+import asyncio
+import logging
+import re
+import time
+from prometheus_client import CollectorRegistry
+from backend.infrastructure.metrics.event_loop_monitor import EventLoopMonitor
+
+def render_synchronously():
+    time.sleep(0.2)
+
+class TestEventLoopMonitor:
+
+    def test_records_lag_and_reports_the_blocking_call_site(self, caplog):
+        registry = CollectorRegistry()
+        monitor = EventLoopMonitor(registry, interval_seconds=0.01, blocking_threshold_seconds=0.05)
+
+        async def run():
+            task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(0.05)
+            render_synchronously()
+            await asyncio.sleep(0.05)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        with caplog.at_level(logging.WARNING, logger="backend.infrastructure.metrics.event_loop_monitor"):
+            asyncio.run(run())
+
+        assert registry.get_sample_value("docugenius_event_loop_lag_seconds_count") == monitor.stats()["samples"]
+        assert registry.get_sample_value("docugenius_event_loop_lag_seconds_bucket", {"le": "0.1"}) \
+            < registry.get_sample_value("docugenius_event_loop_lag_seconds_count")
+        assert monitor.stats()["max_lag_ms"] >= 150
+        assert monitor.stats()["blocked_callbacks"] == 1
+
+        [record] = caplog.records
+        headline = record.getMessage().splitlines()[0]
+        assert int(re.search(r"blocked for (\d+) ms", headline).group(1)) >= 150
+        assert "test_event_loop_monitor" in headline
+        assert "in render_synchronously" in record.getMessage()
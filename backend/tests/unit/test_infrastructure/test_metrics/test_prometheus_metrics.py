@@ -0,0 +1,48 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry, generate_latest
+from backend.infrastructure.metrics.prometheus_metrics import PrometheusHTTPMetrics, StatsCollector
+from backend.interfaces.middleware.metrics_middleware import MetricsMiddleware
+
+def make_app(registry: CollectorRegistry) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/documents/{location_identifier}")
+    async def download(location_identifier: str):
+        return {"location_identifier": location_identifier}
+
+    app.add_middleware(MetricsMiddleware, http_metrics=PrometheusHTTPMetrics(registry))
+    return app
+
+class TestPrometheusMetrics:
+
+    def test_requests_are_labelled_by_route_template_and_status(self):
+        registry = CollectorRegistry()
+        client = TestClient(make_app(registry))
+        for location_identifier in ("a.docx", "b.docx", "c.docx"):
+            assert client.get(f"/documents/{location_identifier}").status_code == 200
+        assert client.get("/missing").status_code == 404
+
+        count = registry.get_sample_value(
+            "docugenius_http_request_duration_seconds_count", {"method": "GET", "route": "/documents/{location_identifier}", "status": "200"}
+        )
+        assert count == 3
+        assert registry.get_sample_value(
+            "docugenius_http_request_duration_seconds_count", {"method": "GET", "route": "unmatched", "status": "404"}
+        ) == 1
+        assert registry.get_sample_value("docugenius_http_requests_in_flight", {"method": "GET"}) == 0
+
+    def test_stats_collector_flattens_numeric_stats_and_skips_failing_providers(self):
+        def broken_stats():
+            raise RuntimeError("pool not initialized")
+
+        registry = CollectorRegistry()
+        registry.register(StatsCollector({
+            "redis_pool": lambda: {"initialized": True, "in_use_connections": 3, "note": "ignored"},
+            "ai_gateway": lambda: {"resilience": {"providers": {"hf": {"circuit_open": False, "failures": 2}}}},
+            "db_pool": broken_stats,
+        }))
+
+        assert registry.get_sample_value("docugenius_redis_pool_stats", {"stat": "in_use_connections"}) == 3
+        assert registry.get_sample_value("docugenius_ai_gateway_stats", {"stat": "resilience.providers.hf.failures"}) == 2
+        assert b"docugenius_db_pool_stats" not in generate_latest(registry)
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import bcrypt
+import pytest
+from backend.infrastructure.password_hasher.bcrypt_password_hasher import BcryptPasswordHasher
+
+class ThreadRecordingPasswordHasher(BcryptPasswordHasher):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = []
+
+    def _hash_sync(self, password):
+        self.threads.append(threading.current_thread().name)
+        return super()._hash_sync(password)
+
+    def _verify_sync(self, password, hashed_password):
+        self.threads.append(threading.current_thread().name)
+        return super()._verify_sync(password, hashed_password)
+
+class TestBcryptPasswordHasher:
+
+    def test_hashing_and_verification_run_in_the_executor_and_match_bcrypt(self):
+        hasher = ThreadRecordingPasswordHasher(max_concurrency=2, rounds=4)
+        synchronous_hash = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=4)).decode('utf-8')
+
+        async def run():
+            hashed = await hasher.hash("correct horse")
+            return hashed, await asyncio.gather(
+                hasher.verify("correct horse", synchronous_hash),
+                hasher.verify("wrong horse", synchronous_hash),
+            )
+
+        try:
+            hashed, (accepted, rejected) = asyncio.run(run())
+        finally:
+            hasher.shutdown()
+
+        assert bcrypt.checkpw(b"correct horse", hashed.encode('utf-8'))
+        assert hashed.startswith("$2b$04$")
+        assert accepted is True and rejected is False
+        assert len(hasher.threads) == 3
+        assert all(name.startswith("bcrypt") for name in hasher.threads)
+        assert hasher.stats()["completed"] == 3
+        assert hasher.stats()["queued"] == hasher.stats()["in_flight"] == 0
+
+    def test_shutdown_stops_accepting_work(self):
+        hasher = BcryptPasswordHasher(max_concurrency=1, rounds=4)
+        hasher.shutdown()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(hasher.hash("correct horse"))
+        assert hasher.stats()["queued"] == 0
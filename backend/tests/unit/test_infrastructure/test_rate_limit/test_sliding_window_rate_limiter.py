@@ -0,0 +1,91 @@
+import asyncio
+import time
+from fakeredis.aioredis import FakeRedis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from backend.infrastructure.rate_limit.sliding_window_rate_limiter import RateLimit, RateLimitPolicy, \
+    SlidingWindowRateLimiter
+
+class UnavailableRedis:
+    def __init__(self):
+        self.calls = 0
+
+    def register_script(self, script):
+        self.calls += 1
+        raise RedisConnectionError("connection refused")
+
+class TestRateLimit:
+
+    def test_parse_limit_and_window(self):
+        assert RateLimit.parse("10/60") == RateLimit(limit=10, window_seconds=60)
+        assert RateLimit.parse("5") == RateLimit(limit=5, window_seconds=60)
+
+    def test_parse_disabled_values(self):
+        assert RateLimit.parse(None) is None
+        assert RateLimit.parse("") is None
+        assert RateLimit.parse("off") is None
+
+class TestSlidingWindowRateLimiter:
+
+    def test_policy_without_applicable_windows_is_allowed_without_redis(self):
+        redis_client = UnavailableRedis()
+        limiter = SlidingWindowRateLimiter(redis_client_provider=lambda: redis_client)
+        policy = RateLimitPolicy(name="suggest", per_user=RateLimit(limit=1, window_seconds=60))
+
+        decision = asyncio.run(limiter.hit(policy, client_ip="10.0.0.1"))
+
+        assert decision.allowed
+        assert redis_client.calls == 0
+
+    def test_fails_open_and_backs_off_when_redis_is_down(self):
+        redis_client = UnavailableRedis()
+        limiter = SlidingWindowRateLimiter(redis_client_provider=lambda: redis_client, redis_retry_after_seconds=60)
+        policy = RateLimitPolicy(name="login", per_ip=RateLimit(limit=1, window_seconds=60))
+
+        first = asyncio.run(limiter.hit(policy, client_ip="10.0.0.1"))
+        second = asyncio.run(limiter.hit(policy, client_ip="10.0.0.1"))
+
+        assert first.allowed and second.allowed
+        assert redis_client.calls == 1
+        assert limiter.stats()["failed_open"] == 2
+        assert limiter.stats()["redis_errors"] == 1
+
+class TestSlidingWindowScript:
+    # Runs the Lua script itself on fakeredis, which executes it with a real Lua interpreter.
+
+    def test_admits_up_to_the_limit_then_reports_retry_after(self):
+        async def run():
+            redis_client = FakeRedis()
+            limiter = SlidingWindowRateLimiter(redis_client_provider=lambda: redis_client, key_prefix="test")
+            policy = RateLimitPolicy(name="login", per_ip=RateLimit(limit=5, window_seconds=60),
+                                     per_route=RateLimit(limit=2, window_seconds=60))
+            decisions = [await limiter.hit(policy, client_ip="10.0.0.1") for _ in range(3)]
+            return decisions, await redis_client.zcard("test:login:ip:10.0.0.1"), \
+                await redis_client.pttl("test:login:route")
+
+        decisions, ip_count, route_ttl_ms = asyncio.run(run())
+
+        assert [decision.allowed for decision in decisions] == [True, True, False]
+        # The tightest window decides what is left, and a rejected hit is not counted against any window.
+        assert [decision.remaining for decision in decisions] == [1, 0, 0]
+        assert 59 <= decisions[2].retry_after_seconds <= 60
+        assert ip_count == 2
+        assert 0 < route_ttl_ms <= 60000
+
+    def test_hits_slide_out_of_the_window(self):
+        async def run():
+            redis_client = FakeRedis()
+            limiter = SlidingWindowRateLimiter(redis_client_provider=lambda: redis_client, key_prefix="test")
+            policy = RateLimitPolicy(name="login", per_ip=RateLimit(limit=1, window_seconds=60))
+            now_ms = int(time.time() * 1000)
+            await redis_client.zadd("test:login:ip:10.0.0.1", {"expired": now_ms - 61000})
+            after_expiry = await limiter.hit(policy, client_ip="10.0.0.1")
+            await redis_client.zadd("test:login:ip:10.0.0.2", {"recent": now_ms - 30000})
+            within_window = await limiter.hit(policy, client_ip="10.0.0.2")
+            return after_expiry, within_window, await redis_client.zrange("test:login:ip:10.0.0.1", 0, -1)
+
+        after_expiry, within_window, members = asyncio.run(run())
+
+        assert after_expiry.allowed
+        assert b"expired" not in members and len(members) == 1
+        assert not within_window.allowed
+        assert 29 <= within_window.retry_after_seconds <= 31
@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+from fakeredis.aioredis import FakeRedis
+from backend.application.dtos.ai_inference import InferenceRequest, InferenceResponse
+from backend.infrastructure.gateways.rate_limited_ai_gateway import AIGatewayQueueTimeoutError, ModelBudget, \
+    RateLimitedAIGateway
+from backend.infrastructure.redis.redis_token_bucket import RedisTokenBucket
+
+class EchoAIGateway:
+    async def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        return InferenceResponse(generated_text="ok")
+
+class TestRedisTokenBucket:
+    # Runs the Lua script itself on fakeredis, which executes it with a real Lua interpreter.
+
+    def test_requests_per_minute_bucket_empties_then_reports_the_refill_wait(self):
+        async def run():
+            redis_client = FakeRedis()
+            bucket = RedisTokenBucket(redis_client_provider=lambda: redis_client, key_prefix="test")
+            results = [await bucket.try_acquire("model", 2, 10000, 10) for _ in range(3)]
+            return results, await redis_client.pttl("test:model:rpm")
+
+        results, rpm_ttl_ms = asyncio.run(run())
+
+        assert [acquired for acquired, _ in results] == [True, True, False]
+        assert [wait_ms for _, wait_ms in results[:2]] == [0, 0]
+        # Two requests per minute refill one request every 30 seconds.
+        assert 29000 <= results[2][1] <= 30000
+        assert 0 < rpm_ttl_ms <= 120000
+
+    def test_a_refused_request_charges_no_bucket(self):
+        async def run():
+            redis_client = FakeRedis()
+            bucket = RedisTokenBucket(redis_client_provider=lambda: redis_client, key_prefix="test")
+            first = await bucket.try_acquire("model", 10, 100, 80)
+            second = await bucket.try_acquire("model", 10, 100, 80)
+            return first, second, float(await redis_client.hget("test:model:rpm", "tokens"))
+
+        first, second, rpm_tokens = asyncio.run(run())
+
+        assert first == (True, 0)
+        assert second[0] is False
+        # 60 missing tokens at 100 per minute.
+        assert 35000 <= second[1] <= 36000
+        assert 9 <= rpm_tokens < 9.1
+
+    def test_a_request_larger_than_the_bucket_is_admitted_on_a_full_bucket(self):
+        async def run():
+            redis_client = FakeRedis()
+            bucket = RedisTokenBucket(redis_client_provider=lambda: redis_client, key_prefix="test")
+            return await bucket.try_acquire("model", 10, 100, 500)
+
+        assert asyncio.run(run()) == (True, 0)
+
+    def test_gateway_times_out_callers_once_the_shared_budget_is_spent(self):
+        async def run():
+            redis_client = FakeRedis()
+            gateway = RateLimitedAIGateway(
+                inner=EchoAIGateway(),
+                token_bucket=RedisTokenBucket(redis_client_provider=lambda: redis_client, key_prefix="test"),
+                default_budget=ModelBudget(requests_per_minute=1, tokens_per_minute=100000),
+                queue_deadline_seconds=0.05,
+            )
+            request = InferenceRequest(model="test-model", prompt="Say hello.")
+            first = await gateway.generate_text(request)
+            with pytest.raises(AIGatewayQueueTimeoutError):
+                await gateway.generate_text(request)
+            return first, gateway.stats()
+
+        first, stats = asyncio.run(run())
+
+        assert first.generated_text == "ok"
+        assert stats["completed"] == 1
+        assert stats["throttled"] == 1
+        assert stats["queue_timeouts"] == 1
+        assert stats["queue_depth"] == 0
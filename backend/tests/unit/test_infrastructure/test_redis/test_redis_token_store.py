@@ -0,0 +1,56 @@
+import asyncio
+from fakeredis.aioredis import FakeRedis
+from backend.infrastructure.redis.redis_token_store import RedisPasswordResetTokenStore
+
+class TestRedisPasswordResetTokenStore:
+
+    def test_issues_past_the_window_limit_return_none_and_leave_no_token(self):
+        async def run():
+            redis_client = FakeRedis(decode_responses=True)
+            store = RedisPasswordResetTokenStore(redis_client, ttl_seconds=600, max_issues_per_window=2,
+                                                 rate_window_seconds=3600)
+            tokens = [await store.issue(7) for _ in range(3)]
+            other_user = await store.issue(8)
+            return tokens, other_user, sorted(await redis_client.keys("reset_token:*")), \
+                await redis_client.ttl("reset_token_rate:7")
+
+        tokens, other_user, token_keys, rate_ttl = asyncio.run(run())
+
+        assert tokens[0] and tokens[1] and tokens[2] is None
+        assert other_user is not None
+        assert token_keys == sorted(f"reset_token:{token}" for token in (tokens[0], tokens[1], other_user))
+        assert 0 < rate_ttl <= 3600
+
+    def test_a_token_is_consumed_exactly_once(self):
+        async def run():
+            store = RedisPasswordResetTokenStore(FakeRedis(decode_responses=True))
+            token = await store.issue(7)
+            return await asyncio.gather(*[store.consume(token) for _ in range(3)])
+
+        assert sorted(asyncio.run(run()), key=str) == [7, None, None]
+
+    def test_unknown_and_expired_tokens_are_rejected(self):
+        async def run():
+            redis_client = FakeRedis(decode_responses=True)
+            store = RedisPasswordResetTokenStore(redis_client, ttl_seconds=600)
+            token = await store.issue(7)
+            await redis_client.pexpire(f"reset_token:{token}", 1)
+            await asyncio.sleep(0.01)
+            return await store.consume("not-a-token"), await store.consume(token)
+
+        assert asyncio.run(run()) == (None, None)
+
+    def test_issue_many_stores_one_expiring_key_per_user(self):
+        async def run():
+            redis_client = FakeRedis(decode_responses=True)
+            store = RedisPasswordResetTokenStore(redis_client, ttl_seconds=600)
+            tokens = await store.issue_many([1, 2, 3])
+            ttls = [await redis_client.ttl(f"reset_token:{token}") for token in tokens]
+            return tokens, ttls, await store.issue_many([]), [await store.consume(token) for token in tokens]
+
+        tokens, ttls, no_tokens, user_ids = asyncio.run(run())
+
+        assert len(set(tokens)) == 3
+        assert all(0 < ttl <= 600 for ttl in ttls)
+        assert no_tokens == []
+        assert user_ids == [1, 2, 3]
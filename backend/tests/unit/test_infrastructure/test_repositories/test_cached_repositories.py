@@ -0,0 +1,91 @@
+import asyncio
+import dataclasses
+from fakeredis.aioredis import FakeRedis
+from backend.core.enums.field_type_enum import FieldType
+from backend.core.models.document_field import DocumentField
+from backend.core.models.document_type import DocumentType
+from backend.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from backend.infrastructure.cache.two_tier_cache import TwoTierCache
+from backend.infrastructure.repositories.cached_document_field_repository import CachedDocumentFieldRepository
+from backend.infrastructure.repositories.cached_document_type_repository import CachedDocumentTypeRepository
+
+class InMemorySchemaRepository:
+    def __init__(self):
+        self.types = {1: DocumentType(id=1, name="Invoice", description="A bill"),
+                      2: DocumentType(id=2, name="Receipt", description="Proof of payment")}
+        self.fields = {10: DocumentField(id=10, document_type_id=1, name="Total", field_type=FieldType.NUMBER, is_required=True)}
+        self.lookups = 0
+
+    async def find_by_id(self, id):
+        self.lookups += 1
+        return self.fields.get(id)
+
+    async def find_all_by_document_type(self, document_type_id):
+        self.lookups += 1
+        return [field for field in self.fields.values() if field.document_type_id == document_type_id]
+
+    async def find_by_id_with_fields(self, id):
+        self.lookups += 1
+        document_type = self.types.get(id)
+        if document_type is None:
+            return None
+        return dataclasses.replace(document_type, fields=await self.find_all_by_document_type(id))
+
+    async def update(self, id, document_field):
+        self.fields[id] = dataclasses.replace(document_field, id=id)
+        return self.fields[id]
+
+    async def delete(self, id):
+        return self.fields.pop(id, None) is not None
+
+def make_repositories():
+    inner = InMemorySchemaRepository()
+    redis_client = FakeRedis()
+    cache = TwoTierCache(
+        namespace="test:schema",
+        redis_client_provider=lambda: redis_client,
+        local_cache=TTLLRUCache(max_entries=100, ttl_seconds=60),
+    )
+    return inner, CachedDocumentFieldRepository(inner, cache), CachedDocumentTypeRepository(inner, cache)
+
+def field_names(document_type):
+    return [field.name for field in document_type.fields]
+
+class TestCachedSchemaRepositories:
+
+    def test_reads_are_served_from_the_cache(self):
+        inner, fields, types = make_repositories()
+
+        async def run():
+            return [await types.find_by_id_with_fields(1), await types.find_by_id_with_fields(1),
+                    await fields.find_all_by_document_type(1), await fields.find_all_by_document_type(1)]
+
+        first_type, cached_type, first_fields, cached_fields = asyncio.run(run())
+        assert field_names(first_type) == field_names(cached_type) == ["Total"]
+        assert [field.name for field in cached_fields] == ["Total"]
+        assert cached_fields[0].field_type == FieldType.NUMBER
+        assert inner.lookups == 3
+
+    def test_moving_a_field_invalidates_both_document_types(self):
+        inner, fields, types = make_repositories()
+
+        async def run():
+            await types.find_by_id_with_fields(1)
+            await types.find_by_id_with_fields(2)
+            moved = dataclasses.replace(inner.fields[10], document_type_id=2)
+            await fields.update(10, moved)
+            return await types.find_by_id_with_fields(1), await types.find_by_id_with_fields(2)
+
+        previous_type, new_type = asyncio.run(run())
+        assert field_names(previous_type) == []
+        assert field_names(new_type) == ["Total"]
+
+    def test_deleting_a_field_invalidates_its_document_type(self):
+        inner, fields, types = make_repositories()
+
+        async def run():
+            await fields.find_all_by_document_type(1)
+            await fields.delete(10)
+            return await fields.find_all_by_document_type(1)
+
+        assert asyncio.run(run()) == []
@@ -0,0 +1,55 @@
+import asyncio
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from backend.core.enums.field_type_enum import FieldType
+from backend.core.models.document_field import DocumentField
+from backend.core.models.document_type import DocumentType
+from backend.infrastructure.models.base import Base
+from backend.infrastructure.models.document_field_model import DocumentFieldModel
+from backend.infrastructure.models.document_type_model import DocumentTypeModel
+from backend.infrastructure.repositories.mysql_document_field_repository import MySqlDocumentFieldRepository
+from backend.infrastructure.repositories.mysql_document_type_repository import MySqlDocumentTypeRepository
+
+async def with_database(scenario):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.execute(insert(DocumentTypeModel), [{"id": 1, "name": "Invoice", "description": None}])
+        return await scenario(async_sessionmaker(engine, expire_on_commit=False))
+    finally:
+        await engine.dispose()
+
+class TestBulkSaveAll:
+
+    def test_document_type_ids_are_returned_in_request_order(self):
+        async def scenario(session_factory):
+            async with session_factory() as session:
+                saved = await MySqlDocumentTypeRepository(session).save_all([
+                    DocumentType(id=None, name=name, description=f"{name} description")
+                    for name in ("Zeta", "alpha", "Mid")
+                ])
+                stored = (await session.execute(select(DocumentTypeModel.name, DocumentTypeModel.id))).all()
+            return saved, dict(stored)
+
+        saved, stored_ids = asyncio.run(with_database(scenario))
+
+        assert [document_type.name for document_type in saved] == ["Zeta", "alpha", "Mid"]
+        assert [document_type.id for document_type in saved] == [stored_ids[name] for name in ("Zeta", "alpha", "Mid")]
+        assert saved[1].description == "alpha description"
+
+    def test_document_field_ids_are_returned_in_request_order(self):
+        async def scenario(session_factory):
+            async with session_factory() as session:
+                saved = await MySqlDocumentFieldRepository(session).save_all([
+                    DocumentField(id=None, document_type_id=1, name=name, field_type=field_type, is_required=True)
+                    for name, field_type in (("Total", FieldType.DECIMAL), ("Due Date", FieldType.DATE))
+                ])
+                stored = (await session.execute(select(DocumentFieldModel.name, DocumentFieldModel.id))).all()
+            return saved, dict(stored)
+
+        saved, stored_ids = asyncio.run(with_database(scenario))
+
+        assert [(field.name, field.field_type) for field in saved] == \
+            [("Total", FieldType.DECIMAL), ("Due Date", FieldType.DATE)]
+        assert [field.id for field in saved] == [stored_ids["Total"], stored_ids["Due Date"]]
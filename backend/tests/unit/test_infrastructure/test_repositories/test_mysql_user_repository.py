@@ -0,0 +1,45 @@
+import asyncio
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from backend.core.enums.user_role_enum import UserRole
+from backend.infrastructure.models.base import Base
+from backend.infrastructure.models.user_model import UserModel
+from backend.infrastructure.repositories.mysql_user_repository import MySqlUserRepository
+
+PASSWORD_HASH = "$2b$12$" + "a" * 53
+
+def user_row(id, username, email):
+    return {"id": id, "username": username, "email": email, "password_hash": PASSWORD_HASH,
+            "role": UserRole.COMMON_USER, "is_active": True}
+
+class TestFindByIdentifier:
+
+    def test_a_username_match_wins_over_another_users_email(self):
+        async def run():
+            engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+            try:
+                async with engine.begin() as connection:
+                    await connection.run_sync(Base.metadata.create_all)
+                    await connection.execute(insert(UserModel), [
+                        user_row(1, "bob", "shared@example.com"),
+                        user_row(2, "shared@example.com", "alice@example.com"),
+                    ])
+                    # SQLite answers the OR from the unique username index first, which would pick user 2 on its own.
+                    # A copy without indexes is scanned in table order, where user 1 (whose email is user 2's
+                    # username) comes first, so only the query's username preference can pick user 2.
+                    await connection.execute(text("CREATE TABLE users_unindexed AS SELECT * FROM users"))
+                    await connection.execute(text("DROP TABLE users"))
+                    await connection.execute(text("ALTER TABLE users_unindexed RENAME TO users"))
+                async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                    repository = MySqlUserRepository(session)
+                    return [await repository.find_by_identifier(identifier) for identifier in
+                            ("shared@example.com", "alice@example.com", "bob", "nobody")]
+            finally:
+                await engine.dispose()
+
+        shared, by_email, by_username, unknown = asyncio.run(run())
+
+        assert (shared.id, shared.username) == (2, "shared@example.com")
+        assert by_email.id == 2
+        assert by_username.id == 1
+        assert unknown is None
@@ -0,0 +1,85 @@
+import asyncio
+from opentelemetry.propagate import inject
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+from backend.application.dtos.api_response import APIResponse
+from backend.application.email.email import OutgoingEmail
+from backend.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+from backend.infrastructure.tracing.traced_proxy import TracedProxy
+
+class FakeRepository:
+    async def find_by_id(self, id):
+        if id is None:
+            raise ValueError("id is required")
+        return {"id": id}
+
+class FakeUseCase:
+    def __init__(self, repository):
+        self._repository = repository
+
+    async def execute(self, id):
+        found = await self._repository.find_by_id(id)
+        if id == 0:
+            return APIResponse[dict](success=False, message="Not found.", error_code="NOT_FOUND")
+        return APIResponse[dict](success=True, message="Found.", data=found)
+
+    async def execute_stream(self, count):
+        for index in range(count):
+            yield index
+
+def make_tracer():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("test"), exporter
+
+class TestTracedProxy:
+
+    def test_nests_repository_spans_under_use_case_and_records_failures(self):
+        tracer, exporter = make_tracer()
+        repository = TracedProxy(FakeRepository(), tracer, "repository")
+        use_case = TracedProxy(FakeUseCase(repository), tracer, "use_case")
+
+        response = asyncio.run(use_case.execute(0))
+        assert response.error_code == "NOT_FOUND"
+
+        repository_span, use_case_span = exporter.get_finished_spans()
+        assert (repository_span.name, use_case_span.name) == ("FakeRepository.find_by_id", "FakeUseCase.execute")
+        assert repository_span.parent.span_id == use_case_span.context.span_id
+        assert use_case_span.attributes["docugenius.component"] == "use_case"
+        assert use_case_span.attributes["docugenius.error_code"] == "NOT_FOUND"
+
+    def test_records_exceptions_and_traces_async_generators(self):
+        tracer, exporter = make_tracer()
+        use_case = TracedProxy(FakeUseCase(TracedProxy(FakeRepository(), tracer, "repository")), tracer, "use_case")
+
+        async def run():
+            try:
+                await use_case.execute(None)
+            except ValueError:
+                pass
+            return [item async for item in use_case.execute_stream(3)]
+
+        assert asyncio.run(run()) == [0, 1, 2]
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert spans["FakeRepository.find_by_id"].status.status_code == StatusCode.ERROR
+        assert spans["FakeUseCase.execute"].status.status_code == StatusCode.ERROR
+        assert "FakeUseCase.execute_stream" in spans
+
+    def test_outbox_batches_continue_or_link_the_traces_that_queued_them(self):
+        tracer, _ = make_tracer()
+        trace_contexts = []
+        for name in ("first request", "second request"):
+            with tracer.start_as_current_span(name):
+                carrier = {}
+                inject(carrier)
+                trace_contexts.append(carrier["traceparent"])
+        email = OutgoingEmail(to_email="user@example.com", subject="Subject", body="Body")
+
+        parent, links = EmailOutboxDispatcher._trace_parent_and_links([(1, email, 0, trace_contexts[0]), (2, email, 0, None)])
+        assert parent is not None and links == []
+
+        parent, links = EmailOutboxDispatcher._trace_parent_and_links([(1, email, 0, trace_contexts[0]), (2, email, 0, trace_contexts[1])])
+        assert parent is None and len(links) == 2
@@ -0,0 +1,30 @@
+import os
+from fastapi.testclient import TestClient
+
+# backend.main creates the database engine at import time.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from backend.infrastructure.metrics import metrics_dependencies
+from backend.main import app
+
+class TestMetricsEndpoint:
+
+    def test_metrics_require_the_configured_bearer_token(self, monkeypatch):
+        monkeypatch.setattr(metrics_dependencies, "METRICS_BEARER_TOKEN", "scrape-secret")
+        client = TestClient(app)
+
+        anonymous = client.get("/metrics")
+        wrong_token = client.get("/metrics", headers={"Authorization": "Bearer guess"})
+        scraper = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+        assert anonymous.status_code == wrong_token.status_code == 401
+        assert anonymous.headers["www-authenticate"] == "Bearer"
+        assert scraper.status_code == 200
+        assert b"process_cpu_seconds_total" in scraper.content
+
+    def test_metrics_are_refused_when_no_token_is_configured(self, monkeypatch):
+        monkeypatch.setattr(metrics_dependencies, "METRICS_BEARER_TOKEN", "")
+
+        response = TestClient(app).get("/metrics", headers={"Authorization": "Bearer "})
+
+        assert response.status_code == 401
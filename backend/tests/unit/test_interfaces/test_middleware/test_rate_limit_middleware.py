@@ -0,0 +1,30 @@
+import os
+from fastapi.testclient import TestClient
+
+# backend.main creates the database engine at import time.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from backend.infrastructure.rate_limit.sliding_window_rate_limiter import RateLimitDecision
+from backend.interfaces.middleware import rate_limit_middleware
+from backend.main import app
+
+class DenyingRateLimiter:
+    async def hit(self, policy, client_ip=None, user_id=None):
+        return RateLimitDecision(allowed=False, remaining=0, retry_after_seconds=42)
+
+class TestRateLimitMiddleware:
+
+    def test_rate_limited_cross_origin_response_carries_cors_headers(self, monkeypatch):
+        monkeypatch.setattr(rate_limit_middleware, "RATE_LIMIT_ENABLED", True)
+        monkeypatch.setattr(rate_limit_middleware, "get_rate_limiter", lambda: DenyingRateLimiter())
+
+        response = TestClient(app).post(
+            "/api/v1/auth/login",
+            json={"identifier": "admin", "password": "wrong"},
+            headers={"Origin": "http://localhost:5173"},
+        )
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "42"
+        assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+        assert response.headers["access-control-allow-credentials"] == "true"
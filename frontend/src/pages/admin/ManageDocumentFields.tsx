@@ -38,6 +38,7 @@ const ManageDocumentFields: React.FC = () => {
   const [suggestedFields, setSuggestedFields] = useState<SuggestedField[]>([]);
   const [loadingSuggestion, setLoadingSuggestion] = useState<boolean>(false);
   const [errorSuggestion, setErrorSuggestion] = useState<string | null>(null);
+  const [lastSuggestedTypeId, setLastSuggestedTypeId] = useState<number | null>(null);
 
   const [modalState, setModalState] = useState<{
     isOpen: boolean;
@@ -364,6 +365,8 @@ const ManageDocumentFields: React.FC = () => {
       const requestPayload: SuggestDocumentFieldsRequest = {
         document_type_name: selectedDocumentType.name,
         document_type_description: selectedDocumentType.description,
+        // Suggestions are cached per document type; asking again for the same type means "give me new ones".
+        refresh: lastSuggestedTypeId === selectedDocumentType.id,
       };
 
       const response = await fetch(`${API_BASE_URL}/admin/document-fields/suggest`, {
@@ -383,6 +386,7 @@ const ManageDocumentFields: React.FC = () => {
 
       if (response.ok && data.success) {
         setSuggestedFields(data.data.fields);
+        setLastSuggestedTypeId(selectedDocumentType.id);
       } else {
         throw new Error(data.message || 'Failed to get field suggestions.');
       }
@@ -38,7 +38,7 @@ const UploadAndFillFields: React.FC = () => {
         throw new Error('Access token not found in localStorage.');
       }
 
-      const response = await fetch(`${API_BASE_URL}/user/document-fields/by-document-type/${typeIdNumber}`, {
+      const response = await fetch(`${API_BASE_URL}/user/document-types/by-id/${typeIdNumber}/with-fields`, {
         method: 'GET',
         headers: {
           'Authorization': `Bearer ${accessToken}`,
@@ -53,9 +53,14 @@ const UploadAndFillFields: React.FC = () => {
       const data = await response.json();
 
       if (data.success) {
-        setFields(data.data.items);
+        setDocumentType({
+          id: data.data.id,
+          name: data.data.name,
+          description: data.data.description,
+        });
+        setFields(data.data.fields);
         const initialFilledFields: Record<string, any> = {};
-        data.data.items.forEach((field: DocumentField) => {
+        data.data.fields.forEach((field: DocumentField) => {
           initialFilledFields[field.name] = '';
         });
         setFilledFields(initialFilledFields);
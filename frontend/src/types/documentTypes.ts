@@ -127,6 +127,7 @@ export interface SuggestDocumentTypesResponse {
 export interface SuggestDocumentFieldsRequest {
   document_type_name: string;
   document_type_description: string;
+  refresh?: boolean;
 }
 
 export interface SuggestedField {